@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -15,20 +16,6 @@ load_dotenv()
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "http://localhost:5173")
 USERS_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "users.json")
-# Khởi tạo app
-app = FastAPI(title="NL to CRUD API with MCP")
-print(f"[INFO] Users file: {USERS_FILE}")
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[FRONTEND_ORIGIN],
-    allow_credentials=True, 
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
 ROOT = Path(__file__).resolve().parents[1]  # Move up two levels to the project root
 SERVER_DIR = ROOT / "user-manager"  # Correct path to user-manager folder
 SERVER_SCRIPT = SERVER_DIR / "user_server.py"  # Full path to user_server.py
@@ -56,6 +43,39 @@ except Exception as e:
     print(f"[ERROR] Failed to initialize MCP or LLM: {e}")
     raise
 
+# Một agent dùng chung cho mọi request: kết nối server, tool và executor chỉ tạo một lần.
+# Mỗi request là một run riêng (bước, lịch sử), nên các request chạy song song an toàn.
+agent = MCPAgent(
+    llm=llm,
+    client=client,
+    max_steps=30,
+    memory_enabled=False,
+    use_server_manager=True
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Khởi tạo agent khi server start, đóng session khi server tắt
+    await agent.initialize()
+    print("[INFO] MCP agent initialized")
+    yield
+    await agent.close()
+
+
+# Khởi tạo app
+app = FastAPI(title="NL to CRUD API with MCP", lifespan=lifespan)
+print(f"[INFO] Users file: {USERS_FILE}")
+
+# CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[FRONTEND_ORIGIN],
+    allow_credentials=True, 
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
 # === Endpoints ===
 
 @app.get("/health")
@@ -94,13 +114,7 @@ async def run_query(req: Request):
 
     # 1. Dùng MCP xử lý
     try:
-        agent = MCPAgent(
-            llm=llm,
-            client=client,
-            max_steps=max_steps,
-            use_server_manager=True
-        )
-        result = await agent.run(query)
+        result = await agent.run(query, max_steps=max_steps, manage_connector=False)
         print("[NL] MCP handled")
         return {
             "mode": "tool",
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -12,18 +13,6 @@ load_dotenv()
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "http://localhost:5173")
 
-# Initialize FastAPI app
-app = FastAPI()
-
-# Enable CORS so that the Vite frontend (running on port 5173) can call this API
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[FRONTEND_ORIGIN],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 # ── MCP client configuration using STDIO ──
 # This will spawn a Playwright MCP server via npx
 stdio_config = {
@@ -40,6 +29,31 @@ client = MCPClient.from_dict(stdio_config)
 # Create the LLM (Large Language Model) interface using OpenAI
 llm = ChatOpenAI(model=OPENAI_MODEL)
 
+# Create one MCP agent shared by all requests: the MCP sessions, tools and
+# executor are built once, and each request runs with its own steps and history
+agent = MCPAgent(llm=llm, client=client, max_steps=30, memory_enabled=False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Connect to the MCP servers on startup, close the sessions on shutdown
+    await agent.initialize()
+    yield
+    await agent.close()
+
+
+# Initialize FastAPI app
+app = FastAPI(lifespan=lifespan)
+
+# Enable CORS so that the Vite frontend (running on port 5173) can call this API
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[FRONTEND_ORIGIN],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
 # Health check endpoint
 @app.get("/health")
 def health():
@@ -55,11 +69,8 @@ async def run_query(req: Request):
 
     print(f"[API] query={q!r}, steps={steps}")
     try:
-        # Create an MCP agent with LLM + MCP client
-        agent = MCPAgent(llm=llm, client=client, max_steps=steps)
-        
-        # Run the query using the agent (LLM + Playwright MCP)
-        result = await agent.run(q, max_steps=steps)
+        # Run the query using the shared agent (LLM + Playwright MCP)
+        result = await agent.run(q, max_steps=steps, manage_connector=False)
 
         print("[API] done")
         return {"result": result}
@@ -0,0 +1,97 @@
+"""
+Overhead benchmark of the agent loops.
+
+Runs MCPAgent with the LangChain AgentExecutor engine and with the native
+engine against a scripted chat model that answers instantly, so the measured
+time is the loops' own overhead: prompt rendering, output parsing, callback
+plumbing and tool dispatch.
+
+Usage:
+    python benchmarks/agent_loop_overhead.py --runs 50 --steps 5 --tools 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+os.environ.setdefault("MCP_USE_ANONYMIZED_TELEMETRY", "false")
+
+from langchain_core.language_models import BaseChatModel  # noqa: E402
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage  # noqa: E402
+from langchain_core.outputs import ChatGeneration, ChatResult  # noqa: E402
+from langchain_core.tools import BaseTool  # noqa: E402
+
+from mcp_use import MCPAgent  # noqa: E402
+from mcp_use.logging import logger  # noqa: E402
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model calling a tool ``steps`` times, then answering."""
+
+    steps: int
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: list, **kwargs: Any) -> "ScriptedChatModel":
+        return self
+
+    def _generate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        done = sum(isinstance(message, ToolMessage) for message in messages)
+        if done < self.steps:
+            call = {"name": "tool_0", "args": {"text": f"step {done}"}, "id": f"call_{done}"}
+            message = AIMessage(content="", tool_calls=[call])
+        else:
+            message = AIMessage(content="Done")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class EchoTool(BaseTool):
+    description: str = "Echo the text"
+
+    def _run(self, text: str) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, text: str) -> str:
+        return text
+
+
+async def measure(engine: str, runs: int, steps: int, tools: int) -> float:
+    agent = MCPAgent(llm=ScriptedChatModel(steps=steps), connectors=[MagicMock()], engine=engine, memory_enabled=False)
+    agent.adapter._create_tools_from_connectors = AsyncMock(
+        return_value=[EchoTool(name=f"tool_{i}") for i in range(tools)]
+    )
+    await agent.initialize()
+    await agent.run("warm up", max_steps=steps + 1, manage_connector=False)
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        await agent.run("Call the tool", max_steps=steps + 1, manage_connector=False)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--tools", type=int, default=50)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    print(f"{args.runs} runs of {args.steps} tool steps with {args.tools} tools")
+    results = {}
+    for engine in ("executor", "native"):
+        elapsed = await measure(engine, args.runs, args.steps, args.tools)
+        results[engine] = elapsed
+        per_step = elapsed / (args.runs * (args.steps + 1)) * 1000
+        print(f"{engine:<9} {elapsed * 1000:9.1f} ms  {per_step:7.2f} ms/step")
+    print(f"speedup   {results['executor'] / results['native']:9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
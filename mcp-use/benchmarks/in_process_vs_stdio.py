@@ -0,0 +1,57 @@
+"""
+Microbenchmark of the in-process connector against the stdio connector.
+
+Mounts the same FastMCP test server in-process and as a stdio subprocess,
+then measures connect + initialize time and tool call latency.
+
+Usage:
+    python benchmarks/in_process_vs_stdio.py --calls 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from mcp_use.connectors import BaseConnector, InProcessConnector, StdioConnector
+
+SERVER_PATH = Path(__file__).parent.parent / "tests" / "integration" / "servers_for_testing" / "simple_server.py"
+
+
+async def measure(label: str, connector: BaseConnector, calls: int) -> None:
+    start = time.perf_counter()
+    await connector.connect()
+    await connector.initialize()
+    startup = time.perf_counter() - start
+
+    latencies = []
+    try:
+        for i in range(calls):
+            start = time.perf_counter()
+            await connector.call_tool("add", {"a": i, "b": 1})
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await connector.disconnect()
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{label:<12} startup {startup * 1000:8.1f} ms   call p50 {p50:7.3f} ms   p99 {p99:7.3f} ms")
+
+
+async def run_benchmark(calls: int) -> None:
+    await measure("in-process", InProcessConnector(f"{SERVER_PATH.name}:mcp", path=str(SERVER_PATH.parent)), calls)
+    await measure("stdio", StdioConnector(sys.executable, [str(SERVER_PATH)]), calls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark of the conversion of MCP tools to LangChain tools.
+
+Converts a synthetic catalog of tools with distinct input schemas twice: cold,
+with an empty argument model cache, then warm, as when the backend builds a
+new agent for each request in the same process. Also reports the memory
+allocated by a warm conversion, which is what each new agent costs.
+
+Usage:
+    python benchmarks/tool_conversion.py --tools 1000 --rounds 5
+"""
+
+import argparse
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+
+from mcp.types import Tool
+
+from mcp_use.adapters import LangChainAdapter
+from mcp_use.adapters.schemas import args_model_cache
+
+
+def make_catalog(size: int) -> list[Tool]:
+    """Create tools with distinct schemas of a few typical arguments each."""
+    return [
+        Tool(
+            name=f"tool_{i}",
+            description=f"Synthetic tool number {i}",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    f"query_{i}": {"type": "string", "description": "What to look for"},
+                    "limit": {"type": ["integer", "null"], "default": 10},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                    "options": {
+                        "type": "object",
+                        "properties": {"exact": {"type": "boolean"}, "scope": {"type": ["string", "null"]}},
+                    },
+                },
+                "required": [f"query_{i}"],
+            },
+        )
+        for i in range(size)
+    ]
+
+
+def convert(catalog: list[Tool]) -> float:
+    adapter = LangChainAdapter()
+    connector = MagicMock()
+    start = time.perf_counter()
+    for tool in catalog:
+        adapter._convert_tool(tool, connector)
+    return time.perf_counter() - start
+
+
+def measure_memory(catalog: list[Tool]) -> int:
+    """Get the memory held by the converted tools, in bytes."""
+    adapter = LangChainAdapter()
+    connector = MagicMock()
+    tracemalloc.start()
+    tools = [adapter._convert_tool(tool, connector) for tool in catalog]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tools
+    return size
+
+
+def report(label: str, tools: int, elapsed: float) -> None:
+    print(f"{label:<8} {elapsed * 1000:9.1f} ms  {elapsed / tools * 1e6:8.1f} us/tool")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    catalog = make_catalog(args.tools)
+    cold, warm = [], []
+    for _ in range(args.rounds):
+        args_model_cache.clear()
+        cold.append(convert(catalog))
+        warm.append(convert(catalog))
+
+    print(f"Converting {args.tools} tools, best of {args.rounds} rounds")
+    report("cold", args.tools, min(cold))
+    report("warm", args.tools, min(warm))
+    print(f"speedup  {min(cold) / min(warm):9.1f}x")
+    memory = measure_memory(catalog)
+    print(f"memory   {memory / 1024:9.1f} KiB  {memory / args.tools / 1024:8.1f} KiB/tool (warm)")
+    print(f"cache    {args_model_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
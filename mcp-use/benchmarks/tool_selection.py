@@ -0,0 +1,110 @@
+"""
+Benchmark of the per-step tool selection.
+
+Builds a synthetic catalog of tools over several servers' domains, then for
+tasks each needing one known tool, measures how often the tool selector
+shows the needed tool (the tasks it keeps solvable) and the prompt tokens it
+saves, for several values of top_k. Needs the search extra:
+``pip install mcp-use[search]``.
+
+Usage:
+    python benchmarks/tool_selection.py --top-k 5 10 20
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from mcp_use.agents import ToolSelector
+from mcp_use.logging import logger
+
+DOMAINS = {
+    "file": "files on the local disk",
+    "issue": "issues of the project tracker",
+    "email": "email messages of the mailbox",
+    "calendar_event": "events of the calendar",
+    "database_row": "rows of the SQL database",
+    "page": "pages of the wiki",
+    "invoice": "invoices of the billing system",
+    "ticket": "support tickets of the help desk",
+    "repository": "git repositories of the code host",
+    "user": "user accounts of the directory",
+    "message": "chat messages of the team channels",
+    "container": "containers of the cluster",
+    "bucket_object": "objects of the storage buckets",
+    "metric": "metrics of the monitoring system",
+    "contact": "contacts of the CRM",
+}
+
+ACTIONS = {
+    "list": ("List the", "Show me all the"),
+    "get": ("Get one of the", "Look up a specific one of the"),
+    "create": ("Create one of the", "Add a new one to the"),
+    "update": ("Update one of the", "Change the fields of one of the"),
+    "delete": ("Delete one of the", "Remove one of the"),
+    "search": ("Search the", "Find matching items among the"),
+    "export": ("Export the", "Download a CSV of the"),
+    "archive": ("Archive one of the", "Move to the archive one of the"),
+    "share": ("Share one of the", "Give someone access to one of the"),
+    "count": ("Count the", "Tell me how many there are of the"),
+}
+
+
+class ItemInput(BaseModel):
+    id: str = Field(description="Identifier of the item")
+    fields: dict = Field(default_factory=dict, description="Fields of the item")
+    limit: int = Field(default=20, description="Maximum number of items")
+
+
+class CatalogTool(BaseTool):
+    args_schema: type[BaseModel] = ItemInput
+
+    def _run(self, **kwargs) -> str:
+        raise NotImplementedError
+
+
+def make_catalog() -> tuple[list[BaseTool], list[tuple[str, str]]]:
+    """Create the tools, and a task needing each tool, worded differently from its description."""
+    tools, tasks = [], []
+    for domain, things in DOMAINS.items():
+        for action, (description, task) in ACTIONS.items():
+            name = f"{action}_{domain}"
+            tools.append(CatalogTool(name=name, description=f"{description} {things}"))
+            tasks.append((f"{task} {things}", name))
+    return tools, tasks
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top-k", type=int, nargs="+", default=[5, 10, 20])
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    tools, tasks = make_catalog()
+    selector = ToolSelector()
+    start = time.perf_counter()
+    await selector.index(tools)
+    print(f"{len(tools)} tools indexed in {(time.perf_counter() - start) * 1000:.0f} ms, {len(tasks)} tasks")
+    all_tokens = selector.tokens(tools)
+    print(f"all tools   {all_tokens:7d} tokens")
+
+    for top_k in args.top_k:
+        selector.top_k = top_k
+        hits, shown, start = 0, 0, time.perf_counter()
+        for task, needed in tasks:
+            selected = await selector.select(tools, task)
+            hits += any(tool.name == needed for tool in selected)
+            shown += selector.tokens(selected)
+        per_task = (time.perf_counter() - start) / len(tasks) * 1000
+        print(
+            f"top_k={top_k:<4} {shown // len(tasks):7d} tokens  {1 - shown / (all_tokens * len(tasks)):6.1%} saved  "
+            f"{hits / len(tasks):6.1%} needed tool shown  {per_task:5.1f} ms/selection"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
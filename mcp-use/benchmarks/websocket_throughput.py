@@ -0,0 +1,84 @@
+"""
+Throughput benchmark for the WebSocket JSON-RPC multiplexer.
+
+Starts a local WebSocket server that answers every JSON-RPC request
+(including batches) immediately, then measures requests per second for
+sequential, concurrent and batched calls.
+
+Usage:
+    python benchmarks/websocket_throughput.py --requests 5000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import time
+
+from websockets.asyncio.server import serve
+
+from mcp_use.connectors.jsonrpc import JsonRpcMultiplexer, dumps, loads
+
+
+async def echo_handler(websocket) -> None:
+    """Answer each request with its params as result."""
+    async for raw in websocket:
+        data = loads(raw)
+        if isinstance(data, list):
+            await websocket.send(dumps([{"jsonrpc": "2.0", "id": m["id"], "result": m["params"]} for m in data]))
+        elif "id" in data:
+            await websocket.send(dumps({"jsonrpc": "2.0", "id": data["id"], "result": data["params"]}))
+
+
+async def run_benchmark(requests: int, concurrency: int, batch_size: int) -> None:
+    from websockets.asyncio.client import connect
+
+    async with serve(echo_handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        async with connect(f"ws://127.0.0.1:{port}") as websocket:
+            multiplexer = JsonRpcMultiplexer(websocket.send, max_in_flight=max(concurrency, batch_size))
+
+            async def receive() -> None:
+                async for message in websocket:
+                    await multiplexer.dispatch(message)
+
+            receiver = asyncio.create_task(receive())
+            params = {"name": "echo", "arguments": {"text": "hello"}}
+
+            start = time.perf_counter()
+            for _ in range(requests):
+                await multiplexer.request("tools/call", params)
+            report("sequential", requests, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one() -> None:
+                async with semaphore:
+                    await multiplexer.request("tools/call", params)
+
+            await asyncio.gather(*(one() for _ in range(requests)))
+            report(f"concurrent ({concurrency})", requests, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            calls = [("tools/call", params)] * batch_size
+            await asyncio.gather(*(multiplexer.request_batch(calls) for _ in range(requests // batch_size)))
+            report(f"batched ({batch_size})", requests // batch_size * batch_size, time.perf_counter() - start)
+
+            multiplexer.close()
+            receiver.cancel()
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<20} {count:>7} requests in {elapsed:6.3f}s  {count / elapsed:>10.0f} req/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.requests, args.concurrency, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,10 @@ Adapters for converting MCP tools to different frameworks.
 This package provides adapters for converting MCP tools to different frameworks.
 """
 
-from .base import BaseAdapter
+from .base import BaseAdapter, ToolHandle
 from .langchain_adapter import LangChainAdapter
+from .rendering import ToolRenderer
+from .results import ResultAssembler
+from .schemas import ArgsModelCache
 
-__all__ = ["BaseAdapter", "LangChainAdapter"]
+__all__ = ["ArgsModelCache", "BaseAdapter", "LangChainAdapter", "ResultAssembler", "ToolHandle", "ToolRenderer"]
@@ -5,19 +5,77 @@ This module provides the abstract base class that all MCP tool adapters should i
 """
 
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import Any, Generic, Literal, TypeVar
 
 from mcp.types import Prompt, Resource, Tool
 
 from ..client import MCPClient
 from ..connectors.base import BaseConnector
 from ..logging import logger
+from .schemas import schema_hash
 
 # Generic type for the tools created by the adapter
 T = TypeVar("T")
 
+ToolKind = Literal["tool", "resource", "prompt"]
 
-class BaseAdapter(ABC):
+
+class ToolHandle(Generic[T]):
+    """Lightweight descriptor of a tool, resource or prompt of a connector.
+
+    A handle carries what is needed to list, search and describe the tool
+    (name, description, schema hash). The tool in the target framework's
+    format, with its argument model, is only built on the first call to
+    ``materialize`` and then reused.
+    """
+
+    def __init__(
+        self,
+        adapter: "BaseAdapter[T]",
+        kind: ToolKind,
+        item: Tool | Resource | Prompt,
+        connector: BaseConnector,
+        name: str,
+        description: str,
+    ) -> None:
+        self.adapter = adapter
+        self.kind = kind
+        self.item = item
+        self.connector = connector
+        self.name = name
+        self.description = description
+        self._schema_hash: str | None = None
+        self._tool: T | None = None
+        self._materialized = False
+
+    @property
+    def schema_hash(self) -> str | None:
+        """Hash of the tool's input schema, None for resources and prompts."""
+        if self._schema_hash is None and self.kind == "tool":
+            self._schema_hash = schema_hash(self.item.inputSchema)
+        return self._schema_hash
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the tool was already built."""
+        return self._materialized
+
+    def materialize(self) -> T | None:
+        """Build the tool in the target framework's format, once.
+
+        Returns:
+            The tool, or None if the adapter does not convert it (e.g. a disallowed tool).
+        """
+        if not self._materialized:
+            self._tool = self.adapter._convert(self.kind, self.item, self.connector)
+            self._materialized = True
+        return self._tool
+
+    def __repr__(self) -> str:
+        return f"ToolHandle({self.kind}: {self.name})"
+
+
+class BaseAdapter(ABC, Generic[T]):
     """Abstract base class for converting MCP tools to other framework formats.
 
     This class defines the common interface that all adapter implementations
@@ -32,6 +90,7 @@ class BaseAdapter(ABC):
         """
         self.disallowed_tools = disallowed_tools or []
         self._connector_tool_map: dict[BaseConnector, list[T]] = {}
+        self._connector_handle_map: dict[BaseConnector, list[ToolHandle[T]]] = {}
 
     async def create_tools(self, client: "MCPClient") -> list[T]:
         """Create tools from an MCPClient instance.
@@ -68,6 +127,69 @@ class BaseAdapter(ABC):
         # Create tools from connectors
         return await self._create_tools_from_connectors(connectors)
 
+    async def create_tool_handles(self, client: "MCPClient") -> list[ToolHandle[T]]:
+        """Create tool handles from an MCPClient instance, without building the tools.
+
+        Args:
+            client: The MCPClient to extract tools from.
+
+        Returns:
+            A handle for each tool, resource and prompt of the client's servers.
+        """
+        if not client.active_sessions:
+            logger.info("No active sessions found, creating new ones...")
+            await client.create_all_sessions()
+
+        connectors = [session.connector for session in client.get_all_active_sessions().values()]
+        return await self._create_handles_from_connectors(connectors)
+
+    async def load_tool_handles(self, connector: BaseConnector) -> list[ToolHandle[T]]:
+        """Load the handles of the tools, resources and prompts of a connector.
+
+        Listing is cheap: the tools are only built when a handle is materialized.
+
+        Args:
+            connector: The connector to load tools for.
+
+        Returns:
+            The handles, without the disallowed tools.
+        """
+        if connector in self._connector_handle_map:
+            return self._connector_handle_map[connector]
+
+        # Make sure the connector is initialized and has tools
+        success = await self._ensure_connector_initialized(connector)
+        if not success:
+            return []
+
+        items: list[tuple[ToolKind, Tool | Resource | Prompt]] = [
+            ("tool", tool) for tool in await connector.list_tools() if tool.name not in self.disallowed_tools
+        ]
+        # Resources and prompts become tools so that agents can access their content directly
+        items.extend(("resource", resource) for resource in await connector.list_resources() or [])
+        items.extend(("prompt", prompt) for prompt in await connector.list_prompts() or [])
+
+        handles = [ToolHandle(self, kind, item, connector, *self._describe(kind, item)) for kind, item in items]
+        self._connector_handle_map[connector] = handles
+        logger.debug(f"Loaded {len(handles)} tool handles for connector: {[handle.name for handle in handles]}")
+        return handles
+
+    def materialize(self, handles: list[ToolHandle[T]]) -> list[T]:
+        """Build the tools of some handles, reusing those already built.
+
+        Args:
+            handles: The handles of the tools to expose.
+
+        Returns:
+            The tools in the target framework's format, in the order of the handles.
+        """
+        tools = []
+        for handle in handles:
+            tool = handle.materialize()
+            if tool:
+                tools.append(tool)
+        return tools
+
     async def load_tools_for_connector(self, connector: BaseConnector) -> list[T]:
         """Dynamically load tools for a specific connector.
 
@@ -82,37 +204,7 @@ class BaseAdapter(ABC):
             logger.debug(f"Returning {len(self._connector_tool_map[connector])} existing tools for connector")
             return self._connector_tool_map[connector]
 
-        # Create tools for this connector
-
-        # Make sure the connector is initialized and has tools
-        success = await self._ensure_connector_initialized(connector)
-        if not success:
-            return []
-
-        connector_tools = []
-        # Now create tools for each MCP tool
-        for tool in await connector.list_tools():
-            # Convert the tool and add it to the list if conversion was successful
-            converted_tool = self._convert_tool(tool, connector)
-            if converted_tool:
-                connector_tools.append(converted_tool)
-
-        # Convert resources to tools so that agents can access resource content directly
-        resources_list = await connector.list_resources() or []
-        if resources_list:
-            for resource in resources_list:
-                converted_resource = self._convert_resource(resource, connector)
-                if converted_resource:
-                    connector_tools.append(converted_resource)
-
-        # Convert prompts to tools so that agents can retrieve prompt content
-        prompts_list = await connector.list_prompts() or []
-        if prompts_list:
-            for prompt in prompts_list:
-                converted_prompt = self._convert_prompt(prompt, connector)
-                if converted_prompt:
-                    connector_tools.append(converted_prompt)
-        # ------------------------------
+        connector_tools = self.materialize(await self.load_tool_handles(connector))
 
         # Store the tools for this connector
         self._connector_tool_map[connector] = connector_tools
@@ -125,6 +217,24 @@ class BaseAdapter(ABC):
 
         return connector_tools
 
+    def _describe(self, kind: ToolKind, item: Tool | Resource | Prompt) -> tuple[str, str]:
+        """Get the name and description the converted tool will have.
+
+        Adapters renaming tools (e.g. to sanitize resource names) override this
+        so that handles match the tools they build.
+        """
+        if kind == "resource":
+            return item.name or f"resource_{item.uri}", item.description or ""
+        return item.name, item.description or ""
+
+    def _convert(self, kind: ToolKind, item: Tool | Resource | Prompt, connector: BaseConnector) -> Any:
+        """Convert a tool, resource or prompt to the target framework's tool format."""
+        if kind == "tool":
+            return self._convert_tool(item, connector)
+        if kind == "resource":
+            return self._convert_resource(item, connector)
+        return self._convert_prompt(item, connector)
+
     @abstractmethod
     def _convert_tool(self, mcp_tool: Tool, connector: BaseConnector) -> T:
         """Convert an MCP tool to the target framework's tool format."""
@@ -159,6 +269,20 @@ class BaseAdapter(ABC):
         logger.debug(f"Available tools: {len(tools)}")
         return tools
 
+    async def _create_handles_from_connectors(self, connectors: list[BaseConnector]) -> list[ToolHandle[T]]:
+        """Create tool handles from all provided connectors.
+
+        Args:
+            connectors: list of MCP connectors to create handles from.
+
+        Returns:
+            The handles of the tools of every connector.
+        """
+        handles = []
+        for connector in connectors:
+            handles.extend(await self.load_tool_handles(connector))
+        return handles
+
     def _check_connector_initialized(self, connector: BaseConnector) -> bool:
         """Check if a connector is initialized and has tools.
 
@@ -4,12 +4,14 @@ LangChain adapter for MCP tools.
 This module provides utilities to convert MCP tools to LangChain tools.
 """
 
+import base64
 import re
+from collections.abc import Iterator
 from typing import Any, NoReturn
 
-from jsonschema_pydantic import jsonschema_to_pydantic
 from langchain_core.tools import BaseTool, ToolException
 from mcp.types import (
+    BlobResourceContents,
     CallToolResult,
     EmbeddedResource,
     ImageContent,
@@ -17,43 +19,245 @@ from mcp.types import (
     ReadResourceRequestParams,
     Resource,
     TextContent,
+    Tool,
+    ToolAnnotations,
 )
-from pydantic import BaseModel, Field, create_model
+from pydantic import AnyUrl, BaseModel, Field, SkipValidation, create_model
 
+from ..artifacts import ArtifactStore
 from ..connectors.base import BaseConnector
 from ..errors.error_formatting import format_error
 from ..logging import logger
-from .base import BaseAdapter
+from .base import BaseAdapter, ToolKind
+from .results import ResultAssembler
+from .schemas import args_model_cache, normalize_schema
+
+TEXT_MIME_PREFIXES = ("text/", "application/json", "application/xml")
+
+# Characters of each text part kept when describing the content of a failed tool result
+CONTENT_PREVIEW_CHARS = 1000
+
+
+class ReadArtifactInput(BaseModel):
+    artifact_id: str = Field(description="The ID of the artifact, as shown in its reference.")
+    offset: int = Field(0, ge=0, description="Byte offset to start reading from.")
+    length: int = Field(16384, gt=0, description="Maximum number of bytes to read.")
+
+
+class ReadArtifactTool(BaseTool):
+    """Tool giving the agent access to the content of stored artifacts."""
+
+    name: str = "read_artifact"
+    description: str = (
+        "Read the content of an artifact referenced in a tool result, by its ID. Text artifacts are "
+        "returned as text, binary ones as base64. Large artifacts can be read in chunks with offset and length."
+    )
+    args_schema: type[BaseModel] = ReadArtifactInput
+    artifact_store: ArtifactStore
+    handle_tool_error: bool = True
+
+    def _run(self, artifact_id: str, offset: int = 0, length: int = 16384) -> str:
+        try:
+            artifact = self.artifact_store.info(artifact_id)
+            data = self.artifact_store.get(artifact_id)[offset : offset + length]
+        except KeyError as e:
+            if self.handle_tool_error:
+                return format_error(e, tool=self.name)
+            raise
+        if artifact.mime_type.startswith(TEXT_MIME_PREFIXES):
+            return bytes(data).decode(errors="replace")
+        return base64.b64encode(data).decode()
+
+    async def _arun(self, artifact_id: str, offset: int = 0, length: int = 16384) -> str:
+        return self._run(artifact_id, offset, length)
+
+
+def _describe_content(content: list) -> list[str]:
+    """Describe the content parts of a tool result without their binary data.
+
+    Text parts are shortened to a preview; images, audio and blobs are reduced to
+    their type, MIME type and size, so errors never carry base64 content.
+    """
+    descriptions = []
+    for item in content:
+        if isinstance(item, TextContent):
+            text = item.text
+            if len(text) > CONTENT_PREVIEW_CHARS:
+                text = f"{text[:CONTENT_PREVIEW_CHARS]}... ({len(item.text)} characters)"
+            descriptions.append(text)
+        elif isinstance(item, EmbeddedResource):
+            resource = item.resource
+            kind = "text" if hasattr(resource, "text") else "blob"
+            descriptions.append(f"[{kind} resource {resource.uri}: {resource.mimeType or 'unknown type'}]")
+        elif hasattr(item, "data"):
+            descriptions.append(f"[{item.type}: {item.mimeType}, {len(item.data)} base64 characters]")
+        else:
+            descriptions.append(f"[{item.type}]")
+    return descriptions
+
+
+def _sanitize_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_]+", "_", name).lower().strip("_")
+
+
+class McpTool(BaseTool):
+    """LangChain tool calling an MCP tool through its connector.
+
+    A single class serves every MCP tool: the name, description and argument
+    model of each tool are instance fields.
+    """
+
+    tool_connector: SkipValidation[BaseConnector]  # Renamed variable to avoid name conflict
+    tool_annotations: ToolAnnotations | None = None
+    adapter: Any = Field(exclude=True, repr=False)
+    handle_tool_error: bool = True
+
+    def __repr__(self) -> str:
+        return f"MCP tool: {self.name}: {self.description}"
+
+    def _run(self, **kwargs: Any) -> NoReturn:
+        """Synchronous run method that always raises an error.
+
+        Raises:
+            NotImplementedError: Always raises this error because MCP tools
+                only support async operations.
+        """
+        raise NotImplementedError("MCP tools only support async operations")
+
+    async def _arun(self, **kwargs: Any) -> Any:
+        """Asynchronously execute the tool with given arguments.
+
+        Args:
+            kwargs: The arguments to pass to the tool.
+
+        Returns:
+            The result of the tool execution.
+
+        Raises:
+            ToolException: If tool execution fails.
+        """
+        logger.debug(f'MCP tool: "{self.name}" received input: {kwargs}')
+
+        try:
+            timeout = self.tool_connector.tool_timeouts.read_timeout(self.name)
+            tool_result: CallToolResult = await self.tool_connector.call_tool(
+                self.name, kwargs, read_timeout_seconds=timeout
+            )
+            try:
+                # Use the helper function to parse the result
+                return self.adapter._parse_mcp_tool_result(tool_result)
+            except Exception as e:
+                # Log the exception for debugging
+                logger.error(f"Error parsing tool result: {e}")
+                return format_error(e, tool=self.name, tool_content=_describe_content(tool_result.content))
+
+        except Exception as e:
+            if self.handle_tool_error:
+                return format_error(e, tool=self.name)  # Format the error to make LLM understand it
+            raise
+
+
+class ResourceTool(BaseTool):
+    """LangChain tool returning the content of an MCP resource.
+
+    The tool takes no arguments because the resource URI is fixed.
+    """
+
+    args_schema: type[BaseModel] = ReadResourceRequestParams
+    resource_uri: AnyUrl
+    tool_connector: SkipValidation[BaseConnector]
+    adapter: Any = Field(exclude=True, repr=False)
+    handle_tool_error: bool = True
+
+    def _run(self, **kwargs: Any) -> NoReturn:
+        raise NotImplementedError("Resource tools only support async operations")
+
+    async def _arun(self, **kwargs: Any) -> Any:
+        logger.debug(f'Resource tool: "{self.name}" called')
+        try:
+            result = await self.tool_connector.read_resource(self.resource_uri)
+            for content in result.contents:
+                # Attempt to decode bytes if necessary
+                if isinstance(content, bytes):
+                    content_decoded = content.decode()
+                elif isinstance(content, BlobResourceContents) and self.adapter.artifact_store is not None:
+                    content_decoded = self.adapter._store_artifact(
+                        content.blob, content.mimeType, f"resource {content.uri}"
+                    )
+                else:
+                    content_decoded = str(content)
+
+            return content_decoded
+        except Exception as e:
+            if self.handle_tool_error:
+                return format_error(e, tool=self.name)  # Format the error to make LLM understand it
+            raise
+
+
+class PromptTool(BaseTool):
+    """LangChain tool getting an MCP prompt with the arguments given by the LLM."""
+
+    tool_connector: SkipValidation[BaseConnector]
+    handle_tool_error: bool = True
+
+    def _run(self, **kwargs: Any) -> NoReturn:
+        raise NotImplementedError("Prompt tools only support async operations")
+
+    async def _arun(self, **kwargs: Any) -> Any:
+        logger.debug(f'Prompt tool: "{self.name}" called with args: {kwargs}')
+        try:
+            result = await self.tool_connector.get_prompt(self.name, kwargs)
+            return result.messages
+        except Exception as e:
+            if self.handle_tool_error:
+                return format_error(e, tool=self.name)  # Format the error to make LLM understand it
+            raise
 
 
 class LangChainAdapter(BaseAdapter):
     """Adapter for converting MCP tools to LangChain tools."""
 
-    def __init__(self, disallowed_tools: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        disallowed_tools: list[str] | None = None,
+        max_result_bytes: int | None = None,
+        max_result_tokens: int | None = None,
+        spill_dir: str | None = None,
+        artifact_store: ArtifactStore | None = None,
+    ) -> None:
         """Initialize a new LangChain adapter.
 
         Args:
             disallowed_tools: list of tool names that should not be available.
+            max_result_bytes: Maximum size in bytes of a tool result given to the LLM.
+            max_result_tokens: Maximum size in tokens (estimated) of a tool result given to the LLM.
+            spill_dir: Directory where results over these caps are saved in full,
+                defaults to the system temp directory. With an artifact store, they
+                are then moved to the store.
+            artifact_store: Optional store for images and binary resources returned by tools.
+                When set, observations get a compact reference instead of the base64 content,
+                and a read_artifact tool is added to the tools.
         """
         super().__init__(disallowed_tools)
         self._connector_tool_map: dict[BaseConnector, list[BaseTool]] = {}
+        self.result_assembler = ResultAssembler(
+            max_bytes=max_result_bytes,
+            max_tokens=max_result_tokens,
+            spill_dir=spill_dir,
+            artifact_store=artifact_store,
+        )
+        self.artifact_store = artifact_store
 
     def fix_schema(self, schema: dict) -> dict:
         """Convert JSON Schema 'type': ['string', 'null'] to 'anyOf' format.
 
         Args:
-            schema: The JSON schema to fix.
+            schema: The JSON schema to fix. It is not modified.
 
         Returns:
-            The fixed JSON schema.
+            A fixed copy of the JSON schema.
         """
-        if isinstance(schema, dict):
-            if "type" in schema and isinstance(schema["type"], list):
-                schema["anyOf"] = [{"type": t} for t in schema["type"]]
-                del schema["type"]  # Remove 'type' and standardize to 'anyOf'
-            for key, value in schema.items():
-                schema[key] = self.fix_schema(value)  # Apply recursively
-        return schema
+        return normalize_schema(schema)
 
     def _parse_mcp_tool_result(self, tool_result: CallToolResult) -> str:
         """Parse the content of a CallToolResult into a string.
@@ -69,35 +273,76 @@ class LangChainAdapter(BaseAdapter):
                         or contained unexpected content types.
         """
         if tool_result.isError:
-            raise ToolException(f"Tool execution failed: {tool_result.content}")
+            raise ToolException(f"Tool execution failed: {_describe_content(tool_result.content)}")
 
         if not tool_result.content:
             raise ToolException("Tool execution returned no content")
 
-        decoded_result = ""
+        return self.result_assembler.assemble(self._iter_result_parts(tool_result))
+
+    def _iter_result_parts(self, tool_result: CallToolResult) -> Iterator[str]:
+        """Yield the text of each content part of a tool result.
+
+        Raises:
+            ToolException: If a content part has an unexpected type.
+        """
         for item in tool_result.content:
             match item.type:
                 case "text":
                     item: TextContent
-                    decoded_result += item.text
+                    yield item.text
                 case "image":
                     item: ImageContent
-                    decoded_result += item.data  # Assuming data is string-like or base64
+                    if self.artifact_store is not None:
+                        yield self._store_artifact(item.data, item.mimeType)
+                    else:
+                        yield item.data  # Assuming data is string-like or base64
                 case "resource":
                     resource: EmbeddedResource = item.resource
                     if hasattr(resource, "text"):
-                        decoded_result += resource.text
+                        yield resource.text
+                    elif hasattr(resource, "blob") and self.artifact_store is not None:
+                        yield self._store_artifact(resource.blob, resource.mimeType, f"resource {resource.uri}")
                     elif hasattr(resource, "blob"):
                         # Assuming blob needs decoding or specific handling; adjust as needed
-                        decoded_result += (
-                            resource.blob.decode() if isinstance(resource.blob, bytes) else str(resource.blob)
-                        )
+                        yield resource.blob.decode() if isinstance(resource.blob, bytes) else str(resource.blob)
                     else:
                         raise ToolException(f"Unexpected resource type: {resource.type}")
                 case _:
                     raise ToolException(f"Unexpected content type: {item.type}")
 
-        return decoded_result
+    def _store_artifact(self, data: str, mime_type: str | None, summary: str | None = None) -> str:
+        """Move base64 content to the artifact store.
+
+        Returns:
+            The reference to put in the observation instead of the content, or a
+            short marker if the content does not fit in the store.
+        """
+        content = base64.b64decode(data)
+        mime_type = mime_type or "application/octet-stream"
+        try:
+            artifact = self.artifact_store.put(content, mime_type, summary=summary)
+        except ValueError as e:
+            logger.warning(f"Dropping tool output: {e}")
+            return f"[Artifact too large to store: {mime_type}, {len(content)} bytes]"
+        return artifact.reference()
+
+    def create_artifact_tool(self) -> BaseTool:
+        """Create the tool reading artifacts from the adapter's artifact store.
+
+        Raises:
+            ValueError: If the adapter has no artifact store.
+        """
+        if self.artifact_store is None:
+            raise ValueError("The adapter has no artifact store")
+        return ReadArtifactTool(artifact_store=self.artifact_store)
+
+    async def _create_tools_from_connectors(self, connectors: list[BaseConnector]) -> list[BaseTool]:
+        """Create tools from all connectors, plus read_artifact when using an artifact store."""
+        tools = await super()._create_tools_from_connectors(connectors)
+        if self.artifact_store is not None:
+            tools.append(self.create_artifact_tool())
+        return tools
 
     def _convert_tool(self, mcp_tool: dict[str, Any], connector: BaseConnector) -> BaseTool:
         """Convert an MCP tool to LangChain's tool format.
@@ -113,61 +358,22 @@ class LangChainAdapter(BaseAdapter):
         if mcp_tool.name in self.disallowed_tools:
             return None
 
-        # This is a dynamic class creation, we need to work with the self reference
-        adapter_self = self
-
-        class McpToLangChainAdapter(BaseTool):
-            name: str = mcp_tool.name or "NO NAME"
-            description: str = mcp_tool.description or ""
-            # Convert JSON schema to Pydantic model for argument validation
-            args_schema: type[BaseModel] = jsonschema_to_pydantic(
-                adapter_self.fix_schema(mcp_tool.inputSchema)  # Apply schema conversion
-            )
-            tool_connector: BaseConnector = connector  # Renamed variable to avoid name conflict
-            handle_tool_error: bool = True
-
-            def __repr__(self) -> str:
-                return f"MCP tool: {self.name}: {self.description}"
-
-            def _run(self, **kwargs: Any) -> NoReturn:
-                """Synchronous run method that always raises an error.
-
-                Raises:
-                    NotImplementedError: Always raises this error because MCP tools
-                        only support async operations.
-                """
-                raise NotImplementedError("MCP tools only support async operations")
-
-            async def _arun(self, **kwargs: Any) -> Any:
-                """Asynchronously execute the tool with given arguments.
-
-                Args:
-                    kwargs: The arguments to pass to the tool.
-
-                Returns:
-                    The result of the tool execution.
-
-                Raises:
-                    ToolException: If tool execution fails.
-                """
-                logger.debug(f'MCP tool: "{self.name}" received input: {kwargs}')
-
-                try:
-                    tool_result: CallToolResult = await self.tool_connector.call_tool(self.name, kwargs)
-                    try:
-                        # Use the helper function to parse the result
-                        return adapter_self._parse_mcp_tool_result(tool_result)
-                    except Exception as e:
-                        # Log the exception for debugging
-                        logger.error(f"Error parsing tool result: {e}")
-                        return format_error(e, tool=self.name, tool_content=tool_result.content)
-
-                except Exception as e:
-                    if self.handle_tool_error:
-                        return format_error(e, tool=self.name)  # Format the error to make LLM understand it
-                    raise
-
-        return McpToLangChainAdapter()
+        return McpTool(
+            name=mcp_tool.name or "NO NAME",
+            description=mcp_tool.description or "",
+            # Pydantic model for argument validation, shared by tools with the same schema
+            args_schema=args_model_cache.get_model(mcp_tool.inputSchema),
+            tool_connector=connector,
+            tool_annotations=mcp_tool.annotations,
+            adapter=self,
+        )
+
+    def _describe(self, kind: ToolKind, item: Tool | Resource | Prompt) -> tuple[str, str]:
+        """Get the name and description of a tool, with resource names made valid tool names."""
+        if kind == "resource":
+            name = _sanitize_name(item.name or f"resource_{item.uri}")
+            return name, item.description or f"Return the content of the resource located at URI {item.uri}."
+        return super()._describe(kind, item)
 
     def _convert_resource(self, mcp_resource: Resource, connector: BaseConnector) -> BaseTool:
         """Convert an MCP resource to LangChain's tool format.
@@ -176,39 +382,14 @@ class LangChainAdapter(BaseAdapter):
         The tool takes **no** arguments because the resource URI is fixed.
         """
 
-        def _sanitize(name: str) -> str:
-            return re.sub(r"[^A-Za-z0-9_]+", "_", name).lower().strip("_")
-
-        class ResourceTool(BaseTool):
-            name: str = _sanitize(mcp_resource.name or f"resource_{mcp_resource.uri}")
-            description: str = (
-                mcp_resource.description or f"Return the content of the resource located at URI {mcp_resource.uri}."
-            )
-            args_schema: type[BaseModel] = ReadResourceRequestParams
-            tool_connector: BaseConnector = connector
-            handle_tool_error: bool = True
-
-            def _run(self, **kwargs: Any) -> NoReturn:
-                raise NotImplementedError("Resource tools only support async operations")
-
-            async def _arun(self, **kwargs: Any) -> Any:
-                logger.debug(f'Resource tool: "{self.name}" called')
-                try:
-                    result = await self.tool_connector.read_resource(mcp_resource.uri)
-                    for content in result.contents:
-                        # Attempt to decode bytes if necessary
-                        if isinstance(content, bytes):
-                            content_decoded = content.decode()
-                        else:
-                            content_decoded = str(content)
-
-                    return content_decoded
-                except Exception as e:
-                    if self.handle_tool_error:
-                        return format_error(e, tool=self.name)  # Format the error to make LLM understand it
-                    raise
-
-        return ResourceTool()
+        name, description = self._describe("resource", mcp_resource)
+        return ResourceTool(
+            name=name,
+            description=description,
+            resource_uri=mcp_resource.uri,
+            tool_connector=connector,
+            adapter=self,
+        )
 
     def _convert_prompt(self, mcp_prompt: Prompt, connector: BaseConnector) -> BaseTool:
         """Convert an MCP prompt to LangChain's tool format.
@@ -244,25 +425,9 @@ class LangChainAdapter(BaseAdapter):
             # Create an empty Pydantic model if there are no arguments
             InputSchema = create_model(dynamic_model_name, __base__=BaseModel)
 
-        class PromptTool(BaseTool):
-            name: str = mcp_prompt.name
-            description: str = mcp_prompt.description
-
-            args_schema: type[BaseModel] = InputSchema
-            tool_connector: BaseConnector = connector
-            handle_tool_error: bool = True
-
-            def _run(self, **kwargs: Any) -> NoReturn:
-                raise NotImplementedError("Prompt tools only support async operations")
-
-            async def _arun(self, **kwargs: Any) -> Any:
-                logger.debug(f'Prompt tool: "{self.name}" called with args: {kwargs}')
-                try:
-                    result = await self.tool_connector.get_prompt(self.name, kwargs)
-                    return result.messages
-                except Exception as e:
-                    if self.handle_tool_error:
-                        return format_error(e, tool=self.name)  # Format the error to make LLM understand it
-                    raise
-
-        return PromptTool()
+        return PromptTool(
+            name=mcp_prompt.name,
+            description=mcp_prompt.description or "",
+            args_schema=InputSchema,
+            tool_connector=connector,
+        )
@@ -0,0 +1,308 @@
+"""
+Compact rendering of tool definitions for the LLM.
+
+This module renders LangChain tools to the OpenAI tool definitions bound to
+the LLM, with their JSON schemas slimmed down: titles dropped, trivial
+``anyOf`` collapsed, descriptions truncated and shared definitions deduped.
+Rendered definitions are cached per tool.
+"""
+
+import json
+import math
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from .results import BYTES_PER_TOKEN
+from .schemas import schema_hash
+
+FULL = "full"
+COMPACT = "compact"
+MINIMAL = "minimal"
+SCHEMA_LEVELS = (FULL, COMPACT, MINIMAL)
+
+# Description limits of the minimal level, in characters
+MINIMAL_DESCRIPTION_CHARS = 200
+MINIMAL_PROPERTY_DESCRIPTION_CHARS = 100
+
+DEFS_PREFIX = "#/$defs/"
+
+# Keywords whose value maps names to schemas, rather than being a schema
+_SCHEMA_MAPS = ("properties", "patternProperties", "$defs", "definitions")
+
+
+def truncate_description(text: str, max_chars: int | None) -> str:
+    """Truncate a description at a word boundary.
+
+    Args:
+        text: The description.
+        max_chars: Maximum number of characters, None for no limit.
+
+    Returns:
+        The description, cut before ``max_chars`` and ending with "..." if it was longer.
+    """
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,;:.") + "..."
+
+
+def definition_tokens(definition: dict[str, Any]) -> int:
+    """Estimate the number of prompt tokens of a tool definition, at 4 bytes per token."""
+    return math.ceil(len(json.dumps(definition, default=str).encode("utf-8")) / BYTES_PER_TOKEN)
+
+
+def compact_schema(
+    schema: dict[str, Any], max_description_chars: int | None = None, drop_examples: bool = False
+) -> dict[str, Any]:
+    """Slim a JSON schema down without changing the values it accepts.
+
+    Titles and null defaults are dropped. ``anyOf`` of a single schema, or of
+    plain types, is collapsed, and optional properties lose their null type.
+    Identical definitions are merged; definitions referenced once are inlined
+    and unused ones dropped.
+
+    Args:
+        schema: The JSON schema. It is not modified.
+        max_description_chars: Maximum length of the descriptions, None for no limit.
+        drop_examples: Whether to drop the examples.
+
+    Returns:
+        The compacted JSON schema.
+    """
+    defs = schema.get("$defs", {})
+    root = _compact_node(
+        {key: value for key, value in schema.items() if key != "$defs"}, max_description_chars, drop_examples
+    )
+    compacted = {name: _compact_node(node, max_description_chars, drop_examples) for name, node in defs.items()}
+
+    # Merge the definitions that became identical, such as models differing by their title only
+    aliases: dict[str, str] = {}
+    by_hash: dict[str, str] = {}
+    for name, node in compacted.items():
+        aliases[name] = by_hash.setdefault(schema_hash(node), name)
+    root = _rename_refs(root, aliases)
+    defs = {name: _rename_refs(node, aliases) for name, node in compacted.items() if aliases[name] == name}
+
+    counts = Counter(_refs(root))
+    for node in defs.values():
+        counts.update(_refs(node))
+    kept: set[str] = set()
+
+    def resolve(node: Any, inlining: frozenset[str]) -> Any:
+        if isinstance(node, list):
+            return [resolve(item, inlining) for item in node]
+        if not isinstance(node, dict):
+            return node
+        name = _ref_name(node)
+        if name in defs:
+            if counts[name] == 1 and name not in inlining:
+                siblings = {key: value for key, value in node.items() if key != "$ref"}
+                return {**resolve(defs[name], inlining | {name}), **resolve(siblings, inlining)}
+            kept.add(name)
+        return {key: resolve(value, inlining) for key, value in node.items()}
+
+    result = resolve(root, frozenset())
+    resolved: dict[str, Any] = {}
+    while kept - resolved.keys():
+        name = min(kept - resolved.keys())
+        resolved[name] = resolve(defs[name], frozenset({name}))
+    if resolved:
+        result["$defs"] = {name: resolved[name] for name in defs if name in resolved}
+    return result
+
+
+def _compact_node(node: Any, max_description_chars: int | None, drop_examples: bool, optional: bool = False) -> Any:
+    """Compact a schema node, without resolving references."""
+    if isinstance(node, list):
+        return [_compact_node(item, max_description_chars, drop_examples) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    required = set(node.get("required", [])) if isinstance(node.get("required"), list) else set()
+    compacted: dict[str, Any] = {}
+    for key, value in node.items():
+        if key == "title" and isinstance(value, str):
+            continue
+        if (key == "default" and value is None) or (key == "examples" and drop_examples):
+            continue
+        if key == "description" and isinstance(value, str):
+            compacted[key] = truncate_description(value, max_description_chars)
+        elif key in _SCHEMA_MAPS and isinstance(value, dict):
+            compacted[key] = {
+                name: _compact_node(
+                    item, max_description_chars, drop_examples, optional=key == "properties" and name not in required
+                )
+                for name, item in value.items()
+            }
+        else:
+            compacted[key] = _compact_node(value, max_description_chars, drop_examples)
+
+    # An omitted optional property needs no null type
+    any_of = compacted.get("anyOf")
+    if optional and isinstance(any_of, list) and len(any_of) > 1:
+        without_null = [item for item in any_of if item != {"type": "null"}]
+        if without_null:
+            compacted["anyOf"] = any_of = without_null
+    types = compacted.get("type")
+    if optional and isinstance(types, list) and "null" in types and len(types) > 1:
+        compacted["type"] = types = [item for item in types if item != "null"]
+
+    # Collapse trivial anyOf: a single schema, or plain types
+    if isinstance(any_of, list) and any_of and all(isinstance(item, dict) for item in any_of):
+        rest = {key: value for key, value in compacted.items() if key != "anyOf"}
+        if len(any_of) == 1 and not set(any_of[0]) & set(rest):
+            compacted = {**any_of[0], **rest}
+        elif all(set(item) == {"type"} and isinstance(item["type"], str) for item in any_of) and "type" not in rest:
+            compacted = {"type": [item["type"] for item in any_of], **rest}
+    if isinstance(compacted.get("type"), list) and len(compacted["type"]) == 1:
+        compacted["type"] = compacted["type"][0]
+    return compacted
+
+
+def _ref_name(node: dict[str, Any]) -> str | None:
+    ref = node.get("$ref")
+    if isinstance(ref, str) and ref.startswith(DEFS_PREFIX):
+        return ref[len(DEFS_PREFIX) :]
+    return None
+
+
+def _refs(node: Any) -> Iterable[str]:
+    """Yield the names of the definitions referenced in a schema node."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _refs(item)
+    elif isinstance(node, dict):
+        name = _ref_name(node)
+        if name is not None:
+            yield name
+        for value in node.values():
+            yield from _refs(value)
+
+
+def _rename_refs(node: Any, aliases: dict[str, str]) -> Any:
+    if isinstance(node, list):
+        return [_rename_refs(item, aliases) for item in node]
+    if not isinstance(node, dict):
+        return node
+    renamed = {key: _rename_refs(value, aliases) for key, value in node.items()}
+    name = _ref_name(node)
+    if name in aliases:
+        renamed["$ref"] = DEFS_PREFIX + aliases[name]
+    return renamed
+
+
+class ToolRenderer:
+    """Renders tools to compact OpenAI tool definitions, cached per tool.
+
+    The ``compact`` level drops titles and null defaults, collapses trivial
+    ``anyOf`` and dedupes shared definitions. The ``minimal`` level also drops
+    examples and truncates the tool and property descriptions. The ``full``
+    level renders the tools as LangChain binds them.
+
+    Tool arguments are still validated against the tools' own argument models.
+    """
+
+    def __init__(
+        self,
+        level: str = COMPACT,
+        max_description_chars: int | None = None,
+        max_property_description_chars: int | None = None,
+        max_size: int | None = 4096,
+    ) -> None:
+        """Initialize a new tool renderer.
+
+        Args:
+            level: The rendering level: "full", "compact" or "minimal".
+            max_description_chars: Maximum length of the tool descriptions, None for no limit,
+                or 200 at the minimal level.
+            max_property_description_chars: Maximum length of the property descriptions, None for
+                no limit, or 100 at the minimal level.
+            max_size: Maximum number of cached definitions, None for no limit.
+        """
+        if level not in SCHEMA_LEVELS:
+            raise ValueError(f"Unknown schema level '{level}', expected one of {SCHEMA_LEVELS}")
+        if level == MINIMAL:
+            max_description_chars = max_description_chars or MINIMAL_DESCRIPTION_CHARS
+            max_property_description_chars = max_property_description_chars or MINIMAL_PROPERTY_DESCRIPTION_CHARS
+        self.level = level
+        self.max_description_chars = max_description_chars
+        self.max_property_description_chars = max_property_description_chars
+        self.max_size = max_size
+        self._definitions: OrderedDict[tuple, tuple[Any, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def describe(self, tool: BaseTool) -> str:
+        """Get the description of a tool, truncated to the renderer's limit."""
+        return truncate_description(tool.description, self.max_description_chars)
+
+    def render(self, tool: BaseTool) -> dict[str, Any]:
+        """Render a tool to an OpenAI tool definition, once per tool.
+
+        Args:
+            tool: The tool.
+
+        Returns:
+            The tool definition, to bind to the LLM in place of the tool.
+        """
+        return self._cached(tool, self.level, self._render)
+
+    def render_all(self, tools: Iterable[BaseTool]) -> list[dict[str, Any]]:
+        """Render tools to OpenAI tool definitions, in order."""
+        return [self.render(tool) for tool in tools]
+
+    def report(self, tools: Iterable[BaseTool]) -> dict[str, int]:
+        """Estimate the prompt tokens of the rendered definitions of tools.
+
+        Args:
+            tools: The tools of a catalog.
+
+        Returns:
+            The number of tools, the estimated tokens of their full and rendered
+            definitions, and the tokens saved.
+        """
+        tools = list(tools)
+        full = sum(definition_tokens(self._cached(tool, FULL, convert_to_openai_tool)) for tool in tools)
+        rendered = sum(definition_tokens(self.render(tool)) for tool in tools)
+        return {"tools": len(tools), "full_tokens": full, "tokens": rendered, "tokens_saved": full - rendered}
+
+    def clear(self) -> None:
+        """Remove every cached definition."""
+        with self._lock:
+            self._definitions.clear()
+
+    def _render(self, tool: BaseTool) -> dict[str, Any]:
+        if self.level == FULL or not tool.args_schema:
+            return convert_to_openai_tool(tool)
+        schema = tool.tool_call_schema
+        schema = dict(schema) if isinstance(schema, dict) else schema.model_json_schema()
+        schema.pop("title", None)
+        schema.pop("description", None)
+        parameters = compact_schema(schema, self.max_property_description_chars, drop_examples=self.level == MINIMAL)
+        return {
+            "type": "function",
+            "function": {"name": tool.name, "description": self.describe(tool), "parameters": parameters},
+        }
+
+    def _cached(self, tool: BaseTool, level: str, render) -> dict[str, Any]:
+        # Argument models are shared by the tools of a schema; holding one in the entry keeps its id unique
+        args_schema = tool.args_schema
+        schema_key = schema_hash(args_schema) if isinstance(args_schema, dict) else id(args_schema)
+        key = (level, tool.name, tool.description, schema_key)
+        with self._lock:
+            entry = self._definitions.get(key)
+            if entry is not None:
+                self._definitions.move_to_end(key)
+                return entry[1]
+        definition = render(tool)
+        with self._lock:
+            self._definitions[key] = (args_schema, definition)
+            while self.max_size is not None and len(self._definitions) > self.max_size:
+                self._definitions.popitem(last=False)
+        return definition
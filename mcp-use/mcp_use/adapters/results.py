@@ -0,0 +1,164 @@
+"""
+Assembly of tool results into agent observations.
+
+This module provides an assembler that joins the content parts of a tool
+result, caps their size and spills oversized results to a file or an
+artifact store.
+"""
+
+import os
+import tempfile
+from collections.abc import Iterable
+from typing import TextIO
+
+from ..artifacts import ArtifactStore
+from ..logging import logger
+
+# Rough size of a token, used to turn token caps into byte caps without a tokenizer
+BYTES_PER_TOKEN = 4
+
+
+class ResultAssembler:
+    """Joins tool result parts into a string of bounded size.
+
+    Parts are consumed one at a time. Without a cap they are joined as is. With
+    a cap, only the first ``max_bytes`` bytes (or about ``max_tokens`` tokens)
+    are kept in memory and returned, followed by a truncation marker. When
+    ``spill`` is enabled, the complete result is written to a file in
+    ``spill_dir`` and the marker points to it, so nothing is lost. With an
+    ``artifact_store``, the spilled result then moves to the store, and the
+    marker gives its artifact ID instead. Spill files left on disk are
+    tracked and removed by :meth:`cleanup`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        max_tokens: int | None = None,
+        spill: bool = True,
+        spill_dir: str | None = None,
+        artifact_store: ArtifactStore | None = None,
+    ) -> None:
+        """Initialize a new result assembler.
+
+        Args:
+            max_bytes: Maximum size in bytes of an assembled result, None for no limit.
+            max_tokens: Maximum size in tokens of an assembled result, estimated at
+                4 bytes per token, None for no limit.
+            spill: Whether to save oversized results to a file.
+            spill_dir: Directory of the spilled results, defaults to the system temp directory.
+            artifact_store: Optional store receiving the spilled results, so they can be
+                read back with the read_artifact tool.
+        """
+        caps = [cap for cap in (max_bytes, max_tokens and max_tokens * BYTES_PER_TOKEN) if cap is not None]
+        if any(cap <= 0 for cap in caps):
+            raise ValueError("Result size caps must be positive")
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.spill = spill
+        self.spill_dir = spill_dir
+        self.artifact_store = artifact_store
+        self.spilled_paths: list[str] = []
+        self.limit = min(caps) if caps else None
+
+    def assemble(self, parts: Iterable[str]) -> str:
+        """Join result parts, truncating and spilling them when over the cap.
+
+        Args:
+            parts: The text of each content part, in order.
+
+        Returns:
+            The assembled result, ending with a truncation marker if it was capped.
+        """
+        if self.limit is None:
+            return "".join(parts)
+
+        kept: list[str] = []
+        kept_bytes = 0
+        total_bytes = 0
+        spill_file = None
+        spill_path = None
+        remaining_parts = iter(parts)
+        try:
+            for part in remaining_parts:
+                size = _utf8_size(part)
+                total_bytes += size
+                if spill_file is not None:
+                    spill_file.write(part)
+                    continue
+                if kept_bytes + size <= self.limit:
+                    kept.append(part)
+                    kept_bytes += size
+                    continue
+
+                # Over the cap: keep what fits and send the whole result to the spill file
+                if self.spill:
+                    spill_file, spill_path = self._open_spill_file()
+                    spill_file.writelines(kept)
+                    spill_file.write(part)
+                head = part.encode()[: self.limit - kept_bytes].decode(errors="ignore")
+                kept.append(head)
+                kept_bytes += _utf8_size(head)
+                if not self.spill:
+                    # Count the remaining parts without keeping them
+                    total_bytes += sum(_utf8_size(rest) for rest in remaining_parts)
+                    break
+        except BaseException:
+            if spill_path:
+                spill_file.close()
+                os.unlink(spill_path)
+            raise
+        finally:
+            if spill_file is not None:
+                spill_file.close()
+
+        if total_bytes <= kept_bytes:
+            return "".join(kept)
+
+        marker = f"\n\n[Result truncated: showing {kept_bytes} of {total_bytes} bytes"
+        if spill_path:
+            artifact_id = self._store_spill_file(spill_path)
+            if artifact_id:
+                marker += f". The full result was saved as artifact {artifact_id}"
+                logger.debug(f"Spilled a {total_bytes} byte tool result to artifact {artifact_id}")
+            else:
+                self.spilled_paths.append(spill_path)
+                marker += f". The full result was saved to {spill_path}"
+                logger.debug(f"Spilled a {total_bytes} byte tool result to {spill_path}")
+        kept.append(marker + "]")
+        return "".join(kept)
+
+    def cleanup(self) -> None:
+        """Remove the spill files written so far."""
+        while self.spilled_paths:
+            try:
+                os.unlink(self.spilled_paths.pop())
+            except FileNotFoundError:
+                pass
+
+    def _store_spill_file(self, path: str) -> str | None:
+        """Move a spill file to the artifact store.
+
+        Returns:
+            The artifact ID, or None if there is no store or the result does not fit in it.
+        """
+        if self.artifact_store is None:
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            artifact = self.artifact_store.put(data, "text/plain", summary="full tool result")
+        except ValueError as e:
+            logger.warning(f"Keeping the spilled tool result on disk: {e}")
+            return None
+        os.unlink(path)
+        return artifact.id
+
+    def _open_spill_file(self) -> tuple[TextIO, str]:
+        fd, path = tempfile.mkstemp(prefix="mcp_use_result_", suffix=".txt", dir=self.spill_dir)
+        return os.fdopen(fd, "w", encoding="utf-8", newline=""), path
+
+
+def _utf8_size(text: str) -> int:
+    # ASCII text, the common case, has one byte per character
+    return len(text) if text.isascii() else len(text.encode())
@@ -0,0 +1,121 @@
+"""
+Conversion of MCP tool input schemas to Pydantic models.
+
+This module normalizes JSON schemas without mutating them and keeps a
+process-wide cache of the compiled argument models, keyed by a canonical hash
+of the schema, so identical schemas are only compiled once per process.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from jsonschema_pydantic import jsonschema_to_pydantic
+from pydantic import BaseModel
+
+
+def normalize_schema(schema: Any) -> Any:
+    """Convert JSON Schema 'type': ['string', 'null'] to 'anyOf' format.
+
+    The schema is not modified; a normalized copy is returned.
+
+    Args:
+        schema: The JSON schema to normalize.
+
+    Returns:
+        The normalized JSON schema.
+    """
+    if isinstance(schema, dict):
+        normalized = {}
+        for key, value in schema.items():
+            if key == "type" and isinstance(value, list):
+                normalized["anyOf"] = [{"type": t} for t in value]
+            else:
+                normalized[key] = normalize_schema(value)
+        return normalized
+    if isinstance(schema, list):
+        return [normalize_schema(item) for item in schema]
+    return schema
+
+
+def schema_hash(schema: dict[str, Any]) -> str:
+    """Get a hash of a JSON schema that does not depend on key order.
+
+    Args:
+        schema: The JSON schema.
+
+    Returns:
+        The hex SHA-256 digest of the schema's canonical JSON.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ArgsModelCache:
+    """Cache of the Pydantic models compiled from tool input schemas.
+
+    Models are keyed by the canonical hash of the schema they were compiled
+    from, so tools sharing a schema, and the same tools converted again for
+    a new agent, reuse the same model. The least recently used models are
+    dropped beyond ``max_size`` entries.
+    """
+
+    def __init__(self, max_size: int | None = 4096) -> None:
+        """Initialize a new argument model cache.
+
+        Args:
+            max_size: Maximum number of cached models, None for no limit.
+        """
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._models: OrderedDict[str, type[BaseModel]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_model(self, schema: dict[str, Any]) -> type[BaseModel]:
+        """Get the argument model of a schema, compiling it on first use.
+
+        Args:
+            schema: The tool's input JSON schema. It is not modified.
+
+        Returns:
+            The Pydantic model validating the tool's arguments.
+        """
+        key = schema_hash(schema)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self._hits += 1
+                return model
+            self._misses += 1
+
+        # Compile outside the lock; a concurrent miss on the same schema only costs a duplicate compilation
+        model = jsonschema_to_pydantic(normalize_schema(schema))
+        with self._lock:
+            model = self._models.setdefault(key, model)
+            while self.max_size is not None and len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+        return model
+
+    def clear(self) -> None:
+        """Remove every cached model and reset the statistics."""
+        with self._lock:
+            self._models.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def stats(self) -> dict[str, int | None]:
+        """Get the number of cached models, hits and misses."""
+        return {"models": len(self._models), "max_size": self.max_size, "hits": self._hits, "misses": self._misses}
+
+
+# Shared by every adapter of the process
+args_model_cache = ArgsModelCache()
@@ -5,10 +5,14 @@ This module provides ready-to-use agent implementations
 that are pre-configured for using MCP tools.
 """
 
+from .history import HistoryCompactor
 from .mcpagent import MCPAgent
 from .remote import RemoteAgent
+from .tool_selection import ToolSelector
 
 __all__ = [
+    "HistoryCompactor",
     "MCPAgent",
     "RemoteAgent",
+    "ToolSelector",
 ]
@@ -0,0 +1,65 @@
+"""
+Per-run state of an agent.
+
+This module provides the context holding everything that belongs to a
+single run of an agent, so that one initialized agent can serve concurrent
+runs while sharing its tools, executor and sessions read-only.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.agents import AgentAction
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.tools import BaseTool
+
+from ..managers.base import BaseServerManager
+
+
+@dataclass
+class RunContext:
+    """State of one run of an agent.
+
+    Attributes:
+        query: The query of the run.
+        max_steps: Maximum number of steps of the run.
+        conversation_id: ID of the stored conversation of the run, None for the agent's own history.
+        timeout: Time limit of the run in seconds, None for no limit.
+        deadline: Event loop time by which the run must complete, set when it starts if it has a time limit.
+        timed_out: Whether the run stopped at its deadline.
+        history: Chat history given to the LLM, a snapshot taken at the start of the run.
+        tools: Tools available to the run, the agent's tools unless the run switched servers.
+        step_tools: Tools shown to the LLM at the current step, the run's tools unless a tool selector narrows them.
+        system_message: System message of the run's executor.
+        executor: Executor driving the run's steps, the agent's executor unless the run switched servers
+            or a tool selector narrowed its tools.
+        server_manager: The run's view of the agent's server manager, in server manager mode.
+        new_messages: Messages of the run to add to the agent's memory when it completes.
+        intermediate_steps: Tool calls of the run with their results.
+        tools_used_names: Names of the tools called during the run.
+        steps_taken: Number of steps taken.
+        prompt_tokens: Estimated size in tokens of the prompt of each step.
+        tool_tokens_saved: Estimated prompt tokens saved by the tool selector at each step.
+        started_at: Start time of the run.
+    """
+
+    query: str
+    max_steps: int
+    conversation_id: str | None = None
+    timeout: float | None = None
+    deadline: float | None = None
+    timed_out: bool = False
+    history: list[BaseMessage] = field(default_factory=list)
+    tools: list[BaseTool] = field(default_factory=list)
+    step_tools: list[BaseTool] = field(default_factory=list)
+    system_message: SystemMessage | None = None
+    executor: Any = None
+    server_manager: BaseServerManager | None = None
+    new_messages: list[BaseMessage] = field(default_factory=list)
+    intermediate_steps: list[tuple[AgentAction, str]] = field(default_factory=list)
+    tools_used_names: list[str] = field(default_factory=list)
+    steps_taken: int = 0
+    prompt_tokens: list[int] = field(default_factory=list)
+    tool_tokens_saved: list[int] = field(default_factory=list)
+    started_at: float = field(default_factory=time.time)
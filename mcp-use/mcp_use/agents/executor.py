@@ -0,0 +1,134 @@
+"""
+Agent executor running the tool calls of a step concurrently.
+
+This module provides a LangChain agent executor whose tool calls, when the
+LLM asks for several in one step, run concurrently within a per-server bound,
+with tools that are destructive or not idempotent optionally run on their own.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from langchain.agents import AgentExecutor
+from langchain_core.agents import AgentAction, AgentStep
+from langchain_core.callbacks import AsyncCallbackManagerForChainRun
+from langchain_core.tools import BaseTool
+from mcp.types import ToolAnnotations
+from pydantic import PrivateAttr
+
+from ..logging import logger
+
+
+def is_serial_tool(annotations: ToolAnnotations | None) -> bool:
+    """Whether a tool's annotations mark it as destructive or not idempotent.
+
+    Tools without annotations, and read-only tools, are not considered serial.
+    """
+    if annotations is None or annotations.readOnlyHint:
+        return False
+    return annotations.destructiveHint is True or annotations.idempotentHint is False
+
+
+class ToolCallScheduler:
+    """Admits tool calls in the order they are made, bounding concurrency per server.
+
+    Shared calls run concurrently, up to ``max_per_server`` at a time for the
+    same server. An exclusive call waits for every call made before it and
+    every call made after it waits for it, so it runs alone and in order.
+    """
+
+    def __init__(self, max_per_server: int | None = None) -> None:
+        """Initialize a new tool call scheduler.
+
+        Args:
+            max_per_server: Maximum number of concurrent calls to a server, None for no limit.
+        """
+        if max_per_server is not None and max_per_server < 1:
+            raise ValueError("max_per_server must be at least 1")
+        self.max_per_server = max_per_server
+        self._semaphores: dict[Any, asyncio.Semaphore] = {}
+        self._last_exclusive: asyncio.Future | None = None
+        self._shared: set[asyncio.Future] = set()
+
+    @asynccontextmanager
+    async def slot(self, server: Any = None, exclusive: bool = False) -> AsyncIterator[None]:
+        """Wait for the turn of a tool call.
+
+        The call's place in line is taken before the first suspension point,
+        so calls started in order by ``asyncio.gather`` are admitted in order.
+
+        Args:
+            server: Key of the server the call goes to, None for local tools that are not bounded.
+            exclusive: Whether the call must run alone.
+        """
+        done = asyncio.get_running_loop().create_future()
+        if exclusive:
+            wait_for = [self._last_exclusive, *self._shared]
+            self._last_exclusive = done
+            self._shared = set()
+        else:
+            wait_for = [self._last_exclusive]
+            self._shared.add(done)
+        try:
+            for future in wait_for:
+                if future is not None:
+                    await asyncio.shield(future)
+            semaphore = self._semaphore(server)
+            if semaphore is None:
+                yield
+            else:
+                async with semaphore:
+                    yield
+        finally:
+            done.set_result(None)
+            self._shared.discard(done)
+            if self._last_exclusive is done:
+                self._last_exclusive = None
+
+    def _semaphore(self, server: Any) -> asyncio.Semaphore | None:
+        if server is None or self.max_per_server is None:
+            return None
+        if server not in self._semaphores:
+            self._semaphores[server] = asyncio.Semaphore(self.max_per_server)
+        return self._semaphores[server]
+
+
+class MCPAgentExecutor(AgentExecutor):
+    """Agent executor scheduling the concurrent tool calls of a step.
+
+    LangChain already runs the tool calls of a step with ``asyncio.gather``,
+    keeping their order in the intermediate steps. This executor adds a bound
+    on the calls in flight to each server and, when ``serial_destructive_tools``
+    is set, runs the tools annotated as destructive or not idempotent one at a
+    time, after the calls before them.
+    """
+
+    max_tool_calls_per_server: int | None = None
+    serial_destructive_tools: bool = False
+    _scheduler: ToolCallScheduler | None = PrivateAttr(default=None)
+
+    @property
+    def scheduler(self) -> ToolCallScheduler:
+        """The scheduler of the executor's tool calls."""
+        if self._scheduler is None:
+            self._scheduler = ToolCallScheduler(self.max_tool_calls_per_server)
+        return self._scheduler
+
+    def _is_serial(self, tool: BaseTool | None) -> bool:
+        return self.serial_destructive_tools and is_serial_tool(getattr(tool, "tool_annotations", None))
+
+    async def _aperform_agent_action(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        agent_action: AgentAction,
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AgentStep:
+        tool = name_to_tool_map.get(agent_action.tool)
+        exclusive = self._is_serial(tool)
+        if exclusive:
+            logger.debug(f"Running tool '{agent_action.tool}' on its own: it is destructive or not idempotent")
+        async with self.scheduler.slot(getattr(tool, "tool_connector", None), exclusive=exclusive):
+            return await super()._aperform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
@@ -0,0 +1,232 @@
+"""
+Token-budgeted compaction of the conversation history.
+
+This module provides a compactor fitting the chat history given to the LLM
+into a token budget: recent turns are kept verbatim, large tool results of
+older turns are dropped, and older turns are folded into rolling summaries
+written in the background.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from ..adapters.results import BYTES_PER_TOKEN
+from ..logging import logger
+
+# Tokens added by the chat format around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+SUMMARY_INSTRUCTIONS = (
+    "Summarize the conversation below for an assistant that will continue it. Keep the facts, decisions, "
+    "names, identifiers and open questions; leave out pleasantries and tool output details. Start from the "
+    "previous summary, if any, and fold the new turns into it. Answer with the summary only."
+)
+
+
+def estimate_tokens(messages: Sequence[BaseMessage]) -> int:
+    """Estimate the number of tokens of messages, at 4 bytes per token.
+
+    Args:
+        messages: The messages.
+
+    Returns:
+        The estimated number of tokens, including the tool calls of AI messages.
+    """
+    total = 0
+    for message in messages:
+        size = len(_message_text(message).encode("utf-8"))
+        tool_calls = getattr(message, "tool_calls", None)
+        if tool_calls:
+            size += len(json.dumps(tool_calls, default=str))
+        total += math.ceil(size / BYTES_PER_TOKEN) + MESSAGE_OVERHEAD_TOKENS
+    return total
+
+
+def _message_text(message: BaseMessage) -> str:
+    return message.content if isinstance(message.content, str) else json.dumps(message.content, default=str)
+
+
+def split_turns(messages: Sequence[BaseMessage]) -> list[list[BaseMessage]]:
+    """Split messages into turns, each starting at a human message.
+
+    Args:
+        messages: The messages of a conversation.
+
+    Returns:
+        The turns, in order. Messages before the first human message form a turn of their own.
+    """
+    turns: list[list[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+class HistoryCompactor:
+    """Fits the chat history of a run into a token budget.
+
+    Histories within the budget are returned unchanged. Larger histories keep
+    their last ``keep_recent_turns`` turns verbatim. In the older turns, tool
+    results over ``max_observation_tokens`` are replaced by a short marker, and
+    the oldest turns are folded into a summary.
+
+    Summaries are written by the ``summarizer`` LLM in a background task, so
+    compaction never waits for them: until the summary of the older turns is
+    ready, the oldest turns that do not fit are left out. Each summary folds
+    the previous one with the turns that followed it, and is cached by the
+    content of the turns it covers, so one compactor serves many conversations.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        keep_recent_turns: int = 4,
+        max_observation_tokens: int = 500,
+        summarizer: BaseLanguageModel | None = None,
+        token_counter: Callable[[Sequence[BaseMessage]], int] | None = None,
+        max_summaries: int = 256,
+    ) -> None:
+        """Initialize a new history compactor.
+
+        Args:
+            max_tokens: Token budget of the chat history.
+            keep_recent_turns: Number of recent turns always kept verbatim.
+            max_observation_tokens: Maximum size in tokens of a tool result in the older turns.
+            summarizer: LLM writing the summaries of the older turns, None to only drop them.
+            token_counter: Function counting the tokens of messages, estimated at 4 bytes
+                per token by default.
+            max_summaries: Maximum number of cached summaries.
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        self.max_tokens = max_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self.max_observation_tokens = max_observation_tokens
+        self.summarizer = summarizer
+        self.count_tokens = token_counter or estimate_tokens
+        self.max_summaries = max_summaries
+        # Summary text by fingerprint of the turns it covers
+        self._summaries: OrderedDict[str, str] = OrderedDict()
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def compact(self, history: Sequence[BaseMessage]) -> list[BaseMessage]:
+        """Fit a chat history into the token budget.
+
+        Args:
+            history: The chat history. System messages are left out.
+
+        Returns:
+            The compacted history: a summary of the older turns, if any, then the
+            older turns that fit, then the recent turns.
+        """
+        messages = [message for message in history if not isinstance(message, SystemMessage)]
+        if self.count_tokens(messages) <= self.max_tokens:
+            return messages
+
+        turns = split_turns(messages)
+        split = max(len(turns) - self.keep_recent_turns, 0)
+        older, recent = turns[:split], [message for turn in turns[split:] for message in turn]
+        fingerprints = self._fingerprints(older)
+
+        # Start from the summary covering the most older turns
+        covered, summary = 0, None
+        for count in range(len(older), 0, -1):
+            summary = self._summaries.get(fingerprints[count - 1])
+            if summary is not None:
+                self._summaries.move_to_end(fingerprints[count - 1])
+                covered = count
+                break
+        head = [HumanMessage(content=SUMMARY_PREFIX + summary)] if summary else []
+
+        # Leave out the oldest turns not covered by the summary until the history fits
+        rest = [self._drop_large_observations(turn) for turn in older[covered:]]
+        sizes = [self.count_tokens(turn) for turn in rest]
+        total = self.count_tokens(head) + sum(sizes) + self.count_tokens(recent)
+        dropped = 0
+        while dropped < len(rest) and total > self.max_tokens:
+            total -= sizes[dropped]
+            dropped += 1
+        rest = rest[dropped:]
+
+        if dropped:
+            logger.debug(f"History over {self.max_tokens} tokens: left out {dropped} older turns")
+            self._schedule_summary(fingerprints[-1], summary, older[covered:])
+        return head + [message for turn in rest for message in turn] + recent
+
+    async def wait(self) -> None:
+        """Wait for the summaries being written."""
+        while self._pending:
+            await asyncio.gather(*self._pending.values(), return_exceptions=True)
+
+    def clear(self) -> None:
+        """Forget the cached summaries and cancel the ones being written."""
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._summaries.clear()
+
+    def _drop_large_observations(self, turn: list[BaseMessage]) -> list[BaseMessage]:
+        """Replace the tool results over the observation budget by a marker."""
+        compacted = []
+        for message in turn:
+            if isinstance(message, ToolMessage):
+                tokens = self.count_tokens([message])
+                if tokens > self.max_observation_tokens:
+                    marker = f"[Tool result of about {tokens} tokens left out of the history]"
+                    message = message.model_copy(update={"content": marker})
+            compacted.append(message)
+        return compacted
+
+    @staticmethod
+    def _fingerprints(turns: list[list[BaseMessage]]) -> list[str]:
+        """Fingerprint each prefix of the turns, by the content of their messages."""
+        digest = hashlib.sha256()
+        fingerprints = []
+        for turn in turns:
+            for message in turn:
+                digest.update(message.type.encode())
+                digest.update(_message_text(message).encode("utf-8", errors="replace"))
+                digest.update(json.dumps(getattr(message, "tool_calls", None), default=str).encode())
+            fingerprints.append(digest.hexdigest())
+        return fingerprints
+
+    def _schedule_summary(self, fingerprint: str, previous: str | None, turns: list[list[BaseMessage]]) -> None:
+        """Start writing the summary of the older turns in the background, once."""
+        if self.summarizer is None or fingerprint in self._pending or fingerprint in self._summaries:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._summarize(fingerprint, previous, turns))
+        except RuntimeError:
+            # No running event loop: the older turns stay left out
+            return
+        self._pending[fingerprint] = task
+
+    async def _summarize(self, fingerprint: str, previous: str | None, turns: list[list[BaseMessage]]) -> None:
+        """Write the summary of the older turns, folding the previous summary."""
+        lines = [f"Previous summary:\n{previous}\n"] if previous else []
+        for turn in turns:
+            for message in self._drop_large_observations(turn):
+                lines.append(f"{message.type}: {_message_text(message)}")
+        try:
+            response = await self.summarizer.ainvoke(
+                [SystemMessage(content=SUMMARY_INSTRUCTIONS), HumanMessage(content="\n".join(lines))]
+            )
+            text = _message_text(response) if isinstance(response, BaseMessage) else str(response)
+            self._summaries[fingerprint] = text
+            while len(self._summaries) > self.max_summaries:
+                self._summaries.popitem(last=False)
+            logger.debug(f"Summarized {len(turns)} older turns of the history")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to summarize the history: {e}")
+        finally:
+            self._pending.pop(fingerprint, None)
@@ -5,18 +5,22 @@ This module provides the main MCPAgent class that integrates all components
 to provide a simple interface for using MCP tools with different LLMs.
 """
 
+import asyncio
 import logging
 import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, AsyncIterator
 from typing import TypeVar
 
 from langchain.agents import AgentExecutor, create_tool_calling_agent
+from langchain.agents.format_scratchpad.tools import format_to_tool_messages
 from langchain.agents.output_parsers.tools import ToolAgentAction
 from langchain.globals import set_debug
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.schema import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain.schema.language_model import BaseLanguageModel
 from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.callbacks.manager import adispatch_custom_event
 from langchain_core.exceptions import OutputParserException
 from langchain_core.runnables.schema import StreamEvent
 from langchain_core.tools import BaseTool
@@ -28,22 +32,39 @@ from mcp_use.connectors.base import BaseConnector
 from mcp_use.telemetry.telemetry import Telemetry
 from mcp_use.telemetry.utils import extract_model_info
 
+from ..adapters.base import ToolHandle
 from ..adapters.langchain_adapter import LangChainAdapter
+from ..adapters.rendering import FULL, SCHEMA_LEVELS, ToolRenderer, definition_tokens
+from ..artifacts import ArtifactStore
+from ..connectors.timeouts import run_deadline
+from ..conversations import ConversationStore, MemoryConversationStore
 from ..logging import logger
 from ..managers.base import BaseServerManager
 from ..managers.server_manager import ServerManager
 
 # Import observability manager
 from ..observability import ObservabilityManager
+from .context import RunContext
+from .executor import MCPAgentExecutor
+from .history import HistoryCompactor, estimate_tokens
+from .native import NativeAgentExecutor
 from .prompts.system_prompt_builder import create_system_message
 from .prompts.templates import DEFAULT_SYSTEM_PROMPT_TEMPLATE, SERVER_MANAGER_SYSTEM_PROMPT_TEMPLATE
 from .remote import RemoteAgent
+from .tool_selection import ToolMap, ToolSelector, materialize_tools
 
 set_debug(logger.level == logging.DEBUG)
 
 # Type variable for structured output
 T = TypeVar("T", bound=BaseModel)
 
+EXECUTOR_ENGINE = "executor"
+NATIVE_ENGINE = "native"
+ENGINES = (EXECUTOR_ENGINE, NATIVE_ENGINE)
+
+# Number of system messages and executors kept for reuse by an agent
+AGENT_CACHE_SIZE = 32
+
 
 class MCPAgent:
     """Main class for using MCP tools with various LLM providers.
@@ -75,6 +96,16 @@ class MCPAgent:
         chat_id: str | None = None,
         retry_on_error: bool = True,
         max_retries_per_step: int = 2,
+        max_tool_result_tokens: int | None = None,
+        artifact_store: ArtifactStore | None = None,
+        max_tool_calls_per_server: int | None = None,
+        serial_destructive_tools: bool = False,
+        engine: str = "executor",
+        max_history_tokens: int | None = None,
+        conversation_store: ConversationStore | None = None,
+        history_window: int | None = 100,
+        tool_selector: ToolSelector | None = None,
+        tool_schema_level: str = FULL,
     ):
         """Initialize a new MCPAgent instance.
 
@@ -96,6 +127,27 @@ class MCPAgent:
             callbacks: List of LangChain callbacks to use. If None and Langfuse is configured, uses langfuse_handler.
             retry_on_error: Whether to retry tool calls that fail due to validation errors.
             max_retries_per_step: Maximum number of retries for validation errors per step.
+            max_tool_result_tokens: Maximum size in tokens (estimated) of a tool result given to
+                the LLM. Larger results are truncated and saved in full to a temporary file.
+            artifact_store: Optional store for images and binary resources returned by tools,
+                which the agent then sees as compact references it can read with read_artifact.
+            max_tool_calls_per_server: Maximum number of tool calls of a step running concurrently
+                on the same server, None for no limit.
+            serial_destructive_tools: Whether to run the tools annotated as destructive or not
+                idempotent one at a time, in order, instead of concurrently with the step's other calls.
+            engine: The agent loop: "executor" for LangChain's AgentExecutor, or "native" for a
+                lighter loop calling the LLM with bound tools directly.
+            max_history_tokens: Token budget of the conversation history given to the LLM, None for no
+                limit. Over the budget, recent turns are kept verbatim and older turns are summarized.
+            conversation_store: Store of the conversations of the runs given a conversation ID, kept
+                in memory by default.
+            history_window: Maximum number of trailing messages of a stored conversation loaded
+                for a run, None to load whole conversations.
+            tool_selector: Selector showing the LLM only the tools relevant to each step, instead of
+                every tool. Not used in server manager mode, where servers are selected instead.
+            tool_schema_level: Rendering of the tool definitions given to the LLM: "full" as LangChain
+                renders them, "compact" without titles, trivial anyOf and duplicate definitions, or
+                "minimal" with truncated descriptions as well.
         """
         # Handle remote execution
         if agent_id is not None:
@@ -107,6 +159,10 @@ class MCPAgent:
         self._remote_agent = None
 
         # Validate requirements for local execution
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown agent engine '{engine}', expected one of {ENGINES}")
+        if tool_schema_level not in SCHEMA_LEVELS:
+            raise ValueError(f"Unknown tool schema level '{tool_schema_level}', expected one of {SCHEMA_LEVELS}")
         if llm is None:
             raise ValueError("llm is required for local execution. For remote execution, provide agent_id instead.")
 
@@ -117,6 +173,7 @@ class MCPAgent:
         self.auto_initialize = auto_initialize
         self.memory_enabled = memory_enabled
         self._initialized = False
+        self._init_lock = asyncio.Lock()
         self._conversation_history: list[BaseMessage] = []
         self.disallowed_tools = disallowed_tools or []
         self.tools_used_names = tools_used_names or []
@@ -125,6 +182,22 @@ class MCPAgent:
         self.verbose = verbose
         self.retry_on_error = retry_on_error
         self.max_retries_per_step = max_retries_per_step
+        self.max_tool_calls_per_server = max_tool_calls_per_server
+        self.serial_destructive_tools = serial_destructive_tools
+        self.engine = engine
+        # Memory of the runs given a conversation ID
+        self.conversation_store = conversation_store if conversation_store is not None else MemoryConversationStore()
+        self.history_window = history_window
+        # Selection of the tools shown at each step
+        self.tool_selector = tool_selector
+        if tool_selector and use_server_manager:
+            logger.warning("⚠️ The tool selector is not used in server manager mode")
+        # Compact rendering of the tool definitions, cached per tool
+        self.tool_renderer = ToolRenderer(tool_schema_level) if tool_schema_level != FULL else None
+        # Compaction of the history, summarizing older turns with the agent's LLM
+        self.history_compactor = (
+            HistoryCompactor(max_history_tokens, summarizer=llm) if max_history_tokens is not None else None
+        )
         # System prompt configuration
         self.system_prompt = system_prompt  # User-provided full prompt override
         # User can provide a template override, otherwise use the imported default
@@ -140,7 +213,11 @@ class MCPAgent:
             raise ValueError("Either client or connector must be provided")
 
         # Create the adapter for tool conversion
-        self.adapter = LangChainAdapter(disallowed_tools=self.disallowed_tools)
+        self.adapter = LangChainAdapter(
+            disallowed_tools=self.disallowed_tools,
+            max_result_tokens=max_tool_result_tokens,
+            artifact_store=artifact_store,
+        )
 
         # Initialize telemetry
         self.telemetry = Telemetry()
@@ -151,9 +228,14 @@ class MCPAgent:
             self.server_manager = ServerManager(self.client, self.adapter)
 
         # State tracking - initialize _tools as empty list
-        self._agent_executor: AgentExecutor | None = None
+        self._agent_executor: AgentExecutor | NativeAgentExecutor | None = None
         self._system_message: SystemMessage | None = None
         self._tools: list[BaseTool] = []
+        # Handles of the tools the selector chooses from, built only once selected or called
+        self._tool_handles: list[ToolHandle | BaseTool] = []
+        # System messages and executors already built, keyed by fingerprint, least recently used first
+        self._system_messages: OrderedDict[tuple, SystemMessage] = OrderedDict()
+        self._executors: OrderedDict[tuple, AgentExecutor | NativeAgentExecutor] = OrderedDict()
 
         # Track model info for telemetry
         self._model_provider, self._model_name = extract_model_info(self.llm)
@@ -185,9 +267,13 @@ class MCPAgent:
                     self.connectors = [session.connector for session in self._sessions.values()]
                     logger.info(f"✅ Created {len(self._sessions)} new sessions")
 
-                # Create LangChain tools directly from the client using the adapter
-                self._tools = await self.adapter.create_tools(self.client)
-                logger.info(f"🛠️ Created {len(self._tools)} LangChain tools from client")
+                if self.tool_selector:
+                    # Only the selected tools are built: their search needs just the names and descriptions
+                    self._tool_handles = await self.adapter.create_tool_handles(self.client)
+                else:
+                    # Create LangChain tools directly from the client using the adapter
+                    self._tools = await self.adapter.create_tools(self.client)
+                    logger.info(f"🛠️ Created {len(self._tools)} LangChain tools from client")
             else:
                 # Using direct connector - only establish connection
                 # LangChainAdapter will handle initialization
@@ -197,56 +283,180 @@ class MCPAgent:
                     if not hasattr(connector, "client_session") or connector.client_session is None:
                         await connector.connect()
 
-                # Create LangChain tools using the adapter with connectors
-                self._tools = await self.adapter._create_tools_from_connectors(connectors_to_use)
-                logger.info(f"🛠️ Created {len(self._tools)} LangChain tools from connectors")
+                if self.tool_selector:
+                    # Only the selected tools are built: their search needs just the names and descriptions
+                    self._tool_handles = await self.adapter._create_handles_from_connectors(connectors_to_use)
+                else:
+                    # Create LangChain tools using the adapter with connectors
+                    self._tools = await self.adapter._create_tools_from_connectors(connectors_to_use)
+                    logger.info(f"🛠️ Created {len(self._tools)} LangChain tools from connectors")
+
+            if self.tool_selector:
+                if self.adapter.artifact_store is not None:
+                    self._tool_handles.append(self.adapter.create_artifact_tool())
+                await self.tool_selector.index(self._tool_handles)
+                # The pinned tools are shown at every step, the others are built once selected
+                pinned_tools = self.tool_selector.pinned_tools
+                self._tools = materialize_tools(tool for tool in self._tool_handles if tool.name in pinned_tools)
+                logger.info(f"🛠️ Listed {len(self._tool_handles)} tools, built when selected")
 
             # Get all tools for system message generation
-            all_tools = self._tools
+            all_tools = self._tool_handles or self._tools
             logger.info(f"🧰 Found {len(all_tools)} tools across all connectors")
 
             # Create the system message based on available tools
             await self._create_system_message_from_tools(all_tools)
 
+        if self.tool_renderer:
+            report = self.tool_renderer.report(self._tools)
+            logger.info(
+                f"🗜️ Rendered {report['tools']} tool definitions at the {self.tool_renderer.level} level: "
+                f"~{report['tokens']} tokens, ~{report['tokens_saved']} saved"
+            )
+
         # Create the agent
         self._agent_executor = self._create_agent()
         self._initialized = True
         logger.info("✨ Agent initialization complete")
 
-    async def _create_system_message_from_tools(self, tools: list[BaseTool]) -> None:
-        """Create the system message based on provided tools using the builder."""
+    async def _ensure_initialized(self) -> bool:
+        """Initialize the agent unless it already is.
+
+        Concurrent runs of an agent that is not initialized yet wait for a
+        single initialization.
+
+        Returns:
+            True if this call initialized the agent.
+        """
+        if self._initialized:
+            return False
+        async with self._init_lock:
+            if self._initialized:
+                return False
+            await self.initialize()
+            return True
+
+    def _build_system_message(self, tools: list[ToolHandle | BaseTool]) -> SystemMessage:
+        """Build the system message for the given tools, or their handles, using the builder.
+
+        Messages are memoized by a fingerprint of the template, instructions,
+        disallowed tools and the names and descriptions of the tools in order,
+        so the same tools get the same message back without rebuilding it.
+        """
         # Use the override if provided, otherwise use the imported default
         default_template = self.system_prompt_template_override or DEFAULT_SYSTEM_PROMPT_TEMPLATE
         # Server manager template is now also imported
         server_template = SERVER_MANAGER_SYSTEM_PROMPT_TEMPLATE
 
+        key = (
+            server_template if self.use_server_manager else default_template,
+            self.system_prompt,
+            self.additional_instructions,
+            tuple(self.disallowed_tools or ()),
+            self._renderer_key(),
+            tuple((tool.name, tool.description) for tool in tools),
+        )
+        if key in self._system_messages:
+            self._system_messages.move_to_end(key)
+            return self._system_messages[key]
+
         # Delegate creation to the imported function
-        self._system_message = create_system_message(
+        message = create_system_message(
             tools=tools,
             system_prompt_template=default_template,
             server_manager_template=server_template,  # Pass the imported template
             use_server_manager=self.use_server_manager,
             disallowed_tools=self.disallowed_tools,
             user_provided_prompt=self.system_prompt,
+            describe=self.tool_renderer.describe if self.tool_renderer else None,
             additional_instructions=self.additional_instructions,
         )
+        self._remember(self._system_messages, key, message)
+        return message
+
+    def _renderer_key(self) -> tuple | None:
+        """Get the settings of the tool renderer that change the rendered tools, if any."""
+        if not self.tool_renderer:
+            return None
+        renderer = self.tool_renderer
+        return (renderer.level, renderer.max_description_chars, renderer.max_property_description_chars)
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: tuple, value) -> None:
+        """Add a value to one of the agent's caches, dropping the least recently used beyond its size."""
+        cache[key] = value
+        while len(cache) > AGENT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    async def _create_system_message_from_tools(self, tools: list[ToolHandle | BaseTool]) -> None:
+        """Create the system message based on provided tools using the builder."""
+        self._system_message = self._build_system_message(tools)
 
         # Update conversation history if memory is enabled
         if self.memory_enabled:
             history_without_system = [msg for msg in self._conversation_history if not isinstance(msg, SystemMessage)]
             self._conversation_history = [self._system_message] + history_without_system
 
-    def _create_agent(self) -> AgentExecutor:
+    def _create_agent(
+        self, tools: list[BaseTool] | None = None, system_message: SystemMessage | None = None
+    ) -> AgentExecutor | NativeAgentExecutor:
         """Create the LangChain agent with the configured system message.
 
+        Executors are memoized by their system message and the identity of their
+        tools, in order, so switching back to the tools of a previous step, such
+        as those of a server activated before, reuses its executor. Executors are
+        shared by the runs using the same tools: callers copy them to change them.
+
+        Args:
+            tools: Tools of the agent, the agent's tools by default.
+            system_message: System message of the agent, the agent's system message by default.
+
         Returns:
-            An initialized AgentExecutor.
+            An initialized AgentExecutor, or NativeAgentExecutor with the native engine.
         """
-        logger.debug(f"Creating new agent with {len(self._tools)} tools")
+        tools = self._tools if tools is None else tools
+        system_message = system_message or self._system_message
+        # The cached executor holds its tools, so their ids are not reused while it is cached
+        key = (
+            system_message.content if system_message else None,
+            self._renderer_key(),
+            self.max_steps,
+            tuple(id(tool) for tool in tools),
+        )
+        if key in self._executors:
+            self._executors.move_to_end(key)
+            logger.debug(f"Reusing agent with {len(tools)} tools")
+            return self._executors[key]
+        executor = self._build_agent(tools, system_message)
+        self._remember(self._executors, key, executor)
+        return executor
+
+    def _build_agent(
+        self, tools: list[BaseTool], system_message: SystemMessage | None
+    ) -> AgentExecutor | NativeAgentExecutor:
+        """Build a new executor for the given tools and system message."""
+        logger.debug(f"Creating new agent with {len(tools)} tools")
+
+        # The LLM is given the compact definitions of the tools, if any; the tools themselves are still called
+        tool_definitions = self.tool_renderer.render_all(tools) if self.tool_renderer else None
 
         system_content = "You are a helpful assistant"
-        if self._system_message:
-            system_content = self._system_message.content
+        if system_message:
+            system_content = system_message.content
+
+        if self.engine == NATIVE_ENGINE:
+            logger.info(f"🧠 Native agent loop ready with tools: {', '.join(tool.name for tool in tools)}")
+            return NativeAgentExecutor(
+                llm=self.llm,
+                tools=tools,
+                tool_definitions=tool_definitions,
+                system_message=system_content,
+                max_iterations=self.max_steps,
+                verbose=self.verbose,
+                callbacks=self.callbacks,
+                max_tool_calls_per_server=self.max_tool_calls_per_server,
+                serial_destructive_tools=self.serial_destructive_tools,
+            )
 
         prompt = ChatPromptTemplate.from_messages(
             [
@@ -257,34 +467,50 @@ class MCPAgent:
             ]
         )
 
-        tool_names = [tool.name for tool in self._tools]
+        tool_names = [tool.name for tool in tools]
         logger.info(f"🧠 Agent ready with tools: {', '.join(tool_names)}")
 
         # Use the standard create_tool_calling_agent
-        agent = create_tool_calling_agent(llm=self.llm, tools=self._tools, prompt=prompt)
+        agent = create_tool_calling_agent(llm=self.llm, tools=tool_definitions or tools, prompt=prompt)
 
-        # Use the standard AgentExecutor with callbacks
-        executor = AgentExecutor(
+        # Use an AgentExecutor scheduling the concurrent tool calls of each step
+        executor = MCPAgentExecutor(
             agent=agent,
-            tools=self._tools,
+            tools=tools,
             max_iterations=self.max_steps,
             verbose=self.verbose,
             callbacks=self.callbacks,
+            max_tool_calls_per_server=self.max_tool_calls_per_server,
+            serial_destructive_tools=self.serial_destructive_tools,
         )
         logger.debug(f"Created agent executor with max_iterations={self.max_steps} and {len(self.callbacks)} callbacks")
         return executor
 
-    def get_conversation_history(self) -> list[BaseMessage]:
+    def get_conversation_history(self, conversation_id: str | None = None) -> list[BaseMessage]:
         """Get the current conversation history.
 
+        Args:
+            conversation_id: ID of a stored conversation, None for the agent's own history.
+
         Returns:
             The list of conversation messages.
         """
+        if conversation_id is not None:
+            return self.conversation_store.load(conversation_id)
         return self._conversation_history
 
-    def clear_conversation_history(self) -> None:
-        """Clear the conversation history."""
+    def clear_conversation_history(self, conversation_id: str | None = None) -> None:
+        """Clear the conversation history.
+
+        Args:
+            conversation_id: ID of a stored conversation to delete, None for the agent's own history.
+        """
+        if conversation_id is not None:
+            self.conversation_store.delete(conversation_id)
+            return
         self._conversation_history = []
+        if self.history_compactor:
+            self.history_compactor.clear()
 
         # Re-add the system message if it exists
         if self._system_message and self.memory_enabled:
@@ -299,6 +525,124 @@ class MCPAgent:
         if self.memory_enabled:
             self._conversation_history.append(message)
 
+    async def _report_prompt_tokens(self, context: RunContext, inputs: dict, run_manager=None) -> None:
+        """Record the estimated size in tokens of the prompt of the next step.
+
+        The size covers the system message, chat history, input and the tool
+        calls and results of the previous steps. It is logged, kept in the run
+        context and sent to the callbacks as a ``prompt_tokens`` custom event.
+        """
+        messages = [context.system_message] if context.system_message else []
+        messages += [*inputs["chat_history"], HumanMessage(content=inputs["input"])]
+        messages += format_to_tool_messages(context.intermediate_steps)
+        count_tokens = self.history_compactor.count_tokens if self.history_compactor else estimate_tokens
+        tokens = count_tokens(messages)
+        context.prompt_tokens.append(tokens)
+        logger.info(f"📏 Prompt of step {len(context.prompt_tokens)}: ~{tokens} tokens")
+        if run_manager:
+            data = {"step": len(context.prompt_tokens), "tokens": tokens}
+            await adispatch_custom_event("prompt_tokens", data, config={"callbacks": run_manager.get_child()})
+
+    async def _select_step_tools(self, context: RunContext, run_manager=None) -> None:
+        """Narrow the tools of the next step to the relevant ones.
+
+        The run's executor is recreated, with a system message listing only the
+        selected tools, when the selection changes. Only the selected tools are
+        built from their handles. The estimated prompt tokens saved are logged,
+        kept in the run context and sent to the callbacks as a ``tool_selection``
+        custom event. Tool calls are still resolved against all the run's tools.
+        """
+        selected = await self.tool_selector.select(context.tools, context.query, context.intermediate_steps)
+        if [tool.name for tool in selected] != [tool.name for tool in context.step_tools]:
+            context.step_tools = materialize_tools(selected)
+            context.system_message = self._build_system_message(context.step_tools)
+            context.executor = self._create_agent(context.step_tools, context.system_message)
+
+        all_tokens = self._tool_tokens(context.tools) + estimate_tokens([self._system_message])
+        step_tokens = self._tool_tokens(selected) + estimate_tokens([context.system_message])
+        saved = all_tokens - step_tokens
+        context.tool_tokens_saved.append(saved)
+        logger.info(f"🎯 Showing {len(selected)} of {len(context.tools)} tools: ~{saved} prompt tokens saved")
+        if run_manager:
+            data = {"step": context.steps_taken, "tools": [tool.name for tool in selected], "tokens_saved": saved}
+            await adispatch_custom_event("tool_selection", data, config={"callbacks": run_manager.get_child()})
+
+    def _tool_tokens(self, tools: list[ToolHandle | BaseTool]) -> int:
+        """Estimate the prompt tokens of the definitions of tools, as bound to the LLM.
+
+        Tools given as handles are estimated from their MCP input schemas, without rendering them.
+        """
+        if self.tool_renderer and not any(isinstance(tool, ToolHandle) for tool in tools):
+            return sum(definition_tokens(definition) for definition in self.tool_renderer.render_all(tools))
+        return self.tool_selector.tokens(tools)
+
+    async def _take_next_step(
+        self, context: RunContext, **kwargs
+    ) -> AgentFinish | list[tuple[AgentAction, str]] | None:
+        """Take the next step of a run with its executor, within the run's deadline.
+
+        The tool calls of the step get at most the time left before the deadline.
+        At the deadline the step is cancelled, which cancels its tool calls and
+        notifies their servers.
+
+        Args:
+            context: The run's context.
+            **kwargs: The arguments of the executor's ``_atake_next_step``.
+
+        Returns:
+            The output of the step, or None if the deadline passed, with ``context.timed_out`` set.
+        """
+        if context.deadline is None:
+            return await context.executor._atake_next_step(**kwargs)
+        if asyncio.get_running_loop().time() >= context.deadline:
+            context.timed_out = True
+            return None
+        deadline = asyncio.timeout_at(context.deadline)
+        try:
+            with run_deadline(context.deadline):
+                async with deadline:
+                    return await context.executor._atake_next_step(**kwargs)
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            context.timed_out = True
+            return None
+
+    @staticmethod
+    def _timeout_result(context: RunContext) -> str:
+        """Get the partial result of a run stopped at its deadline: the tool calls it completed."""
+        result = f"Agent stopped after reaching the time limit ({context.timeout:g}s)."
+        if not context.intermediate_steps:
+            return result
+        lines = [f"{result} Completed tool calls:"]
+        for action, observation in context.intermediate_steps:
+            observation = str(observation).replace("\n", " ")
+            if len(observation) > 200:
+                observation = observation[:197] + "..."
+            lines.append(f"- {action.tool}({action.tool_input}): {observation}")
+        return "\n".join(lines)
+
+    async def _load_run_history(self, conversation_id: str | None) -> list[BaseMessage]:
+        """Load the history of a run: the trailing window of its conversation, or the agent's own history."""
+        if conversation_id is None:
+            return list(self._conversation_history)
+        if not self.memory_enabled:
+            return []
+        return await asyncio.to_thread(self.conversation_store.load, conversation_id, self.history_window)
+
+    async def _commit_run_history(self, context: RunContext) -> None:
+        """Add the messages of a run to the conversation history in one go.
+
+        Runs commit before yielding their final result, since callers usually
+        stop iterating the stream there.
+        """
+        messages, context.new_messages = context.new_messages, []
+        if context.conversation_id is None:
+            for message in messages:
+                self.add_to_history(message)
+        elif self.memory_enabled and messages:
+            await asyncio.to_thread(self.conversation_store.append, context.conversation_id, messages)
+
     def get_system_message(self) -> SystemMessage | None:
         """Get the current system message.
 
@@ -396,6 +740,8 @@ class MCPAgent:
         external_history: list[BaseMessage] | None = None,
         track_execution: bool = True,
         output_schema: type[T] | None = None,
+        conversation_id: str | None = None,
+        timeout: float | None = None,
     ) -> AsyncGenerator[tuple[AgentAction, str] | str | T, None]:
         """Run the agent and yield intermediate steps as an async generator.
 
@@ -409,10 +755,15 @@ class MCPAgent:
             output_schema: Optional Pydantic BaseModel class for structured output.
                 If provided, the agent will attempt structured output at finish points
                 and continue execution if required information is missing.
+            conversation_id: Optional ID of a conversation of the conversation store, whose
+                history the run uses and extends instead of the agent's own history.
+            timeout: Optional time limit of the run in seconds. The tool calls get at most the
+                time left, and the step running at the deadline is cancelled.
 
         Yields:
             Intermediate steps as (AgentAction, str) tuples, followed by the final result.
             If output_schema is provided, yields structured output as instance of the schema.
+            A run stopped by its time limit yields a partial result listing the completed tool calls.
         """
         # Delegate to remote agent if in remote mode
         if self._is_remote and self._remote_agent:
@@ -422,11 +773,36 @@ class MCPAgent:
                 yield item
             return
 
+        context = RunContext(
+            query=query, max_steps=max_steps or self.max_steps, conversation_id=conversation_id, timeout=timeout
+        )
+        async for item in self._stream(
+            context, max_steps, manage_connector, external_history, track_execution, output_schema
+        ):
+            yield item
+
+    async def _stream(
+        self,
+        context: RunContext,
+        max_steps: int | None,
+        manage_connector: bool,
+        external_history: list[BaseMessage] | None,
+        track_execution: bool,
+        output_schema: type[T] | None,
+    ) -> AsyncGenerator[tuple[AgentAction, str] | str | T, None]:
+        """Run the agent, keeping the state of the run in its context.
+
+        The agent's tools, executor and sessions are only read, so that an
+        initialized agent can serve concurrent runs. The run's messages are
+        added to the agent's memory once it completes.
+        """
+        query = context.query
         result = ""
         initialized_here = False
-        start_time = time.time()
-        steps_taken = 0
+        start_time = context.started_at
         success = False
+        if context.timeout is not None:
+            context.deadline = asyncio.get_running_loop().time() + context.timeout
 
         # Schema-aware setup for structured output
         structured_llm = None
@@ -449,46 +825,56 @@ class MCPAgent:
 
         try:
             # Initialize if needed
-            if manage_connector and not self._initialized:
-                await self.initialize()
-                initialized_here = True
-            elif not self._initialized and self.auto_initialize:
-                await self.initialize()
-                initialized_here = True
+            if manage_connector or self.auto_initialize:
+                initialized_here = await self._ensure_initialized()
 
             # Check if initialization succeeded
             if not self._agent_executor:
                 raise RuntimeError("MCP agent failed to initialize")
 
-            steps = max_steps or self.max_steps
-            if self._agent_executor:
-                self._agent_executor.max_iterations = steps
+            # The run starts from the agent's tools and executor; the step limit is the run's own
+            steps = context.max_steps
+            context.tools = context.step_tools = self._tools
+            context.system_message = self._system_message
+            context.executor = self._agent_executor
+            if self._tool_handles:
+                # Each step selects from every tool, building the selected ones
+                context.tools, context.step_tools = self._tool_handles, []
+            if self.use_server_manager and self.server_manager:
+                # The run selects servers through its own view of the server manager
+                context.server_manager = self.server_manager.view()
+                if context.server_manager is not self.server_manager:
+                    context.tools = context.step_tools = context.server_manager.tools
+                    context.executor = self._create_agent(context.tools)
 
             display_query = query[:50].replace("\n", " ") + "..." if len(query) > 50 else query.replace("\n", " ")
             logger.info(f"💬 Received query: '{display_query}'")
 
-            # Add the user query to conversation history if memory is enabled
-            if self.memory_enabled:
-                self.add_to_history(HumanMessage(content=query))
-
-            # Use the provided history or the internal history
-            history_to_use = external_history if external_history is not None else self._conversation_history
+            # Use the provided history or a snapshot of the internal history
+            history_to_use = (
+                external_history
+                if external_history is not None
+                else await self._load_run_history(context.conversation_id)
+            )
 
             # Convert messages to format expected by LangChain agent input
             # Exclude the main system message as it's part of the agent's prompt
-            langchain_history = []
-            for msg in history_to_use:
-                if isinstance(msg, HumanMessage):
-                    langchain_history.append(msg)
-                elif isinstance(msg, AIMessage):
-                    langchain_history.append(msg)
+            context.history = [msg for msg in history_to_use if isinstance(msg, HumanMessage | AIMessage)]
+            if self.history_compactor:
+                context.history = self.history_compactor.compact(context.history)
 
-            intermediate_steps: list[tuple[AgentAction, str]] = []
-            inputs = {"input": query, "chat_history": langchain_history}
+            # Add the user query to conversation history if memory is enabled
+            if self.memory_enabled:
+                context.new_messages.append(HumanMessage(content=query))
 
-            # Construct a mapping of tool name to tool for easy lookup
-            name_to_tool_map = {tool.name: tool for tool in self._tools}
-            color_mapping = get_color_mapping([tool.name for tool in self._tools], excluded_colors=["green", "red"])
+            intermediate_steps = context.intermediate_steps
+            inputs = {"input": query, "chat_history": context.history}
+
+            # Construct a mapping of tool name to tool for easy lookup, building the tools of handles on demand
+            name_to_tool_map = (
+                ToolMap(context.tools) if self._tool_handles else {tool.name: tool for tool in context.tools}
+            )
+            color_mapping = get_color_mapping([tool.name for tool in context.tools], excluded_colors=["green", "red"])
 
             logger.info(f"🏁 Starting agent execution with max_steps={steps}")
 
@@ -509,31 +895,34 @@ class MCPAgent:
                 )
 
             for step_num in range(steps):
-                steps_taken = step_num + 1
+                context.steps_taken = step_num + 1
                 # --- Check for tool updates if using server manager ---
-                if self.use_server_manager and self.server_manager:
-                    current_tools = self.server_manager.tools
+                if context.server_manager:
+                    current_tools = context.server_manager.tools
                     current_tool_names = {tool.name for tool in current_tools}
-                    existing_tool_names = {tool.name for tool in self._tools}
+                    existing_tool_names = {tool.name for tool in context.tools}
 
                     if current_tool_names != existing_tool_names:
                         logger.info(
                             f"🔄 Tools changed before step {step_num + 1}, updating agent."
                             f"New tools: {', '.join(current_tool_names)}"
                         )
-                        self._tools = current_tools
-                        # Regenerate system message with ALL current tools
-                        await self._create_system_message_from_tools(self._tools)
-                        # Recreate the agent executor with the new tools and system message
-                        self._agent_executor = self._create_agent()
-                        self._agent_executor.max_iterations = steps
+                        context.tools = context.step_tools = current_tools
+                        # Recreate the run's executor with ALL current tools and a matching system message,
+                        # leaving the agent's own executor to the other runs
+                        context.system_message = self._build_system_message(current_tools)
+                        context.executor = self._create_agent(current_tools, context.system_message)
                         # Update maps for this iteration
-                        name_to_tool_map = {tool.name: tool for tool in self._tools}
+                        name_to_tool_map = {tool.name: tool for tool in context.tools}
                         color_mapping = get_color_mapping(
-                            [tool.name for tool in self._tools], excluded_colors=["green", "red"]
+                            [tool.name for tool in context.tools], excluded_colors=["green", "red"]
                         )
 
+                elif self.tool_selector:
+                    await self._select_step_tools(context, run_manager)
+
                 logger.info(f"👣 Step {step_num + 1}/{steps}")
+                await self._report_prompt_tokens(context, inputs, run_manager)
 
                 # --- Plan and execute the next step ---
                 try:
@@ -544,7 +933,8 @@ class MCPAgent:
                         try:
                             # Use the internal _atake_next_step which handles planning and execution
                             # This requires providing the necessary context like maps and intermediate steps
-                            next_step_output = await self._agent_executor._atake_next_step(
+                            next_step_output = await self._take_next_step(
+                                context,
                                 name_to_tool_map=name_to_tool_map,
                                 color_mapping=color_mapping,
                                 inputs=inputs,
@@ -560,6 +950,7 @@ class MCPAgent:
                                 logger.error(f"❌ Validation error during step {step_num + 1}: {e}")
                                 result = f"Agent stopped due to a validation error: {str(e)}"
                                 success = False
+                                await self._commit_run_history(context)
                                 yield result
                                 return
 
@@ -575,6 +966,9 @@ class MCPAgent:
                             # Continue to next iteration of retry loop
                             continue
 
+                    if context.timed_out:
+                        break
+
                     # Process the output
                     if isinstance(next_step_output, AgentFinish):
                         logger.info(f"✅ Agent finished at step {step_num + 1}")
@@ -593,10 +987,13 @@ class MCPAgent:
 
                                 # Add the final response to conversation history if memory is enabled
                                 if self.memory_enabled:
-                                    self.add_to_history(AIMessage(content=f"Structured result: {structured_result}"))
+                                    context.new_messages.append(
+                                        AIMessage(content=f"Structured result: {structured_result}")
+                                    )
 
                                 logger.info("✅ Structured output successful")
                                 success = True
+                                await self._commit_run_history(context)
                                 yield structured_result
                                 return
 
@@ -618,7 +1015,7 @@ class MCPAgent:
                                 # Add this as feedback and continue the loop
                                 inputs["input"] = missing_info_prompt
                                 if self.memory_enabled:
-                                    self.add_to_history(HumanMessage(content=missing_info_prompt))
+                                    context.new_messages.append(HumanMessage(content=missing_info_prompt))
 
                                 logger.info("🔄 Continuing execution to gather missing information...")
                                 continue
@@ -640,7 +1037,7 @@ class MCPAgent:
                                 reasoning_str = reasoning_str[:297] + "..."
                             logger.info(f"💭 Reasoning: {reasoning_str}")
                         tool_name = action.tool
-                        self.tools_used_names.append(tool_name)
+                        context.tools_used_names.append(tool_name)
                         tool_input_str = str(action.tool_input)
                         # Truncate long inputs for readability
                         if len(tool_input_str) > 100:
@@ -656,7 +1053,7 @@ class MCPAgent:
                     # Check for return_direct on the last action taken
                     if len(next_step_output) > 0:
                         last_step: tuple[AgentAction, str] = next_step_output[-1]
-                        tool_return = self._agent_executor._get_tool_return(last_step)
+                        tool_return = context.executor._get_tool_return(last_step)
                         if tool_return is not None:
                             logger.info(f"🏆 Tool returned directly at step {step_num + 1}")
                             result = tool_return.return_values.get("output", "No output generated")
@@ -680,14 +1077,19 @@ class MCPAgent:
                     break
 
             # --- Loop finished ---
-            if not result:
+            if context.timed_out:
+                logger.warning(f"⏱️ Agent stopped after reaching its time limit ({context.timeout:g}s)")
+                result = self._timeout_result(context)
+                if run_manager:
+                    await run_manager.on_chain_end({"output": result})
+            elif not result:
                 logger.warning(f"⚠️ Agent stopped after reaching max iterations ({steps})")
                 result = f"Agent stopped after reaching the maximum number of steps ({steps})."
                 if run_manager:
                     await run_manager.on_chain_end({"output": result})
 
-            # If structured output was requested but not achieved, attempt one final time
-            if output_schema and structured_llm and not success:
+            # If structured output was requested but not achieved, attempt one final time, unless out of time
+            if output_schema and structured_llm and not success and not context.timed_out:
                 try:
                     logger.info("🔧 Final attempt at structured output...")
                     structured_result = await self._attempt_structured_output(
@@ -696,10 +1098,11 @@ class MCPAgent:
 
                     # Add the final response to conversation history if memory is enabled
                     if self.memory_enabled:
-                        self.add_to_history(AIMessage(content=f"Structured result: {structured_result}"))
+                        context.new_messages.append(AIMessage(content=f"Structured result: {structured_result}"))
 
                     logger.info("✅ Final structured output successful")
                     success = True
+                    await self._commit_run_history(context)
                     yield structured_result
                     return
 
@@ -707,15 +1110,16 @@ class MCPAgent:
                     logger.error(f"❌ Final structured output attempt failed: {e}")
                     raise RuntimeError(f"Failed to generate structured output after {steps} steps: {str(e)}") from e
 
-            if self.memory_enabled and not output_schema:
-                self.add_to_history(AIMessage(content=result))
+            if self.memory_enabled and (not output_schema or context.timed_out):
+                context.new_messages.append(AIMessage(content=result))
 
             logger.info(f"🎉 Agent execution complete in {time.time() - start_time} seconds")
             if not success:
                 success = True
 
-            # Yield the final result (only for non-structured output)
-            if not output_schema:
+            # Yield the final result (only for non-structured output, or the partial result of a timed out run)
+            await self._commit_run_history(context)
+            if not output_schema or context.timed_out:
                 yield result
 
         except Exception as e:
@@ -726,6 +1130,8 @@ class MCPAgent:
             raise
 
         finally:
+            await self._commit_run_history(context)
+
             # Track comprehensive execution data
             execution_time_ms = int((time.time() - start_time) * 1000)
 
@@ -757,9 +1163,9 @@ class MCPAgent:
                     max_steps_used=max_steps,
                     manage_connector=manage_connector,
                     external_history_used=external_history is not None,
-                    steps_taken=steps_taken,
-                    tools_used_count=len(self.tools_used_names),
-                    tools_used_names=self.tools_used_names,
+                    steps_taken=context.steps_taken,
+                    tools_used_count=len(context.tools_used_names),
+                    tools_used_names=context.tools_used_names,
                     response=result,
                     execution_time_ms=execution_time_ms,
                     error_type=None if success else "execution_error",
@@ -778,6 +1184,8 @@ class MCPAgent:
         manage_connector: bool = True,
         external_history: list[BaseMessage] | None = None,
         output_schema: type[T] | None = None,
+        conversation_id: str | None = None,
+        timeout: float | None = None,
     ) -> str | T:
         """Run a query using the MCP tools and return the final result.
 
@@ -796,10 +1204,15 @@ class MCPAgent:
                 internal conversation history.
             output_schema: Optional Pydantic BaseModel class for structured output.
                 If provided, the agent will attempt to return an instance of this model.
+            conversation_id: Optional ID of a conversation of the conversation store, whose
+                history the run uses and extends instead of the agent's own history.
+            timeout: Optional time limit of the run in seconds. The tool calls get at most the
+                time left, and the step running at the deadline is cancelled.
 
         Returns:
             The result of running the query as a string, or if output_schema is provided,
-            an instance of the specified Pydantic model.
+            an instance of the specified Pydantic model. A run stopped by its time limit
+            returns a partial result listing the tool calls completed before the deadline.
 
         Example:
             ```python
@@ -827,8 +1240,11 @@ class MCPAgent:
         success = True
         start_time = time.time()
 
-        generator = self.stream(
-            query, max_steps, manage_connector, external_history, track_execution=False, output_schema=output_schema
+        context = RunContext(
+            query=query, max_steps=max_steps or self.max_steps, conversation_id=conversation_id, timeout=timeout
+        )
+        generator = self._stream(
+            context, max_steps, manage_connector, external_history, track_execution=False, output_schema=output_schema
         )
         error = None
         steps_taken = 0
@@ -850,8 +1266,8 @@ class MCPAgent:
                 model_name=self._model_name,
                 server_count=len(self.client.get_all_active_sessions()) if self.client else len(self.connectors),
                 server_identifiers=[connector.public_identifier for connector in self.connectors],
-                total_tools_available=len(self._tools) if self._tools else 0,
-                tools_available_names=[tool.name for tool in self._tools],
+                total_tools_available=len(self._tool_handles or self._tools),
+                tools_available_names=[tool.name for tool in self._tool_handles or self._tools],
                 max_steps_configured=self.max_steps,
                 memory_enabled=self.memory_enabled,
                 use_server_manager=self.use_server_manager,
@@ -859,8 +1275,8 @@ class MCPAgent:
                 manage_connector=manage_connector,
                 external_history_used=external_history is not None,
                 steps_taken=steps_taken,
-                tools_used_count=len(self.tools_used_names),
-                tools_used_names=self.tools_used_names,
+                tools_used_count=len(context.tools_used_names),
+                tools_used_names=context.tools_used_names,
                 response=str(result),
                 execution_time_ms=int((time.time() - start_time) * 1000),
                 error_type=error,
@@ -938,6 +1354,7 @@ class MCPAgent:
         max_steps: int | None = None,
         manage_connector: bool = True,
         external_history: list[BaseMessage] | None = None,
+        conversation_id: str | None = None,
     ) -> AsyncIterator[StreamEvent]:
         """Internal async generator yielding response chunks.
 
@@ -953,32 +1370,49 @@ class MCPAgent:
 
         # 1. Initialise on-demand ------------------------------------------------
         initialised_here = False
-        if (manage_connector and not self._initialized) or (not self._initialized and self.auto_initialize):
-            await self.initialize()
-            initialised_here = True
+        if manage_connector or self.auto_initialize:
+            initialised_here = await self._ensure_initialized()
 
         if not self._agent_executor:
             raise RuntimeError("MCP agent failed to initialise – call initialise() first?")
 
         # 2. Build inputs --------------------------------------------------------
+        # The step limit goes on a copy of the executor shared by concurrent runs
         effective_max_steps = max_steps or self.max_steps
-        self._agent_executor.max_iterations = effective_max_steps
-
-        if self.memory_enabled:
-            self.add_to_history(HumanMessage(content=query))
-
-        history_to_use = external_history if external_history is not None else self._conversation_history
+        executor = self._agent_executor.model_copy(update={"max_iterations": effective_max_steps})
+        if self.use_server_manager and self.server_manager:
+            # Servers are selected through a view of the server manager for this run
+            server_manager = self.server_manager.view()
+            if server_manager is not self.server_manager:
+                executor = self._create_agent(server_manager.tools)
+                executor = executor.model_copy(update={"max_iterations": effective_max_steps})
+        elif self._tool_handles:
+            # The steps of a streamed run share one executor: its tools are selected once, for the query
+            selected = materialize_tools(await self.tool_selector.select(self._tool_handles, query))
+            executor = self._create_agent(selected, self._build_system_message(selected))
+            executor = executor.model_copy(update={"max_iterations": effective_max_steps})
+
+        history_to_use = (
+            external_history if external_history is not None else await self._load_run_history(conversation_id)
+        )
+        if self.history_compactor:
+            history_to_use = self.history_compactor.compact(history_to_use)
         inputs = {"input": query, "chat_history": history_to_use}
+        context = RunContext(query=query, max_steps=effective_max_steps, conversation_id=conversation_id)
+        context.new_messages.append(HumanMessage(content=query))
 
         # 3. Stream & diff -------------------------------------------------------
-        async for event in self._agent_executor.astream_events(inputs):
+        async for event in executor.astream_events(inputs):
             if event.get("event") == "on_chain_end":
                 output = event["data"]["output"]
                 if isinstance(output, list):
                     for message in output:
                         if not isinstance(message, ToolAgentAction):
-                            self.add_to_history(message)
+                            context.new_messages.append(message)
             yield event
+
+        # 4. Persist the run's messages ------------------------------------------
+        await self._commit_run_history(context)
         # 5. House-keeping -------------------------------------------------------
         # Restrict agent cleanup in _generate_response_chunks_async to only occur
         #  when the agent was initialized in this generator and is not client-managed
@@ -993,9 +1427,19 @@ class MCPAgent:
         max_steps: int | None = None,
         manage_connector: bool = True,
         external_history: list[BaseMessage] | None = None,
+        conversation_id: str | None = None,
     ) -> AsyncIterator[str]:
         """Asynchronous streaming interface.
 
+        Args:
+            query: The query to run.
+            max_steps: Optional maximum number of steps to take.
+            manage_connector: Whether to handle the connector lifecycle internally.
+            external_history: Optional external history to use instead of the
+                internal conversation history.
+            conversation_id: Optional ID of a conversation of the conversation store, whose
+                history the run uses and extends instead of the agent's own history.
+
         Example::
 
             async for chunk in agent.astream("hello"):
@@ -1012,6 +1456,7 @@ class MCPAgent:
                 max_steps=max_steps,
                 manage_connector=manage_connector,
                 external_history=external_history,
+                conversation_id=conversation_id,
             ):
                 chunk_count += 1
                 if isinstance(chunk, str):
@@ -1038,8 +1483,8 @@ class MCPAgent:
                 model_name=self._model_name,
                 server_count=server_count,
                 server_identifiers=[connector.public_identifier for connector in self.connectors],
-                total_tools_available=len(self._tools) if self._tools else 0,
-                tools_available_names=[tool.name for tool in self._tools],
+                total_tools_available=len(self._tool_handles or self._tools),
+                tools_available_names=[tool.name for tool in self._tool_handles or self._tools],
                 max_steps_configured=self.max_steps,
                 memory_enabled=self.memory_enabled,
                 use_server_manager=self.use_server_manager,
@@ -1064,6 +1509,12 @@ class MCPAgent:
             # Clean up the agent first
             self._agent_executor = None
             self._tools = []
+            self._tool_handles = []
+            self._system_messages.clear()
+            self._executors.clear()
+            # Remove the tool results spilled to disk
+            if hasattr(self.adapter, "result_assembler"):
+                self.adapter.result_assembler.cleanup()
 
             # If using client with session, close the session through client
             if self.client:
@@ -1080,6 +1531,8 @@ class MCPAgent:
             # Clear adapter tool cache
             if hasattr(self.adapter, "_connector_tool_map"):
                 self.adapter._connector_tool_map = {}
+            if hasattr(self.adapter, "_connector_handle_map"):
+                self.adapter._connector_handle_map = {}
 
             self._initialized = False
             logger.info("👋 Agent closed successfully")
@@ -1090,6 +1543,7 @@ class MCPAgent:
             self._agent_executor = None
             if hasattr(self, "_tools"):
                 self._tools = []
+            self._tool_handles = []
             if hasattr(self, "_sessions"):
                 self._sessions = {}
             self._initialized = False
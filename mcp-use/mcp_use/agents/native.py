@@ -0,0 +1,205 @@
+"""
+Native agent loop calling the LLM with bound tools.
+
+This module provides a lightweight alternative to LangChain's AgentExecutor.
+It binds the tools to the LLM once and builds the message list of each step
+itself, without a prompt template or an agent runnable, and runs the tool
+calls of a step concurrently.
+"""
+
+import asyncio
+from typing import Any
+
+from langchain.agents.format_scratchpad.tools import format_to_tool_messages
+from langchain.agents.output_parsers.tools import parse_ai_message_to_tool_action
+from langchain.chains.base import Chain
+from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain_core.callbacks import AsyncCallbackManagerForChainRun, CallbackManagerForChainRun
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+
+from ..logging import logger
+from .executor import ToolCallScheduler, is_serial_tool
+
+
+class NativeAgentExecutor(Chain):
+    """Agent loop driving a tool-calling LLM directly.
+
+    Each step sends the system message, the chat history, the input and the
+    tool calls and results of the previous steps to the LLM, with the tools
+    bound once at construction. The tool calls the LLM asks for run
+    concurrently through a :class:`ToolCallScheduler`, and their results come
+    back in call order.
+
+    It exposes the same step interface as ``AgentExecutor`` (``max_iterations``,
+    ``_atake_next_step`` and ``_get_tool_return``), so ``MCPAgent`` drives
+    either one the same way.
+    """
+
+    llm: BaseLanguageModel
+    tools: list[BaseTool]
+    tool_definitions: list[dict[str, Any]] | None = None
+    system_message: str = "You are a helpful assistant"
+    max_iterations: int | None = 15
+    return_intermediate_steps: bool = False
+    max_tool_calls_per_server: int | None = None
+    serial_destructive_tools: bool = False
+
+    _llm_with_tools: Runnable | None = PrivateAttr(default=None)
+    _system: SystemMessage | None = PrivateAttr(default=None)
+    _scheduler: ToolCallScheduler | None = PrivateAttr(default=None)
+
+    @property
+    def input_keys(self) -> list[str]:
+        return ["input"]
+
+    @property
+    def output_keys(self) -> list[str]:
+        return ["output", "intermediate_steps"] if self.return_intermediate_steps else ["output"]
+
+    @property
+    def llm_with_tools(self) -> Runnable:
+        """The LLM with the tools, or their definitions if given, bound once."""
+        if self._llm_with_tools is None:
+            self._llm_with_tools = self.llm.bind_tools(self.tool_definitions or self.tools) if self.tools else self.llm
+        return self._llm_with_tools
+
+    @property
+    def scheduler(self) -> ToolCallScheduler:
+        """The scheduler of the tool calls."""
+        if self._scheduler is None:
+            self._scheduler = ToolCallScheduler(self.max_tool_calls_per_server)
+        return self._scheduler
+
+    def build_messages(
+        self, inputs: dict[str, Any], intermediate_steps: list[tuple[AgentAction, str]]
+    ) -> list[BaseMessage]:
+        """Build the messages sent to the LLM for the next step.
+
+        Args:
+            inputs: The input, and optionally the chat history.
+            intermediate_steps: The tool calls and results of the previous steps.
+
+        Returns:
+            The system message, chat history, input message, then each tool call with its result.
+        """
+        if self._system is None:
+            # The system message is a template with escaped braces: render it once
+            self._system = ChatPromptTemplate.from_messages([("system", self.system_message)]).format_messages()[0]
+        # The agent's own system message replaces any system message of the history
+        history = [message for message in inputs.get("chat_history", []) if not isinstance(message, SystemMessage)]
+        return [
+            self._system,
+            *history,
+            HumanMessage(content=inputs["input"]),
+            *format_to_tool_messages(intermediate_steps),
+        ]
+
+    async def aplan(
+        self,
+        inputs: dict[str, Any],
+        intermediate_steps: list[tuple[AgentAction, str]],
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AgentFinish | list[AgentAction]:
+        """Ask the LLM for the next tool calls or the final answer.
+
+        Raises:
+            OutputParserException: If the tool call arguments are not valid JSON.
+        """
+        message = await self.llm_with_tools.ainvoke(
+            self.build_messages(inputs, intermediate_steps),
+            config={"callbacks": run_manager.get_child() if run_manager else None},
+        )
+        return parse_ai_message_to_tool_action(message)
+
+    async def _atake_next_step(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        inputs: dict[str, Any],
+        intermediate_steps: list[tuple[AgentAction, str]],
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AgentFinish | list[tuple[AgentAction, str]]:
+        """Take one step: call the LLM, then the tools it asks for.
+
+        Returns:
+            The final answer, or the tool calls with their results in call order.
+        """
+        output = await self.aplan(inputs, intermediate_steps, run_manager)
+        if isinstance(output, AgentFinish):
+            return output
+        steps = await asyncio.gather(
+            *(self._aperform_agent_action(name_to_tool_map, color_mapping, action, run_manager) for action in output)
+        )
+        return [(step.action, step.observation) for step in steps]
+
+    async def _aperform_agent_action(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        agent_action: AgentAction,
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AgentStep:
+        """Call the tool of an action, in its turn."""
+        tool = name_to_tool_map.get(agent_action.tool)
+        exclusive = self.serial_destructive_tools and is_serial_tool(getattr(tool, "tool_annotations", None))
+        if exclusive:
+            logger.debug(f"Running tool '{agent_action.tool}' on its own: it is destructive or not idempotent")
+        async with self.scheduler.slot(getattr(tool, "tool_connector", None), exclusive=exclusive):
+            if run_manager:
+                await run_manager.on_agent_action(agent_action, verbose=self.verbose, color="green")
+            if tool is None:
+                observation = f"{agent_action.tool} is not a valid tool, try one of [{', '.join(name_to_tool_map)}]."
+            else:
+                observation = await tool.arun(
+                    agent_action.tool_input,
+                    verbose=self.verbose,
+                    color=color_mapping.get(agent_action.tool),
+                    callbacks=run_manager.get_child() if run_manager else None,
+                )
+        return AgentStep(action=agent_action, observation=observation)
+
+    def _get_tool_return(self, next_step_output: tuple[AgentAction, str]) -> AgentFinish | None:
+        """Get the final answer if the step's tool returns directly."""
+        agent_action, observation = next_step_output
+        for tool in self.tools:
+            if tool.name == agent_action.tool and tool.return_direct:
+                return AgentFinish({"output": observation}, "")
+        return None
+
+    async def _acall(
+        self, inputs: dict[str, Any], run_manager: AsyncCallbackManagerForChainRun | None = None
+    ) -> dict[str, Any]:
+        """Run steps until the LLM answers, a tool returns directly or the step limit is hit."""
+        name_to_tool_map = {tool.name: tool for tool in self.tools}
+        intermediate_steps: list[tuple[AgentAction, str]] = []
+        iterations = 0
+        while self.max_iterations is None or iterations < self.max_iterations:
+            output = await self._atake_next_step(name_to_tool_map, {}, inputs, intermediate_steps, run_manager)
+            if isinstance(output, AgentFinish):
+                return self._return(output, intermediate_steps)
+            intermediate_steps.extend(output)
+            if output:
+                tool_return = self._get_tool_return(output[-1])
+                if tool_return is not None:
+                    return self._return(tool_return, intermediate_steps)
+            iterations += 1
+        stopped = AgentFinish({"output": "Agent stopped due to max iterations."}, "")
+        return self._return(stopped, intermediate_steps)
+
+    def _return(self, output: AgentFinish, intermediate_steps: list[tuple[AgentAction, str]]) -> dict[str, Any]:
+        result = dict(output.return_values)
+        if self.return_intermediate_steps:
+            result["intermediate_steps"] = intermediate_steps
+        return result
+
+    def _call(self, inputs: dict[str, Any], run_manager: CallbackManagerForChainRun | None = None) -> dict[str, Any]:
+        raise NotImplementedError("The native agent loop only supports async execution")
+
+    @property
+    def _chain_type(self) -> str:
+        return "mcp_use_native_agent"
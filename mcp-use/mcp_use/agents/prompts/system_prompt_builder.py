@@ -1,14 +1,21 @@
+from collections.abc import Callable
+
 from langchain.schema import SystemMessage
 from langchain_core.tools import BaseTool
 
 
-def generate_tool_descriptions(tools: list[BaseTool], disallowed_tools: list[str] | None = None) -> list[str]:
+def generate_tool_descriptions(
+    tools: list[BaseTool],
+    disallowed_tools: list[str] | None = None,
+    describe: Callable[[BaseTool], str] | None = None,
+) -> list[str]:
     """
     Generates a list of formatted tool descriptions, excluding disallowed tools.
 
     Args:
         tools: The list of available BaseTool objects.
         disallowed_tools: A list of tool names to exclude.
+        describe: Optional function giving the description of a tool, its full description by default.
 
     Returns:
         A list of strings, each describing a tool in the format "- tool_name: description".
@@ -19,7 +26,8 @@ def generate_tool_descriptions(tools: list[BaseTool], disallowed_tools: list[str
         if tool.name in disallowed_set:
             continue
         # Escape curly braces for formatting
-        escaped_desc = tool.description.replace("{", "{{").replace("}", "}}")
+        tool_description = describe(tool) if describe else tool.description
+        escaped_desc = tool_description.replace("{", "{{").replace("}", "}}")
         description = f"- {tool.name}: {escaped_desc}"
         tool_descriptions_list.append(description)
     return tool_descriptions_list
@@ -64,6 +72,7 @@ def create_system_message(
     disallowed_tools: list[str] | None = None,
     user_provided_prompt: str | None = None,
     additional_instructions: str | None = None,
+    describe: Callable[[BaseTool], str] | None = None,
 ) -> SystemMessage:
     """
     Creates the final SystemMessage object for the agent.
@@ -79,6 +88,7 @@ def create_system_message(
         disallowed_tools: List of tool names to exclude.
         user_provided_prompt: A complete system prompt provided by the user, overriding templates.
         additional_instructions: Extra instructions to append to the template-based prompt.
+        describe: Optional function giving the description of a tool, its full description by default.
 
     Returns:
         A SystemMessage object containing the final prompt content.
@@ -91,7 +101,7 @@ def create_system_message(
     template_to_use = server_manager_template if use_server_manager else system_prompt_template
 
     # Generate tool descriptions
-    tool_description_lines = generate_tool_descriptions(tools, disallowed_tools)
+    tool_description_lines = generate_tool_descriptions(tools, disallowed_tools, describe)
 
     # Build the final prompt content
     final_prompt_content = build_system_prompt_content(
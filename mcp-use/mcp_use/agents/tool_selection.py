@@ -0,0 +1,191 @@
+"""
+Per-step selection of the tools shown to the LLM.
+
+This module provides a selector narrowing the tools of an agent to the ones
+relevant to the current query and step, using the semantic search engine of
+the server manager, so that prompts do not carry the description and schema
+of every tool of every server. The tools can be given as handles, which are
+only built into LangChain tools once selected or called.
+"""
+
+import asyncio
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+from langchain_core.agents import AgentAction
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from ..adapters.base import ToolHandle
+from ..adapters.rendering import definition_tokens
+from ..logging import logger
+from ..managers.tools.search_tools import ToolSearchEngine
+
+
+def estimate_tool_tokens(tool: ToolHandle | BaseTool) -> int:
+    """Estimate the number of prompt tokens of a tool bound to the LLM, at 4 bytes per token.
+
+    Args:
+        tool: The tool, or its handle, estimated from the MCP input schema without building the tool.
+
+    Returns:
+        The estimated number of tokens of the tool's name, description and argument schema.
+    """
+    if isinstance(tool, ToolHandle):
+        parameters = tool.item.inputSchema if tool.kind == "tool" else {}
+        function = {"name": tool.name, "description": tool.description, "parameters": parameters}
+        return definition_tokens({"type": "function", "function": function})
+    try:
+        definition = convert_to_openai_tool(tool)
+    except Exception:
+        definition = {"name": tool.name, "description": tool.description}
+    return definition_tokens(definition)
+
+
+def materialize_tools(tools: Iterable[ToolHandle | BaseTool]) -> list[BaseTool]:
+    """Build the tools of handles, once, keeping the tools already built.
+
+    Args:
+        tools: The tools or their handles.
+
+    Returns:
+        The tools, in order, without the handles the adapter does not convert.
+    """
+    built = (tool.materialize() if isinstance(tool, ToolHandle) else tool for tool in tools)
+    return [tool for tool in built if tool is not None]
+
+
+class ToolMap(Mapping[str, BaseTool]):
+    """Tools by name, built from their handles when first looked up.
+
+    Tool calls of a run are resolved against every tool, while only the
+    selected tools are built ahead of a step.
+    """
+
+    def __init__(self, tools: Iterable[ToolHandle | BaseTool]) -> None:
+        """Initialize a new tool map.
+
+        Args:
+            tools: The tools or their handles.
+        """
+        self._tools = {tool.name: tool for tool in tools}
+
+    def __getitem__(self, name: str) -> BaseTool:
+        tool = self._tools[name]
+        if isinstance(tool, ToolHandle):
+            tool = tool.materialize()
+            if tool is None:
+                raise KeyError(name)
+        return tool
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tools)
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+
+class ToolSelector:
+    """Selects the tools relevant to each step of a run.
+
+    Each step shows the LLM the ``top_k`` tools whose description best matches
+    the query and the last tool result, plus the ``pinned_tools`` and the tools
+    already called in the run. The selected tools keep the agent's tool order.
+
+    The tools are indexed with a :class:`ToolSearchEngine`, which needs the
+    ``search`` extra (``pip install mcp-use[search]``). When they cannot be
+    indexed, every tool is selected. Step queries are embedded and scored in a
+    worker thread, off the event loop, and their results are not cached since
+    each step has its own query.
+
+    The tools can be given as handles: only their names and descriptions are
+    indexed, so they need not be built to be selected.
+    """
+
+    def __init__(
+        self,
+        top_k: int = 10,
+        pinned_tools: Iterable[str] | None = None,
+        search_engine: ToolSearchEngine | None = None,
+        max_observation_chars: int = 500,
+    ) -> None:
+        """Initialize a new tool selector.
+
+        Args:
+            top_k: Number of tools selected by relevance at each step.
+            pinned_tools: Names of the tools always selected.
+            search_engine: Search engine indexing the tools, a new one without query cache by default.
+            max_observation_chars: Maximum number of characters of the last tool result added
+                to the search query of a step.
+        """
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        self.top_k = top_k
+        self.pinned_tools = set(pinned_tools or ())
+        self.search_engine = search_engine or ToolSearchEngine(use_caching=False)
+        self.max_observation_chars = max_observation_chars
+        self._indexed_names: frozenset[str] | None = None
+        self._tool_tokens: dict[str, int] = {}
+
+    async def index(self, tools: Sequence[ToolHandle | BaseTool]) -> None:
+        """Index the tools to select from, unless the same tools are already indexed.
+
+        Args:
+            tools: The agent's tools, or their handles.
+        """
+        names = frozenset(tool.name for tool in tools)
+        if names == self._indexed_names and self.search_engine.is_indexed:
+            return
+        await self.search_engine.index_tools({"agent": list(tools)})
+        self._indexed_names = names
+        self._tool_tokens.clear()
+        if not self.search_engine.is_indexed:
+            logger.warning("⚠️ Could not index the tools for selection: every tool will be shown to the LLM")
+
+    async def select(
+        self,
+        tools: Sequence[ToolHandle | BaseTool],
+        query: str,
+        intermediate_steps: Sequence[tuple[AgentAction, str]] = (),
+    ) -> list[ToolHandle | BaseTool]:
+        """Select the tools of the next step.
+
+        Args:
+            tools: The agent's tools, or their handles.
+            query: The query of the run.
+            intermediate_steps: The tool calls and results of the previous steps.
+
+        Returns:
+            The selected tools, in the order of ``tools``.
+        """
+        if len(tools) <= self.top_k or not self.search_engine.is_indexed:
+            return list(tools)
+        names = set(self.pinned_tools)
+        names.update(action.tool for action, _ in intermediate_steps)
+        results = await asyncio.to_thread(
+            self.search_engine.search, self.step_query(query, intermediate_steps), top_k=self.top_k
+        )
+        names.update(tool.name for tool, _, _ in results)
+        return [tool for tool in tools if tool.name in names]
+
+    def step_query(self, query: str, intermediate_steps: Sequence[tuple[AgentAction, str]] = ()) -> str:
+        """Build the search query of a step: the run's query, then the last tool call and its result."""
+        if not intermediate_steps:
+            return query
+        action, observation = intermediate_steps[-1]
+        return f"{query}\n{action.tool}: {str(observation)[: self.max_observation_chars]}"
+
+    def tokens(self, tools: Iterable[ToolHandle | BaseTool]) -> int:
+        """Estimate the number of prompt tokens of tools bound to the LLM.
+
+        Args:
+            tools: The tools, or their handles.
+
+        Returns:
+            The estimated number of tokens, with the estimate of each tool cached by name.
+        """
+        total = 0
+        for tool in tools:
+            if tool.name not in self._tool_tokens:
+                self._tool_tokens[tool.name] = estimate_tool_tokens(tool)
+            total += self._tool_tokens[tool.name]
+        return total
@@ -0,0 +1,207 @@
+"""
+Out-of-band storage for binary tool outputs.
+
+This module provides stores that keep images and binary resources returned by
+tools out of the agent's observations. Observations get a compact reference
+and the bytes are fetched from the store only when needed.
+"""
+
+import mmap
+import os
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """Reference to binary content held in an artifact store."""
+
+    id: str
+    mime_type: str
+    size: int
+    summary: str | None = None
+    created_at: float = field(default_factory=time.time)
+
+    def reference(self) -> str:
+        """Get the compact text that stands for the artifact in an observation."""
+        text = f"[Artifact {self.id}: {self.mime_type}, {self.size} bytes"
+        if self.summary:
+            text += f", {self.summary}"
+        return text + "]"
+
+
+class ArtifactStore(ABC):
+    """Base class of artifact stores, with least recently used eviction over a byte budget."""
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        """Initialize a new artifact store.
+
+        Args:
+            max_bytes: Total size of the stored artifacts, None for no limit. The least
+                recently used artifacts are evicted to stay under it.
+        """
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._artifacts: OrderedDict[str, Artifact] = OrderedDict()
+        self._size = 0
+        self._evicted = 0
+        self._lock = threading.Lock()
+
+    def put(self, data: bytes, mime_type: str = "application/octet-stream", summary: str | None = None) -> Artifact:
+        """Store binary content.
+
+        Args:
+            data: The content.
+            mime_type: The MIME type of the content.
+            summary: Optional short description shown in the reference.
+
+        Returns:
+            The artifact referencing the content.
+
+        Raises:
+            ValueError: If the content alone is larger than the store's budget.
+        """
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            raise ValueError(f"Artifact of {len(data)} bytes exceeds the store budget of {self.max_bytes} bytes")
+        artifact = Artifact(id=uuid.uuid4().hex[:12], mime_type=mime_type, size=len(data), summary=summary)
+        with self._lock:
+            self._write(artifact.id, data)
+            self._artifacts[artifact.id] = artifact
+            self._size += artifact.size
+            self._evict()
+        return artifact
+
+    def get(self, artifact_id: str) -> memoryview:
+        """Get the content of an artifact without copying it.
+
+        Args:
+            artifact_id: The artifact ID.
+
+        Returns:
+            A read-only view of the content.
+
+        Raises:
+            KeyError: If the artifact does not exist or was evicted.
+        """
+        with self._lock:
+            if artifact_id not in self._artifacts:
+                raise KeyError(f"Artifact {artifact_id} not found")
+            self._artifacts.move_to_end(artifact_id)
+            return self._read(artifact_id)
+
+    def info(self, artifact_id: str) -> Artifact:
+        """Get the metadata of an artifact.
+
+        Raises:
+            KeyError: If the artifact does not exist or was evicted.
+        """
+        try:
+            return self._artifacts[artifact_id]
+        except KeyError:
+            raise KeyError(f"Artifact {artifact_id} not found") from None
+
+    def delete(self, artifact_id: str) -> None:
+        """Delete an artifact, if it exists."""
+        with self._lock:
+            artifact = self._artifacts.pop(artifact_id, None)
+            if artifact:
+                self._size -= artifact.size
+                self._remove(artifact_id)
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return artifact_id in self._artifacts
+
+    def __len__(self) -> int:
+        return len(self._artifacts)
+
+    def stats(self) -> dict[str, int | None]:
+        """Get the number and total size of the stored artifacts."""
+        return {
+            "artifacts": len(self._artifacts),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "evicted": self._evicted,
+        }
+
+    def _evict(self) -> None:
+        while self.max_bytes is not None and self._size > self.max_bytes:
+            artifact_id, artifact = self._artifacts.popitem(last=False)
+            self._size -= artifact.size
+            self._evicted += 1
+            self._remove(artifact_id)
+
+    @abstractmethod
+    def _write(self, artifact_id: str, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def _read(self, artifact_id: str) -> memoryview:
+        pass
+
+    @abstractmethod
+    def _remove(self, artifact_id: str) -> None:
+        pass
+
+
+class MemoryArtifactStore(ArtifactStore):
+    """Artifact store keeping content in memory, within a byte budget."""
+
+    def __init__(self, max_bytes: int | None = 64 * 1024 * 1024) -> None:
+        """Initialize a new in-memory artifact store.
+
+        Args:
+            max_bytes: Total size of the stored artifacts, 64 MiB by default.
+        """
+        super().__init__(max_bytes)
+        self._data: dict[str, bytes] = {}
+
+    def _write(self, artifact_id: str, data: bytes) -> None:
+        self._data[artifact_id] = bytes(data)
+
+    def _read(self, artifact_id: str) -> memoryview:
+        return memoryview(self._data[artifact_id])
+
+    def _remove(self, artifact_id: str) -> None:
+        self._data.pop(artifact_id, None)
+
+
+class DiskArtifactStore(ArtifactStore):
+    """Artifact store keeping content in files, read back through memory maps."""
+
+    def __init__(self, directory: str | None = None, max_bytes: int | None = None) -> None:
+        """Initialize a new on-disk artifact store.
+
+        Args:
+            directory: Directory of the artifact files, a new temporary directory by default.
+            max_bytes: Total size of the stored artifacts, None for no limit.
+        """
+        super().__init__(max_bytes)
+        self.directory = directory or tempfile.mkdtemp(prefix="mcp_use_artifacts_")
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, artifact_id: str) -> str:
+        """Get the path of the file holding an artifact."""
+        return os.path.join(self.directory, artifact_id)
+
+    def _write(self, artifact_id: str, data: bytes) -> None:
+        with open(self.path(artifact_id), "wb") as f:
+            f.write(data)
+
+    def _read(self, artifact_id: str) -> memoryview:
+        with open(self.path(artifact_id), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            # The map stays valid after the file is closed
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _remove(self, artifact_id: str) -> None:
+        try:
+            os.remove(self.path(artifact_id))
+        except FileNotFoundError:
+            pass
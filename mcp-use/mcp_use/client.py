@@ -203,6 +203,11 @@ class MCPClient:
             logging_callback=self.logging_callback,
         )
 
+        breaker_config = server_config.get("circuit_breaker")
+        if connector.circuit_breaker and not (isinstance(breaker_config, dict) and breaker_config.get("name")):
+            # Report circuit state under the server name rather than its transport details
+            connector.circuit_breaker.name = server_name
+
         # Create the session
         session = MCPSession(connector)
         if auto_initialize:
@@ -269,6 +274,23 @@ class MCPClient:
         """
         return {name: self.sessions[name] for name in self.active_sessions if name in self.sessions}
 
+    def get_server_health(self, server_name: str | None = None) -> dict[str, dict[str, Any]]:
+        """Get the health of the servers with an open session.
+
+        Args:
+            server_name: Optional name of a single server to report on.
+
+        Returns:
+            Dictionary mapping server names to their health report (state, probe
+            results for supervised servers and reconnection counters).
+
+        Raises:
+            ValueError: If the specified session doesn't exist.
+        """
+        if server_name is not None:
+            return {server_name: self.get_session(server_name).connector.health()}
+        return {name: session.connector.health() for name, session in self.sessions.items()}
+
     async def close_session(self, server_name: str) -> None:
         """Close a session.
 
@@ -11,8 +11,21 @@ from mcp.client.session import ElicitationFnT, LoggingFnT, MessageHandlerFnT, Sa
 
 from mcp_use.types.sandbox import SandboxOptions
 
-from .connectors import BaseConnector, HttpConnector, SandboxConnector, StdioConnector, WebSocketConnector
+from .connectors import (
+    BaseConnector,
+    HttpConnector,
+    InProcessConnector,
+    ReplicatedConnector,
+    SandboxConnector,
+    StdioConnector,
+    WebSocketConnector,
+)
+from .connectors.admission import AdmissionController
+from .connectors.circuit_breaker import CircuitBreaker
+from .connectors.reconnect import ReconnectPolicy
+from .connectors.timeouts import ToolTimeouts
 from .connectors.utils import is_stdio_server
+from .task_managers import HttpConnectionPool, get_shared_http_pool
 
 
 def load_config_file(filepath: str) -> dict[str, Any]:
@@ -28,6 +41,81 @@ def load_config_file(filepath: str) -> dict[str, Any]:
         return json.load(f)
 
 
+def _get_http_pool(server_config: dict[str, Any], url: str) -> HttpConnectionPool | None:
+    """Get the shared HTTP connection pool requested by a server configuration.
+
+    Args:
+        server_config: The server configuration section. Its "http_pool" key can be
+            true or a dict of pool options (http2, max_connections, ...).
+        url: The server URL, or the URL of one of its replicas.
+
+    Returns:
+        The shared pool for the server origin, or None if pooling is not enabled.
+    """
+    pool_config = server_config.get("http_pool")
+    if not pool_config:
+        return None
+    options = pool_config if isinstance(pool_config, dict) else {}
+    return get_shared_http_pool(url, **options)
+
+
+def _apply_reconnect_config(connector: BaseConnector, server_config: dict[str, Any]) -> None:
+    """Apply the reconnection settings of a server configuration to a connector.
+
+    Args:
+        connector: The connector to configure.
+        server_config: The server configuration section. Its "reconnect" key can be
+            false to disable automatic reconnection, or a dict of ReconnectPolicy
+            options (initial_delay, max_delay, max_attempts, wait_timeout, ...).
+    """
+    reconnect_config = server_config.get("reconnect", True)
+    if reconnect_config is False:
+        connector.auto_reconnect = False
+    elif isinstance(reconnect_config, dict):
+        connector.reconnect_policy = ReconnectPolicy.from_config(reconnect_config)
+
+
+def _apply_admission_config(connector: BaseConnector, server_config: dict[str, Any]) -> None:
+    """Apply the admission control settings of a server configuration to a connector.
+
+    Args:
+        connector: The connector to configure.
+        server_config: The server configuration section. Its "admission" key is a dict of
+            AdmissionController options (max_in_flight, rate, burst, max_queue, max_queue_time).
+    """
+    admission_config = server_config.get("admission")
+    if admission_config:
+        connector.admission = AdmissionController.from_config(admission_config)
+
+
+def _apply_circuit_breaker_config(connector: BaseConnector, server_config: dict[str, Any]) -> None:
+    """Apply the circuit breaker settings of a server configuration to a connector.
+
+    Args:
+        connector: The connector to configure.
+        server_config: The server configuration section. Its "circuit_breaker" key is true for
+            the defaults or a dict of CircuitBreaker options.
+    """
+    breaker_config = server_config.get("circuit_breaker")
+    if breaker_config:
+        connector.circuit_breaker = CircuitBreaker.from_config(breaker_config)
+        if connector.circuit_breaker.name is None:
+            connector.circuit_breaker.name = str(connector.public_identifier)
+
+
+def _apply_timeouts_config(connector: BaseConnector, server_config: dict[str, Any]) -> None:
+    """Apply the tool timeout settings of a server configuration to a connector.
+
+    Args:
+        connector: The connector to configure.
+        server_config: The server configuration section. Its "timeouts" key is a dict of
+            ToolTimeouts options, including per-tool overrides under "tools".
+    """
+    timeouts_config = server_config.get("timeouts")
+    if timeouts_config:
+        connector.tool_timeouts = ToolTimeouts.from_config(timeouts_config)
+
+
 def create_connector_from_config(
     server_config: dict[str, Any],
     sandbox: bool = False,
@@ -51,7 +139,7 @@ def create_connector_from_config(
 
     # Stdio connector (command-based)
     if is_stdio_server(server_config) and not sandbox:
-        return StdioConnector(
+        connector = StdioConnector(
             command=server_config["command"],
             args=server_config["args"],
             env=server_config.get("env", None),
@@ -60,10 +148,13 @@ def create_connector_from_config(
             message_handler=message_handler,
             logging_callback=logging_callback,
         )
+        supervise = server_config.get("supervise")
+        if supervise:
+            connector.supervise(**(supervise if isinstance(supervise, dict) else {}))
 
     # Sandboxed connector
     elif is_stdio_server(server_config) and sandbox:
-        return SandboxConnector(
+        connector = SandboxConnector(
             command=server_config["command"],
             args=server_config["args"],
             env=server_config.get("env", None),
@@ -74,26 +165,62 @@ def create_connector_from_config(
             logging_callback=logging_callback,
         )
 
-    # HTTP connector
+    # HTTP connector, load balanced when the server has several replicas
     elif "url" in server_config:
-        return HttpConnector(
-            base_url=server_config["url"],
+        urls = server_config["url"]
+        connectors = [
+            HttpConnector(
+                base_url=url,
+                headers=server_config.get("headers", None),
+                auth_token=server_config.get("auth_token", None),
+                timeout=server_config.get("timeout", 5),
+                sse_read_timeout=server_config.get("sse_read_timeout", 60 * 5),
+                transport=server_config.get("transport", "auto"),
+                http_pool=_get_http_pool(server_config, url),
+                sampling_callback=sampling_callback,
+                elicitation_callback=elicitation_callback,
+                message_handler=message_handler,
+                logging_callback=logging_callback,
+            )
+            for url in (urls if isinstance(urls, list) else [urls])
+        ]
+        if isinstance(urls, list):
+            for replica in connectors:
+                _apply_reconnect_config(replica, server_config)
+            connector = ReplicatedConnector(connectors, **server_config.get("load_balancing", {}))
+        else:
+            connector = connectors[0]
+
+    # WebSocket connector
+    elif "ws_url" in server_config:
+        connector = WebSocketConnector(
+            url=server_config["ws_url"],
             headers=server_config.get("headers", None),
             auth_token=server_config.get("auth_token", None),
-            timeout=server_config.get("timeout", 5),
-            sse_read_timeout=server_config.get("sse_read_timeout", 60 * 5),
+            request_timeout=server_config.get("request_timeout", 60),
+            max_in_flight=server_config.get("max_in_flight", 64),
             sampling_callback=sampling_callback,
             elicitation_callback=elicitation_callback,
             message_handler=message_handler,
             logging_callback=logging_callback,
         )
 
-    # WebSocket connector
-    elif "ws_url" in server_config:
-        return WebSocketConnector(
-            url=server_config["ws_url"],
-            headers=server_config.get("headers", None),
-            auth_token=server_config.get("auth_token", None),
+    # In-process connector (Python MCP server imported from a module)
+    elif "module" in server_config:
+        connector = InProcessConnector(
+            server=server_config["module"],
+            path=server_config.get("path", None),
+            sampling_callback=sampling_callback,
+            elicitation_callback=elicitation_callback,
+            message_handler=message_handler,
+            logging_callback=logging_callback,
         )
 
-    raise ValueError("Cannot determine connector type from config")
+    else:
+        raise ValueError("Cannot determine connector type from config")
+
+    _apply_reconnect_config(connector, server_config)
+    _apply_admission_config(connector, server_config)
+    _apply_circuit_breaker_config(connector, server_config)
+    _apply_timeouts_config(connector, server_config)
+    return connector
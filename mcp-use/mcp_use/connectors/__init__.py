@@ -5,10 +5,16 @@ This module provides interfaces for connecting to MCP implementations
 through different transport mechanisms.
 """
 
+from .admission import AdmissionController, AdmissionRejectedError, request_priority  # noqa: F401
 from .base import BaseConnector  # noqa: F401
+from .circuit_breaker import CircuitBreaker, CircuitOpenError  # noqa: F401
 from .http import HttpConnector  # noqa: F401
+from .in_process import InProcessConnector  # noqa: F401
+from .reconnect import ReconnectPolicy  # noqa: F401
+from .replicated import ReplicatedConnector, ReplicaUnavailableError  # noqa: F401
 from .sandbox import SandboxConnector  # noqa: F401
 from .stdio import StdioConnector  # noqa: F401
+from .timeouts import ToolTimeouts  # noqa: F401
 from .websocket import WebSocketConnector  # noqa: F401
 
 __all__ = [
@@ -17,4 +23,14 @@ __all__ = [
     "HttpConnector",
     "WebSocketConnector",
     "SandboxConnector",
+    "InProcessConnector",
+    "ReplicatedConnector",
+    "ReplicaUnavailableError",
+    "ReconnectPolicy",
+    "AdmissionController",
+    "AdmissionRejectedError",
+    "request_priority",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ToolTimeouts",
 ]
@@ -0,0 +1,269 @@
+"""
+Admission control for MCP server requests.
+
+This module provides a per-server admission controller that bounds the number
+of in-flight requests, applies a token-bucket rate limit and queues waiting
+requests by priority, shedding them early when the queue is over budget.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = {INTERACTIVE: 0, BACKGROUND: 1}
+
+_request_priority: contextvars.ContextVar[str] = contextvars.ContextVar("mcp_use_request_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Set the admission priority of the requests made in this context.
+
+    Args:
+        priority: Either "interactive" (the default) or "background".
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown request priority '{priority}', expected one of {list(PRIORITIES)}")
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class AdmissionRejectedError(RuntimeError):
+    """Raised when a request is shed instead of being sent to an overloaded server."""
+
+    code = "SERVER_OVERLOADED"
+
+
+class AdmissionController:
+    """Concurrency cap, rate limit and priority queue for one MCP server.
+
+    Requests are admitted immediately while the server has a free in-flight
+    slot and a rate-limit token. Otherwise they wait in a queue ordered by
+    priority (interactive before background), then arrival. A request is
+    rejected with AdmissionRejectedError when the queue is full, when its
+    estimated wait exceeds max_queue_time, or when it waited that long.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        rate: float | None = None,
+        burst: int | None = None,
+        max_queue: int = 100,
+        max_queue_time: float | None = None,
+    ) -> None:
+        """Initialize a new admission controller.
+
+        Args:
+            max_in_flight: Maximum number of concurrent requests, None for no limit.
+            rate: Sustained requests per second allowed by the token bucket, None for no limit.
+            burst: Token bucket capacity, defaults to max(1, rate).
+            max_queue: Maximum number of waiting requests. When full, a new interactive
+                request evicts the newest background one, otherwise it is rejected.
+            max_queue_time: Maximum seconds a request may wait for admission, None to wait
+                as long as needed.
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_queue = max_queue
+        self.max_queue_time = max_queue_time
+
+        self._in_flight = 0
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+        self._admitted = 0
+        self._rejected = 0
+        self._total_queue_time = 0.0
+        self._max_queue_time_seen = 0.0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "AdmissionController":
+        """Create a controller from the "admission" section of a server configuration.
+
+        Args:
+            config: Controller options, using the constructor argument names.
+
+        Returns:
+            The configured AdmissionController.
+        """
+        return cls(**config)
+
+    @asynccontextmanager
+    async def slot(self, priority: str | None = None) -> AsyncIterator[None]:
+        """Hold an admission slot for the duration of a request.
+
+        Args:
+            priority: "interactive" or "background"; defaults to the priority set
+                with request_priority(), which is interactive unless changed.
+
+        Raises:
+            AdmissionRejectedError: If the request is shed.
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: str | None = None) -> None:
+        """Wait until a request may be sent to the server.
+
+        Args:
+            priority: "interactive" or "background", see slot().
+
+        Raises:
+            AdmissionRejectedError: If the request is shed.
+        """
+        priority = priority or _request_priority.get()
+        rank = PRIORITIES[priority]
+        self._refill()
+
+        if not self._queued() and self._can_admit():
+            self._admit()
+            self._record_queue_time(0.0)
+            return
+
+        self._shed_if_over_budget(rank, priority)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._sequence), future))
+        start = time.monotonic()
+        self._schedule_wakeup()
+        try:
+            await asyncio.wait_for(future, self.max_queue_time)
+        except TimeoutError:
+            self._rejected += 1
+            raise AdmissionRejectedError(
+                f"Request waited more than {self.max_queue_time}s for admission to an overloaded server"
+            ) from None
+        except BaseException:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Admitted just as the caller gave up, hand the slot back
+                self.release()
+            raise
+        self._record_queue_time(time.monotonic() - start)
+
+    def release(self) -> None:
+        """Release an in-flight slot and admit the next waiting request."""
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _can_admit(self) -> bool:
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            return False
+        return self.rate is None or self._tokens >= 1
+
+    def _admit(self) -> None:
+        self._in_flight += 1
+        if self.rate is not None:
+            self._tokens -= 1
+
+    def _record_queue_time(self, queue_time: float) -> None:
+        self._admitted += 1
+        self._total_queue_time += queue_time
+        self._max_queue_time_seen = max(self._max_queue_time_seen, queue_time)
+
+    def _refill(self) -> None:
+        if self.rate is None:
+            return
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _queued(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def _shed_if_over_budget(self, rank: int, priority: str) -> None:
+        """Reject a request on arrival when the queue cannot take it in time."""
+        if self._queued() >= self.max_queue:
+            # Interactive requests make room by shedding the newest background request
+            if rank != PRIORITIES[INTERACTIVE] or not self._evict_background():
+                self._rejected += 1
+                raise AdmissionRejectedError(f"Admission queue is full ({self.max_queue} waiting requests)")
+
+        if self.rate is not None and self.max_queue_time is not None:
+            ahead = sum(1 for r, _, future in self._waiters if r <= rank and not future.done())
+            estimated_wait = (ahead + 1 - self._tokens) / self.rate
+            if estimated_wait > self.max_queue_time:
+                self._rejected += 1
+                raise AdmissionRejectedError(
+                    f"Estimated wait of {estimated_wait:.1f}s for a {priority} request exceeds "
+                    f"the queue budget of {self.max_queue_time}s"
+                )
+
+    def _evict_background(self) -> bool:
+        """Shed the newest waiting background request to make room."""
+        background = [w for w in self._waiters if w[0] == PRIORITIES[BACKGROUND] and not w[2].done()]
+        if not background:
+            return False
+        _, _, future = max(background, key=lambda waiter: waiter[1])
+        future.set_exception(AdmissionRejectedError("Background request shed in favor of an interactive request"))
+        self._rejected += 1
+        return True
+
+    def _dispatch(self) -> None:
+        """Admit waiting requests in priority order while capacity allows."""
+        self._refill()
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_admit():
+                break
+            heapq.heappop(self._waiters)
+            self._admit()
+            future.set_result(None)
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        """Wake the dispatcher when the next rate-limit token becomes available."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        if self.rate is None or not self._queued():
+            return
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            return
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def stats(self) -> dict[str, Any]:
+        """Get admission metrics.
+
+        Returns:
+            A dictionary with in-flight and queued requests per priority, admitted
+            and rejected counts and queue times in seconds.
+        """
+        queued = {name: 0 for name in PRIORITIES}
+        names = {rank: name for name, rank in PRIORITIES.items()}
+        for rank, _, future in self._waiters:
+            if not future.done():
+                queued[names[rank]] += 1
+        return {
+            "in_flight": self._in_flight,
+            "queued": queued,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "avg_queue_time": self._total_queue_time / self._admitted if self._admitted else 0.0,
+            "max_queue_time": self._max_queue_time_seen,
+        }
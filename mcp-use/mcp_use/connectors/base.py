@@ -5,8 +5,12 @@ This module provides the base connector interface that all MCP connectors
 must implement.
 """
 
+import asyncio
+import time
 import warnings
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import Any
 
@@ -15,6 +19,9 @@ from mcp.client.session import ElicitationFnT, LoggingFnT, MessageHandlerFnT, Sa
 from mcp.shared.exceptions import McpError
 from mcp.types import (
     CallToolResult,
+    CancelledNotification,
+    CancelledNotificationParams,
+    ClientNotification,
     GetPromptResult,
     Prompt,
     PromptListChangedNotification,
@@ -31,7 +38,12 @@ from pydantic import AnyUrl
 import mcp_use
 
 from ..logging import logger
-from ..task_managers import ConnectionManager
+from ..task_managers import ClientSessionManager, ConnectionManager
+from ..task_managers.request_ids import record_sent_requests
+from .admission import AdmissionController
+from .circuit_breaker import CircuitBreaker, is_server_failure
+from .reconnect import ReconnectPolicy, ReconnectStats
+from .timeouts import CANCEL_NOTIFICATION_TIMEOUT, ToolTimeouts, cap_timeout, is_timeout_error
 
 
 class BaseConnector(ABC):
@@ -50,12 +62,19 @@ class BaseConnector(ABC):
         """Initialize base connector with common attributes."""
         self.client_session: ClientSession | None = None
         self._connection_manager: ConnectionManager | None = None
+        self._session_manager: ClientSessionManager | None = None
         self._tools: list[Tool] | None = None
         self._resources: list[Resource] | None = None
         self._prompts: list[Prompt] | None = None
         self._connected = False
         self._initialized = False  # Track if client_session.initialize() has been called
-        self.auto_reconnect = True  # Whether to automatically reconnect on connection loss (not configurable for now)
+        self.auto_reconnect = True  # Whether to automatically reconnect on connection loss
+        self.reconnect_policy = ReconnectPolicy()
+        self._reconnect_stats = ReconnectStats()
+        self._reconnect_task: asyncio.Task | None = None
+        self.admission: AdmissionController | None = None  # Optional per-server admission control
+        self.circuit_breaker: CircuitBreaker | None = None  # Optional per-server circuit breaker
+        self.tool_timeouts = ToolTimeouts()  # Tool latencies and timeouts, fixed or adaptive
         self.sampling_callback = sampling_callback
         self.elicitation_callback = elicitation_callback
         self.message_handler = message_handler
@@ -97,7 +116,20 @@ class BaseConnector(ABC):
         pass
 
     async def disconnect(self) -> None:
-        """Close the connection to the MCP implementation."""
+        """Close the connection to the MCP implementation.
+
+        A reconnection in progress is cancelled so it cannot open a new session afterwards.
+        """
+        reconnect_task = self._reconnect_task
+        if reconnect_task is not None:
+            logger.debug("Cancelling the reconnection in progress")
+            reconnect_task.cancel()
+            await asyncio.gather(reconnect_task, return_exceptions=True)
+            await self._cleanup_resources()
+            self._connected = False
+            self._reconnect_stats.disconnected_since = None
+            return
+
         if not self._connected:
             logger.debug("Not connected to MCP implementation")
             return
@@ -105,17 +137,38 @@ class BaseConnector(ABC):
         logger.debug("Disconnecting from MCP implementation")
         await self._cleanup_resources()
         self._connected = False
+        self._reconnect_stats.disconnected_since = None
         logger.debug("Disconnected from MCP implementation")
 
+    async def _enter_client_session(self, session: ClientSession) -> None:
+        """Enter a client session in a dedicated task.
+
+        The session can then be closed from any task, see ClientSessionManager.
+
+        Args:
+            session: The client session to enter.
+        """
+        session_manager = ClientSessionManager(session)
+        await session_manager.start()
+        self._session_manager = session_manager
+
+    async def _exit_client_session(self) -> None:
+        """Exit the current client session."""
+        if self._session_manager:
+            session_manager, self._session_manager = self._session_manager, None
+            await session_manager.stop()
+        elif self.client_session:
+            await self.client_session.__aexit__(None, None, None)
+
     async def _cleanup_resources(self) -> None:
         """Clean up all resources associated with this connector."""
         errors = []
 
         # First close the client session
-        if self.client_session:
+        if self.client_session or self._session_manager:
             try:
                 logger.debug("Closing client session")
-                await self.client_session.__aexit__(None, None, None)
+                await self._exit_client_session()
             except Exception as e:
                 error_msg = f"Error closing client session: {e}"
                 logger.warning(error_msg)
@@ -313,60 +366,251 @@ class BaseConnector(ABC):
 
         return True
 
-    async def _ensure_connected(self) -> None:
+    @property
+    def reconnect_stats(self) -> dict[str, Any]:
+        """Get reconnection counters for this connector.
+
+        Returns:
+            A dictionary with the number of reconnections, failed attempts and
+            downtime in seconds.
+        """
+        stats = self._reconnect_stats.as_dict()
+        stats["reconnecting"] = self._reconnect_task is not None and not self._reconnect_task.done()
+        return stats
+
+    def health(self) -> dict[str, Any]:
+        """Get the health of the connection to the MCP implementation.
+
+        Returns:
+            A dictionary with the connection state and reconnection counters.
+        """
+        reconnecting = self._reconnect_task is not None and not self._reconnect_task.done()
+        if reconnecting:
+            state = "reconnecting"
+        else:
+            state = "healthy" if self.is_connected else "disconnected"
+        health = {"state": state, "reconnects": self.reconnect_stats}
+        if self.admission:
+            health["admission"] = self.admission.stats()
+        if self.circuit_breaker:
+            health["circuit_breaker"] = self.circuit_breaker.stats()
+        tool_stats = self.tool_timeouts.stats()
+        if tool_stats:
+            health["tools"] = tool_stats
+        return health
+
+    async def _ensure_connected(self, timeout: float | None = None) -> None:
         """Ensure the connector is connected, reconnecting if necessary.
 
+        Concurrent callers share a single reconnection attempt and wait for it
+        for at most ``timeout`` seconds (the reconnect policy's wait_timeout by default).
+
+        Args:
+            timeout: Optional number of seconds to wait for an ongoing reconnection.
+
         Raises:
             RuntimeError: If connection cannot be established and auto_reconnect is False.
         """
-        if not self.client_session:
+        connection_lost = self._reconnect_stats.disconnected_since is not None
+        if not self.client_session and not connection_lost:
             raise RuntimeError("MCP client is not connected")
 
-        if not self.is_connected:
-            if self.auto_reconnect:
-                logger.debug("Connection lost, attempting to reconnect...")
-                try:
-                    await self.connect()
-                    logger.debug("Reconnection successful")
-                except Exception as e:
-                    raise RuntimeError(f"Failed to reconnect to MCP server: {e}") from e
-            else:
+        if connection_lost or not self.is_connected:
+            self._reconnect_stats.mark_disconnected()
+            if not self.auto_reconnect:
                 raise RuntimeError(
                     "Connection to MCP server has been lost. Auto-reconnection is disabled. Please reconnect manually."
                 )
 
+            await self._wait_for_reconnect(timeout)
+
+    async def reconnect(self, timeout: float | None = None) -> None:
+        """Replace the current connection with a new one.
+
+        Joins the reconnection already in progress if there is one.
+
+        Args:
+            timeout: Optional number of seconds to wait for the reconnection.
+
+        Raises:
+            RuntimeError: If the reconnection fails or times out.
+        """
+        self._reconnect_stats.mark_disconnected()
+        await self._wait_for_reconnect(timeout)
+
+    async def _wait_for_reconnect(self, timeout: float | None) -> None:
+        """Start the shared reconnection attempt if needed and wait for it."""
+        if self._reconnect_task is None:
+            logger.debug("Connection lost, attempting to reconnect...")
+            self._reconnect_task = asyncio.create_task(self._reconnect(), name="mcp_reconnect_task")
+            self._reconnect_task.add_done_callback(self._on_reconnect_done)
+
+        timeout = self.reconnect_policy.wait_timeout if timeout is None else timeout
+        try:
+            # Shield the shared attempt so a caller giving up does not cancel it for the others
+            await asyncio.wait_for(asyncio.shield(self._reconnect_task), timeout)
+        except TimeoutError as e:
+            raise RuntimeError(f"Timed out after {timeout}s waiting to reconnect to MCP server") from e
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+            # The attempt itself was cancelled because the connector was disconnected
+            raise RuntimeError("MCP connector was disconnected while reconnecting") from None
+        except Exception as e:
+            raise RuntimeError(f"Failed to reconnect to MCP server: {e}") from e
+
+    async def _reconnect(self) -> None:
+        """Reconnect with capped exponential backoff, keeping the cached catalog.
+
+        The tools, resources and prompts cached before the connection was lost
+        stay available until the new session refreshes them.
+        """
+        cached = (self._tools, self._resources, self._prompts)
+        was_initialized = self._initialized or self._tools is not None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await self._cleanup_resources()
+                self._tools, self._resources, self._prompts = cached
+                self._connected = False
+                await self.connect()
+                if was_initialized:
+                    await self.initialize()
+                self._reconnect_stats.mark_reconnected()
+                logger.debug(f"Reconnection successful after {attempt} attempt(s)")
+                return
+            except Exception as e:
+                self._reconnect_stats.failed_attempts += 1
+                if self._tools is None:
+                    self._tools, self._resources, self._prompts = cached
+                max_attempts = self.reconnect_policy.max_attempts
+                if max_attempts is not None and attempt >= max_attempts:
+                    logger.error(f"Giving up reconnecting to MCP server after {attempt} attempt(s): {e}")
+                    raise
+                delay = self.reconnect_policy.backoff(attempt)
+                logger.warning(f"Reconnection attempt {attempt} failed: {e}. Retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def _on_reconnect_done(self, task: asyncio.Task) -> None:
+        """Release the shared reconnection attempt once it finishes."""
+        if self._reconnect_task is task:
+            self._reconnect_task = None
+        if not task.cancelled():
+            # Retrieve the exception so it is not reported as unhandled when nobody waited
+            task.exception()
+
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Apply the circuit breaker and admission control around a request to the server."""
+        breaker = self.circuit_breaker
+        if breaker:
+            # Fail fast before waiting for admission
+            breaker.check()
+        if self.admission:
+            await self.admission.acquire()
+        try:
+            if breaker is None:
+                yield
+                return
+            breaker.acquire()
+            start = time.monotonic()
+            try:
+                yield
+            except BaseException as e:
+                if is_server_failure(e):
+                    breaker.record_failure(e)
+                else:
+                    breaker.record_ignored()
+                raise
+            breaker.record_success(time.monotonic() - start)
+        finally:
+            if self.admission:
+                self.admission.release()
+
     async def call_tool(
         self, name: str, arguments: dict[str, Any], read_timeout_seconds: timedelta | None = None
     ) -> CallToolResult:
-        """Call an MCP tool with automatic reconnection handling.
+        """Call an MCP tool with the connector policies and automatic reconnection handling.
 
         Args:
             name: The name of the tool to call.
             arguments: The arguments to pass to the tool.
-            read_timeout_seconds: timeout seconds when calling tool
+            read_timeout_seconds: timeout seconds when calling tool, defaults to the
+                timeout of the tool from tool_timeouts. It is shortened to the time left
+                before the deadline of the agent run making the call, if any.
 
         Returns:
             The result of the tool call.
 
         Raises:
             RuntimeError: If the connection is lost and cannot be reestablished.
+            CircuitOpenError: If the server's circuit is open and the call failed fast.
+            AdmissionRejectedError: If the server is overloaded and the call was shed.
         """
+        if read_timeout_seconds is None:
+            read_timeout_seconds = self.tool_timeouts.read_timeout(name)
+        timeout = cap_timeout(read_timeout_seconds)
+        async with self._request_slot():
+            start = time.monotonic()
+            try:
+                result = await self._call_tool(name, arguments, timeout)
+            except Exception as e:
+                # A call cut short by the run's deadline says nothing about the tool's latency
+                if is_timeout_error(e) and timeout == read_timeout_seconds:
+                    self.tool_timeouts.record_timeout(name)
+                raise
+            self.tool_timeouts.record(name, time.monotonic() - start)
+            return result
 
+    async def _call_tool(
+        self, name: str, arguments: dict[str, Any], read_timeout_seconds: timedelta | None = None
+    ) -> CallToolResult:
+        """Send a tool call over the connection."""
         # Ensure we're connected
         await self._ensure_connected()
 
         logger.debug(f"Calling tool '{name}' with arguments: {arguments}")
+        # The tool call is the first request the session sends in the block
+        with record_sent_requests() as sent_request_ids:
+            try:
+                result = await self.client_session.call_tool(name, arguments, read_timeout_seconds)
+                logger.debug(f"Tool '{name}' called with result: {result}")
+                return result
+            except asyncio.CancelledError:
+                request_id = sent_request_ids[0] if sent_request_ids else None
+                await self._notify_cancelled(request_id, f"The call of tool '{name}' was cancelled")
+                raise
+            except Exception as e:
+                if is_timeout_error(e):
+                    request_id = sent_request_ids[0] if sent_request_ids else None
+                    await self._notify_cancelled(request_id, f"The call of tool '{name}' timed out")
+                # Check if the error might be due to connection loss
+                if not self.is_connected:
+                    raise RuntimeError(f"Tool call '{name}' failed due to connection loss: {e}") from e
+                else:
+                    # Re-raise the original error if it's not connection-related
+                    raise
+
+    async def _notify_cancelled(self, request_id: int | str | None, reason: str) -> None:
+        """Tell the server to stop working on a request the client gave up on.
+
+        Args:
+            request_id: The ID of the request in the session, None if unknown.
+            reason: Why the request was given up on.
+        """
+        if request_id is None or self.client_session is None:
+            return
+        notification = CancelledNotification(
+            method="notifications/cancelled", params=CancelledNotificationParams(requestId=request_id, reason=reason)
+        )
         try:
-            result = await self.client_session.call_tool(name, arguments, read_timeout_seconds)
-            logger.debug(f"Tool '{name}' called with result: {result}")
-            return result
+            async with asyncio.timeout(CANCEL_NOTIFICATION_TIMEOUT):
+                await self.client_session.send_notification(ClientNotification(notification))
+            logger.debug(f"Notified the server of cancelled request {request_id}: {reason}")
         except Exception as e:
-            # Check if the error might be due to connection loss
-            if not self.is_connected:
-                raise RuntimeError(f"Tool call '{name}' failed due to connection loss: {e}") from e
-            else:
-                # Re-raise the original error if it's not connection-related
-                raise
+            logger.debug(f"Could not notify the server of cancelled request {request_id}: {e}")
 
     async def list_tools(self) -> list[Tool]:
         """List all available tools from the MCP implementation."""
@@ -408,11 +652,12 @@ class BaseConnector(ABC):
 
     async def read_resource(self, uri: AnyUrl) -> ReadResourceResult:
         """Read a resource by URI."""
-        await self._ensure_connected()
+        async with self._request_slot():
+            await self._ensure_connected()
 
-        logger.debug(f"Reading resource: {uri}")
-        result = await self.client_session.read_resource(uri)
-        return result
+            logger.debug(f"Reading resource: {uri}")
+            result = await self.client_session.read_resource(uri)
+            return result
 
     async def list_prompts(self) -> list[Prompt]:
         """List all available prompts from the MCP implementation."""
@@ -434,11 +679,12 @@ class BaseConnector(ABC):
 
     async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> GetPromptResult:
         """Get a prompt by name."""
-        await self._ensure_connected()
+        async with self._request_slot():
+            await self._ensure_connected()
 
-        logger.debug(f"Getting prompt: {name}")
-        result = await self.client_session.get_prompt(name, arguments)
-        return result
+            logger.debug(f"Getting prompt: {name}")
+            result = await self.client_session.get_prompt(name, arguments)
+            return result
 
     async def request(self, method: str, params: dict[str, Any] | None = None) -> Any:
         """Send a raw request to the MCP implementation."""
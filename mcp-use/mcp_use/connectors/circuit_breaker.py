@@ -0,0 +1,265 @@
+"""
+Circuit breaker for MCP server requests.
+
+This module provides a per-server circuit breaker that stops sending requests
+to a server that keeps failing or answering too slowly, and fails them fast
+instead until the server has had time to recover.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from mcp.shared.exceptions import McpError
+
+from ..logging import logger
+from ..observability.events import emit_event
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# JSON-RPC error code used by the MCP client session for request timeouts
+REQUEST_TIMEOUT_CODE = 408
+
+CircuitBreakerListener = Callable[[dict[str, Any]], None]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request to a server whose circuit is open."""
+
+    code = "SERVER_UNAVAILABLE"
+
+    def __init__(self, server: str, retry_after: float, reason: str | None = None):
+        self.server = server
+        self.retry_after = retry_after
+        message = f"MCP server '{server}' is temporarily unavailable"
+        if reason:
+            message += f" ({reason})"
+        message += (
+            f". Requests to it are failing fast for the next {retry_after:.0f}s; "
+            "do not call its tools again until then and continue with other tools if possible."
+        )
+        super().__init__(message)
+
+
+def is_server_failure(error: BaseException) -> bool:
+    """Whether an error means the server is unhealthy, rather than rejecting one request.
+
+    Error responses from the server prove it is alive, except request timeouts.
+
+    Args:
+        error: The error raised by a request.
+
+    Returns:
+        True if the error should count against the server's circuit.
+    """
+    if isinstance(error, McpError):
+        return error.error.code == REQUEST_TIMEOUT_CODE
+    return isinstance(error, Exception)
+
+
+class CircuitBreaker:
+    """Closed, open and half-open circuit for one MCP server.
+
+    While closed, the outcome of the last ``window_size`` requests is tracked.
+    Failed requests and requests slower than ``slow_call_threshold`` count as
+    errors. Once at least ``min_calls`` outcomes are recorded and the error
+    rate reaches ``failure_rate_threshold``, the circuit opens and requests
+    fail fast with CircuitOpenError. After ``open_timeout`` seconds the circuit
+    is half-open and lets ``half_open_max_calls`` trial requests through: if
+    they all succeed it closes, otherwise it opens again.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float | None = None,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """Initialize a new circuit breaker.
+
+        Args:
+            name: Name of the server, used in errors and events.
+            failure_rate_threshold: Error rate, between 0 and 1, that opens the circuit.
+            slow_call_threshold: Seconds after which a successful request counts as an
+                error, None to ignore latency.
+            window_size: Number of recent requests used to compute the error rate.
+            min_calls: Minimum number of recorded requests before the circuit can open.
+            open_timeout: Seconds the circuit stays open before trial requests are allowed.
+            half_open_max_calls: Number of trial requests that must succeed to close the circuit.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be between 0 and 1")
+        if min_calls < 1 or window_size < min_calls:
+            raise ValueError("min_calls must be at least 1 and at most window_size")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.listeners: list[CircuitBreakerListener] = []
+
+        self.state = CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._open_reason: str | None = None
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | bool) -> "CircuitBreaker":
+        """Create a circuit breaker from the "circuit_breaker" section of a server configuration.
+
+        Args:
+            config: True for the defaults, or a dict using the constructor argument names.
+
+        Returns:
+            The configured CircuitBreaker.
+        """
+        if config is True:
+            return cls()
+        return cls(**config)
+
+    def add_listener(self, listener: CircuitBreakerListener) -> None:
+        """Register a callable that receives every state transition.
+
+        Args:
+            listener: Called with a dict holding the server, the previous and new
+                state, the reason and the current error rate.
+        """
+        self.listeners.append(listener)
+
+    @property
+    def error_rate(self) -> float:
+        """Error rate over the recorded requests."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def retry_after(self) -> float:
+        """Seconds left before the open circuit allows trial requests."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_timeout - time.monotonic())
+
+    def check(self) -> None:
+        """Fail fast if the circuit does not let requests through.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trials in progress.
+        """
+        if self.state == OPEN and self.retry_after() == 0:
+            self._transition(HALF_OPEN, "open timeout elapsed")
+        if self.state == OPEN or (self.state == HALF_OPEN and self._trial_calls >= self.half_open_max_calls):
+            self._rejected += 1
+            raise CircuitOpenError(self.name or "unknown", max(self.retry_after(), 1.0), self._open_reason)
+
+    def acquire(self) -> None:
+        """Let a request through, counting it as a trial when half-open.
+
+        Raises:
+            CircuitOpenError: If the circuit does not let requests through.
+        """
+        self.check()
+        if self.state == HALF_OPEN:
+            self._trial_calls += 1
+
+    def record_success(self, latency: float) -> None:
+        """Record a request the server answered.
+
+        Args:
+            latency: Seconds the request took.
+        """
+        if self.slow_call_threshold is not None and latency > self.slow_call_threshold:
+            self._record(False, f"slow call ({latency:.1f}s > {self.slow_call_threshold}s)")
+        else:
+            self._record(True, None)
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a request that failed.
+
+        Args:
+            error: The error raised by the request.
+        """
+        self._record(False, f"{type(error).__name__}: {error}")
+
+    def record_ignored(self) -> None:
+        """Release a request whose outcome says nothing about the server's health."""
+        if self.state == HALF_OPEN and self._trial_calls > self._trial_successes:
+            self._trial_calls -= 1
+
+    def _record(self, success: bool, reason: str | None) -> None:
+        if self.state == HALF_OPEN:
+            if not success:
+                self._transition(OPEN, f"trial request failed: {reason}")
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_max_calls:
+                self._transition(CLOSED, "trial requests succeeded")
+            return
+        if self.state == OPEN:
+            # Request sent before the circuit opened
+            return
+
+        self._outcomes.append(success)
+        if not success and len(self._outcomes) >= self.min_calls and self.error_rate >= self.failure_rate_threshold:
+            self._transition(OPEN, f"error rate {self.error_rate:.0%}, last error: {reason}")
+
+    def _transition(self, state: str, reason: str) -> None:
+        previous, self.state = self.state, state
+        self._trial_calls = 0
+        self._trial_successes = 0
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self._open_reason = reason
+            self._times_opened += 1
+            logger.warning(f"Circuit opened for MCP server {self.name}: {reason}")
+        elif state == CLOSED:
+            self._outcomes.clear()
+            self._open_reason = None
+            logger.info(f"Circuit closed for MCP server {self.name}")
+        else:
+            logger.debug(f"Circuit half-open for MCP server {self.name}")
+
+        event = {
+            "server": self.name,
+            "previous_state": previous,
+            "state": state,
+            "reason": reason,
+            "error_rate": self.error_rate,
+            "timestamp": time.time(),
+        }
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.debug(f"Circuit breaker listener failed: {e}")
+        emit_event("mcp_circuit_breaker", event)
+
+    def stats(self) -> dict[str, Any]:
+        """Get circuit breaker metrics.
+
+        Returns:
+            A dictionary with the state, error rate, seconds until trial requests
+            are allowed, and open and rejection counts.
+        """
+        return {
+            "state": self.state,
+            "error_rate": self.error_rate,
+            "recorded_calls": len(self._outcomes),
+            "retry_after": self.retry_after(),
+            "times_opened": self._times_opened,
+            "rejected": self._rejected,
+        }
@@ -10,8 +10,14 @@ from mcp import ClientSession
 from mcp.client.session import ElicitationFnT, LoggingFnT, MessageHandlerFnT, SamplingFnT
 
 from ..logging import logger
-from ..task_managers import SseConnectionManager, StreamableHttpConnectionManager
+from ..task_managers import (
+    ConnectionManager,
+    HttpConnectionPool,
+    SseConnectionManager,
+    StreamableHttpConnectionManager,
+)
 from .base import BaseConnector
+from .transport_cache import HTTP_TRANSPORTS, SSE, STREAMABLE_HTTP, TransportCache, get_default_transport_cache
 
 
 class HttpConnector(BaseConnector):
@@ -32,6 +38,9 @@ class HttpConnector(BaseConnector):
         elicitation_callback: ElicitationFnT | None = None,
         message_handler: MessageHandlerFnT | None = None,
         logging_callback: LoggingFnT | None = None,
+        transport: str = "auto",
+        transport_cache: TransportCache | None = None,
+        http_pool: HttpConnectionPool | None = None,
     ):
         """Initialize a new HTTP connector.
 
@@ -43,7 +52,14 @@ class HttpConnector(BaseConnector):
             sse_read_timeout: Timeout for SSE read operations in seconds.
             sampling_callback: Optional sampling callback.
             elicitation_callback: Optional elicitation callback.
+            transport: "streamable_http" or "sse" to force a transport, or "auto" to
+                negotiate it (remembering the outcome in the transport cache).
+            transport_cache: Cache of negotiated transports. Defaults to the process-wide cache.
+            http_pool: Optional shared connection pool. When set, the connection reuses
+                keep-alive connections with every other connector using the same pool.
         """
+        if transport != "auto" and transport not in HTTP_TRANSPORTS:
+            raise ValueError(f"Unknown HTTP transport '{transport}', expected 'auto' or one of {HTTP_TRANSPORTS}")
         super().__init__(
             sampling_callback=sampling_callback,
             elicitation_callback=elicitation_callback,
@@ -57,6 +73,15 @@ class HttpConnector(BaseConnector):
             self.headers["Authorization"] = f"Bearer {auth_token}"
         self.timeout = timeout
         self.sse_read_timeout = sse_read_timeout
+        self.transport = transport
+        self.transport_cache = transport_cache if transport_cache is not None else get_default_transport_cache()
+        self.transport_type: str | None = None
+        self.http_pool = http_pool
+
+    @property
+    def _httpx_client_factory(self):
+        """Get the httpx client factory for the connection managers, if pooling is enabled."""
+        return self.http_pool.create_client if self.http_pool else None
 
     async def connect(self) -> None:
         """Establish a connection to the MCP implementation."""
@@ -64,19 +89,90 @@ class HttpConnector(BaseConnector):
             logger.debug("Already connected to MCP implementation")
             return
 
-        # Try streamable HTTP first (new transport), fall back to SSE (old transport)
-        # This implements backwards compatibility per MCP specification
         self.transport_type = None
-        connection_manager = None
+        if self.transport == STREAMABLE_HTTP:
+            connection_manager = await self._connect_streamable_http()
+        elif self.transport == SSE:
+            connection_manager = await self._connect_sse()
+        else:
+            connection_manager = await self._negotiate_transport()
+
+        # Store the successful connection manager and mark as connected
+        self._connection_manager = connection_manager
+        self._connected = True
+        logger.debug(f"Successfully connected to MCP implementation via {self.transport_type}: {self.base_url}")
+
+    async def _negotiate_transport(self) -> ConnectionManager:
+        """Connect with the cached transport, or probe streamable HTTP then SSE.
+
+        Returns:
+            The started connection manager.
+        """
+        cached_transport = self.transport_cache.get(self.base_url)
+        if cached_transport is not None:
+            logger.debug(f"Using cached {cached_transport} transport for: {self.base_url}")
+            try:
+                if cached_transport == SSE:
+                    return await self._connect_sse()
+                return await self._connect_streamable_http()
+            except Exception as cached_error:
+                # The server may have changed, forget it and negotiate from scratch
+                logger.debug(f"Cached {cached_transport} transport failed, renegotiating: {cached_error}")
+                self.transport_cache.invalidate(self.base_url)
 
+        # Try streamable HTTP first (new transport), fall back to SSE (old transport)
+        # This implements backwards compatibility per MCP specification
         try:
-            # First, try the new streamable HTTP transport
-            logger.debug(f"Attempting streamable HTTP connection to: {self.base_url}")
-            connection_manager = StreamableHttpConnectionManager(
-                self.base_url, self.headers, self.timeout, self.sse_read_timeout
-            )
+            connection_manager = await self._connect_streamable_http()
+        except Exception as streamable_error:
+            logger.debug(f"Streamable HTTP failed: {streamable_error}")
 
-            # Test if this is a streamable HTTP server by attempting initialization
+            # Check if this is a 4xx error that indicates we should try SSE fallback
+            should_fallback = False
+            if isinstance(streamable_error, httpx.HTTPStatusError):
+                if streamable_error.response.status_code in [404, 405]:
+                    should_fallback = True
+            elif "405 Method Not Allowed" in str(streamable_error) or "404 Not Found" in str(streamable_error):
+                should_fallback = True
+            else:
+                # For other errors, still try fallback but they might indicate
+                # real connectivity issues
+                should_fallback = True
+
+            if not should_fallback:
+                raise streamable_error
+
+            try:
+                connection_manager = await self._connect_sse()
+            except Exception as sse_error:
+                logger.error(f"Both transport methods failed. Streamable HTTP: {streamable_error}, SSE: {sse_error}")
+                raise sse_error
+
+            self.transport_cache.set(self.base_url, SSE)
+            return connection_manager
+
+        self.transport_cache.set(self.base_url, STREAMABLE_HTTP)
+        return connection_manager
+
+    async def _connect_streamable_http(self) -> ConnectionManager:
+        """Connect and initialize a session over the streamable HTTP transport.
+
+        Returns:
+            The started connection manager.
+
+        Raises:
+            Exception: If the server does not accept streamable HTTP.
+        """
+        logger.debug(f"Attempting streamable HTTP connection to: {self.base_url}")
+        connection_manager = StreamableHttpConnectionManager(
+            self.base_url,
+            self.headers,
+            self.timeout,
+            self.sse_read_timeout,
+            httpx_client_factory=self._httpx_client_factory,
+        )
+
+        try:
             read_stream, write_stream = await connection_manager.start()
 
             # Test if this actually works by trying to create a client session and initialize it
@@ -89,14 +185,13 @@ class HttpConnector(BaseConnector):
                 logging_callback=self.logging_callback,
                 client_info=self.client_info,
             )
-            await test_client.__aenter__()
+            await self._enter_client_session(test_client)
 
             try:
                 # Try to initialize - this is where streamable HTTP vs SSE difference should show up
                 result = await test_client.initialize()
 
                 # If we get here, streamable HTTP works
-
                 self.client_session = test_client
                 self.transport_type = "streamable HTTP"
                 self._initialized = True  # Mark as initialized since we just called initialize()
@@ -127,69 +222,66 @@ class HttpConnector(BaseConnector):
 
             except Exception as init_error:
                 # Clean up the test client
+                self.client_session = None
+                self._initialized = False
                 try:
-                    await test_client.__aexit__(None, None, None)
+                    await self._exit_client_session()
                 except Exception:
                     pass
                 raise init_error
 
-        except Exception as streamable_error:
-            logger.debug(f"Streamable HTTP failed: {streamable_error}")
-
+        except Exception:
             # Clean up the failed streamable HTTP connection manager
-            if connection_manager:
-                try:
-                    await connection_manager.close()
-                except Exception:
-                    pass
+            try:
+                await connection_manager.stop()
+            except Exception:
+                pass
+            raise
 
-            # Check if this is a 4xx error that indicates we should try SSE fallback
-            should_fallback = False
-            if isinstance(streamable_error, httpx.HTTPStatusError):
-                if streamable_error.response.status_code in [404, 405]:
-                    should_fallback = True
-            elif "405 Method Not Allowed" in str(streamable_error) or "404 Not Found" in str(streamable_error):
-                should_fallback = True
-            else:
-                # For other errors, still try fallback but they might indicate
-                # real connectivity issues
-                should_fallback = True
+        return connection_manager
 
-            if should_fallback:
-                try:
-                    # Fall back to the old SSE transport
-                    logger.debug(f"Attempting SSE fallback connection to: {self.base_url}")
-                    connection_manager = SseConnectionManager(
-                        self.base_url, self.headers, self.timeout, self.sse_read_timeout
-                    )
-
-                    read_stream, write_stream = await connection_manager.start()
-
-                    # Create the client session for SSE
-                    self.client_session = ClientSession(
-                        read_stream,
-                        write_stream,
-                        sampling_callback=self.sampling_callback,
-                        elicitation_callback=self.elicitation_callback,
-                        message_handler=self._internal_message_handler,
-                        logging_callback=self.logging_callback,
-                        client_info=self.client_info,
-                    )
-                    await self.client_session.__aenter__()
-                    self.transport_type = "SSE"
-
-                except Exception as sse_error:
-                    logger.error(
-                        f"Both transport methods failed. Streamable HTTP: {streamable_error}, SSE: {sse_error}"
-                    )
-                    raise sse_error
-            else:
-                raise streamable_error
+    async def _connect_sse(self) -> ConnectionManager:
+        """Connect a session over the legacy SSE transport.
 
-        # Store the successful connection manager and mark as connected
-        self._connection_manager = connection_manager
-        self._connected = True
-        logger.debug(f"Successfully connected to MCP implementation via {self.transport_type}: {self.base_url}")
+        Returns:
+            The started connection manager.
+
+        Raises:
+            Exception: If the SSE connection cannot be established.
+        """
+        logger.debug(f"Attempting SSE connection to: {self.base_url}")
+        connection_manager = SseConnectionManager(
+            self.base_url,
+            self.headers,
+            self.timeout,
+            self.sse_read_timeout,
+            httpx_client_factory=self._httpx_client_factory,
+        )
+
+        try:
+            read_stream, write_stream = await connection_manager.start()
+
+            # Create the client session for SSE
+            client_session = ClientSession(
+                read_stream,
+                write_stream,
+                sampling_callback=self.sampling_callback,
+                elicitation_callback=self.elicitation_callback,
+                message_handler=self._internal_message_handler,
+                logging_callback=self.logging_callback,
+                client_info=self.client_info,
+            )
+            await self._enter_client_session(client_session)
+        except Exception:
+            try:
+                await connection_manager.stop()
+            except Exception:
+                pass
+            raise
+
+        self.client_session = client_session
+        self.transport_type = "SSE"
+        return connection_manager
 
     @property
     def public_identifier(self) -> str:
@@ -0,0 +1,166 @@
+"""
+In-process connector for Python MCP servers.
+
+This module provides a connector that mounts a Python MCP server (FastMCP or a
+low-level ``mcp.server.Server``) in the current event loop instead of spawning
+it as a stdio subprocess.
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any
+
+from mcp import ClientSession
+from mcp.client.session import ElicitationFnT, LoggingFnT, MessageHandlerFnT, SamplingFnT
+from mcp.server.lowlevel import Server
+
+from ..logging import logger
+from ..task_managers import InProcessConnectionManager
+from .base import BaseConnector
+
+
+def load_server(spec: str, path: str | None = None) -> Any:
+    """Import the MCP server object named by a "module:attribute" spec.
+
+    Args:
+        spec: The module and attribute holding the server, e.g. "user_server:app".
+            The module can be a dotted import path or a path to a .py file. The
+            attribute defaults to "mcp" when omitted.
+        path: Optional directory added to sys.path before importing.
+
+    Returns:
+        The server object.
+
+    Raises:
+        ValueError: If the spec is malformed or the attribute does not exist.
+    """
+    module_name, _, attribute = spec.partition(":")
+    if not module_name:
+        raise ValueError(f"Invalid in-process server spec '{spec}', expected 'module:attribute'")
+    attribute = attribute or "mcp"
+
+    if path and path not in sys.path:
+        sys.path.insert(0, path)
+
+    if module_name.endswith(".py"):
+        file_path = Path(path or ".", module_name).resolve()
+        import_name = file_path.stem
+        module = sys.modules.get(import_name)
+        if module is None or getattr(module, "__file__", None) != str(file_path):
+            module_spec = importlib.util.spec_from_file_location(import_name, file_path)
+            if module_spec is None or module_spec.loader is None:
+                raise ValueError(f"Cannot load in-process server module from {file_path}")
+            module = importlib.util.module_from_spec(module_spec)
+            sys.modules[import_name] = module
+            module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+
+    try:
+        return getattr(module, attribute)
+    except AttributeError as e:
+        raise ValueError(f"Module '{module_name}' has no attribute '{attribute}'") from e
+
+
+def get_lowlevel_server(server: Any) -> Server:
+    """Get the low-level MCP server behind a FastMCP app.
+
+    Args:
+        server: A FastMCP app (from ``fastmcp`` or ``mcp.server.fastmcp``) or a low-level Server.
+
+    Returns:
+        The low-level Server that can be run over streams.
+
+    Raises:
+        TypeError: If the object is not an MCP server.
+    """
+    lowlevel = getattr(server, "_mcp_server", server)
+    if not isinstance(lowlevel, Server):
+        raise TypeError(f"Expected a FastMCP app or mcp.server.Server, got {type(server).__name__}")
+    return lowlevel
+
+
+class InProcessConnector(BaseConnector):
+    """Connector for Python MCP servers running in the same process.
+
+    The server is mounted in the current event loop and connected over in-memory
+    streams, which avoids the process spawn and pipe serialization of stdio.
+    """
+
+    def __init__(
+        self,
+        server: Any,
+        path: str | None = None,
+        raise_exceptions: bool = False,
+        sampling_callback: SamplingFnT | None = None,
+        elicitation_callback: ElicitationFnT | None = None,
+        message_handler: MessageHandlerFnT | None = None,
+        logging_callback: LoggingFnT | None = None,
+    ):
+        """Initialize a new in-process connector.
+
+        Args:
+            server: The server object (FastMCP app or low-level Server), or a
+                "module:attribute" spec to import it from.
+            path: Optional directory added to sys.path when importing a spec.
+            raise_exceptions: Whether server errors should propagate instead of being
+                returned as error responses.
+            sampling_callback: Optional callback to sample the client.
+            elicitation_callback: Optional callback to elicit the client.
+            message_handler: Optional callback to handle messages.
+            logging_callback: Optional callback to handle log messages.
+        """
+        super().__init__(
+            sampling_callback=sampling_callback,
+            elicitation_callback=elicitation_callback,
+            message_handler=message_handler,
+            logging_callback=logging_callback,
+        )
+        self.spec = server if isinstance(server, str) else None
+        self.path = path
+        self.raise_exceptions = raise_exceptions
+        self._server = None if isinstance(server, str) else get_lowlevel_server(server)
+
+    @property
+    def server(self) -> Server:
+        """Get the low-level server, importing it from the spec on first use."""
+        if self._server is None:
+            self._server = get_lowlevel_server(load_server(self.spec, self.path))
+        return self._server
+
+    async def connect(self) -> None:
+        """Start the server in-process and connect to it."""
+        if self._connected:
+            logger.debug("Already connected to MCP implementation")
+            return
+
+        logger.debug(f"Connecting to in-process MCP server: {self.server.name}")
+        try:
+            self._connection_manager = InProcessConnectionManager(self.server, self.raise_exceptions)
+            read_stream, write_stream = await self._connection_manager.start()
+
+            self.client_session = ClientSession(
+                read_stream,
+                write_stream,
+                sampling_callback=self.sampling_callback,
+                elicitation_callback=self.elicitation_callback,
+                message_handler=self._internal_message_handler,
+                logging_callback=self.logging_callback,
+                client_info=self.client_info,
+            )
+            await self._enter_client_session(self.client_session)
+
+            self._connected = True
+            logger.debug(f"Successfully connected to in-process MCP server: {self.server.name}")
+
+        except Exception as e:
+            logger.error(f"Failed to connect to in-process MCP server: {e}")
+            await self._cleanup_resources()
+            raise
+
+    @property
+    def public_identifier(self) -> str:
+        """Get the identifier for the connector."""
+        return {"type": "in_process", "server": self.spec or self.server.name}
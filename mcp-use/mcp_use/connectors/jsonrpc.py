@@ -0,0 +1,272 @@
+"""
+JSON-RPC multiplexing for message-based MCP transports.
+
+This module provides a multiplexer that matches JSON-RPC responses to
+in-flight requests over a single connection, with per-request deadlines,
+a bounded in-flight window, batched sends and notification dispatch.
+"""
+
+import asyncio
+import itertools
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from mcp.shared.exceptions import McpError
+from mcp.types import METHOD_NOT_FOUND, ErrorData
+
+from ..logging import logger
+from .timeouts import CANCEL_NOTIFICATION_TIMEOUT
+
+try:
+    import orjson  # optional fast JSON codec
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    loads = json.loads
+
+
+SendFn = Callable[[str], Awaitable[None]]
+MessageCallback = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+class JsonRpcMultiplexer:
+    """Multiplexes JSON-RPC requests and responses over a single connection.
+
+    The multiplexer does not own the connection: it writes encoded messages
+    through the ``send`` coroutine and expects the owner to feed every
+    received frame to :meth:`dispatch`.
+    """
+
+    def __init__(
+        self,
+        send: SendFn,
+        request_timeout: float | None = 60.0,
+        max_in_flight: int = 64,
+        notification_handler: MessageCallback | None = None,
+        request_handler: MessageCallback | None = None,
+        cancel_method: str | None = None,
+    ) -> None:
+        """Initialize a new multiplexer.
+
+        Args:
+            send: Coroutine that writes one encoded frame to the connection.
+            request_timeout: Default deadline in seconds for a request, None to wait forever.
+            max_in_flight: Maximum number of requests awaiting a response. Further
+                requests wait for a free slot (backpressure).
+            notification_handler: Optional coroutine called with each server notification.
+            request_handler: Optional coroutine called with each server-initiated request,
+                whose return value is sent back as the result.
+            cancel_method: Optional method of the notification telling the server to stop
+                working on a request that timed out or was cancelled, e.g. "notifications/cancelled".
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._send = send
+        self.request_timeout = request_timeout
+        self.max_in_flight = max_in_flight
+        self.notification_handler = notification_handler
+        self.request_handler = request_handler
+        self.cancel_method = cancel_method
+        self.pending_requests: dict[int, asyncio.Future] = {}
+        self._window = asyncio.Semaphore(max_in_flight)
+        # Serializes slot acquisition so concurrent batches cannot each hold part of the window
+        self._window_lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+        self._closed_error: Exception | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently awaiting a response."""
+        return len(self.pending_requests)
+
+    async def request(self, method: str, params: dict[str, Any] | None = None, timeout: float | None = None) -> Any:
+        """Send a request and wait for its result.
+
+        Args:
+            method: The JSON-RPC method.
+            params: Optional request parameters.
+            timeout: Deadline in seconds, including the wait for a free in-flight slot.
+                Defaults to the multiplexer's request_timeout.
+
+        Returns:
+            The ``result`` member of the response.
+
+        Raises:
+            TimeoutError: If no response arrived before the deadline.
+            McpError: If the server answered with a JSON-RPC error.
+            ConnectionError: If the connection was closed.
+        """
+        results = await self._call([(method, params)], timeout)
+        return results[0]
+
+    async def request_batch(
+        self, calls: list[tuple[str, dict[str, Any] | None]], timeout: float | None = None
+    ) -> list[Any]:
+        """Send several requests in a single JSON-RPC batch frame.
+
+        Args:
+            calls: (method, params) pairs.
+            timeout: Deadline in seconds for the whole batch.
+
+        Returns:
+            The results in the same order as the calls.
+
+        Raises:
+            ValueError: If the batch is larger than the in-flight window.
+            TimeoutError: If a response did not arrive before the deadline.
+            McpError: If the server answered any call with a JSON-RPC error.
+        """
+        if not calls:
+            return []
+        if len(calls) > self.max_in_flight:
+            raise ValueError(f"Batch of {len(calls)} requests exceeds the in-flight window of {self.max_in_flight}")
+        return await self._call(calls, timeout)
+
+    async def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Send a notification, which gets no response.
+
+        Args:
+            method: The JSON-RPC method.
+            params: Optional notification parameters.
+        """
+        self._check_open()
+        message: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self._send(dumps(message))
+
+    async def _call(self, calls: list[tuple[str, dict[str, Any] | None]], timeout: float | None) -> list[Any]:
+        """Send one or more requests in one frame and wait for all results."""
+        timeout = self.request_timeout if timeout is None else timeout
+        acquired = 0
+        request_ids: list[int] = []
+        sent = False
+        try:
+            async with asyncio.timeout(timeout):
+                async with self._window_lock:
+                    for _ in calls:
+                        await self._window.acquire()
+                        acquired += 1
+                self._check_open()
+
+                loop = asyncio.get_running_loop()
+                messages = []
+                futures = []
+                for method, params in calls:
+                    request_id = next(self._ids)
+                    future = loop.create_future()
+                    self.pending_requests[request_id] = future
+                    request_ids.append(request_id)
+                    futures.append(future)
+                    messages.append({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+
+                await self._send(dumps(messages[0] if len(messages) == 1 else messages))
+                sent = True
+                logger.debug(f"Sent {len(messages)} request(s), first method {calls[0][0]!r}")
+                return list(await asyncio.gather(*futures))
+        except TimeoutError:
+            logger.warning(f"{len(calls)} JSON-RPC request(s) starting with {calls[0][0]!r} timed out after {timeout}s")
+            raise TimeoutError(f"No response to {calls[0][0]!r} within {timeout} seconds") from None
+        finally:
+            # Drop pending entries so a late or missing reply cannot leak them; answered ones are already gone
+            unanswered = []
+            for request_id in request_ids:
+                future = self.pending_requests.pop(request_id, None)
+                if future is not None:
+                    future.cancel()
+                    unanswered.append(request_id)
+            for _ in range(acquired):
+                self._window.release()
+            if sent and unanswered and self.cancel_method:
+                await self._cancel_requests(unanswered)
+
+    async def _cancel_requests(self, request_ids: list[int]) -> None:
+        """Tell the server to stop working on requests given up on."""
+        try:
+            async with asyncio.timeout(CANCEL_NOTIFICATION_TIMEOUT):
+                for request_id in request_ids:
+                    params = {"requestId": request_id, "reason": "The request timed out or was cancelled"}
+                    await self.notify(self.cancel_method, params)
+            logger.debug(f"Notified the server of {len(request_ids)} cancelled request(s)")
+        except Exception as e:
+            logger.debug(f"Could not notify the server of cancelled requests {request_ids}: {e}")
+
+    async def dispatch(self, raw: str | bytes) -> None:
+        """Route one received frame to the waiting requests or the handlers.
+
+        Args:
+            raw: The encoded frame, a single JSON-RPC message or a batch.
+        """
+        try:
+            data = loads(raw)
+        except ValueError as e:
+            logger.warning(f"Dropping undecodable JSON-RPC frame: {e}")
+            return
+
+        for message in data if isinstance(data, list) else [data]:
+            if not isinstance(message, dict):
+                logger.warning(f"Dropping invalid JSON-RPC message: {message!r}")
+                continue
+            if "method" not in message:
+                self._resolve(message)
+            elif "id" in message:
+                await self._handle_server_request(message)
+            elif self.notification_handler:
+                try:
+                    await self.notification_handler(message)
+                except Exception as e:
+                    logger.error(f"Error in notification handler for {message.get('method')}: {e}")
+            else:
+                logger.debug(f"Received notification: {message.get('method')}")
+
+    def _resolve(self, message: dict[str, Any]) -> None:
+        """Complete the future of the request a response belongs to."""
+        future = self.pending_requests.pop(message.get("id"), None)
+        if future is None or future.done():
+            logger.debug(f"Dropping response for unknown or expired request {message.get('id')}")
+            return
+        if "error" in message:
+            error = message["error"]
+            future.set_exception(McpError(ErrorData.model_validate(error) if isinstance(error, dict) else error))
+        else:
+            future.set_result(message.get("result"))
+
+    async def _handle_server_request(self, message: dict[str, Any]) -> None:
+        """Answer a request initiated by the server."""
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+        if self.request_handler is None:
+            response["error"] = {"code": METHOD_NOT_FOUND, "message": f"Method not found: {message['method']}"}
+        else:
+            try:
+                response["result"] = await self.request_handler(message)
+            except McpError as e:
+                response["error"] = e.error.model_dump(exclude_none=True)
+            except Exception as e:
+                response["error"] = {"code": -32603, "message": str(e)}
+        await self._send(dumps(response))
+
+    def close(self, error: Exception | None = None) -> None:
+        """Fail every pending request and reject new ones.
+
+        Args:
+            error: The exception given to pending requests.
+        """
+        self._closed_error = error or ConnectionError("Connection closed")
+        if self.pending_requests:
+            logger.debug(f"Rejecting {len(self.pending_requests)} pending requests")
+        for future in self.pending_requests.values():
+            if not future.done():
+                future.set_exception(self._closed_error)
+        self.pending_requests.clear()
+
+    def _check_open(self) -> None:
+        if self._closed_error is not None:
+            raise ConnectionError(f"Connection closed: {self._closed_error}")
@@ -0,0 +1,112 @@
+"""
+Reconnection policy for MCP connectors.
+
+This module provides the backoff policy and statistics used by connectors to
+re-establish a lost connection.
+"""
+
+import random
+import time
+from typing import Any
+
+
+class ReconnectPolicy:
+    """Capped exponential backoff with jitter for reconnection attempts."""
+
+    def __init__(
+        self,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        max_attempts: int | None = 5,
+        wait_timeout: float | None = 60.0,
+    ) -> None:
+        """Initialize a new reconnection policy.
+
+        Args:
+            initial_delay: Seconds to wait after the first failed attempt.
+            max_delay: Upper bound in seconds for the wait between attempts.
+            multiplier: Factor applied to the delay after each failed attempt.
+            jitter: Fraction (0 to 1) of each delay that is randomized, so that
+                many clients do not retry in lockstep.
+            max_attempts: Attempts per reconnection before giving up, None to retry forever.
+            wait_timeout: Default seconds a caller waits for an ongoing reconnection,
+                None to wait until it finishes.
+        """
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if max_attempts is not None and max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.wait_timeout = wait_timeout
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "ReconnectPolicy":
+        """Create a policy from the "reconnect" section of a server configuration.
+
+        Args:
+            config: Policy options, using the constructor argument names.
+
+        Returns:
+            The configured ReconnectPolicy.
+        """
+        return cls(**config)
+
+    def backoff(self, attempt: int) -> float:
+        """Get the delay before the next attempt.
+
+        Args:
+            attempt: Number of failed attempts so far (1 for the first failure).
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+class ReconnectStats:
+    """Counters describing the reconnections of one connector."""
+
+    def __init__(self) -> None:
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.total_downtime = 0.0
+        self.last_downtime: float | None = None
+        self.disconnected_since: float | None = None
+
+    def mark_disconnected(self) -> None:
+        """Record that the connection was found lost, if not already recorded."""
+        if self.disconnected_since is None:
+            self.disconnected_since = time.monotonic()
+
+    def mark_reconnected(self) -> None:
+        """Record a successful reconnection and the downtime it ended."""
+        self.reconnects += 1
+        if self.disconnected_since is not None:
+            self.last_downtime = time.monotonic() - self.disconnected_since
+            self.total_downtime += self.last_downtime
+            self.disconnected_since = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the counters as a dictionary.
+
+        Returns:
+            Reconnect counts, failed attempts and downtime in seconds, including
+            the ongoing outage if the connection is currently down.
+        """
+        current_downtime = None
+        if self.disconnected_since is not None:
+            current_downtime = time.monotonic() - self.disconnected_since
+        return {
+            "reconnects": self.reconnects,
+            "failed_attempts": self.failed_attempts,
+            "total_downtime": self.total_downtime + (current_downtime or 0.0),
+            "last_downtime": self.last_downtime,
+            "current_downtime": current_downtime,
+        }
@@ -0,0 +1,377 @@
+"""
+Client-side load balancing across replicas of an MCP server.
+
+This module provides a connector that holds one connection per replica of a
+server and spreads requests across them, taking failing replicas out of
+rotation and optionally hedging slow idempotent requests.
+"""
+
+import asyncio
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any, TypeVar
+
+from mcp.types import CallToolResult, GetPromptResult, Prompt, ReadResourceResult, Resource, Tool
+from pydantic import AnyUrl
+
+from ..logging import logger
+from .admission import AdmissionRejectedError
+from .base import BaseConnector
+from .circuit_breaker import CircuitOpenError, is_server_failure
+
+T = TypeVar("T")
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+STRATEGIES = (ROUND_ROBIN, LEAST_OUTSTANDING)
+
+
+class ReplicaUnavailableError(RuntimeError):
+    """Raised when a replica cannot be reached, before the request was sent to it."""
+
+
+class Replica:
+    """A replica of a server and its load balancing state."""
+
+    def __init__(self, connector: BaseConnector):
+        self.connector = connector
+        self.outstanding = 0
+        self.requests = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.last_error: str | None = None
+        self.startup_failed = False  # Whether connecting or initializing failed in ReplicatedConnector.connect
+        self.connect_lock = asyncio.Lock()
+
+    @property
+    def ejected(self) -> bool:
+        """Whether the replica is out of rotation."""
+        return self.ejected_until > time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        """Get the replica's load balancing state."""
+        return {
+            "replica": self.connector.public_identifier,
+            "connected": self.connector.is_connected,
+            "ejected": self.ejected,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+
+class ReplicatedConnector(BaseConnector):
+    """Connector for a server deployed as several interchangeable replicas.
+
+    Each request goes to one replica, chosen in turn (round_robin) or as the one
+    with the fewest requests in flight (least_outstanding). A replica failing
+    ``max_failures`` times in a row is taken out of rotation for
+    ``ejection_time`` seconds. Idempotent requests (resource reads, prompts,
+    listings and tools marked read-only or idempotent) fail over to another
+    replica, and when ``hedge_after`` is set, are also sent to a second replica
+    if the first has not answered after that many seconds; the first answer wins.
+    Any request that could not be sent to its replica fails over as well. A
+    replica that could not be reached at startup is connected to the next time
+    it is chosen, once its ejection has expired, unless its auto_reconnect is off.
+    """
+
+    def __init__(
+        self,
+        replicas: list[BaseConnector],
+        strategy: str = ROUND_ROBIN,
+        max_failures: int = 1,
+        ejection_time: float = 30.0,
+        hedge_after: float | None = None,
+        hedge_tools: list[str] | None = None,
+    ):
+        """Initialize a new replicated connector.
+
+        Args:
+            replicas: One connector per replica of the server.
+            strategy: "round_robin" or "least_outstanding".
+            max_failures: Consecutive failures that take a replica out of rotation.
+            ejection_time: Seconds a failing replica stays out of rotation.
+            hedge_after: Seconds after which an unanswered idempotent request is also
+                sent to another replica, None to disable hedging.
+            hedge_tools: Names of tools that are safe to send twice, in addition to the
+                tools annotated as read-only or idempotent by the server.
+        """
+        if not replicas:
+            raise ValueError("At least one replica is required")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown load balancing strategy '{strategy}', expected one of {STRATEGIES}")
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+        super().__init__()
+        self.replicas = [Replica(connector) for connector in replicas]
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.hedge_after = hedge_after
+        self.hedge_tools = set(hedge_tools or [])
+        self._turn = itertools.count()
+        self._hedged = 0
+        self._failovers = 0
+
+    @property
+    def public_identifier(self) -> dict[str, Any]:
+        """Get the identifier for the connector."""
+        return {"type": "replicated", "replicas": [replica.connector.public_identifier for replica in self.replicas]}
+
+    async def connect(self) -> None:
+        """Connect to every replica, ejecting those that cannot be reached.
+
+        Raises:
+            RuntimeError: If no replica can be reached.
+        """
+        if self._connected:
+            logger.debug("Already connected to MCP implementation")
+            return
+
+        results = await asyncio.gather(
+            *(replica.connector.connect() for replica in self.replicas), return_exceptions=True
+        )
+        for replica, result in zip(self.replicas, results, strict=True):
+            replica.startup_failed = isinstance(result, Exception)
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to connect to replica {replica.connector.public_identifier}: {result}")
+                self._record_failure(replica, result, eject=True)
+        connected = [replica for replica in self.replicas if replica.connector.client_session is not None]
+        if not connected:
+            raise RuntimeError(f"Failed to connect to any of the {len(self.replicas)} replicas")
+
+        # Expose a session for callers checking the connection state
+        self.client_session = connected[0].connector.client_session
+        self._connected = True
+        logger.debug(f"Connected to {len(connected)} of {len(self.replicas)} replicas")
+
+    async def initialize(self) -> dict[str, Any]:
+        """Initialize the connected replicas and cache the catalog of the first one."""
+        if not self._connected:
+            raise RuntimeError("MCP client is not connected")
+        if self._initialized:
+            return {"status": "already_initialized"}
+
+        connected = [replica for replica in self.replicas if replica.connector.client_session is not None]
+        results = await asyncio.gather(
+            *(replica.connector.initialize() for replica in connected), return_exceptions=True
+        )
+        result = None
+        for replica, replica_result in zip(connected, results, strict=True):
+            if isinstance(replica_result, Exception):
+                logger.warning(f"Failed to initialize replica {replica.connector.public_identifier}: {replica_result}")
+                self._record_failure(replica, replica_result, eject=True)
+                replica.startup_failed = True
+                # Drop the session so the replica is connected to again once its ejection expires
+                await replica.connector.disconnect()
+            elif result is None:
+                result = replica_result
+                self.capabilities = replica.connector.capabilities
+                self._tools = replica.connector._tools
+                self._resources = replica.connector._resources
+                self._prompts = replica.connector._prompts
+        if result is None:
+            raise RuntimeError(f"Failed to initialize any of the {len(self.replicas)} replicas")
+
+        self._initialized = True
+        return result
+
+    async def _cleanup_resources(self) -> None:
+        """Disconnect every replica."""
+        await asyncio.gather(*(replica.connector.disconnect() for replica in self.replicas), return_exceptions=True)
+        self.client_session = None
+        self._tools = None
+        self._resources = None
+        self._prompts = None
+        self._initialized = False
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if at least one replica is connected."""
+        return self._connected and any(replica.connector.is_connected for replica in self.replicas)
+
+    async def _ensure_connected(self, timeout: float | None = None) -> None:
+        """Check the connector is connected; each replica reconnects on its own."""
+        if not self._connected:
+            raise RuntimeError("MCP client is not connected")
+
+    def health(self) -> dict[str, Any]:
+        """Get the health of the server and of each of its replicas.
+
+        Returns:
+            A dictionary with the connection state, policy metrics, the number of
+            hedged and failed over requests, and the state of each replica.
+        """
+        health = super().health()
+        health["hedged"] = self._hedged
+        health["failovers"] = self._failovers
+        health["replicas"] = [replica.stats() for replica in self.replicas]
+        return health
+
+    def _select(self, exclude: list[Replica]) -> Replica | None:
+        """Choose the replica for the next attempt of a request."""
+        candidates = [replica for replica in self.replicas if replica not in exclude]
+        if not candidates:
+            return None
+        in_rotation = [replica for replica in candidates if not replica.ejected]
+        if not in_rotation:
+            # Every replica left is ejected: try the one that will be back the soonest
+            return min(candidates, key=lambda replica: replica.ejected_until)
+
+        start = next(self._turn) % len(in_rotation)
+        rotated = in_rotation[start:] + in_rotation[:start]
+        if self.strategy == LEAST_OUTSTANDING:
+            return min(rotated, key=lambda replica: replica.outstanding)
+        return rotated[0]
+
+    def _record_failure(self, replica: Replica, error: BaseException, eject: bool = False) -> None:
+        replica.consecutive_failures += 1
+        replica.last_error = f"{type(error).__name__}: {error}"
+        if eject or replica.consecutive_failures >= self.max_failures:
+            replica.ejected_until = time.monotonic() + self.ejection_time
+            logger.warning(
+                f"Taking replica {replica.connector.public_identifier} out of rotation "
+                f"for {self.ejection_time}s: {replica.last_error}"
+            )
+
+    async def _prepare(self, replica: Replica) -> None:
+        """Make sure a replica is connected before sending it a request.
+
+        Raises:
+            ReplicaUnavailableError: If the replica cannot be reached.
+        """
+        connector = replica.connector
+        try:
+            async with replica.connect_lock:
+                if replica.startup_failed and connector.auto_reconnect:
+                    # The replica could not be reached at startup: connect now that its ejection expired
+                    logger.debug(f"Connecting to replica {connector.public_identifier}")
+                    await connector.connect()
+                    try:
+                        if self._initialized:
+                            await connector.initialize()
+                    except Exception:
+                        await connector.disconnect()
+                        raise
+                    replica.startup_failed = False
+            await connector._ensure_connected()
+        except Exception as e:
+            raise ReplicaUnavailableError(f"Replica {connector.public_identifier} is unavailable: {e}") from e
+
+    async def _attempt(self, replica: Replica, operation: Callable[[BaseConnector], Awaitable[T]]) -> T:
+        """Send a request to one replica and update its state."""
+        replica.outstanding += 1
+        replica.requests += 1
+        try:
+            await self._prepare(replica)
+            result = await operation(replica.connector)
+        except Exception as e:
+            if is_server_failure(e):
+                self._record_failure(replica, e)
+            raise
+        finally:
+            replica.outstanding -= 1
+        replica.consecutive_failures = 0
+        replica.ejected_until = 0.0
+        return result
+
+    async def _dispatch(self, operation: Callable[[BaseConnector], Awaitable[T]], idempotent: bool) -> T:
+        """Send a request to a replica, failing over and hedging idempotent requests.
+
+        Args:
+            operation: Sends the request through a replica's connector.
+            idempotent: Whether the request can safely be sent more than once.
+
+        Returns:
+            The first successful result.
+        """
+        tried: list[Replica] = []
+        pending: set[asyncio.Task] = set()
+        error: BaseException | None = None
+        try:
+            while True:
+                replica = self._select(exclude=tried)
+                if replica is not None:
+                    tried.append(replica)
+                    pending.add(asyncio.create_task(self._attempt(replica, operation)))
+                elif not pending:
+                    raise error or RuntimeError("No replica available")
+
+                hedge = idempotent and self.hedge_after is not None and len(tried) < len(self.replicas)
+                done, pending = await asyncio.wait(
+                    pending, timeout=self.hedge_after if hedge else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self._hedged += 1
+                    logger.debug(f"No answer after {self.hedge_after}s, hedging request to another replica")
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                sent = not isinstance(error, ReplicaUnavailableError | CircuitOpenError | AdmissionRejectedError)
+                if sent and not (idempotent and is_server_failure(error)):
+                    raise error
+                if len(tried) < len(self.replicas):
+                    self._failovers += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _is_idempotent(self, tool_name: str) -> bool:
+        """Whether a tool can be called twice, from the config or the server's annotations."""
+        if tool_name in self.hedge_tools:
+            return True
+        for tool in self._tools or []:
+            if tool.name == tool_name:
+                annotations = tool.annotations
+                return bool(annotations and (annotations.readOnlyHint or annotations.idempotentHint))
+        return False
+
+    async def _call_tool(
+        self, name: str, arguments: dict[str, Any], read_timeout_seconds: timedelta | None = None
+    ) -> CallToolResult:
+        """Send a tool call to a replica."""
+        await self._ensure_connected()
+        return await self._dispatch(
+            lambda connector: connector.call_tool(name, arguments, read_timeout_seconds),
+            idempotent=self._is_idempotent(name),
+        )
+
+    async def list_tools(self) -> list[Tool]:
+        """List all available tools from a replica."""
+        await self._ensure_connected()
+        self._tools = await self._dispatch(lambda connector: connector.list_tools(), idempotent=True)
+        return self._tools
+
+    async def list_resources(self) -> list[Resource]:
+        """List all available resources from a replica."""
+        await self._ensure_connected()
+        self._resources = await self._dispatch(lambda connector: connector.list_resources(), idempotent=True)
+        return self._resources
+
+    async def read_resource(self, uri: AnyUrl) -> ReadResourceResult:
+        """Read a resource by URI from a replica."""
+        async with self._request_slot():
+            await self._ensure_connected()
+            return await self._dispatch(lambda connector: connector.read_resource(uri), idempotent=True)
+
+    async def list_prompts(self) -> list[Prompt]:
+        """List all available prompts from a replica."""
+        await self._ensure_connected()
+        self._prompts = await self._dispatch(lambda connector: connector.list_prompts(), idempotent=True)
+        return self._prompts
+
+    async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> GetPromptResult:
+        """Get a prompt by name from a replica."""
+        async with self._request_slot():
+            await self._ensure_connected()
+            return await self._dispatch(lambda connector: connector.get_prompt(name, arguments), idempotent=True)
+
+    async def request(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        """Send a raw request to a replica."""
+        await self._ensure_connected()
+        return await self._dispatch(lambda connector: connector.request(method, params), idempotent=False)
@@ -235,7 +235,7 @@ class SandboxConnector(BaseConnector):
                 logging_callback=self.logging_callback,
                 client_info=self.client_info,
             )
-            await self.client_session.__aenter__()
+            await self._enter_client_session(self.client_session)
 
             # Mark as connected
             self._connected = True
@@ -6,6 +6,7 @@ through the standard input/output streams.
 """
 
 import sys
+from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.session import ElicitationFnT, LoggingFnT, MessageHandlerFnT, SamplingFnT
@@ -13,6 +14,7 @@ from mcp.client.session import ElicitationFnT, LoggingFnT, MessageHandlerFnT, Sa
 from ..logging import logger
 from ..task_managers import StdioConnectionManager
 from .base import BaseConnector
+from .supervisor import ProcessSupervisor
 
 
 class StdioConnector(BaseConnector):
@@ -54,6 +56,24 @@ class StdioConnector(BaseConnector):
         self.args = args or []  # Ensure args is never None
         self.env = env
         self.errlog = errlog
+        self.supervisor: ProcessSupervisor | None = None
+
+    def supervise(self, **options: Any) -> ProcessSupervisor:
+        """Supervise the server process with health probes and restarts.
+
+        The supervisor starts with the next connection.
+
+        Args:
+            **options: ProcessSupervisor options (probe_interval, probe_timeout,
+                failure_threshold, max_restarts, restart_window).
+
+        Returns:
+            The supervisor attached to this connector.
+        """
+        self.supervisor = ProcessSupervisor(self, **options)
+        if self._connected:
+            self.supervisor.start()
+        return self.supervisor
 
     async def connect(self) -> None:
         """Establish a connection to the MCP implementation."""
@@ -80,12 +100,15 @@ class StdioConnector(BaseConnector):
                 logging_callback=self.logging_callback,
                 client_info=self.client_info,
             )
-            await self.client_session.__aenter__()
+            await self._enter_client_session(self.client_session)
 
             # Mark as connected
             self._connected = True
             logger.debug(f"Successfully connected to MCP implementation: {self.command}")
 
+            if self.supervisor:
+                self.supervisor.start()
+
         except Exception as e:
             logger.error(f"Failed to connect to MCP implementation: {e}")
 
@@ -95,6 +118,23 @@ class StdioConnector(BaseConnector):
             # Re-raise the original exception
             raise
 
+    async def disconnect(self) -> None:
+        """Stop supervision and close the connection to the MCP implementation."""
+        if self.supervisor:
+            await self.supervisor.stop()
+        await super().disconnect()
+
+    def health(self) -> dict[str, Any]:
+        """Get the health of the server process.
+
+        Returns:
+            The supervisor's health report when supervised, otherwise the connection state,
+            together with reconnection counters.
+        """
+        if not self.supervisor:
+            return super().health()
+        return {**self.supervisor.health(), "reconnects": self.reconnect_stats}
+
     @property
     def public_identifier(self) -> str:
         """Get the identifier for the connector."""
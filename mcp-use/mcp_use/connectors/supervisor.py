@@ -0,0 +1,190 @@
+"""
+Supervision of MCP server processes.
+
+This module provides a supervisor that probes a server with MCP pings and
+restarts it when it crashes or stops answering.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from ..logging import logger
+
+if TYPE_CHECKING:
+    from .base import BaseConnector
+
+STARTING = "starting"
+HEALTHY = "healthy"
+UNHEALTHY = "unhealthy"
+RESTARTING = "restarting"
+FAILED = "failed"
+STOPPED = "stopped"
+
+
+class ProcessSupervisor:
+    """Health prober and restarter for the server behind a connector.
+
+    Every ``probe_interval`` seconds the supervisor sends an MCP ping. After
+    ``failure_threshold`` consecutive failed or timed-out pings the server is
+    considered crashed or hung and the connection is replaced, which stops the
+    old process and starts a new one. At most ``max_restarts`` restarts are
+    allowed within ``restart_window`` seconds; past that budget the supervisor
+    gives up and reports the server as failed.
+    """
+
+    def __init__(
+        self,
+        connector: "BaseConnector",
+        probe_interval: float = 30.0,
+        probe_timeout: float = 10.0,
+        failure_threshold: int = 2,
+        max_restarts: int = 5,
+        restart_window: float = 600.0,
+    ) -> None:
+        """Initialize a new supervisor.
+
+        Args:
+            connector: The connector whose server is supervised.
+            probe_interval: Seconds between two health probes.
+            probe_timeout: Seconds a ping may take before the probe fails.
+            failure_threshold: Consecutive failed probes that trigger a restart.
+            max_restarts: Maximum number of restarts within restart_window.
+            restart_window: Length in seconds of the restart budget window.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.connector = connector
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.failure_threshold = failure_threshold
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+
+        self.state = STOPPED
+        self.consecutive_failures = 0
+        self.last_probe_at: float | None = None
+        self.last_probe_latency: float | None = None
+        self.last_error: str | None = None
+        self.total_restarts = 0
+        self._restart_times: deque[float] = deque()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the supervisor loop is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start supervising, if not already running."""
+        if self.running:
+            return
+        self.state = STARTING
+        self.consecutive_failures = 0
+        self._task = asyncio.create_task(self._run(), name="mcp_process_supervisor")
+
+    async def stop(self) -> None:
+        """Stop supervising."""
+        task, self._task = self._task, None
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.state = STOPPED
+
+    async def probe(self) -> bool:
+        """Send one ping to the server.
+
+        Returns:
+            True if the server answered within probe_timeout, False otherwise.
+        """
+        self.last_probe_at = time.time()
+        session = self.connector.client_session
+        if session is None or not self.connector.is_connected:
+            self._record_failure("not connected")
+            return False
+
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(session.send_ping(), self.probe_timeout)
+        except TimeoutError:
+            self._record_failure(f"ping timed out after {self.probe_timeout}s")
+            return False
+        except Exception as e:
+            self._record_failure(f"ping failed: {e}")
+            return False
+
+        self.last_probe_latency = time.monotonic() - start
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.state = HEALTHY
+        return True
+
+    def _record_failure(self, error: str) -> None:
+        self.consecutive_failures += 1
+        self.last_error = error
+        self.state = UNHEALTHY
+        logger.warning(f"Health probe failed for {self.connector.public_identifier}: {error}")
+
+    def _restart_allowed(self) -> bool:
+        """Check the restart budget, forgetting restarts older than the window."""
+        now = time.monotonic()
+        while self._restart_times and now - self._restart_times[0] > self.restart_window:
+            self._restart_times.popleft()
+        return len(self._restart_times) < self.max_restarts
+
+    async def restart(self) -> bool:
+        """Replace the server process if the restart budget allows it.
+
+        Returns:
+            True if the server was restarted and answers pings again.
+        """
+        if not self._restart_allowed():
+            self.state = FAILED
+            logger.error(
+                f"Giving up on {self.connector.public_identifier}: "
+                f"{self.max_restarts} restarts within {self.restart_window}s"
+            )
+            return False
+
+        self.state = RESTARTING
+        self._restart_times.append(time.monotonic())
+        self.total_restarts += 1
+        logger.warning(f"Restarting MCP server {self.connector.public_identifier}")
+        try:
+            await self.connector.reconnect()
+        except Exception as e:
+            self._record_failure(f"restart failed: {e}")
+            return False
+        return await self.probe()
+
+    async def _run(self) -> None:
+        """Probe periodically and restart the server when it is unhealthy."""
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            if await self.probe() or self.consecutive_failures < self.failure_threshold:
+                continue
+            await self.restart()
+            if self.state == FAILED:
+                return
+
+    def health(self) -> dict[str, Any]:
+        """Get the supervised server's health.
+
+        Returns:
+            A dictionary with the state, probe results and restart counters.
+        """
+        self._restart_allowed()
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "last_probe_at": self.last_probe_at,
+            "last_probe_latency": self.last_probe_latency,
+            "last_error": self.last_error,
+            "restarts": self.total_restarts,
+            "restarts_in_window": len(self._restart_times),
+            "max_restarts": self.max_restarts,
+        }
@@ -0,0 +1,259 @@
+"""
+Per-tool timeouts for MCP servers.
+
+This module tracks the latency of each tool of a server over a rolling window
+and derives read timeouts for tool calls from it, with per-tool overrides.
+It also holds the deadline of the current agent run, which caps the timeout
+of the tool calls made on its behalf.
+"""
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import Any
+
+from mcp.shared.exceptions import McpError
+
+from .circuit_breaker import REQUEST_TIMEOUT_CODE
+
+# Seconds given to the notification of a cancelled request before giving up on it
+CANCEL_NOTIFICATION_TIMEOUT = 1.0
+
+# Event loop time by which the current run must complete, None without deadline
+_run_deadline: ContextVar[float | None] = ContextVar("run_deadline", default=None)
+
+
+@contextmanager
+def run_deadline(deadline: float | None) -> Iterator[None]:
+    """Cap the timeout of the tool calls made in this context by a deadline.
+
+    Args:
+        deadline: Event loop time (``loop.time()``) by which the calls must complete,
+            None for no deadline.
+    """
+    token = _run_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _run_deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Get the seconds left before the deadline of the current run.
+
+    Returns:
+        The seconds left, 0 once the deadline passed, or None without deadline.
+    """
+    deadline = _run_deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - asyncio.get_running_loop().time(), 0.0)
+
+
+def cap_timeout(timeout: timedelta | None) -> timedelta | None:
+    """Shorten a request timeout to the time left before the deadline of the current run.
+
+    Args:
+        timeout: The timeout of the request, None for the session-level timeout.
+
+    Returns:
+        The timeout, or the time left if that is shorter.
+    """
+    remaining = remaining_time()
+    if remaining is None or (timeout is not None and timeout.total_seconds() <= remaining):
+        return timeout
+    return timedelta(seconds=remaining)
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """Whether an error means a request timed out.
+
+    Args:
+        error: The error raised by a request.
+
+    Returns:
+        True for request timeouts reported by the session or the transport.
+    """
+    if isinstance(error, McpError):
+        return error.error.code == REQUEST_TIMEOUT_CODE
+    return isinstance(error, TimeoutError)
+
+
+class ToolTimeouts:
+    """Latency tracker and timeout policy for the tools of one MCP server.
+
+    The timeout of a tool call is, in order of precedence:
+
+    1. the override configured for the tool in ``tools``;
+    2. when ``adaptive`` is enabled and at least ``min_samples`` calls were recorded,
+       the ``percentile`` of the recent latencies times ``factor``, bounded by
+       ``min_timeout`` and ``max_timeout``;
+    3. ``default``, or ``max_timeout`` while an adaptive timeout is warming up;
+    4. None, leaving the call to the session-level read timeout.
+
+    An adaptive timeout doubles after each consecutive timeout of the tool, up to
+    ``max_timeout``, so a tool that became slower can still complete. It is reset
+    by the next call that completes.
+    """
+
+    def __init__(
+        self,
+        adaptive: bool = False,
+        default: float | None = None,
+        tools: dict[str, float] | None = None,
+        percentile: float = 99.0,
+        factor: float = 3.0,
+        min_timeout: float = 5.0,
+        max_timeout: float = 300.0,
+        min_samples: int = 20,
+        window_size: int = 200,
+    ) -> None:
+        """Initialize a new tool timeout policy.
+
+        Args:
+            adaptive: Whether to derive timeouts from the observed latencies.
+            default: Timeout in seconds for tools without override or enough samples.
+            tools: Timeout overrides in seconds, by tool name.
+            percentile: Latency percentile, between 0 and 100, used for adaptive timeouts.
+            factor: Multiplier applied to the latency percentile.
+            min_timeout: Lower bound of adaptive timeouts, in seconds.
+            max_timeout: Upper bound of adaptive timeouts, in seconds.
+            min_samples: Calls to record for a tool before its timeout adapts.
+            window_size: Number of recent latencies kept per tool.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if min_timeout > max_timeout:
+            raise ValueError("min_timeout must not exceed max_timeout")
+        if min_samples < 1 or window_size < min_samples:
+            raise ValueError("min_samples must be at least 1 and at most window_size")
+        self.adaptive = adaptive
+        self.default = default
+        self.tools = dict(tools or {})
+        self.percentile = percentile
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self.window_size = window_size
+
+        self._latencies: dict[str, deque[float]] = {}
+        self._timeouts: dict[str, int] = {}
+        self._consecutive_timeouts: dict[str, int] = {}
+        self._adaptive_cache: dict[str, float] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "ToolTimeouts":
+        """Create a policy from the "timeouts" section of a server configuration.
+
+        Adaptive timeouts are enabled unless the section sets "adaptive" to false.
+
+        Args:
+            config: Policy options, using the constructor argument names.
+
+        Returns:
+            The configured ToolTimeouts.
+        """
+        return cls(**{"adaptive": True, **config})
+
+    def record(self, tool: str, latency: float) -> None:
+        """Record the latency of a completed tool call.
+
+        Args:
+            tool: The tool name.
+            latency: Seconds the call took.
+        """
+        samples = self._latencies.get(tool)
+        if samples is None:
+            samples = self._latencies[tool] = deque(maxlen=self.window_size)
+        samples.append(latency)
+        self._adaptive_cache.pop(tool, None)
+        self._consecutive_timeouts.pop(tool, None)
+
+    def record_timeout(self, tool: str) -> None:
+        """Record a tool call that timed out.
+
+        Args:
+            tool: The tool name.
+        """
+        self._timeouts[tool] = self._timeouts.get(tool, 0) + 1
+        self._consecutive_timeouts[tool] = self._consecutive_timeouts.get(tool, 0) + 1
+
+    def latency_percentile(self, tool: str, percentile: float | None = None) -> float | None:
+        """Get a percentile of the recent latencies of a tool.
+
+        Args:
+            tool: The tool name.
+            percentile: The percentile, between 0 and 100; defaults to the configured one.
+
+        Returns:
+            The latency in seconds, or None if no call was recorded.
+        """
+        samples = self._latencies.get(tool)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        # Nearest-rank percentile
+        rank = math.ceil((percentile or self.percentile) / 100 * len(ordered))
+        return ordered[max(rank, 1) - 1]
+
+    def timeout_for(self, tool: str) -> float | None:
+        """Get the timeout for the next call of a tool.
+
+        Args:
+            tool: The tool name.
+
+        Returns:
+            The timeout in seconds, or None to use the session-level timeout.
+        """
+        if tool in self.tools:
+            return self.tools[tool]
+        if self.adaptive:
+            if len(self._latencies.get(tool, ())) >= self.min_samples:
+                timeout = self._adaptive_cache.get(tool)
+                if timeout is None:
+                    timeout = self.latency_percentile(tool) * self.factor
+                    timeout = self._adaptive_cache[tool] = min(max(timeout, self.min_timeout), self.max_timeout)
+            else:
+                timeout = self.default if self.default is not None else self.max_timeout
+            backoff = self._consecutive_timeouts.get(tool, 0)
+            if backoff and timeout < self.max_timeout:
+                # Back off exponentially, bounding the exponent so the product cannot overflow
+                timeout = min(timeout * 2 ** min(backoff, 64), self.max_timeout)
+            return timeout
+        return self.default
+
+    def read_timeout(self, tool: str) -> timedelta | None:
+        """Get the timeout for the next call of a tool, as passed to call_tool.
+
+        Args:
+            tool: The tool name.
+
+        Returns:
+            The timeout, or None to use the session-level timeout.
+        """
+        timeout = self.timeout_for(tool)
+        return timedelta(seconds=timeout) if timeout is not None else None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get latency and timeout metrics by tool.
+
+        Returns:
+            A dictionary by tool name with the number of recorded calls, the p50
+            and configured percentile latencies, the current timeout and the
+            number of timed out calls.
+        """
+        return {
+            tool: {
+                "calls": len(self._latencies.get(tool, ())),
+                "p50": self.latency_percentile(tool, 50),
+                f"p{self.percentile:g}": self.latency_percentile(tool),
+                "timeout": self.timeout_for(tool),
+                "timeouts": self._timeouts.get(tool, 0),
+            }
+            for tool in self._latencies.keys() | self._timeouts.keys()
+        }
@@ -0,0 +1,145 @@
+"""
+Transport negotiation cache for HTTP connectors.
+
+This module remembers which HTTP transport (streamable HTTP or SSE) a server
+URL accepted, so that reconnects can skip the failed probe of the other one.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from ..logging import logger
+
+STREAMABLE_HTTP = "streamable_http"
+SSE = "sse"
+HTTP_TRANSPORTS = (STREAMABLE_HTTP, SSE)
+
+
+class TransportCache:
+    """Cache of negotiated HTTP transports keyed by base URL.
+
+    The cache always lives in memory. When a path is given, entries are also
+    loaded from and written back to a JSON file so that they survive restarts.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None, max_age: float | None = None) -> None:
+        """Initialize a new transport cache.
+
+        Args:
+            path: Optional JSON file used to persist negotiated transports.
+            max_age: Optional number of seconds after which an entry is ignored.
+        """
+        self.path = Path(path).expanduser() if path else None
+        self.max_age = max_age
+        self._entries: dict[str, dict[str, float | str]] = {}
+        self._lock = threading.Lock()
+        if self.path:
+            self._load()
+
+    @staticmethod
+    def _key(base_url: str) -> str:
+        return base_url.rstrip("/")
+
+    def get(self, base_url: str) -> str | None:
+        """Get the transport negotiated for a URL.
+
+        Args:
+            base_url: The server URL.
+
+        Returns:
+            The transport name, or None if nothing (fresh) is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(base_url))
+        if entry is None:
+            return None
+        if self.max_age is not None and time.time() - entry["updated_at"] > self.max_age:
+            self.invalidate(base_url)
+            return None
+        return entry["transport"]
+
+    def set(self, base_url: str, transport: str) -> None:
+        """Record the transport negotiated for a URL.
+
+        Args:
+            base_url: The server URL.
+            transport: Either "streamable_http" or "sse".
+        """
+        if transport not in HTTP_TRANSPORTS:
+            raise ValueError(f"Unknown HTTP transport '{transport}', expected one of {HTTP_TRANSPORTS}")
+        key = self._key(base_url)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous["transport"] == transport:
+                previous["updated_at"] = time.time()
+                return
+            self._entries[key] = {"transport": transport, "updated_at": time.time()}
+        self._save()
+
+    def invalidate(self, base_url: str) -> None:
+        """Forget the transport negotiated for a URL.
+
+        Args:
+            base_url: The server URL.
+        """
+        with self._lock:
+            removed = self._entries.pop(self._key(base_url), None)
+        if removed is not None:
+            self._save()
+
+    def clear(self) -> None:
+        """Forget all negotiated transports."""
+        with self._lock:
+            self._entries.clear()
+        self._save()
+
+    def _load(self) -> None:
+        """Load persisted entries, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable transport cache {self.path}: {e}")
+            return
+
+        for key, entry in data.items():
+            if isinstance(entry, dict) and entry.get("transport") in HTTP_TRANSPORTS:
+                self._entries[key] = {"transport": entry["transport"], "updated_at": entry.get("updated_at", 0.0)}
+
+    def _save(self) -> None:
+        """Persist entries if a path was configured."""
+        if not self.path:
+            return
+        with self._lock:
+            data = dict(self._entries)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist transport cache to {self.path}: {e}")
+
+
+_default_cache: TransportCache | None = None
+
+
+def get_default_transport_cache() -> TransportCache:
+    """Get the process-wide transport cache.
+
+    The cache is persisted when the MCP_USE_TRANSPORT_CACHE environment
+    variable points to a file.
+
+    Returns:
+        The default TransportCache instance.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TransportCache(path=os.getenv("MCP_USE_TRANSPORT_CACHE") or None)
+    return _default_cache
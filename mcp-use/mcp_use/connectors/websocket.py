@@ -6,23 +6,36 @@ through WebSocket connections.
 """
 
 import asyncio
-import json
-import uuid
+from datetime import timedelta
 from typing import Any
 
-from mcp.types import Tool
+from mcp.client.session import ElicitationFnT, LoggingFnT, MessageHandlerFnT, SamplingFnT
+from mcp.types import (
+    LATEST_PROTOCOL_VERSION,
+    CallToolResult,
+    GetPromptResult,
+    Prompt,
+    ReadResourceResult,
+    Resource,
+    ServerCapabilities,
+    ServerNotification,
+    Tool,
+)
+from pydantic import ValidationError
 from websockets import ClientConnection
 
 from ..logging import logger
 from ..task_managers import ConnectionManager, WebSocketConnectionManager
 from .base import BaseConnector
+from .jsonrpc import JsonRpcMultiplexer
 
 
 class WebSocketConnector(BaseConnector):
     """Connector for MCP implementations using WebSocket transport.
 
     This connector uses WebSockets to communicate with remote MCP implementations,
-    using a connection manager to handle the proper lifecycle management.
+    using a connection manager to handle the proper lifecycle management and a
+    JSON-RPC multiplexer to run many requests concurrently over one socket.
     """
 
     def __init__(
@@ -30,6 +43,12 @@ class WebSocketConnector(BaseConnector):
         url: str,
         auth_token: str | None = None,
         headers: dict[str, str] | None = None,
+        request_timeout: float | None = 60.0,
+        max_in_flight: int = 64,
+        sampling_callback: SamplingFnT | None = None,
+        elicitation_callback: ElicitationFnT | None = None,
+        message_handler: MessageHandlerFnT | None = None,
+        logging_callback: LoggingFnT | None = None,
     ):
         """Initialize a new WebSocket connector.
 
@@ -37,19 +56,47 @@ class WebSocketConnector(BaseConnector):
             url: The WebSocket URL to connect to.
             auth_token: Optional authentication token.
             headers: Optional additional headers.
+            request_timeout: Default deadline in seconds for each request.
+            max_in_flight: Maximum number of concurrent requests awaiting a response.
+            sampling_callback: Optional sampling callback (not supported over WebSocket yet).
+            elicitation_callback: Optional elicitation callback (not supported over WebSocket yet).
+            message_handler: Optional handler for server notifications.
+            logging_callback: Optional logging callback (not supported over WebSocket yet).
         """
+        super().__init__(
+            sampling_callback=sampling_callback,
+            elicitation_callback=elicitation_callback,
+            message_handler=message_handler,
+            logging_callback=logging_callback,
+        )
         self.url = url
         self.auth_token = auth_token
         self.headers = headers or {}
         if auth_token:
             self.headers["Authorization"] = f"Bearer {auth_token}"
+        self.request_timeout = request_timeout
+        self.max_in_flight = max_in_flight
 
         self.ws: ClientConnection | None = None
         self._connection_manager: ConnectionManager | None = None
         self._receiver_task: asyncio.Task | None = None
-        self.pending_requests: dict[str, asyncio.Future] = {}
-        self._tools: list[Tool] | None = None
-        self._connected = False
+        self._multiplexer: JsonRpcMultiplexer | None = None
+
+    @property
+    def pending_requests(self) -> dict[int, asyncio.Future]:
+        """Get the requests currently awaiting a response."""
+        return self._multiplexer.pending_requests if self._multiplexer else {}
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the WebSocket is connected and its receiver is still running."""
+        if not self._connected or self.ws is None:
+            return False
+        if self._receiver_task is not None and self._receiver_task.done():
+            logger.debug("WebSocket receiver task is done, marking as disconnected")
+            self._connected = False
+            return False
+        return True
 
     async def connect(self) -> None:
         """Establish a connection to the MCP implementation."""
@@ -62,6 +109,13 @@ class WebSocketConnector(BaseConnector):
             # Create and start the connection manager
             self._connection_manager = WebSocketConnectionManager(self.url, self.headers)
             self.ws = await self._connection_manager.start()
+            self._multiplexer = JsonRpcMultiplexer(
+                self.ws.send,
+                request_timeout=self.request_timeout,
+                max_in_flight=self.max_in_flight,
+                notification_handler=self._handle_notification,
+                cancel_method="notifications/cancelled",
+            )
 
             # Start the message receiver task
             self._receiver_task = asyncio.create_task(self._receive_messages(), name="websocket_receiver_task")
@@ -80,45 +134,30 @@ class WebSocketConnector(BaseConnector):
             raise
 
     async def _receive_messages(self) -> None:
-        """Continuously receive and process messages from the WebSocket."""
-        if not self.ws:
+        """Continuously receive messages from the WebSocket and dispatch them."""
+        if not self.ws or not self._multiplexer:
             raise RuntimeError("WebSocket is not connected")
 
+        multiplexer = self._multiplexer
+        error: Exception | None = None
         try:
             async for message in self.ws:
-                # Parse the message
-                data = json.loads(message)
-
-                # Check if this is a response to a pending request
-                request_id = data.get("id")
-                if request_id and request_id in self.pending_requests:
-                    future = self.pending_requests.pop(request_id)
-                    if "result" in data:
-                        future.set_result(data["result"])
-                    elif "error" in data:
-                        future.set_exception(Exception(data["error"]))
-
-                    logger.debug(f"Received response for request {request_id}")
-                else:
-                    logger.debug(f"Received message: {data}")
+                await multiplexer.dispatch(message)
         except Exception as e:
             logger.error(f"Error in WebSocket message receiver: {e}")
-            # If the websocket connection was closed or errored,
-            # reject all pending requests
-            for future in self.pending_requests.values():
-                if not future.done():
-                    future.set_exception(e)
-
-    async def disconnect(self) -> None:
-        """Close the connection to the MCP implementation."""
-        if not self._connected:
-            logger.debug("Not connected to MCP implementation")
-            return
+            error = e
+        finally:
+            # If the websocket connection was closed or errored, reject all pending requests
+            multiplexer.close(error)
 
-        logger.debug("Disconnecting from MCP implementation")
-        await self._cleanup_resources()
-        self._connected = False
-        logger.debug("Disconnected from MCP implementation")
+    async def _handle_notification(self, message: dict[str, Any]) -> None:
+        """Forward a server notification to the message handler."""
+        try:
+            notification = ServerNotification.model_validate(message)
+        except ValidationError:
+            logger.debug(f"Received unknown notification: {message.get('method')}")
+            return
+        await self._internal_message_handler(notification)
 
     async def _cleanup_resources(self) -> None:
         """Clean up all resources associated with this connector."""
@@ -143,12 +182,9 @@ class WebSocketConnector(BaseConnector):
                 self._receiver_task = None
 
         # Reject any pending requests
-        if self.pending_requests:
-            logger.debug(f"Rejecting {len(self.pending_requests)} pending requests")
-            for future in self.pending_requests.values():
-                if not future.done():
-                    future.set_exception(ConnectionError("WebSocket disconnected"))
-            self.pending_requests.clear()
+        if self._multiplexer:
+            self._multiplexer.close(ConnectionError("WebSocket disconnected"))
+            self._multiplexer = None
 
         # Then stop the connection manager
         if self._connection_manager:
@@ -165,77 +201,109 @@ class WebSocketConnector(BaseConnector):
 
         # Reset tools
         self._tools = None
+        self._resources = None
+        self._prompts = None
+        self._initialized = False
 
         if errors:
             logger.warning(f"Encountered {len(errors)} errors during resource cleanup")
 
-    async def _send_request(self, method: str, params: dict[str, Any] | None = None) -> Any:
+    async def _send_request(
+        self, method: str, params: dict[str, Any] | None = None, timeout: float | None = None
+    ) -> Any:
         """Send a request and wait for a response."""
-        if not self.ws:
+        if not self._multiplexer:
             raise RuntimeError("WebSocket is not connected")
+        return await self._multiplexer.request(method, params, timeout)
 
-        # Create a request ID
-        request_id = str(uuid.uuid4())
-
-        # Create a future to receive the response
-        future = asyncio.Future()
-        self.pending_requests[request_id] = future
+    async def send_batch(
+        self, calls: list[tuple[str, dict[str, Any] | None]], timeout: float | None = None
+    ) -> list[Any]:
+        """Send several requests in a single JSON-RPC batch frame.
 
-        # Send the request
-        await self.ws.send(json.dumps({"id": request_id, "method": method, "params": params or {}}))
+        Only use this with servers that accept JSON-RPC batches.
 
-        logger.debug(f"Sent request {request_id} method: {method}")
+        Args:
+            calls: (method, params) pairs.
+            timeout: Optional deadline in seconds for the whole batch.
 
-        # Wait for the response
-        try:
-            return await future
-        except Exception as e:
-            # Remove the request from pending requests
-            self.pending_requests.pop(request_id, None)
-            logger.error(f"Error waiting for response to request {request_id}: {e}")
-            raise
+        Returns:
+            The raw results, in the same order as the calls.
+        """
+        if not self._multiplexer:
+            raise RuntimeError("WebSocket is not connected")
+        return await self._multiplexer.request_batch(calls, timeout)
 
     async def initialize(self) -> dict[str, Any]:
         """Initialize the MCP session and return session information."""
+        if not self._multiplexer:
+            raise RuntimeError("MCP client is not connected")
+
+        if self._initialized:
+            return {"status": "already_initialized"}
+
         logger.debug("Initializing MCP session")
-        result = await self._send_request("initialize")
+        result = await self._send_request(
+            "initialize",
+            {
+                "protocolVersion": LATEST_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": self.client_info.model_dump(mode="json", exclude_none=True),
+            },
+        )
+        await self._multiplexer.notify("notifications/initialized")
+        self._initialized = True
+        self.capabilities = ServerCapabilities.model_validate(result.get("capabilities", {}))
 
         # Get available tools
-        tools_result = await self.list_tools()
-        self._tools = [Tool(**tool) for tool in tools_result]
+        self._tools = await self.list_tools() if self.capabilities.tools else []
+        self._resources = await self.list_resources() if self.capabilities.resources else []
+        self._prompts = await self.list_prompts() if self.capabilities.prompts else []
 
         logger.debug(f"MCP session initialized with {len(self._tools)} tools")
         return result
 
-    async def list_tools(self) -> list[dict[str, Any]]:
+    async def list_tools(self) -> list[Tool]:
         """List all available tools from the MCP implementation."""
         logger.debug("Listing tools")
         result = await self._send_request("tools/list")
-        return result.get("tools", [])
-
-    @property
-    def tools(self) -> list[Tool]:
-        """Get the list of available tools."""
-        if not self._tools:
-            raise RuntimeError("MCP client is not initialized")
+        self._tools = [Tool.model_validate(tool) for tool in result.get("tools", [])]
         return self._tools
 
-    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
-        """Call an MCP tool with the given arguments."""
+    async def _call_tool(
+        self, name: str, arguments: dict[str, Any], read_timeout_seconds: timedelta | None = None
+    ) -> CallToolResult:
+        """Send a tool call over the WebSocket."""
         logger.debug(f"Calling tool '{name}' with arguments: {arguments}")
-        return await self._send_request("tools/call", {"name": name, "arguments": arguments})
+        timeout = read_timeout_seconds.total_seconds() if read_timeout_seconds else None
+        result = await self._send_request("tools/call", {"name": name, "arguments": arguments}, timeout)
+        return CallToolResult.model_validate(result)
 
-    async def list_resources(self) -> list[dict[str, Any]]:
+    async def list_resources(self) -> list[Resource]:
         """List all available resources from the MCP implementation."""
         logger.debug("Listing resources")
         result = await self._send_request("resources/list")
-        return result
+        self._resources = [Resource.model_validate(resource) for resource in result.get("resources", [])]
+        return self._resources
 
-    async def read_resource(self, uri: str) -> tuple[bytes, str]:
+    async def read_resource(self, uri: str) -> ReadResourceResult:
         """Read a resource by URI."""
         logger.debug(f"Reading resource: {uri}")
-        result = await self._send_request("resources/read", {"uri": uri})
-        return result.get("content", b""), result.get("mimeType", "")
+        result = await self._send_request("resources/read", {"uri": str(uri)})
+        return ReadResourceResult.model_validate(result)
+
+    async def list_prompts(self) -> list[Prompt]:
+        """List all available prompts from the MCP implementation."""
+        logger.debug("Listing prompts")
+        result = await self._send_request("prompts/list")
+        self._prompts = [Prompt.model_validate(prompt) for prompt in result.get("prompts", [])]
+        return self._prompts
+
+    async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> GetPromptResult:
+        """Get a prompt by name."""
+        logger.debug(f"Getting prompt: {name}")
+        result = await self._send_request("prompts/get", {"name": name, "arguments": arguments or {}})
+        return GetPromptResult.model_validate(result)
 
     async def request(self, method: str, params: dict[str, Any] | None = None) -> Any:
         """Send a raw request to the MCP implementation."""
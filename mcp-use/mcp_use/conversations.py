@@ -0,0 +1,235 @@
+"""
+Storage of agent conversations by conversation ID.
+
+This module provides stores keeping the messages of many conversations, so
+that one agent can hold a separate memory for each user or chat. Stores only
+append messages, and load the trailing window of a conversation needed for
+its next turn rather than the whole conversation.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from langchain_core.messages import BaseMessage, HumanMessage, message_to_dict, messages_from_dict
+
+# Size of the blocks read from the end of a JSONL file to find its last lines
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _window(messages: list[BaseMessage], last: int | None) -> list[BaseMessage]:
+    """Keep the last messages, starting at a human message so that no turn is cut."""
+    if last is None or len(messages) <= last:
+        return messages
+    window = messages[-last:] if last > 0 else []
+    for i, message in enumerate(window):
+        if isinstance(message, HumanMessage):
+            return window[i:]
+    return []
+
+
+class ConversationStore(ABC):
+    """Base class of conversation stores.
+
+    Stores are thread-safe. ``load`` returns the trailing window of a
+    conversation, cut at the start of a turn so that the window never starts
+    in the middle of one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def append(self, conversation_id: str, messages: Sequence[BaseMessage]) -> None:
+        """Add messages at the end of a conversation, creating it if needed.
+
+        Args:
+            conversation_id: The conversation ID.
+            messages: The messages, in order.
+        """
+        if not messages:
+            return
+        with self._lock:
+            self._append(conversation_id, list(messages))
+
+    def load(self, conversation_id: str, last: int | None = None) -> list[BaseMessage]:
+        """Load the messages of a conversation.
+
+        Args:
+            conversation_id: The conversation ID.
+            last: Maximum number of trailing messages to load, None for the whole conversation.
+
+        Returns:
+            The messages, in order, or an empty list for an unknown conversation.
+        """
+        if last is not None and last < 0:
+            raise ValueError("last must not be negative")
+        with self._lock:
+            # One more message tells whether the conversation is longer than the window
+            return _window(self._load(conversation_id, None if last is None else last + 1), last)
+
+    def delete(self, conversation_id: str) -> None:
+        """Delete a conversation, if it exists."""
+        with self._lock:
+            self._delete(conversation_id)
+
+    @abstractmethod
+    def _append(self, conversation_id: str, messages: list[BaseMessage]) -> None:
+        pass
+
+    @abstractmethod
+    def _load(self, conversation_id: str, last: int | None) -> list[BaseMessage]:
+        """Load at most the ``last`` trailing messages of a conversation."""
+
+    @abstractmethod
+    def _delete(self, conversation_id: str) -> None:
+        pass
+
+
+class MemoryConversationStore(ConversationStore):
+    """Conversation store keeping conversations in memory.
+
+    The least recently used conversations are evicted beyond
+    ``max_conversations``, and each conversation keeps at most its last
+    ``max_messages`` messages.
+    """
+
+    def __init__(self, max_conversations: int | None = 1000, max_messages: int | None = 1000) -> None:
+        """Initialize a new in-memory conversation store.
+
+        Args:
+            max_conversations: Maximum number of conversations kept, None for no limit.
+            max_messages: Maximum number of messages kept per conversation, None for no limit.
+        """
+        super().__init__()
+        self.max_conversations = max_conversations
+        self.max_messages = max_messages
+        self._conversations: OrderedDict[str, list[BaseMessage]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def _append(self, conversation_id: str, messages: list[BaseMessage]) -> None:
+        conversation = self._conversations.setdefault(conversation_id, [])
+        self._conversations.move_to_end(conversation_id)
+        conversation.extend(messages)
+        if self.max_messages is not None and len(conversation) > self.max_messages:
+            del conversation[: len(conversation) - self.max_messages]
+        while self.max_conversations is not None and len(self._conversations) > self.max_conversations:
+            self._conversations.popitem(last=False)
+
+    def _load(self, conversation_id: str, last: int | None) -> list[BaseMessage]:
+        conversation = self._conversations.get(conversation_id)
+        if conversation is None:
+            return []
+        self._conversations.move_to_end(conversation_id)
+        return list(conversation if last is None else conversation[-last:] if last else [])
+
+    def _delete(self, conversation_id: str) -> None:
+        self._conversations.pop(conversation_id, None)
+
+
+class SQLiteConversationStore(ConversationStore):
+    """Conversation store appending messages to an SQLite database."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize a new SQLite conversation store.
+
+        Args:
+            path: Path of the database file, created if needed.
+        """
+        super().__init__()
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, conversation_id TEXT NOT NULL, message TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS messages_by_conversation ON messages (conversation_id, id)"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _append(self, conversation_id: str, messages: list[BaseMessage]) -> None:
+        rows = [(conversation_id, json.dumps(message_to_dict(message))) for message in messages]
+        with self._connection:
+            self._connection.executemany("INSERT INTO messages (conversation_id, message) VALUES (?, ?)", rows)
+
+    def _load(self, conversation_id: str, last: int | None) -> list[BaseMessage]:
+        rows = self._connection.execute(
+            "SELECT message FROM messages WHERE conversation_id = ? ORDER BY id DESC LIMIT ?",
+            (conversation_id, -1 if last is None else last),
+        ).fetchall()
+        return messages_from_dict([json.loads(row[0]) for row in reversed(rows)])
+
+    def _delete(self, conversation_id: str) -> None:
+        with self._connection:
+            self._connection.execute("DELETE FROM messages WHERE conversation_id = ?", (conversation_id,))
+
+
+class JSONLConversationStore(ConversationStore):
+    """Conversation store appending messages to one JSON Lines file per conversation.
+
+    Windows are read from the end of the file, so loading the last messages of
+    a long conversation does not read all of it.
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        """Initialize a new JSONL conversation store.
+
+        Args:
+            directory: Directory of the conversation files, a new temporary directory by default.
+        """
+        super().__init__()
+        self.directory = directory or tempfile.mkdtemp(prefix="mcp_use_conversations_")
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, conversation_id: str) -> str:
+        """Get the path of the file holding a conversation."""
+        name = hashlib.sha256(conversation_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.jsonl")
+
+    def _append(self, conversation_id: str, messages: list[BaseMessage]) -> None:
+        lines = "".join(json.dumps(message_to_dict(message)) + "\n" for message in messages)
+        with open(self.path(conversation_id), "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def _load(self, conversation_id: str, last: int | None) -> list[BaseMessage]:
+        try:
+            with open(self.path(conversation_id), "rb") as f:
+                lines = f.read().splitlines() if last is None else self._tail(f, last)
+        except FileNotFoundError:
+            return []
+        return messages_from_dict([json.loads(line) for line in lines if line.strip()])
+
+    @staticmethod
+    def _tail(f, count: int) -> list[bytes]:
+        """Read the last lines of a file, block by block from its end."""
+        if count == 0:
+            return []
+        end = f.seek(0, os.SEEK_END)
+        position, data = end, b""
+        # One more newline than lines is needed, unless the start of the file is reached
+        while position > 0 and data.count(b"\n") <= count:
+            size = min(TAIL_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            data = f.read(size) + data
+        return data.splitlines()[-count:]
+
+    def _delete(self, conversation_id: str) -> None:
+        try:
+            os.remove(self.path(conversation_id))
+        except FileNotFoundError:
+            pass
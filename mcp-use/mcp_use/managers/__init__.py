@@ -1,4 +1,4 @@
-from .server_manager import ServerManager
+from .server_manager import ServerManager, ServerView
 from .tools import (
     ConnectServerTool,
     DisconnectServerTool,
@@ -10,6 +10,7 @@ from .tools import (
 
 __all__ = [
     "ServerManager",
+    "ServerView",
     "MCPServerTool",
     "ConnectServerTool",
     "DisconnectServerTool",
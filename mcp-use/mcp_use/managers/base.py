@@ -15,6 +15,18 @@ class BaseServerManager(ABC):
         """Initialize the server manager."""
         raise NotImplementedError
 
+    def view(self) -> "BaseServerManager":
+        """Get the server manager to use for one run of an agent.
+
+        Server managers keeping per-run state, such as the active server,
+        return a new view sharing everything else. By default the manager
+        itself is used, so its state is shared by all runs.
+
+        Returns:
+            The server manager of the run.
+        """
+        return self
+
     @property
     @abstractmethod
     def tools(self) -> list[BaseTool]:
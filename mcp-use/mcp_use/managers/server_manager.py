@@ -1,11 +1,14 @@
+import asyncio
+
 from langchain_core.tools import BaseTool
 
 from mcp_use.client import MCPClient
 from mcp_use.logging import logger
 
-from ..adapters.base import BaseAdapter
+from ..adapters.base import BaseAdapter, ToolHandle
 from .base import BaseServerManager
 from .tools import ConnectServerTool, DisconnectServerTool, GetActiveServerTool, ListServersTool, SearchToolsTool
+from .tools.search_tools import ToolSearchEngine
 
 
 class ServerManager(BaseServerManager):
@@ -13,6 +16,10 @@ class ServerManager(BaseServerManager):
 
     This class allows an agent to discover and select which MCP server to use,
     dynamically activating the tools for the selected server.
+
+    The server catalog, the tool handles of each server and the search index
+    are shared by all runs. Each run selects its active server through its own
+    :meth:`view`, so concurrent runs do not switch servers under each other.
     """
 
     def __init__(self, client: MCPClient, adapter: BaseAdapter) -> None:
@@ -26,7 +33,11 @@ class ServerManager(BaseServerManager):
         self.adapter = adapter
         self.active_server: str | None = None
         self.initialized_servers: dict[str, bool] = {}
-        self._server_tools: dict[str, list[BaseTool]] = {}
+        # Tool handles of each server; only the active server's tools are built
+        self._server_tools: dict[str, list[ToolHandle]] = {}
+        self._server_locks: dict[str, asyncio.Lock] = {}
+        self._search_engine: ToolSearchEngine | None = None
+        self._management_tools: list[BaseTool] | None = None
 
     async def initialize(self) -> None:
         """Initialize the server manager and prepare server management tools."""
@@ -34,6 +45,53 @@ class ServerManager(BaseServerManager):
         if not self.client.get_server_names():
             logger.warning("No MCP servers defined in client configuration")
 
+    def view(self) -> "ServerView":
+        """Create a view of this manager for one run.
+
+        Returns:
+            A view sharing the catalog, tool cache and search index of this manager,
+            with its own active server.
+        """
+        return ServerView(self)
+
+    @property
+    def search_engine(self) -> ToolSearchEngine:
+        """The tool search engine, shared by all the views of this manager."""
+        if self._search_engine is None:
+            self._search_engine = ToolSearchEngine(server_manager=self)
+        return self._search_engine
+
+    def _invalidate_search_index(self) -> None:
+        """Re-index the tools on the next search, after the tool cache changed."""
+        if self._search_engine is not None:
+            self._search_engine.is_indexed = False
+
+    async def load_server_tools(self, server_name: str) -> list[ToolHandle]:
+        """Load the tool handles of a server once, creating its session if needed.
+
+        Concurrent loads of the same server wait for a single one.
+
+        Args:
+            server_name: The name of the server.
+
+        Returns:
+            The tool handles of the server.
+        """
+        lock = self._server_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            if server_name not in self._server_tools:
+                try:
+                    session = self.client.get_session(server_name)
+                    logger.debug(f"Using existing session for server '{server_name}'")
+                except ValueError:
+                    logger.debug(f"Creating new session for server '{server_name}'")
+                    session = await self.client.create_session(server_name)
+                handles = await self.adapter._create_handles_from_connectors([session.connector])
+                self._server_tools[server_name] = handles
+                self.initialized_servers[server_name] = True
+                self._invalidate_search_index()
+            return self._server_tools[server_name]
+
     async def _prefetch_server_tools(self) -> None:
         """Pre-fetch tools for all servers to populate the tool search index."""
         servers = self.client.get_server_names()
@@ -55,12 +113,13 @@ class ServerManager(BaseServerManager):
                 # Fetch tools if session is available
                 if session:
                     connector = session.connector
-                    tools = await self.adapter._create_tools_from_connectors([connector])
+                    tools = await self.adapter._create_handles_from_connectors([connector])
 
                     # Check if this server's tools have changed
                     if server_name not in self._server_tools or self._server_tools[server_name] != tools:
                         self._server_tools[server_name] = tools  # Cache tools
                         self.initialized_servers[server_name] = True  # Mark as initialized
+                        self._invalidate_search_index()
                         logger.debug(f"Prefetched {len(tools)} tools for server '{server_name}'.")
                     else:
                         logger.debug(f"Tools for server '{server_name}' unchanged, using cached version.")
@@ -74,22 +133,28 @@ class ServerManager(BaseServerManager):
             List of tools from the active server, or empty list if no server is active
         """
         if self.active_server and self.active_server in self._server_tools:
-            return self._server_tools[self.active_server]
+            return self.adapter.materialize(self._server_tools[self.active_server])
         return []
 
     def get_management_tools(self) -> list[BaseTool]:
         """Get the server management tools.
 
+        The tools include read_artifact when the adapter has an artifact store.
+
         Returns:
             List of server management tools
         """
-        return [
-            ListServersTool(self),
-            ConnectServerTool(self),
-            GetActiveServerTool(self),
-            DisconnectServerTool(self),
-            SearchToolsTool(self),
-        ]
+        if self._management_tools is None:
+            self._management_tools = [
+                ListServersTool(self),
+                ConnectServerTool(self),
+                GetActiveServerTool(self),
+                DisconnectServerTool(self),
+                SearchToolsTool(self, search_engine=self.search_engine),
+            ]
+            if getattr(self.adapter, "artifact_store", None) is not None:
+                self._management_tools.append(self.adapter.create_artifact_tool())
+        return list(self._management_tools)
 
     def has_tool_changes(self, current_tool_names: set[str]) -> bool:
         """Check if the available tools have changed.
@@ -114,7 +179,7 @@ class ServerManager(BaseServerManager):
 
         # Add tools from the active server if available
         if self.active_server and self.active_server in self._server_tools:
-            server_tools = self._server_tools[self.active_server]
+            server_tools = self.adapter.materialize(self._server_tools[self.active_server])
             logger.debug(f"Including {len(server_tools)} tools from active server '{self.active_server}'")
             logger.debug(f"Server tools: {[tool.name for tool in server_tools]}")
             return management_tools + server_tools
@@ -122,3 +187,46 @@ class ServerManager(BaseServerManager):
             logger.debug("No active server - returning only management tools")
 
         return management_tools
+
+
+class ServerView(ServerManager):
+    """View of a ServerManager for one run.
+
+    The view shares the client, catalog, tool cache and search index of its
+    manager, and holds the run's own active server. Its management tools act on
+    the view, so connecting to a server only changes the tools of its run.
+    """
+
+    def __init__(self, manager: ServerManager) -> None:
+        """Initialize the view.
+
+        Args:
+            manager: The server manager holding the shared state.
+        """
+        super().__init__(manager.client, manager.adapter)
+        self.manager = manager
+        # Share the catalog and tool cache of the manager; the active server stays per view
+        self.initialized_servers = manager.initialized_servers
+        self._server_tools = manager._server_tools
+        self._server_locks = manager._server_locks
+
+    async def initialize(self) -> None:
+        """Initialize the underlying server manager."""
+        await self.manager.initialize()
+
+    def view(self) -> "ServerView":
+        """Create another view of the underlying server manager."""
+        return self.manager.view()
+
+    @property
+    def search_engine(self) -> ToolSearchEngine:
+        """The tool search engine of the underlying server manager."""
+        return self.manager.search_engine
+
+    def _invalidate_search_index(self) -> None:
+        """Re-index the tools of the underlying server manager on the next search."""
+        self.manager._invalidate_search_index()
+
+    async def load_server_tools(self, server_name: str) -> list[ToolHandle]:
+        """Load the tool handles of a server through the underlying server manager."""
+        return await self.manager.load_server_tools(server_name)
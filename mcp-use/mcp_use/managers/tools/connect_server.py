@@ -37,26 +37,11 @@ class ConnectServerTool(MCPServerTool):
             return f"Already connected to MCP server '{server_name}'"
 
         try:
-            # Create or get session for this server
-            try:
-                session = self.server_manager.client.get_session(server_name)
-                logger.debug(f"Using existing session for server '{server_name}'")
-            except ValueError:
-                logger.debug(f"Creating new session for server '{server_name}'")
-                session = await self.server_manager.client.create_session(server_name)
+            # Load the server's session and tool handles once; tools are built when exposed
+            server_tools = await self.server_manager.load_server_tools(server_name)
 
             # Set as active server
             self.server_manager.active_server = server_name
-
-            # Initialize server tools if not already initialized
-            if server_name not in self.server_manager._server_tools:
-                connector = session.connector
-                self.server_manager._server_tools[
-                    server_name
-                ] = await self.server_manager.adapter._create_tools_from_connectors([connector])
-                self.server_manager.initialized_servers[server_name] = True
-
-            server_tools = self.server_manager._server_tools.get(server_name, [])
             num_tools = len(server_tools)
 
             return f"Connected to MCP server '{server_name}'. {num_tools} tools are now available."
@@ -6,6 +6,7 @@ from typing import ClassVar
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from ...adapters.base import ToolHandle
 from ...logging import logger
 from .base_tool import MCPServerTool
 
@@ -34,10 +35,15 @@ class SearchToolsTool(MCPServerTool):
     )
     args_schema: ClassVar[type[BaseModel]] = ToolSearchInput
 
-    def __init__(self, server_manager):
-        """Initialize with server manager and create a search tool."""
+    def __init__(self, server_manager, search_engine: "ToolSearchEngine | None" = None):
+        """Initialize with server manager and a search engine.
+
+        Args:
+            server_manager: The server manager, or view of it, of the tool.
+            search_engine: A search engine to share with other tools; a new one is created by default.
+        """
         super().__init__(server_manager)
-        self._search_tool = ToolSearchEngine(server_manager=server_manager)
+        self._search_tool = search_engine or ToolSearchEngine(server_manager=server_manager)
 
     async def _arun(self, query: str, top_k: int = 100) -> str:
         """Search for tools across all MCP servers using semantic search."""
@@ -129,12 +135,15 @@ class ToolSearchEngine:
         if server_tools:
             await self.index_tools(server_tools)
 
-    async def index_tools(self, server_tools: dict[str, list[BaseTool]]) -> None:
+    async def index_tools(self, server_tools: dict[str, list[ToolHandle | BaseTool]]) -> None:
         """
         Index all tools from all servers for search.
 
+        Only the name and description of the tools are used, so handles are
+        indexed without building the tools.
+
         Args:
-            server_tools: dictionary mapping server names to their tools
+            server_tools: dictionary mapping server names to their tool handles or tools
         """
         # Clear previous indexes
         self.tool_embeddings = {}
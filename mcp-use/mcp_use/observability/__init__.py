@@ -5,5 +5,6 @@ load_dotenv()
 
 from . import laminar, langfuse  # noqa
 from .callbacks_manager import ObservabilityManager, get_default_manager, create_manager  # noqa
+from .events import emit_event  # noqa
 
-__all__ = ["laminar", "langfuse", "ObservabilityManager", "get_default_manager", "create_manager"]
+__all__ = ["laminar", "langfuse", "ObservabilityManager", "get_default_manager", "create_manager", "emit_event"]
@@ -0,0 +1,47 @@
+"""
+Custom observability events for MCP-use.
+
+This module forwards events raised outside of LangChain runnables, such as
+connector state changes, to the callbacks of the agent run they happen in.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from langchain_core.callbacks.manager import adispatch_custom_event
+
+logger = logging.getLogger(__name__)
+
+# Keep references to in-flight dispatch tasks so they are not garbage collected
+_pending_dispatches: set[asyncio.Task] = set()
+
+
+async def _dispatch(name: str, data: dict[str, Any]) -> None:
+    try:
+        await adispatch_custom_event(name, data)
+    except RuntimeError:
+        # Not inside a LangChain run, there are no callbacks to notify
+        pass
+    except Exception as e:
+        logger.debug(f"Failed to dispatch observability event {name}: {e}")
+
+
+def emit_event(name: str, data: dict[str, Any]) -> None:
+    """Send a custom event to the callbacks of the current LangChain run.
+
+    Observability handlers receive it through ``on_custom_event``. The event is
+    dropped when no run is active or when called outside of an event loop.
+
+    Args:
+        name: The event name.
+        data: The event payload.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    # The task copies the current context, so it dispatches within the active run
+    task = loop.create_task(_dispatch(name, data))
+    _pending_dispatches.add(task)
+    task.add_done_callback(_pending_dispatches.discard)
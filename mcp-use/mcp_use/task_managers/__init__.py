@@ -6,6 +6,9 @@ through different transport mechanisms.
 """
 
 from .base import ConnectionManager
+from .http_pool import HttpConnectionPool, get_http_pool_stats, get_shared_http_pool
+from .in_process import InProcessConnectionManager
+from .session import ClientSessionManager
 from .sse import SseConnectionManager
 from .stdio import StdioConnectionManager
 from .streamable_http import StreamableHttpConnectionManager
@@ -17,4 +20,9 @@ __all__ = [
     "WebSocketConnectionManager",
     "SseConnectionManager",
     "StreamableHttpConnectionManager",
+    "InProcessConnectionManager",
+    "ClientSessionManager",
+    "HttpConnectionPool",
+    "get_shared_http_pool",
+    "get_http_pool_stats",
 ]
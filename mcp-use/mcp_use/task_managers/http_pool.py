@@ -0,0 +1,208 @@
+"""
+Shared HTTP connection pools for MCP connections.
+
+This module provides keep-alive connection pools, keyed by origin, that can be
+shared by every SSE and streamable HTTP connection to the same host.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from ..logging import logger
+
+# Factory of the httpx client of an SSE or streamable HTTP connection, with the MCP SDK's signature
+HttpClientFactory = Callable[..., httpx.AsyncClient]
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """Lease on a shared pool handed to one httpx client.
+
+    Closing the client releases the lease instead of closing the pooled sockets.
+    """
+
+    def __init__(self, pool: "HttpConnectionPool", transport: httpx.AsyncHTTPTransport):
+        self._pool = pool
+        self._transport = transport
+        self._released = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._pool._request_started()
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self._pool._request_finished()
+
+    async def aclose(self) -> None:
+        if not self._released:
+            self._released = True
+            await self._pool._release()
+
+
+class HttpConnectionPool:
+    """Keep-alive HTTP connection pool shared by several MCP connections.
+
+    The underlying sockets are opened on first use and closed when the last
+    client using the pool is closed.
+    """
+
+    def __init__(
+        self,
+        origin: str,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+        http2: bool = False,
+    ) -> None:
+        """Initialize a new HTTP connection pool.
+
+        Args:
+            origin: The origin (scheme://host:port) served by this pool.
+            max_connections: Maximum number of concurrent connections, None for no limit.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept alive.
+            http2: Whether to negotiate HTTP/2 and multiplex requests over one connection.
+
+        Raises:
+            ImportError: If http2 is requested but the h2 package is not installed.
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401  # optional dependency install with [http2]
+            except ImportError as exc:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package. Please install it by running: pip install mcp-use[http2]"
+                ) from exc
+
+        self.origin = origin
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport: httpx.AsyncHTTPTransport | None = None
+        self._leases = 0
+        self._pending_requests = 0
+        self._peak_pending_requests = 0
+        self._total_requests = 0
+        self._total_clients = 0
+
+    def create_client(
+        self,
+        headers: dict[str, str] | None = None,
+        timeout: httpx.Timeout | None = None,
+        auth: httpx.Auth | None = None,
+    ) -> httpx.AsyncClient:
+        """Create an httpx client backed by this pool.
+
+        The signature matches the MCP SDK's httpx client factory so this method can
+        be passed as ``httpx_client_factory`` to the SSE and streamable HTTP clients.
+
+        Args:
+            headers: Optional headers to include with all requests.
+            timeout: Request timeout, defaults to 30 seconds.
+            auth: Optional authentication handler.
+
+        Returns:
+            An AsyncClient whose connections come from this pool.
+        """
+        if self._transport is None:
+            logger.debug(f"Opening shared HTTP connection pool for {self.origin}")
+            self._transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+        self._leases += 1
+        self._total_clients += 1
+
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+            auth=auth,
+            follow_redirects=True,
+            transport=_PooledTransport(self, self._transport),
+        )
+
+    def _request_started(self) -> None:
+        self._pending_requests += 1
+        self._total_requests += 1
+        self._peak_pending_requests = max(self._peak_pending_requests, self._pending_requests)
+
+    def _request_finished(self) -> None:
+        self._pending_requests -= 1
+
+    async def _release(self) -> None:
+        """Release one lease, closing the sockets once nobody uses the pool."""
+        self._leases -= 1
+        if self._leases == 0 and self._transport is not None:
+            transport, self._transport = self._transport, None
+            logger.debug(f"Closing shared HTTP connection pool for {self.origin}")
+            try:
+                await transport.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing shared HTTP connection pool for {self.origin}: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get utilization metrics for this pool.
+
+        Returns:
+            A dictionary with the pool's limits and its lease and request counters.
+        """
+        return {
+            "origin": self.origin,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "active_clients": self._leases,
+            "total_clients": self._total_clients,
+            "pending_requests": self._pending_requests,
+            "peak_pending_requests": self._peak_pending_requests,
+            "total_requests": self._total_requests,
+        }
+
+
+_shared_pools: dict[str, HttpConnectionPool] = {}
+
+
+def get_origin(url: str) -> str:
+    """Get the origin (scheme://host:port) of a URL.
+
+    Args:
+        url: The URL.
+
+    Returns:
+        The origin string used as pool key.
+    """
+    parsed = httpx.URL(url)
+    port = parsed.port or {"http": 80, "https": 443}.get(parsed.scheme)
+    return f"{parsed.scheme}://{parsed.host}:{port}"
+
+
+def get_shared_http_pool(url: str, **options: Any) -> HttpConnectionPool:
+    """Get the shared connection pool for the origin of a URL, creating it if needed.
+
+    Options only apply when the pool is created; later callers share the
+    existing pool for that origin.
+
+    Args:
+        url: Any URL on the target origin.
+        **options: HttpConnectionPool options (max_connections, http2, ...).
+
+    Returns:
+        The shared HttpConnectionPool for the origin.
+    """
+    origin = get_origin(url)
+    pool = _shared_pools.get(origin)
+    if pool is None:
+        pool = HttpConnectionPool(origin, **options)
+        _shared_pools[origin] = pool
+    elif options.get("http2", pool.http2) != pool.http2:
+        logger.warning(f"Shared HTTP connection pool for {origin} already exists with http2={pool.http2}")
+    return pool
+
+
+def get_http_pool_stats() -> list[dict[str, Any]]:
+    """Get utilization metrics for all shared connection pools.
+
+    Returns:
+        A list with one stats dictionary per origin.
+    """
+    return [pool.stats() for pool in _shared_pools.values()]
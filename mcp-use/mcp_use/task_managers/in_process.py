@@ -0,0 +1,88 @@
+"""
+In-process connection management for MCP implementations.
+
+This module provides a connection manager that runs a Python MCP server in the
+current event loop and connects to it over in-memory streams.
+"""
+
+import asyncio
+from typing import Any
+
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams
+
+from ..logging import logger
+from .base import ConnectionManager
+from .request_ids import RequestIdRecorder
+
+
+class InProcessConnectionManager(ConnectionManager[tuple[Any, Any]]):
+    """Connection manager for MCP servers running in the same process.
+
+    The server runs in a background task of the connection task and exchanges
+    messages with the client through in-memory streams, so there is no
+    subprocess to spawn and no JSON serialization over pipes.
+    """
+
+    def __init__(self, server: Server, raise_exceptions: bool = False):
+        """Initialize a new in-process connection manager.
+
+        Args:
+            server: The low-level MCP server to run.
+            raise_exceptions: Whether server errors should propagate instead of being
+                returned to the client as error responses.
+        """
+        super().__init__()
+        self.server = server
+        self.raise_exceptions = raise_exceptions
+        self._streams_ctx = None
+        self._server_task: asyncio.Task | None = None
+
+    async def _establish_connection(self) -> tuple[Any, Any]:
+        """Start the server and connect to it.
+
+        Returns:
+            A tuple of (read_stream, write_stream) for the client
+        """
+        self._streams_ctx = create_client_server_memory_streams()
+        client_streams, server_streams = await self._streams_ctx.__aenter__()
+        self._server_task = asyncio.create_task(self._run_server(*server_streams), name="in_process_mcp_server")
+        read_stream, write_stream = client_streams
+        return (read_stream, RequestIdRecorder(write_stream))
+
+    async def _run_server(self, read_stream: Any, write_stream: Any) -> None:
+        """Run the server until its streams are closed."""
+        try:
+            await self.server.run(
+                read_stream,
+                write_stream,
+                self.server.create_initialization_options(),
+                raise_exceptions=self.raise_exceptions,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"In-process MCP server '{self.server.name}' stopped with an error: {e}")
+        finally:
+            # Let the client see the end of the stream if the server exits on its own
+            await write_stream.aclose()
+
+    async def _close_connection(self) -> None:
+        """Stop the server and close the in-memory streams."""
+        if self._server_task and not self._server_task.done():
+            self._server_task.cancel()
+            try:
+                await self._server_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.warning(f"Error stopping in-process MCP server: {e}")
+        self._server_task = None
+
+        if self._streams_ctx:
+            try:
+                await self._streams_ctx.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Error closing in-process streams: {e}")
+            finally:
+                self._streams_ctx = None
@@ -0,0 +1,65 @@
+"""
+Request IDs of client sessions.
+
+This module provides the write stream handed to client sessions by the
+connection managers. It records the JSON-RPC IDs of the requests sent from a
+task, e.g. so the server can be told which request a client gave up on.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCRequest
+
+_sent_request_ids: ContextVar[list[int | str] | None] = ContextVar("sent_request_ids", default=None)
+
+
+class RequestIdRecorder:
+    """Write stream recording the IDs of the requests sent through it.
+
+    A client session sends each request from the task making it, so the IDs are
+    recorded for the ``record_sent_requests`` block of that task, if any.
+    """
+
+    def __init__(self, write_stream: Any):
+        """Initialize a new request ID recorder.
+
+        Args:
+            write_stream: The write stream of the connection.
+        """
+        self.write_stream = write_stream
+
+    async def send(self, message: SessionMessage) -> None:
+        """Send a message, recording its ID if it is a request."""
+        sent_request_ids = _sent_request_ids.get()
+        if sent_request_ids is not None and isinstance(message.message.root, JSONRPCRequest):
+            sent_request_ids.append(message.message.root.id)
+        await self.write_stream.send(message)
+
+    async def aclose(self) -> None:
+        """Close the write stream."""
+        await self.write_stream.aclose()
+
+    async def __aenter__(self) -> "RequestIdRecorder":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+@contextmanager
+def record_sent_requests() -> Iterator[list[int | str]]:
+    """Record the IDs of the requests the current task sends in the block.
+
+    Yields:
+        The IDs of the requests sent so far, in order.
+    """
+    sent_request_ids: list[int | str] = []
+    token = _sent_request_ids.set(sent_request_ids)
+    try:
+        yield sent_request_ids
+    finally:
+        _sent_request_ids.reset(token)
@@ -0,0 +1,42 @@
+"""
+Client session management for MCP implementations.
+
+This module provides a manager that keeps an MCP client session open in a
+dedicated task.
+"""
+
+from mcp import ClientSession
+
+from .base import ConnectionManager
+
+
+class ClientSessionManager(ConnectionManager[ClientSession]):
+    """Runs the lifecycle of a ClientSession in a dedicated task.
+
+    A ClientSession owns an anyio task group, which must be entered and exited
+    by the same task. Keeping the session in its own task lets any task close
+    it, for example a shared reconnection replacing a session that another
+    task opened.
+    """
+
+    def __init__(self, session: ClientSession):
+        """Initialize a new client session manager.
+
+        Args:
+            session: The client session to enter; it must not be entered yet.
+        """
+        super().__init__()
+        self.session = session
+
+    async def _establish_connection(self) -> ClientSession:
+        """Enter the client session.
+
+        Returns:
+            The entered client session
+        """
+        await self.session.__aenter__()
+        return self.session
+
+    async def _close_connection(self) -> None:
+        """Exit the client session."""
+        await self.session.__aexit__(None, None, None)
@@ -11,6 +11,8 @@ from mcp.client.sse import sse_client
 
 from ..logging import logger
 from .base import ConnectionManager
+from .http_pool import HttpClientFactory
+from .request_ids import RequestIdRecorder
 
 
 class SseConnectionManager(ConnectionManager[tuple[Any, Any]]):
@@ -27,6 +29,7 @@ class SseConnectionManager(ConnectionManager[tuple[Any, Any]]):
         headers: dict[str, str] | None = None,
         timeout: float = 5,
         sse_read_timeout: float = 60 * 5,
+        httpx_client_factory: HttpClientFactory | None = None,
     ):
         """Initialize a new SSE connection manager.
 
@@ -35,12 +38,15 @@ class SseConnectionManager(ConnectionManager[tuple[Any, Any]]):
             headers: Optional HTTP headers
             timeout: Timeout for HTTP operations in seconds
             sse_read_timeout: Timeout for SSE read operations in seconds
+            httpx_client_factory: Optional factory for the underlying httpx client,
+                e.g. a shared connection pool. The MCP SDK's own client by default.
         """
         super().__init__()
         self.url = url
         self.headers = headers or {}
         self.timeout = timeout
         self.sse_read_timeout = sse_read_timeout
+        self.httpx_client_factory = httpx_client_factory
         self._sse_ctx = None
 
     async def _establish_connection(self) -> tuple[Any, Any]:
@@ -52,19 +58,22 @@ class SseConnectionManager(ConnectionManager[tuple[Any, Any]]):
         Raises:
             Exception: If connection cannot be established.
         """
+        # The SDK's own httpx client is used unless a factory was given
+        client_options = {"httpx_client_factory": self.httpx_client_factory} if self.httpx_client_factory else {}
         # Create the context manager
         self._sse_ctx = sse_client(
             url=self.url,
             headers=self.headers,
             timeout=self.timeout,
             sse_read_timeout=self.sse_read_timeout,
+            **client_options,
         )
 
         # Enter the context manager
         read_stream, write_stream = await self._sse_ctx.__aenter__()
 
         # Return the streams
-        return (read_stream, write_stream)
+        return (read_stream, RequestIdRecorder(write_stream))
 
     async def _close_connection(self) -> None:
         """Close the SSE connection."""
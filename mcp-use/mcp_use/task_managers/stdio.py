@@ -13,6 +13,7 @@ from mcp.client.stdio import stdio_client
 
 from ..logging import logger
 from .base import ConnectionManager
+from .request_ids import RequestIdRecorder
 
 
 class StdioConnectionManager(ConnectionManager[tuple[Any, Any]]):
@@ -55,7 +56,7 @@ class StdioConnectionManager(ConnectionManager[tuple[Any, Any]]):
         read_stream, write_stream = await self._stdio_ctx.__aenter__()
 
         # Return the streams
-        return (read_stream, write_stream)
+        return (read_stream, RequestIdRecorder(write_stream))
 
     async def _close_connection(self) -> None:
         """Close the stdio connection."""
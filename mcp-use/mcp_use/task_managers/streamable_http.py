@@ -12,6 +12,8 @@ from mcp.client.streamable_http import streamablehttp_client
 
 from ..logging import logger
 from .base import ConnectionManager
+from .http_pool import HttpClientFactory
+from .request_ids import RequestIdRecorder
 
 
 class StreamableHttpConnectionManager(ConnectionManager[tuple[Any, Any]]):
@@ -28,6 +30,7 @@ class StreamableHttpConnectionManager(ConnectionManager[tuple[Any, Any]]):
         headers: dict[str, str] | None = None,
         timeout: float = 5,
         read_timeout: float = 60 * 5,
+        httpx_client_factory: HttpClientFactory | None = None,
     ):
         """Initialize a new streamable HTTP connection manager.
 
@@ -36,12 +39,15 @@ class StreamableHttpConnectionManager(ConnectionManager[tuple[Any, Any]]):
             headers: Optional HTTP headers
             timeout: Timeout for HTTP operations in seconds
             read_timeout: Timeout for HTTP read operations in seconds
+            httpx_client_factory: Optional factory for the underlying httpx client,
+                e.g. a shared connection pool. The MCP SDK's own client by default.
         """
         super().__init__()
         self.url = url
         self.headers = headers or {}
         self.timeout = timedelta(seconds=timeout)
         self.read_timeout = timedelta(seconds=read_timeout)
+        self.httpx_client_factory = httpx_client_factory
         self._http_ctx = None
 
     async def _establish_connection(self) -> tuple[Any, Any]:
@@ -53,19 +59,22 @@ class StreamableHttpConnectionManager(ConnectionManager[tuple[Any, Any]]):
         Raises:
             Exception: If connection cannot be established.
         """
+        # The SDK's own httpx client is used unless a factory was given
+        client_options = {"httpx_client_factory": self.httpx_client_factory} if self.httpx_client_factory else {}
         # Create the context manager
         self._http_ctx = streamablehttp_client(
             url=self.url,
             headers=self.headers,
             timeout=self.timeout,
             sse_read_timeout=self.read_timeout,
+            **client_options,
         )
 
         # Enter the context manager. Ignoring the session id callback
         read_stream, write_stream, _ = await self._http_ctx.__aenter__()
 
         # Return the streams
-        return (read_stream, write_stream)
+        return (read_stream, RequestIdRecorder(write_stream))
 
     async def _close_connection(self) -> None:
         """Close the streamable HTTP connection."""
@@ -4,15 +4,15 @@ WebSocket connection management for MCP implementations.
 This module provides a connection manager for WebSocket-based MCP connections.
 """
 
-from typing import Any
-
-from mcp.client.websocket import websocket_client
+from websockets import ClientConnection
+from websockets.asyncio.client import connect as ws_connect
+from websockets.typing import Subprotocol
 
 from ..logging import logger
 from .base import ConnectionManager
 
 
-class WebSocketConnectionManager(ConnectionManager[tuple[Any, Any]]):
+class WebSocketConnectionManager(ConnectionManager[ClientConnection]):
     """Connection manager for WebSocket-based MCP connections.
 
     This class handles the lifecycle of WebSocket connections, ensuring proper
@@ -33,8 +33,9 @@ class WebSocketConnectionManager(ConnectionManager[tuple[Any, Any]]):
         super().__init__()
         self.url = url
         self.headers = headers or {}
+        self._ws_ctx = None
 
-    async def _establish_connection(self) -> tuple[Any, Any]:
+    async def _establish_connection(self) -> ClientConnection:
         """Establish a WebSocket connection.
 
         Returns:
@@ -44,16 +45,15 @@ class WebSocketConnectionManager(ConnectionManager[tuple[Any, Any]]):
             Exception: If connection cannot be established
         """
         logger.debug(f"Connecting to WebSocket: {self.url}")
-        # Create the context manager
-        # Note: The current MCP websocket_client implementation doesn't support headers
-        # If headers need to be passed, this would need to be updated when MCP supports it
-        self._ws_ctx = websocket_client(self.url)
+        # Create the context manager, requesting the "mcp" subprotocol
+        self._ws_ctx = ws_connect(
+            self.url,
+            subprotocols=[Subprotocol("mcp")],
+            additional_headers=self.headers or None,
+        )
 
         # Enter the context manager
-        read_stream, write_stream = await self._ws_ctx.__aenter__()
-
-        # Return the streams
-        return (read_stream, write_stream)
+        return await self._ws_ctx.__aenter__()
 
     async def _close_connection(self) -> None:
         """Close the WebSocket connection."""
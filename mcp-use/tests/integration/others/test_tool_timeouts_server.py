@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from mcp_use import MCPClient
+from mcp_use.adapters import LangChainAdapter
+
+SERVER_DIR = Path(__file__).parent.parent / "servers_for_testing"
+
+
+def timeout_server_config(timeouts: dict) -> dict:
+    return {
+        "mcpServers": {
+            "timeout": {
+                "module": "timeout_test_server.py:mcp",
+                "path": str(SERVER_DIR),
+                "timeouts": timeouts,
+            }
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout_override_through_adapter():
+    """Test that a per-tool timeout override stops a slow call made by a LangChain tool"""
+    client = MCPClient(config=timeout_server_config({"tools": {"slow": 0.5}}))
+    try:
+        tools = {tool.name: tool for tool in await LangChainAdapter().create_tools(client)}
+
+        result = await tools["slow"].ainvoke({"seconds": 5})
+        assert "Timed out" in str(result), "The call should time out after 0.5s"
+
+        result = await tools["slow"].ainvoke({"seconds": 0.1})
+        assert "slept" in str(result), "A call within the timeout should succeed"
+
+        stats = client.get_server_health("timeout")["timeout"]["tools"]["slow"]
+        assert stats["timeouts"] == 1
+        assert stats["calls"] == 1
+    finally:
+        await client.close_all_sessions()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeout_from_latency():
+    """Test that the timeout of a tool adapts to its observed latency"""
+    timeouts = {"factor": 2, "min_timeout": 0.2, "max_timeout": 60, "min_samples": 5}
+    client = MCPClient(config=timeout_server_config(timeouts))
+    try:
+        tools = {tool.name: tool for tool in await LangChainAdapter().create_tools(client)}
+        connector = client.get_session("timeout").connector
+
+        assert connector.tool_timeouts.timeout_for("slow") == 60, "The timeout is bounded while warming up"
+        for _ in range(5):
+            await tools["slow"].ainvoke({"seconds": 0.1})
+
+        timeout = connector.tool_timeouts.timeout_for("slow")
+        assert 0.2 <= timeout < 1, "The timeout should follow the ~0.1s latency"
+
+        result = await tools["slow"].ainvoke({"seconds": 3})
+        assert "Timed out" in str(result), "A call much slower than usual should time out"
+    finally:
+        await client.close_all_sessions()
@@ -45,6 +45,13 @@ def echo(message: str) -> dict[str, Any]:
     return {"original_message": message, "echo": f"Server received: {message}", "timestamp": datetime.now().isoformat()}
 
 
+@mcp.tool()
+async def slow(seconds: float) -> dict[str, Any]:
+    """Answer after the given number of seconds"""
+    await asyncio.sleep(seconds)
+    return {"slept": seconds, "timestamp": datetime.now().isoformat()}
+
+
 @mcp.resource("test://server/status")
 def server_status_resource() -> str:
     """Server status as a resource"""
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+from mcp_use import MCPClient
+
+
+@pytest.mark.asyncio
+async def test_in_process_connection():
+    """Test that we can mount a FastMCP server in-process and call its tools"""
+    server_dir = Path(__file__).parent.parent / "servers_for_testing"
+    config = {
+        "mcpServers": {
+            "in_process": {
+                "module": "simple_server.py:mcp",
+                "path": str(server_dir),
+            }
+        }
+    }
+
+    client = MCPClient(config=config)
+    try:
+        await client.create_all_sessions()
+        session = client.get_session("in_process")
+
+        # Verify session was created
+        assert session is not None, "Session should be created"
+
+        # Get tools and verify they exist
+        tools = await session.list_tools()
+        tool_names = [tool.name for tool in tools]
+        assert "add" in tool_names, "The 'add' tool should be available"
+
+        # Test calling the add tool
+        result = await session.call_tool("add", {"a": 5, "b": 3})
+        assert result.content[0].text == "8", "Result should be 8"
+    finally:
+        await client.close_all_sessions()
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from mcp_use.connectors import InProcessConnector, ReplicatedConnector
+
+SERVER_DIR = Path(__file__).parent.parent / "servers_for_testing"
+
+
+@pytest.mark.asyncio
+async def test_replicated_connection():
+    """Test that calls are spread across replicas and fail over when one goes down"""
+    replicas = [InProcessConnector("simple_server.py:mcp", path=str(SERVER_DIR)) for _ in range(2)]
+    connector = ReplicatedConnector(replicas, hedge_tools=["add"])
+    try:
+        await connector.connect()
+        await connector.initialize()
+        tool_names = [tool.name for tool in await connector.list_tools()]
+        assert "add" in tool_names, "The 'add' tool should be available"
+
+        for _ in range(4):
+            result = await connector.call_tool("add", {"a": 5, "b": 3})
+            assert result.content[0].text == "8", "Result should be 8"
+        assert [replica.requests for replica in connector.replicas] == [3, 2], "Calls should alternate"
+
+        # Take the first replica down without letting it reconnect
+        replicas[0].auto_reconnect = False
+        await replicas[0].disconnect()
+        for _ in range(3):
+            result = await connector.call_tool("add", {"a": 1, "b": 2})
+            assert result.content[0].text == "3", "Calls should fail over to the healthy replica"
+        assert connector.replicas[0].ejected, "The failed replica should be out of rotation"
+        assert connector.health()["failovers"] == 1
+    finally:
+        await connector.disconnect()
@@ -51,3 +51,38 @@ async def test_stdio_connection(server_process):
         assert result.content[0].text == "8", "Result should be 8"
     finally:
         await client.close_all_sessions()
+
+
+@pytest.mark.asyncio
+async def test_stdio_supervised_restart(server_process):
+    """Test that a supervised stdio server reports health and survives a restart"""
+    server_path = server_process
+    config = {
+        "mcpServers": {
+            "stdio": {
+                "command": "python",
+                "args": [str(server_path)],
+                "supervise": {"probe_interval": 60},
+            }
+        }
+    }
+
+    client = MCPClient(config=config)
+    try:
+        await client.create_all_sessions()
+        session = client.get_session("stdio")
+        supervisor = session.connector.supervisor
+
+        assert await supervisor.probe(), "Server should answer pings"
+        assert client.get_server_health("stdio")["stdio"]["state"] == "healthy"
+
+        # Replace the server process and check it still serves tool calls
+        assert await supervisor.restart(), "Restart should succeed"
+        result = await session.call_tool("add", {"a": 2, "b": 2})
+        assert result.content[0].text == "4", "Result should be 4"
+
+        health = client.get_server_health()["stdio"]
+        assert health["restarts"] == 1
+        assert health["reconnects"]["reconnects"] == 1
+    finally:
+        await client.close_all_sessions()
@@ -72,3 +72,38 @@ async def test_streamable_http_connection(server_process):
         assert result.content[0].text == "8", "Result should be 8"
     finally:
         await client.close_all_sessions()
+
+
+@pytest.mark.asyncio
+async def test_streamable_http_shared_pool(server_process):
+    """Test that pooled server entries on one host share a single connection pool"""
+    server_url = server_process
+    config = {
+        "mcpServers": {
+            "first": {"url": f"{server_url}/mcp", "http_pool": {"max_connections": 10}},
+            "second": {"url": f"{server_url}/mcp", "http_pool": True},
+        }
+    }
+    client = MCPClient(config=config)
+    try:
+        await client.create_all_sessions()
+        first = client.get_session("first")
+        second = client.get_session("second")
+
+        pool = first.connector.http_pool
+        assert pool is second.connector.http_pool, "Both servers should share the pool"
+
+        results = await asyncio.gather(
+            first.call_tool("add", {"a": 1, "b": 2}),
+            second.call_tool("add", {"a": 3, "b": 4}),
+        )
+        assert [result.content[0].text for result in results] == ["3", "7"]
+
+        stats = pool.stats()
+        assert stats["active_clients"] == 2
+        assert stats["max_connections"] == 10
+        assert stats["total_requests"] > 0
+    finally:
+        await client.close_all_sessions()
+
+    assert pool.stats()["active_clients"] == 0, "Closing sessions should release the pool"
@@ -0,0 +1,96 @@
+"""
+Fakes shared by the unit tests of agents.
+"""
+
+import asyncio
+from collections.abc import Callable, Sequence
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import BaseTool
+from pydantic import Field
+
+from mcp_use import MCPAgent
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model answering with ``respond(messages)``, or else with the next of ``responses``.
+
+    The messages of each call are recorded in ``received``, and the tools of each
+    bind_tools call in ``bound``.
+    """
+
+    respond: Callable[[list[BaseMessage]], AIMessage] | None = None
+    responses: list[AIMessage] = Field(default_factory=list)
+    received: list[list[BaseMessage]] = Field(default_factory=list)
+    bound: list[list] = Field(default_factory=list)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def bind_tools(self, tools: list, **kwargs: Any) -> "FakeChatModel":
+        self.bound.append(list(tools))
+        return self
+
+    def _generate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.received.append(messages)
+        message = self.respond(messages) if self.respond else self.responses[len(self.received) - 1]
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class EchoTool(BaseTool):
+    """Tool answering with its text, after ``delay`` seconds and in upper case if ``upper``."""
+
+    name: str = "echo"
+    description: str = "Echo the text"
+    delay: float = 0.0
+    upper: bool = False
+
+    def _run(self, text: str = "") -> str:
+        raise NotImplementedError
+
+    async def _arun(self, text: str = "") -> str:
+        await asyncio.sleep(self.delay)
+        return text.upper() if self.upper else text
+
+
+class EventRecorder(AsyncCallbackHandler):
+    """Callback handler recording the custom events, as (name, data) pairs."""
+
+    def __init__(self):
+        self.events: list[tuple[str, Any]] = []
+
+    async def on_custom_event(self, name: str, data: Any, **kwargs: Any) -> None:
+        self.events.append((name, data))
+
+    def data(self, name: str) -> list[Any]:
+        """Get the data of the events with the given name, in order."""
+        return [data for event_name, data in self.events if event_name == name]
+
+
+def last_query(messages: list[BaseMessage]) -> str:
+    """Get the content of the last human message."""
+    return [message for message in messages if isinstance(message, HumanMessage)][-1].content
+
+
+def tool_results(messages: list[BaseMessage]) -> list[ToolMessage]:
+    """Get the tool messages, in order."""
+    return [message for message in messages if isinstance(message, ToolMessage)]
+
+
+def tool_call(name: str, args: dict[str, Any], call_id: str) -> dict[str, Any]:
+    """Create a tool call of an AI message."""
+    return {"name": name, "args": args, "id": call_id}
+
+
+def make_agent(llm: BaseChatModel, tools: Sequence[BaseTool] = (), **kwargs: Any) -> MCPAgent:
+    """Create an agent with a mocked connector providing the given tools, or their handles."""
+    agent = MCPAgent(llm=llm, connectors=[MagicMock()], **kwargs)
+    agent.adapter._create_tools_from_connectors = AsyncMock(return_value=list(tools))
+    agent.adapter._create_handles_from_connectors = AsyncMock(return_value=list(tools))
+    return agent
@@ -0,0 +1,23 @@
+"""
+Fakes shared by the unit tests of connectors.
+"""
+
+from unittest.mock import MagicMock
+
+from mcp_use.connectors.base import BaseConnector
+
+
+class DummyConnector(BaseConnector):
+    """Connected connector with a mocked client session."""
+
+    def __init__(self):
+        super().__init__()
+        self.client_session = MagicMock()
+        self._connected = True
+
+    async def connect(self) -> None:
+        pass
+
+    @property
+    def public_identifier(self) -> dict[str, str]:
+        return {"type": "dummy"}
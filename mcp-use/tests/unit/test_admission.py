@@ -0,0 +1,183 @@
+"""
+Unit tests for admission control.
+"""
+
+import asyncio
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from connector_fakes import DummyConnector
+
+from mcp_use.config import create_connector_from_config
+from mcp_use.connectors.admission import AdmissionController, AdmissionRejectedError, request_priority
+
+
+class TestAdmissionConfig(unittest.TestCase):
+    """Tests for admission configuration."""
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            AdmissionController(max_in_flight=0)
+        with self.assertRaises(ValueError):
+            AdmissionController(rate=0)
+
+    def test_unknown_priority(self):
+        with self.assertRaises(ValueError):
+            with request_priority("urgent"):
+                pass
+
+    def test_config(self):
+        connector = create_connector_from_config(
+            {"url": "http://localhost:8000/mcp", "admission": {"max_in_flight": 4, "rate": 10}}
+        )
+        self.assertEqual(connector.admission.max_in_flight, 4)
+        self.assertEqual(connector.admission.rate, 10)
+        self.assertEqual(connector.admission.burst, 10)
+
+    def test_no_config(self):
+        connector = create_connector_from_config({"url": "http://localhost:8000/mcp"})
+        self.assertIsNone(connector.admission)
+
+
+class TestAdmissionController(IsolatedAsyncioTestCase):
+    """Tests for the admission controller."""
+
+    async def test_concurrency_cap(self):
+        controller = AdmissionController(max_in_flight=2)
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with controller.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        self.assertEqual(peak, 2)
+        stats = controller.stats()
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["admitted"], 6)
+        self.assertGreater(stats["max_queue_time"], 0)
+
+    async def test_rate_limit(self):
+        controller = AdmissionController(rate=50, burst=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(4):
+            async with controller.slot():
+                pass
+        # One request from the burst, then three tokens at 50 per second
+        self.assertGreaterEqual(loop.time() - start, 0.05)
+
+    async def test_interactive_before_background(self):
+        controller = AdmissionController(max_in_flight=1)
+        order = []
+
+        async def request(name, priority):
+            async with controller.slot(priority):
+                order.append(name)
+
+        await controller.acquire()
+        tasks = [
+            asyncio.create_task(request("background", "background")),
+            asyncio.create_task(request("interactive", "interactive")),
+        ]
+        await asyncio.sleep(0)
+        self.assertEqual(controller.stats()["queued"], {"interactive": 1, "background": 1})
+        controller.release()
+        await asyncio.gather(*tasks)
+        self.assertEqual(order, ["interactive", "background"])
+
+    async def test_priority_from_context(self):
+        controller = AdmissionController(max_in_flight=1)
+        await controller.acquire()
+        with request_priority("background"):
+            task = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        self.assertEqual(controller.stats()["queued"]["background"], 1)
+        controller.release()
+        await task
+
+    async def test_queue_full_rejects(self):
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        await controller.acquire()
+        waiting = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        with self.assertRaises(AdmissionRejectedError) as context:
+            await controller.acquire()
+        self.assertEqual(context.exception.code, "SERVER_OVERLOADED")
+        self.assertEqual(controller.stats()["rejected"], 1)
+        controller.release()
+        await waiting
+
+    async def test_interactive_evicts_background(self):
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        await controller.acquire()
+        background = asyncio.create_task(controller.acquire("background"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(controller.acquire("interactive"))
+        with self.assertRaises(AdmissionRejectedError):
+            await background
+        controller.release()
+        await interactive
+        self.assertEqual(controller.stats()["in_flight"], 1)
+
+    async def test_max_queue_time(self):
+        controller = AdmissionController(max_in_flight=1, max_queue_time=0.01)
+        await controller.acquire()
+        with self.assertRaises(AdmissionRejectedError):
+            await controller.acquire()
+        self.assertEqual(controller.stats()["queued"], {"interactive": 0, "background": 0})
+        controller.release()
+        self.assertEqual(controller.stats()["in_flight"], 0)
+
+    async def test_early_shedding_from_estimated_wait(self):
+        controller = AdmissionController(rate=1, burst=1, max_queue_time=0.5)
+        await controller.acquire()
+        # The next token is a second away, more than the queue budget
+        with self.assertRaises(AdmissionRejectedError) as context:
+            await controller.acquire()
+        self.assertIn("Estimated wait", str(context.exception))
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        controller = AdmissionController(max_in_flight=1)
+        await controller.acquire()
+        waiting = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        controller.release()
+        self.assertEqual(controller.stats()["in_flight"], 0)
+
+
+class TestConnectorAdmission(IsolatedAsyncioTestCase):
+    """Tests for admission control in connectors."""
+
+    async def test_call_tool_holds_slot(self):
+        connector = DummyConnector()
+        connector.admission = AdmissionController(max_in_flight=1)
+        in_flight = []
+
+        async def call_tool(*args, **kwargs):
+            in_flight.append(connector.admission.stats()["in_flight"])
+            return MagicMock()
+
+        connector.client_session.call_tool = AsyncMock(side_effect=call_tool)
+        await connector.call_tool("test_tool", {})
+        self.assertEqual(in_flight, [1])
+        self.assertEqual(connector.admission.stats()["in_flight"], 0)
+        self.assertIn("admission", connector.health())
+
+    async def test_call_tool_rejected(self):
+        connector = DummyConnector()
+        connector.admission = AdmissionController(max_in_flight=1, max_queue=0)
+        connector.client_session.call_tool = AsyncMock()
+        await connector.admission.acquire()
+        with self.assertRaises(AdmissionRejectedError):
+            await connector.call_tool("test_tool", {})
+        connector.client_session.call_tool.assert_not_called()
@@ -0,0 +1,107 @@
+"""
+Unit tests for concurrent runs of one MCPAgent.
+"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agent_fakes import EchoTool, FakeChatModel, last_query, make_agent, tool_call, tool_results
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+from mcp_use import MCPAgent
+
+
+def echo_as_asked(messages: list[BaseMessage]) -> AIMessage:
+    """Call the echo tool as many times as the query asks, e.g. "job 3"."""
+    query = last_query(messages)
+    done = len(tool_results(messages))
+    if done < int(query.split()[-1]):
+        return AIMessage(content="", tool_calls=[tool_call("echo", {"text": f"{query}/{done}"}, f"{query}/{done}")])
+    return AIMessage(content=f"{query} done")
+
+
+async def collect(agent: MCPAgent, query: str) -> list:
+    return [item async for item in agent.stream(query, manage_connector=False)]
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.native.logger", MagicMock())
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestAgentConcurrency(unittest.IsolatedAsyncioTestCase):
+    """Tests for one agent serving concurrent runs."""
+
+    def make_agent(self, engine: str = "executor", **kwargs) -> MCPAgent:
+        return make_agent(FakeChatModel(respond=echo_as_asked), [EchoTool(delay=0.01)], engine=engine, **kwargs)
+
+    async def test_runs_are_isolated(self):
+        for engine in ("executor", "native"):
+            with self.subTest(engine=engine):
+                agent = self.make_agent(engine, memory_enabled=False)
+                await agent.initialize()
+                executor = agent._agent_executor
+
+                queries = [f"job{i} {i % 3 + 1}" for i in range(6)]
+                streams = await asyncio.gather(*(collect(agent, query) for query in queries))
+                for query, items in zip(queries, streams, strict=True):
+                    *steps, result = items
+                    self.assertEqual(result, f"{query} done")
+                    observations = [observation for _, observation in steps]
+                    self.assertEqual(observations, [f"{query}/{n}" for n in range(int(query.split()[-1]))])
+
+                self.assertIs(agent._agent_executor, executor)
+                self.assertEqual(agent.get_conversation_history(), [])
+
+    async def test_max_steps_is_per_run(self):
+        agent = self.make_agent(max_steps=5)
+        await agent.initialize()
+        limited, unlimited = await asyncio.gather(
+            agent.run("short 3", max_steps=1, manage_connector=False),
+            agent.run("long 3", manage_connector=False),
+        )
+        self.assertIn("maximum number of steps (1)", limited)
+        self.assertEqual(unlimited, "long 3 done")
+        self.assertEqual(agent._agent_executor.max_iterations, 5)
+
+    async def test_memory_keeps_runs_together(self):
+        agent = self.make_agent()
+        await agent.initialize()
+        await asyncio.gather(*(agent.run(f"job{i} {i + 1}", manage_connector=False) for i in range(3)))
+
+        history = [message for message in agent.get_conversation_history() if not isinstance(message, SystemMessage)]
+        self.assertEqual(len(history), 6)
+        for question, answer in zip(history[::2], history[1::2], strict=True):
+            self.assertIsInstance(question, HumanMessage)
+            self.assertEqual(answer.content, f"{question.content} done")
+
+    async def test_concurrent_first_runs_initialize_once(self):
+        agent = self.make_agent(memory_enabled=False, auto_initialize=True)
+        agent.initialize = AsyncMock(side_effect=agent.initialize)
+        results = await asyncio.gather(*(agent.run(f"job{i} 1", manage_connector=False) for i in range(3)))
+        self.assertEqual(results, [f"job{i} 1 done" for i in range(3)])
+        agent.initialize.assert_awaited_once()
+
+    async def test_system_messages_and_executors_are_memoized(self):
+        agent = self.make_agent()
+        await agent.initialize()
+        tools = agent._tools
+
+        message = agent._build_system_message(tools)
+        self.assertIs(agent._build_system_message(list(tools)), message)
+        self.assertIs(agent._create_agent(list(tools)), agent._agent_executor)
+        self.assertIsNot(agent._create_agent([EchoTool()]), agent._agent_executor)
+        self.assertEqual(agent._build_system_message([EchoTool()]), message)
+
+        agent.additional_instructions = "Be brief"
+        self.assertIn("Be brief", agent._build_system_message(tools).content)
+        agent.set_system_message("Only echo")
+        self.assertIsNot(agent._agent_executor, agent._create_agent([EchoTool()]))
+        self.assertIs(agent._create_agent(), agent._agent_executor)
+
+        await agent.close()
+        self.assertEqual((len(agent._system_messages), len(agent._executors)), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
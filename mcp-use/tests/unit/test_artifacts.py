@@ -0,0 +1,187 @@
+"""
+Unit tests for artifact stores.
+"""
+
+import base64
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp.types import (
+    BlobResourceContents,
+    CallToolResult,
+    EmbeddedResource,
+    ImageContent,
+    ReadResourceResult,
+    Resource,
+    TextContent,
+    Tool,
+)
+
+from mcp_use.adapters import LangChainAdapter
+from mcp_use.adapters.langchain_adapter import ReadArtifactTool
+from mcp_use.artifacts import Artifact, DiskArtifactStore, MemoryArtifactStore
+
+
+class StoreTests:
+    """Tests shared by all artifact stores."""
+
+    def create_store(self, max_bytes=None):
+        raise NotImplementedError
+
+    def test_put_and_get(self):
+        store = self.create_store()
+        artifact = store.put(b"\x89PNG data", "image/png", summary="chart")
+        self.assertEqual(artifact.size, 9)
+        self.assertEqual(artifact.mime_type, "image/png")
+        self.assertIn(artifact.id, store)
+        view = store.get(artifact.id)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(bytes(view), b"\x89PNG data")
+        self.assertEqual(store.info(artifact.id), artifact)
+
+    def test_empty_artifact(self):
+        store = self.create_store()
+        artifact = store.put(b"")
+        self.assertEqual(bytes(store.get(artifact.id)), b"")
+
+    def test_missing_artifact(self):
+        store = self.create_store()
+        with self.assertRaises(KeyError):
+            store.get("missing")
+        with self.assertRaises(KeyError):
+            store.info("missing")
+
+    def test_lru_eviction(self):
+        store = self.create_store(max_bytes=10)
+        first = store.put(b"a" * 4)
+        second = store.put(b"b" * 4)
+        store.get(first.id)  # Now the most recently used
+        third = store.put(b"c" * 4)
+        self.assertIn(first.id, store)
+        self.assertNotIn(second.id, store)
+        self.assertIn(third.id, store)
+        self.assertEqual(store.stats(), {"artifacts": 2, "bytes": 8, "max_bytes": 10, "evicted": 1})
+
+    def test_oversized_artifact(self):
+        store = self.create_store(max_bytes=4)
+        with self.assertRaises(ValueError):
+            store.put(b"too large")
+
+    def test_delete(self):
+        store = self.create_store()
+        artifact = store.put(b"data")
+        store.delete(artifact.id)
+        self.assertNotIn(artifact.id, store)
+        self.assertEqual(len(store), 0)
+
+
+class TestMemoryArtifactStore(StoreTests, unittest.TestCase):
+    def create_store(self, max_bytes=None):
+        return MemoryArtifactStore(max_bytes=max_bytes)
+
+    def test_get_does_not_copy(self):
+        store = self.create_store()
+        data = b"x" * 1024
+        artifact = store.put(data)
+        self.assertIs(store.get(artifact.id).obj, data)
+
+
+class TestDiskArtifactStore(StoreTests, unittest.TestCase):
+    def create_store(self, max_bytes=None):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return DiskArtifactStore(directory.name, max_bytes=max_bytes)
+
+    def test_files_are_removed(self):
+        store = self.create_store(max_bytes=4)
+        first = store.put(b"abcd")
+        self.assertTrue(os.path.exists(store.path(first.id)))
+        store.put(b"efgh")
+        self.assertFalse(os.path.exists(store.path(first.id)))
+
+
+class TestAdapterArtifacts(unittest.IsolatedAsyncioTestCase):
+    """Tests for artifacts in the LangChain adapter."""
+
+    def setUp(self):
+        self.store = MemoryArtifactStore()
+        self.adapter = LangChainAdapter(artifact_store=self.store)
+
+    def test_image_becomes_reference(self):
+        image = base64.b64encode(b"\x89PNG" * 1000).decode()
+        result = CallToolResult(
+            content=[
+                TextContent(type="text", text="Here is the chart: "),
+                ImageContent(type="image", data=image, mimeType="image/png"),
+            ]
+        )
+        parsed = self.adapter._parse_mcp_tool_result(result)
+        artifact = next(iter(self.store._artifacts.values()))
+        self.assertEqual(parsed, "Here is the chart: " + artifact.reference())
+        self.assertNotIn(image, parsed)
+        self.assertEqual(bytes(self.store.get(artifact.id)), b"\x89PNG" * 1000)
+
+    def test_embedded_blob_becomes_reference(self):
+        blob = BlobResourceContents(uri="file:///report.pdf", mimeType="application/pdf", blob="JVBERi0=")
+        result = CallToolResult(content=[EmbeddedResource(type="resource", resource=blob)])
+        parsed = self.adapter._parse_mcp_tool_result(result)
+        self.assertIn("application/pdf, 5 bytes, resource file:///report.pdf", parsed)
+
+    @patch("mcp_use.adapters.langchain_adapter.logger", MagicMock())
+    def test_oversized_image(self):
+        adapter = LangChainAdapter(artifact_store=MemoryArtifactStore(max_bytes=10))
+        image = base64.b64encode(b"\x89PNG" * 1000).decode()
+        result = CallToolResult(content=[ImageContent(type="image", data=image, mimeType="image/png")])
+        self.assertEqual(adapter._parse_mcp_tool_result(result), "[Artifact too large to store: image/png, 4000 bytes]")
+
+    async def test_errors_do_not_carry_binary_content(self):
+        image = base64.b64encode(b"\x89PNG" * 1000).decode()
+        connector = MagicMock()
+        connector.call_tool = AsyncMock(
+            return_value=CallToolResult(
+                content=[ImageContent(type="image", data=image, mimeType="image/png")], isError=True
+            )
+        )
+        tool = self.adapter._convert_tool(Tool(name="chart", inputSchema={"type": "object"}), connector)
+        output = await tool._arun()
+        self.assertNotIn(image, str(output))
+        self.assertIn("[image: image/png, 5336 base64 characters]", str(output))
+
+    def test_without_store(self):
+        result = CallToolResult(content=[ImageContent(type="image", data="aGk=", mimeType="image/png")])
+        self.assertEqual(LangChainAdapter()._parse_mcp_tool_result(result), "aGk=")
+
+    async def test_resource_tool_blob(self):
+        connector = MagicMock()
+        connector.read_resource = AsyncMock(
+            return_value=ReadResourceResult(
+                contents=[BlobResourceContents(uri="file:///logo.png", mimeType="image/png", blob="aGk=")]
+            )
+        )
+        resource = Resource(uri="file:///logo.png", name="logo", mimeType="image/png")
+        tool = self.adapter._convert_resource(resource, connector)
+        output = await tool._arun()
+        self.assertTrue(output.startswith("[Artifact "))
+        self.assertEqual(len(self.store), 1)
+
+    async def test_read_artifact_tool(self):
+        tools = await self.adapter._create_tools_from_connectors([])
+        self.assertEqual([tool.name for tool in tools], ["read_artifact"])
+        tool = tools[0]
+
+        text = self.store.put(b"hello world", "text/plain")
+        self.assertEqual(await tool.ainvoke({"artifact_id": text.id, "offset": 6}), "world")
+        binary = self.store.put(b"\x00\x01\x02", "image/png")
+        self.assertEqual(await tool.ainvoke({"artifact_id": binary.id}), "AAEC")
+        self.assertIn("not found", str(await tool.ainvoke({"artifact_id": "missing"})))
+
+    def test_artifact_tool_requires_store(self):
+        with self.assertRaises(ValueError):
+            LangChainAdapter().create_artifact_tool()
+        self.assertIsInstance(self.adapter.create_artifact_tool(), ReadArtifactTool)
+
+    def test_reference(self):
+        artifact = Artifact(id="abc", mime_type="image/png", size=10, summary="chart")
+        self.assertEqual(artifact.reference(), "[Artifact abc: image/png, 10 bytes, chart]")
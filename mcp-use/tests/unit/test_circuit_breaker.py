@@ -0,0 +1,175 @@
+"""
+Unit tests for the circuit breaker.
+"""
+
+import asyncio
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, patch
+
+from agent_fakes import EventRecorder
+from connector_fakes import DummyConnector
+from langchain_core.runnables import RunnableLambda
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from mcp_use.client import MCPClient
+from mcp_use.config import create_connector_from_config
+from mcp_use.connectors.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    is_server_failure,
+)
+from mcp_use.errors.error_formatting import format_error
+
+
+@patch("mcp_use.connectors.circuit_breaker.logger")
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for the circuit breaker state machine."""
+
+    def test_invalid_options(self, _):
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_rate_threshold=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(window_size=2, min_calls=5)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(half_open_max_calls=0)
+
+    def test_opens_on_error_rate(self, _):
+        breaker = CircuitBreaker(name="airbnb", failure_rate_threshold=0.5, min_calls=4)
+        breaker.record_success(0.1)
+        breaker.record_failure(ConnectionError("refused"))
+        breaker.record_success(0.1)
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record_failure(ConnectionError("refused"))
+        self.assertEqual(breaker.state, OPEN)
+
+        with self.assertRaises(CircuitOpenError) as context:
+            breaker.check()
+        self.assertEqual(context.exception.code, "SERVER_UNAVAILABLE")
+        self.assertIn("airbnb", str(context.exception))
+        self.assertIn("refused", str(context.exception))
+        self.assertEqual(breaker.stats()["rejected"], 1)
+
+    def test_slow_calls_count_as_errors(self, _):
+        breaker = CircuitBreaker(slow_call_threshold=1.0, min_calls=2)
+        breaker.record_success(0.5)
+        breaker.record_success(2.0)
+        self.assertEqual(breaker.state, OPEN)
+
+    def test_half_open_trial(self, _):
+        breaker = CircuitBreaker(min_calls=1, open_timeout=0)
+        breaker.record_failure(TimeoutError())
+        self.assertEqual(breaker.state, OPEN)
+
+        breaker.acquire()
+        self.assertEqual(breaker.state, HALF_OPEN)
+        # Only one trial at a time
+        with self.assertRaises(CircuitOpenError):
+            breaker.check()
+        breaker.record_success(0.1)
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertEqual(breaker.error_rate, 0.0)
+
+    def test_failed_trial_reopens(self, _):
+        breaker = CircuitBreaker(min_calls=1, open_timeout=0)
+        breaker.record_failure(TimeoutError())
+        breaker.acquire()
+        breaker.record_failure(TimeoutError())
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.stats()["times_opened"], 2)
+
+    def test_ignored_trial_frees_slot(self, _):
+        breaker = CircuitBreaker(min_calls=1, open_timeout=0)
+        breaker.record_failure(TimeoutError())
+        breaker.acquire()
+        breaker.record_ignored()
+        breaker.acquire()
+        self.assertEqual(breaker.state, HALF_OPEN)
+
+    def test_listeners(self, _):
+        breaker = CircuitBreaker(name="airbnb", min_calls=1)
+        events = []
+        breaker.add_listener(events.append)
+        breaker.record_failure(ConnectionError())
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["server"], "airbnb")
+        self.assertEqual(events[0]["previous_state"], CLOSED)
+        self.assertEqual(events[0]["state"], OPEN)
+
+    def test_server_failures(self, _):
+        self.assertTrue(is_server_failure(ConnectionError()))
+        self.assertTrue(is_server_failure(McpError(ErrorData(code=408, message="timed out"))))
+        self.assertFalse(is_server_failure(McpError(ErrorData(code=-32602, message="invalid params"))))
+        self.assertFalse(is_server_failure(asyncio.CancelledError()))
+
+    def test_format_error(self, _):
+        error = CircuitOpenError("airbnb", 30)
+        with patch("mcp_use.errors.error_formatting.logger"):
+            formatted = format_error(error, tool="search")
+        self.assertEqual(formatted["code"], "SERVER_UNAVAILABLE")
+        self.assertFalse(formatted["isRetryable"])
+
+    def test_config(self, _):
+        connector = create_connector_from_config(
+            {"url": "http://localhost:8000/mcp", "circuit_breaker": {"min_calls": 3, "open_timeout": 10}}
+        )
+        self.assertEqual(connector.circuit_breaker.min_calls, 3)
+        self.assertEqual(connector.circuit_breaker.open_timeout, 10)
+
+        connector = create_connector_from_config({"url": "http://localhost:8000/mcp", "circuit_breaker": True})
+        self.assertEqual(connector.circuit_breaker.window_size, 20)
+
+
+@patch("mcp_use.connectors.circuit_breaker.logger")
+class TestConnectorCircuitBreaker(IsolatedAsyncioTestCase):
+    """Tests for the circuit breaker in connectors."""
+
+    async def test_fails_fast_when_open(self, _):
+        connector = DummyConnector()
+        connector.circuit_breaker = CircuitBreaker(min_calls=2)
+        connector.client_session.call_tool = AsyncMock(side_effect=ConnectionError("down"))
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                await connector.call_tool("search", {})
+        with self.assertRaises(CircuitOpenError):
+            await connector.call_tool("search", {})
+        self.assertEqual(connector.client_session.call_tool.await_count, 2)
+        self.assertEqual(connector.health()["circuit_breaker"]["state"], OPEN)
+
+    async def test_error_responses_do_not_open(self, _):
+        connector = DummyConnector()
+        connector.circuit_breaker = CircuitBreaker(min_calls=1)
+        connector.client_session.call_tool = AsyncMock(side_effect=McpError(ErrorData(code=-32602, message="bad")))
+        with self.assertRaises(McpError):
+            await connector.call_tool("search", {})
+        self.assertEqual(connector.circuit_breaker.state, CLOSED)
+
+    async def test_transitions_reach_run_callbacks(self, _):
+        connector = DummyConnector()
+        connector.circuit_breaker = CircuitBreaker(name="airbnb", min_calls=1)
+        connector.client_session.call_tool = AsyncMock(side_effect=ConnectionError("down"))
+        recorder = EventRecorder()
+
+        async def call(_):
+            try:
+                await connector.call_tool("search", {})
+            except ConnectionError:
+                pass
+            await asyncio.sleep(0)
+
+        await RunnableLambda(call).ainvoke({}, config={"callbacks": [recorder]})
+        self.assertEqual(len(recorder.events), 1)
+        name, data = recorder.events[0]
+        self.assertEqual(name, "mcp_circuit_breaker")
+        self.assertEqual(data["server"], "airbnb")
+        self.assertEqual(data["state"], OPEN)
+
+    async def test_client_names_breaker(self, _):
+        client = MCPClient({"mcpServers": {"airbnb": {"url": "http://localhost:8000/mcp", "circuit_breaker": True}}})
+        session = await client.create_session("airbnb", auto_initialize=False)
+        self.assertEqual(session.connector.circuit_breaker.name, "airbnb")
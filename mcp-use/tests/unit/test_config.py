@@ -92,6 +92,26 @@ class TestConnectorCreation(unittest.TestCase):
         self.assertEqual(connector.base_url, "http://test.com")
         self.assertEqual(connector.headers, {})
         self.assertIsNone(connector.auth_token)
+        self.assertEqual(connector.transport, "auto")
+
+    def test_create_http_connector_with_transport(self):
+        """Test creating an HTTP connector pinned to a transport."""
+        server_config = {"url": "http://test.com", "transport": "sse"}
+
+        connector = create_connector_from_config(server_config)
+
+        self.assertIsInstance(connector, HttpConnector)
+        self.assertEqual(connector.transport, "sse")
+
+    def test_create_http_connectors_with_shared_pool(self):
+        """Test that pooled HTTP connectors to the same origin share one pool."""
+        first = create_connector_from_config({"url": "http://gateway.test/a/mcp", "http_pool": True})
+        second = create_connector_from_config({"url": "http://gateway.test/b/mcp", "http_pool": {"max_connections": 5}})
+        unpooled = create_connector_from_config({"url": "http://gateway.test/c/mcp"})
+
+        self.assertIsNotNone(first.http_pool)
+        self.assertIs(first.http_pool, second.http_pool)
+        self.assertIsNone(unpooled.http_pool)
 
     def test_create_websocket_connector(self):
         """Test creating a WebSocket connector from config."""
@@ -0,0 +1,182 @@
+"""
+Unit tests for the conversation stores and their use by the agent.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from agent_fakes import FakeChatModel, make_agent
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+from mcp_use import MCPAgent
+from mcp_use.conversations import (
+    JSONLConversationStore,
+    MemoryConversationStore,
+    SQLiteConversationStore,
+)
+
+
+def turns(count: int, start: int = 0) -> list[BaseMessage]:
+    messages: list[BaseMessage] = []
+    for i in range(start, start + count):
+        messages.append(HumanMessage(content=f"Question {i}"))
+        messages.append(AIMessage(content=f"Answer {i}"))
+    return messages
+
+
+class ConversationStoreTests:
+    """Tests shared by all conversation stores."""
+
+    def make_store(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.store = self.make_store()
+
+    def test_append_and_load(self):
+        self.store.append("a", turns(2))
+        self.store.append("a", turns(1, start=2))
+        self.store.append("b", turns(1))
+        self.assertEqual(self.store.load("a"), turns(3))
+        self.assertEqual(self.store.load("b"), turns(1))
+        self.assertEqual(self.store.load("unknown"), [])
+
+    def test_window_starts_at_a_turn(self):
+        self.store.append("a", turns(5))
+        self.assertEqual(self.store.load("a", last=4), turns(2, start=3))
+        self.assertEqual(self.store.load("a", last=3), turns(1, start=4))
+        self.assertEqual(self.store.load("a", last=100), turns(5))
+        self.assertEqual(self.store.load("a", last=1), [])
+        with self.assertRaises(ValueError):
+            self.store.load("a", last=-1)
+
+    def test_delete(self):
+        self.store.append("a", turns(1))
+        self.store.delete("a")
+        self.store.delete("a")
+        self.assertEqual(self.store.load("a"), [])
+
+    def test_message_types_round_trip(self):
+        call = AIMessage(content="", tool_calls=[{"name": "search", "args": {"q": "x"}, "id": "1"}])
+        self.store.append("a", [HumanMessage(content="Search"), call])
+        loaded = self.store.load("a")
+        self.assertIsInstance(loaded[1], AIMessage)
+        self.assertEqual(loaded[1].tool_calls[0]["args"], {"q": "x"})
+
+
+class TestMemoryConversationStore(ConversationStoreTests, unittest.TestCase):
+    def make_store(self):
+        return MemoryConversationStore()
+
+    def test_least_recently_used_conversations_are_evicted(self):
+        store = MemoryConversationStore(max_conversations=2)
+        store.append("a", turns(1))
+        store.append("b", turns(1))
+        store.load("a")
+        store.append("c", turns(1))
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.load("b"), [])
+        self.assertEqual(store.load("a"), turns(1))
+
+    def test_conversations_keep_their_last_messages(self):
+        store = MemoryConversationStore(max_messages=4)
+        store.append("a", turns(3))
+        self.assertEqual(store.load("a"), turns(2, start=1))
+
+
+class TestSQLiteConversationStore(ConversationStoreTests, unittest.TestCase):
+    def make_store(self):
+        self.directory = tempfile.TemporaryDirectory()
+        return SQLiteConversationStore(os.path.join(self.directory.name, "conversations.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_conversations_persist(self):
+        self.store.append("a", turns(2))
+        self.store.close()
+        self.store = SQLiteConversationStore(self.store.path)
+        self.assertEqual(self.store.load("a", last=2), turns(1, start=1))
+
+
+class TestJSONLConversationStore(ConversationStoreTests, unittest.TestCase):
+    def make_store(self):
+        self.directory = tempfile.TemporaryDirectory()
+        return JSONLConversationStore(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @patch("mcp_use.conversations.TAIL_BLOCK_SIZE", 16)
+    def test_window_read_across_blocks(self):
+        self.store.append("a", turns(20))
+        self.assertEqual(self.store.load("a", last=6), turns(3, start=17))
+        self.assertEqual(self.store.load("a", last=40), turns(20))
+
+    def test_one_file_per_conversation(self):
+        self.store.append("user/1", turns(1))
+        self.assertTrue(os.path.exists(self.store.path("user/1")))
+        self.assertEqual(os.path.dirname(self.store.path("user/1")), self.directory.name)
+
+
+def count_questions(messages: list[BaseMessage]) -> AIMessage:
+    """Answer with the number of questions in the conversation."""
+    questions = [message for message in messages if isinstance(message, HumanMessage)]
+    return AIMessage(content=f"{len(questions)} questions")
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestAgentConversations(unittest.IsolatedAsyncioTestCase):
+    async def make_agent(self, **kwargs) -> MCPAgent:
+        agent = make_agent(FakeChatModel(respond=count_questions), **kwargs)
+        await agent.initialize()
+        return agent
+
+    def history(self, messages: list[BaseMessage]) -> list[str]:
+        return [message.content for message in messages if not isinstance(message, SystemMessage)]
+
+    async def test_conversations_are_separate(self):
+        agent = await self.make_agent()
+        for query, conversation_id in [("A1", "a"), ("B1", "b"), ("A2", "a")]:
+            await agent.run(query, manage_connector=False, conversation_id=conversation_id)
+
+        self.assertEqual(self.history(agent.llm.received[-1]), ["A1", "1 questions", "A2"])
+        self.assertEqual(len(agent.get_conversation_history("a")), 4)
+        self.assertEqual(len(agent.get_conversation_history("b")), 2)
+        self.assertEqual(self.history(agent.get_conversation_history()), [])
+
+        agent.clear_conversation_history("a")
+        self.assertEqual(agent.get_conversation_history("a"), [])
+        self.assertEqual(len(agent.get_conversation_history("b")), 2)
+
+    async def test_history_window(self):
+        agent = await self.make_agent(history_window=4)
+        for i in range(4):
+            await agent.run(f"Q{i}", manage_connector=False, conversation_id="a")
+
+        self.assertEqual(self.history(agent.llm.received[-1]), ["Q1", "2 questions", "Q2", "3 questions", "Q3"])
+        self.assertEqual(len(agent.get_conversation_history("a")), 8)
+
+    async def test_memory_disabled(self):
+        agent = await self.make_agent(memory_enabled=False)
+        await agent.run("Q0", manage_connector=False, conversation_id="a")
+        self.assertEqual(agent.get_conversation_history("a"), [])
+
+    async def test_stream_events(self):
+        store = MemoryConversationStore()
+        agent = await self.make_agent(conversation_store=store)
+        for query in ["Q0", "Q1"]:
+            async for _ in agent.stream_events(query, manage_connector=False, conversation_id="a"):
+                pass
+
+        self.assertEqual(self.history(agent.llm.received[-1])[0], "Q0")
+        questions = [message.content for message in store.load("a") if isinstance(message, HumanMessage)]
+        self.assertEqual(questions, ["Q0", "Q1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Unit tests for the token-budgeted compaction of the conversation history.
+"""
+
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agent_fakes import EventRecorder, FakeChatModel, make_agent
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from mcp_use.agents import HistoryCompactor
+from mcp_use.agents.history import SUMMARY_INSTRUCTIONS, SUMMARY_PREFIX, estimate_tokens, split_turns
+
+
+def conversation(turns: int, size: int = 100) -> list[BaseMessage]:
+    messages: list[BaseMessage] = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"Question {i} " + "q" * size))
+        messages.append(AIMessage(content=f"Answer {i} " + "a" * size))
+    return messages
+
+
+class TestHelpers(unittest.TestCase):
+    def test_estimate_tokens(self):
+        self.assertEqual(estimate_tokens([HumanMessage(content="x" * 40)]), 14)
+        with_call = AIMessage(content="", tool_calls=[{"name": "search", "args": {"q": "x"}, "id": "1"}])
+        self.assertGreater(estimate_tokens([with_call]), estimate_tokens([AIMessage(content="")]))
+
+    def test_split_turns(self):
+        messages = [AIMessage(content="Hi"), *conversation(2)]
+        self.assertEqual([len(turn) for turn in split_turns(messages)], [1, 2, 2])
+
+
+class TestHistoryCompactor(unittest.IsolatedAsyncioTestCase):
+    def test_history_within_budget_is_unchanged(self):
+        history = conversation(3)
+        compactor = HistoryCompactor(max_tokens=10_000)
+        self.assertEqual(compactor.compact([SystemMessage(content="System"), *history]), history)
+
+    def test_recent_turns_are_kept(self):
+        history = conversation(10)
+        compactor = HistoryCompactor(max_tokens=200, keep_recent_turns=2)
+        compacted = compactor.compact(history)
+        self.assertEqual(compacted[-4:], history[-4:])
+        self.assertLessEqual(estimate_tokens(compacted), 200)
+        self.assertEqual(compacted, history[-len(compacted) :])
+
+    def test_recent_turns_are_kept_over_budget(self):
+        history = conversation(3, size=1000)
+        compacted = HistoryCompactor(max_tokens=10, keep_recent_turns=2).compact(history)
+        self.assertEqual(compacted, history[-4:])
+
+    def test_large_observations_are_dropped(self):
+        call = AIMessage(content="", tool_calls=[{"name": "fetch", "args": {}, "id": "1"}])
+        history = [HumanMessage(content="Fetch"), call, ToolMessage(content="x" * 4000, tool_call_id="1")]
+        history += conversation(2)
+        compacted = HistoryCompactor(max_tokens=300, keep_recent_turns=2).compact(history)
+        self.assertEqual(len(compacted), len(history))
+        self.assertIn("left out of the history", compacted[2].content)
+        self.assertEqual(compacted[2].tool_call_id, "1")
+        self.assertEqual(compacted[3:], history[3:])
+
+    async def test_older_turns_are_summarized(self):
+        summarizer = FakeListChatModel(responses=["First summary", "Second summary"])
+        summarizer = MagicMock(wraps=summarizer, ainvoke=AsyncMock(side_effect=summarizer.ainvoke))
+        compactor = HistoryCompactor(max_tokens=200, keep_recent_turns=2, summarizer=summarizer)
+        history = conversation(6)
+
+        # The summary is written in the background: the first compaction leaves the older turns out
+        first = compactor.compact(history)
+        self.assertNotIn(SUMMARY_PREFIX, first[0].content)
+        await compactor.wait()
+        second = compactor.compact(history)
+        self.assertEqual(second[0].content, SUMMARY_PREFIX + "First summary")
+        self.assertEqual(second[1:], history[-4:])
+
+        # The next summary folds the previous one with the turns that followed it
+        history += conversation(2)
+        compactor.compact(history)
+        await compactor.wait()
+        prompt = summarizer.ainvoke.await_args_list[-1].args[0]
+        self.assertEqual(prompt[0].content, SUMMARY_INSTRUCTIONS)
+        self.assertIn("Previous summary:\nFirst summary", prompt[1].content)
+        self.assertNotIn("Question 0", prompt[1].content)
+        self.assertEqual(compactor.compact(history)[0].content, SUMMARY_PREFIX + "Second summary")
+        self.assertEqual(summarizer.ainvoke.await_count, 2)
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            HistoryCompactor(max_tokens=0)
+
+
+def answer_or_summarize(messages: list[BaseMessage]) -> AIMessage:
+    """Answer each question with a long answer, and summary requests with a summary."""
+    if messages[0].content == SUMMARY_INSTRUCTIONS:
+        return AIMessage(content="Summary")
+    return AIMessage(content="Answer " + "a" * 400)
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestAgentHistoryCompaction(unittest.IsolatedAsyncioTestCase):
+    async def test_history_stays_within_budget(self):
+        llm = FakeChatModel(respond=answer_or_summarize)
+        handler = EventRecorder()
+        agent = make_agent(llm, max_history_tokens=1200, callbacks=[handler])
+        await agent.initialize()
+
+        for i in range(10):
+            await agent.run(f"Question {i} " + "q" * 400, manage_connector=False)
+            await agent.history_compactor.wait()
+
+        prompt = [messages for messages in llm.received if messages[0].content != SUMMARY_INSTRUCTIONS][-1]
+        history = [message for message in prompt if not isinstance(message, SystemMessage)][:-1]
+        self.assertEqual(history[0].content, SUMMARY_PREFIX + "Summary")
+        self.assertLessEqual(estimate_tokens(history), 1200)
+        self.assertEqual(len(agent.get_conversation_history()), 21)
+        self.assertEqual([name for name, _ in handler.events], ["prompt_tokens"] * 10)
+        self.assertLess(handler.events[-1][1]["tokens"], 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 Unit tests for the HttpConnector class.
 """
 
+import os
+import tempfile
 import unittest
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
@@ -11,6 +13,7 @@ from mcp import McpError
 from mcp.types import EmptyResult, ErrorData, Prompt, Resource, Tool
 
 from mcp_use.connectors.http import HttpConnector
+from mcp_use.connectors.transport_cache import TransportCache
 from mcp_use.task_managers import SseConnectionManager
 
 
@@ -76,6 +79,45 @@ class TestHttpConnectorInitialization(unittest.TestCase):
         connector = HttpConnector(base_url="http://localhost:8000/")
         self.assertEqual(connector.base_url, "http://localhost:8000")
 
+    def test_init_with_invalid_transport(self, _):
+        """Test that an unknown transport is rejected."""
+        with self.assertRaises(ValueError):
+            HttpConnector(base_url="http://localhost:8000", transport="grpc")
+
+
+class TestTransportCache(unittest.TestCase):
+    """Tests for the transport negotiation cache."""
+
+    def test_set_get_invalidate(self):
+        """Test recording and forgetting a negotiated transport."""
+        cache = TransportCache()
+        cache.set("http://localhost:8000/", "sse")
+
+        self.assertEqual(cache.get("http://localhost:8000"), "sse")
+        cache.invalidate("http://localhost:8000")
+        self.assertIsNone(cache.get("http://localhost:8000"))
+
+    def test_rejects_unknown_transport(self):
+        """Test that only HTTP transports can be cached."""
+        with self.assertRaises(ValueError):
+            TransportCache().set("http://localhost:8000", "websocket")
+
+    def test_max_age(self):
+        """Test that expired entries are ignored."""
+        cache = TransportCache(max_age=0)
+        cache.set("http://localhost:8000", "sse")
+        cache._entries["http://localhost:8000"]["updated_at"] -= 1
+
+        self.assertIsNone(cache.get("http://localhost:8000"))
+
+    def test_persistence(self):
+        """Test that entries survive through the persisted file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "transports.json")
+            TransportCache(path=path).set("http://localhost:8000", "streamable_http")
+
+            self.assertEqual(TransportCache(path=path).get("http://localhost:8000"), "streamable_http")
+
 
 @patch("mcp_use.connectors.base.logger")
 class TestHttpConnectorConnection(IsolatedAsyncioTestCase):
@@ -83,7 +125,7 @@ class TestHttpConnectorConnection(IsolatedAsyncioTestCase):
 
     def setUp(self):
         """Set up a connector for each test."""
-        self.connector = HttpConnector(base_url="http://localhost:8000")
+        self.connector = HttpConnector(base_url="http://localhost:8000", transport_cache=TransportCache())
 
         # Mock the connection manager
         self.mock_cm = MagicMock(spec=SseConnectionManager)
@@ -191,7 +233,7 @@ class TestHttpConnectorConnection(IsolatedAsyncioTestCase):
         await self.connector.connect()
 
         # Verify streamable HTTP connection manager was used
-        mock_cm_class.assert_called_once_with("http://localhost:8000", {}, 5, 300)
+        mock_cm_class.assert_called_once_with("http://localhost:8000", {}, 5, 300, httpx_client_factory=None)
         mock_cm_instance.start.assert_called_once()
 
         # Verify client session was created and initialized
@@ -267,6 +309,93 @@ class TestHttpConnectorConnection(IsolatedAsyncioTestCase):
         self.assertIsNone(self.connector._connection_manager)
         self.assertFalse(self.connector._connected)
 
+    @patch("mcp_use.connectors.http.SseConnectionManager")
+    @patch("mcp_use.connectors.http.StreamableHttpConnectionManager")
+    @patch("mcp_use.connectors.http.ClientSession")
+    async def test_connect_uses_cached_sse_transport(
+        self, mock_client_session_class, mock_streamable_cm_class, mock_sse_cm_class, _
+    ):
+        """Test that a cached SSE transport skips the streamable HTTP probe."""
+        self.connector.transport_cache.set("http://localhost:8000", "sse")
+        mock_sse_cm_instance = MagicMock()
+        mock_sse_cm_instance.start = AsyncMock(return_value=("sse_read_stream", "sse_write_stream"))
+        mock_sse_cm_class.return_value = mock_sse_cm_instance
+        mock_client_session_class.return_value.__aenter__ = AsyncMock()
+
+        await self.connector.connect()
+
+        mock_streamable_cm_class.assert_not_called()
+        mock_sse_cm_class.assert_called_once()
+        self.assertEqual(self.connector.transport_type, "SSE")
+        self.assertEqual(self.connector._connection_manager, mock_sse_cm_instance)
+        self.assertTrue(self.connector._connected)
+
+    @patch("mcp_use.connectors.http.SseConnectionManager")
+    @patch("mcp_use.connectors.http.StreamableHttpConnectionManager")
+    @patch("mcp_use.connectors.http.ClientSession")
+    async def test_connect_records_sse_fallback(
+        self, mock_client_session_class, mock_streamable_cm_class, mock_sse_cm_class, _
+    ):
+        """Test that falling back to SSE is remembered for the next connection."""
+        mock_streamable_cm_instance = MagicMock()
+        mock_streamable_cm_instance.start = AsyncMock(side_effect=Exception("405 Method Not Allowed"))
+        mock_streamable_cm_instance.stop = AsyncMock()
+        mock_streamable_cm_class.return_value = mock_streamable_cm_instance
+        mock_sse_cm_instance = MagicMock()
+        mock_sse_cm_instance.start = AsyncMock(return_value=("sse_read_stream", "sse_write_stream"))
+        mock_sse_cm_class.return_value = mock_sse_cm_instance
+        mock_client_session_class.return_value.__aenter__ = AsyncMock()
+
+        await self.connector.connect()
+
+        mock_streamable_cm_instance.stop.assert_called_once()
+        self.assertEqual(self.connector.transport_cache.get("http://localhost:8000"), "sse")
+
+    @patch("mcp_use.connectors.http.SseConnectionManager")
+    @patch("mcp_use.connectors.http.StreamableHttpConnectionManager")
+    @patch("mcp_use.connectors.http.ClientSession")
+    async def test_connect_renegotiates_when_cached_transport_fails(
+        self, mock_client_session_class, mock_streamable_cm_class, mock_sse_cm_class, _
+    ):
+        """Test that a stale cache entry is dropped and the transport renegotiated."""
+        self.connector.transport_cache.set("http://localhost:8000", "sse")
+        mock_sse_cm_instance = MagicMock()
+        mock_sse_cm_instance.start = AsyncMock(side_effect=Exception("SSE endpoint gone"))
+        mock_sse_cm_instance.stop = AsyncMock()
+        mock_sse_cm_class.return_value = mock_sse_cm_instance
+        mock_streamable_cm_instance = MagicMock()
+        mock_streamable_cm_instance.start = AsyncMock(return_value=("read_stream", "write_stream"))
+        mock_streamable_cm_class.return_value = mock_streamable_cm_instance
+        mock_session = mock_client_session_class.return_value
+        mock_session.__aenter__ = AsyncMock()
+        mock_session.initialize = AsyncMock(
+            return_value=MagicMock(capabilities=MagicMock(tools=False, resources=False, prompts=False))
+        )
+
+        await self.connector.connect()
+
+        self.assertEqual(self.connector.transport_type, "streamable HTTP")
+        self.assertEqual(self.connector.transport_cache.get("http://localhost:8000"), "streamable_http")
+
+    @patch("mcp_use.connectors.http.SseConnectionManager")
+    @patch("mcp_use.connectors.http.StreamableHttpConnectionManager")
+    async def test_connect_explicit_transport_does_not_fall_back(self, mock_streamable_cm_class, mock_sse_cm_class, _):
+        """Test that an explicitly configured transport is used without fallback."""
+        connector = HttpConnector(
+            base_url="http://localhost:8000", transport="streamable_http", transport_cache=TransportCache()
+        )
+        mock_streamable_cm_instance = MagicMock()
+        mock_streamable_cm_instance.start = AsyncMock(side_effect=Exception("Streamable HTTP failed"))
+        mock_streamable_cm_instance.stop = AsyncMock()
+        mock_streamable_cm_class.return_value = mock_streamable_cm_instance
+
+        with self.assertRaises(Exception) as context:
+            await connector.connect()
+
+        self.assertEqual(str(context.exception), "Streamable HTTP failed")
+        mock_sse_cm_class.assert_not_called()
+        self.assertIsNone(connector.transport_cache.get("http://localhost:8000"))
+
     async def test_disconnect(self, _):
         """Test disconnecting from the MCP implementation."""
         # Set up the connector as connected
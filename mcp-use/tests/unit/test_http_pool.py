@@ -0,0 +1,102 @@
+"""
+Unit tests for the shared HTTP connection pools.
+"""
+
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+import httpx
+
+from mcp_use.task_managers.http_pool import HttpConnectionPool, get_origin, get_shared_http_pool
+
+
+class TestOrigin(unittest.TestCase):
+    """Tests for origin computation."""
+
+    def test_default_ports(self):
+        """Test that default ports are made explicit."""
+        self.assertEqual(get_origin("http://example.com/mcp"), "http://example.com:80")
+        self.assertEqual(get_origin("https://example.com/a/b"), "https://example.com:443")
+
+    def test_explicit_port(self):
+        """Test that explicit ports are kept."""
+        self.assertEqual(get_origin("http://127.0.0.1:8000/mcp"), "http://127.0.0.1:8000")
+
+    def test_shared_pool_per_origin(self):
+        """Test that URLs on the same origin share a pool."""
+        first = get_shared_http_pool("http://pool-test.local/a")
+        second = get_shared_http_pool("http://pool-test.local:80/b")
+        other = get_shared_http_pool("https://pool-test.local/a")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+
+class TestHttpConnectionPool(IsolatedAsyncioTestCase):
+    """Tests for HttpConnectionPool leases and metrics."""
+
+    async def test_clients_share_transport(self):
+        """Test that clients created from one pool share the underlying transport."""
+        pool = HttpConnectionPool("http://localhost:80")
+
+        first = pool.create_client(headers={"A": "1"})
+        second = pool.create_client(headers={"B": "2"})
+
+        handle_request = patch.object(
+            httpx.AsyncHTTPTransport, "handle_async_request", autospec=True, return_value=httpx.Response(200)
+        )
+        with handle_request as send:
+            await first.get("http://localhost/a")
+            await second.get("http://localhost/b")
+        self.assertIs(send.call_args_list[0].args[0], send.call_args_list[1].args[0])
+        self.assertEqual(first.headers["A"], "1")
+        self.assertNotIn("A", second.headers)
+        self.assertEqual(pool.stats()["active_clients"], 2)
+
+        await first.aclose()
+        self.assertIsNotNone(pool._transport)
+        await second.aclose()
+        self.assertIsNone(pool._transport)
+        self.assertEqual(pool.stats()["active_clients"], 0)
+        self.assertEqual(pool.stats()["total_clients"], 2)
+
+    async def test_release_is_idempotent(self):
+        """Test that closing a client twice releases its lease only once."""
+        pool = HttpConnectionPool("http://localhost:80")
+        first = pool.create_client()
+        second = pool.create_client()
+
+        await first.aclose()
+        await first.aclose()
+
+        self.assertEqual(pool.stats()["active_clients"], 1)
+        await second.aclose()
+
+    async def test_request_counters(self):
+        """Test that requests through pooled clients are counted."""
+        pool = HttpConnectionPool("http://localhost:80", max_connections=3)
+        client = pool.create_client()
+
+        async def handler(request):
+            self.assertEqual(pool.stats()["pending_requests"], 1)
+            return httpx.Response(200, text="ok")
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handler):
+            response = await client.get("http://localhost/ping")
+
+        self.assertEqual(response.text, "ok")
+        stats = pool.stats()
+        self.assertEqual(stats["total_requests"], 1)
+        self.assertEqual(stats["pending_requests"], 0)
+        self.assertEqual(stats["peak_pending_requests"], 1)
+        self.assertEqual(stats["max_connections"], 3)
+        await client.aclose()
+
+    def test_http2_requires_h2(self):
+        """Test that requesting HTTP/2 without h2 gives an install hint."""
+        with patch.dict("sys.modules", {"h2": None}):
+            with self.assertRaises(ImportError) as context:
+                HttpConnectionPool("https://localhost:443", http2=True)
+
+        self.assertIn("mcp-use[http2]", str(context.exception))
@@ -0,0 +1,160 @@
+"""
+Unit tests for the InProcessConnector.
+"""
+
+import asyncio
+import sys
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase
+
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.lowlevel import Server
+from mcp.shared.exceptions import McpError
+
+from mcp_use.config import create_connector_from_config
+from mcp_use.connectors.in_process import InProcessConnector, get_lowlevel_server, load_server
+
+SERVER_SOURCE = """
+from mcp.server.fastmcp import FastMCP
+
+app = FastMCP("module-server")
+
+
+@app.tool()
+def echo(text: str) -> str:
+    return text
+"""
+
+
+class TestLoadServer(unittest.TestCase):
+    """Tests for importing in-process servers from specs."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        Path(self.tmp_dir.name, "inproc_test_server.py").write_text(SERVER_SOURCE)
+
+    def tearDown(self):
+        sys.modules.pop("inproc_test_server", None)
+        if self.tmp_dir.name in sys.path:
+            sys.path.remove(self.tmp_dir.name)
+        self.tmp_dir.cleanup()
+
+    def test_load_dotted_module(self):
+        """Test loading a server from an importable module."""
+        server = load_server("inproc_test_server:app", path=self.tmp_dir.name)
+        self.assertEqual(server.name, "module-server")
+
+    def test_load_file(self):
+        """Test loading a server from a .py file path."""
+        server = load_server("inproc_test_server.py:app", path=self.tmp_dir.name)
+        self.assertEqual(server.name, "module-server")
+
+    def test_missing_attribute(self):
+        """Test that a missing attribute raises ValueError."""
+        with self.assertRaises(ValueError):
+            load_server("inproc_test_server:missing", path=self.tmp_dir.name)
+
+    def test_invalid_spec(self):
+        """Test that an empty module name raises ValueError."""
+        with self.assertRaises(ValueError):
+            load_server(":app")
+
+    def test_get_lowlevel_server(self):
+        """Test that FastMCP apps and low-level servers are both accepted."""
+        app = FastMCP("x")
+        self.assertIs(get_lowlevel_server(app), app._mcp_server)
+        lowlevel = Server("y")
+        self.assertIs(get_lowlevel_server(lowlevel), lowlevel)
+        with self.assertRaises(TypeError):
+            get_lowlevel_server(object())
+
+    def test_config(self):
+        """Test that the module key creates an in-process connector."""
+        connector = create_connector_from_config({"module": "inproc_test_server:app", "path": self.tmp_dir.name})
+
+        self.assertIsInstance(connector, InProcessConnector)
+        self.assertEqual(connector.spec, "inproc_test_server:app")
+        self.assertEqual(connector.server.name, "module-server")
+
+
+class TestInProcessConnector(IsolatedAsyncioTestCase):
+    """Tests for running a server in-process."""
+
+    async def test_call_tool(self):
+        """Test connecting, initializing and calling a tool in-process."""
+        app = FastMCP("in-process")
+
+        @app.tool()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        connector = InProcessConnector(app)
+        await connector.connect()
+        try:
+            await connector.initialize()
+            tools = await connector.list_tools()
+            result = await connector.call_tool("add", {"a": 2, "b": 3})
+        finally:
+            await connector.disconnect()
+
+        self.assertEqual([tool.name for tool in tools], ["add"])
+        self.assertEqual(result.content[0].text, "5")
+        self.assertFalse(connector.is_connected)
+
+
+class TestCancelledCalls(IsolatedAsyncioTestCase):
+    """Tests for telling the server about tool calls given up on."""
+
+    async def asyncSetUp(self):
+        self.started: list = []
+        self.cancelled: list = []
+        app = FastMCP("slow")
+
+        @app.tool()
+        async def wait(ctx: Context) -> str:
+            self.started.append(ctx.request_id)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(ctx.request_id)
+                raise
+            return "done"
+
+        self.connector = InProcessConnector(app)
+        await self.connector.connect()
+        await self.connector.initialize()
+        # A first call, so the slow call is not the first request of the session
+        await self.connector.list_tools()
+
+    async def asyncTearDown(self):
+        await self.connector.disconnect()
+
+    async def wait_for_cancellation(self):
+        for _ in range(100):
+            if self.cancelled:
+                return
+            await asyncio.sleep(0.01)
+
+    async def test_timed_out_call_is_cancelled(self):
+        """Test that the server stops working on a call that timed out."""
+        with self.assertRaises(McpError):
+            await self.connector.call_tool("wait", {}, timedelta(seconds=0.1))
+        await self.wait_for_cancellation()
+
+        self.assertEqual(len(self.started), 1)
+        self.assertEqual(self.cancelled, self.started)
+
+    async def test_cancelled_call_is_cancelled(self):
+        """Test that the server stops working on a call cancelled by the client."""
+        call = asyncio.create_task(self.connector.call_tool("wait", {}))
+        while not self.started:
+            await asyncio.sleep(0.01)
+        call.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await call
+        await self.wait_for_cancellation()
+
+        self.assertEqual(self.cancelled, self.started)
@@ -0,0 +1,105 @@
+"""
+Unit tests for the native agent loop.
+"""
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from agent_fakes import EchoTool, FakeChatModel, make_agent, tool_call
+from langchain_core.messages import AIMessage, SystemMessage, ToolMessage
+from langchain_core.tools import BaseTool
+
+from mcp_use import MCPAgent
+from mcp_use.agents.native import NativeAgentExecutor
+
+
+def echo_call(text: str, call_id: str) -> dict:
+    return tool_call("echo", {"text": text}, call_id)
+
+
+def upper_echo(delay: float = 0.0) -> EchoTool:
+    return EchoTool(description="Echo the text in upper case, e.g. {text}", delay=delay, upper=True)
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.native.logger", MagicMock())
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestNativeAgent(unittest.IsolatedAsyncioTestCase):
+    """Tests for MCPAgent with the native engine."""
+
+    async def make_agent(self, responses: list[AIMessage], tools: list[BaseTool] | None = None) -> MCPAgent:
+        self.llm = FakeChatModel(responses=responses)
+        agent = make_agent(self.llm, tools or [upper_echo()], engine="native")
+        await agent.initialize()
+        return agent
+
+    async def test_parallel_tool_calls(self):
+        agent = await self.make_agent(
+            [
+                AIMessage(content="", tool_calls=[echo_call("slow", "1"), echo_call("fast", "2")]),
+                AIMessage(content="SLOW and FAST"),
+            ],
+            tools=[upper_echo(delay=0.01)],
+        )
+        result = await agent.run("Echo slow and fast", manage_connector=False)
+
+        self.assertEqual(result, "SLOW and FAST")
+        second_call = self.llm.received[1]
+        tool_messages = [message for message in second_call if isinstance(message, ToolMessage)]
+        self.assertEqual([(m.tool_call_id, m.content) for m in tool_messages], [("1", "SLOW"), ("2", "FAST")])
+
+    async def test_stream_yields_steps(self):
+        agent = await self.make_agent(
+            [AIMessage(content="", tool_calls=[echo_call("hi", "1")]), AIMessage(content="Done")],
+        )
+        items = [item async for item in agent.stream("Say hi", manage_connector=False)]
+        self.assertEqual(len(items), 2)
+        action, observation = items[0]
+        self.assertEqual((action.tool, observation), ("echo", "HI"))
+        self.assertEqual(items[1], "Done")
+
+    async def test_tools_bound_once(self):
+        agent = await self.make_agent(
+            [AIMessage(content="", tool_calls=[echo_call("a", "1")]), AIMessage(content="Done")],
+        )
+        self.assertIsInstance(agent._agent_executor, NativeAgentExecutor)
+        await agent.run("Go", manage_connector=False)
+        self.assertEqual(len(self.llm.bound), 1)
+
+    async def test_system_message_is_rendered(self):
+        agent = await self.make_agent([AIMessage(content="Hello")])
+        await agent.run("Hi", manage_connector=False)
+        system = self.llm.received[0][0]
+        self.assertIsInstance(system, SystemMessage)
+        self.assertIn("e.g. {text}", system.content)
+        self.assertEqual(sum(isinstance(message, SystemMessage) for message in self.llm.received[0]), 1)
+
+    async def test_memory(self):
+        agent = await self.make_agent([AIMessage(content="First"), AIMessage(content="Second")])
+        await agent.run("One", manage_connector=False)
+        await agent.run("Two", manage_connector=False)
+        contents = [message.content for message in self.llm.received[1]]
+        self.assertEqual(contents[1:], ["One", "First", "Two"])
+
+    async def test_max_steps(self):
+        agent = await self.make_agent([AIMessage(content="", tool_calls=[echo_call(str(i), str(i))]) for i in range(3)])
+        result = await agent.run("Loop", max_steps=2, manage_connector=False)
+        self.assertIn("maximum number of steps (2)", result)
+
+    async def test_chain_invoke(self):
+        llm = FakeChatModel(
+            responses=[AIMessage(content="", tool_calls=[echo_call("x", "1")]), AIMessage(content="X done")]
+        )
+        executor = NativeAgentExecutor(llm=llm, tools=[upper_echo()], return_intermediate_steps=True)
+        result = await executor.ainvoke({"input": "Echo x"})
+        self.assertEqual(result["output"], "X done")
+        self.assertEqual([step[1] for step in result["intermediate_steps"]], ["X"])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            MCPAgent(llm=FakeChatModel(), connectors=[MagicMock()], engine="turbo")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Unit tests for connector reconnection.
+"""
+
+import asyncio
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp.types import Tool
+
+from mcp_use.config import create_connector_from_config
+from mcp_use.connectors.base import BaseConnector
+from mcp_use.connectors.reconnect import ReconnectPolicy
+
+
+class FlakyConnector(BaseConnector):
+    """Connector whose connect() fails a given number of times."""
+
+    def __init__(self, failures: int = 0, connect_delay: float = 0.0):
+        super().__init__()
+        self.failures = failures
+        self.connect_delay = connect_delay
+        self.connect_calls = 0
+
+    async def connect(self) -> None:
+        self.connect_calls += 1
+        await asyncio.sleep(self.connect_delay)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("server unavailable")
+        self.client_session = MagicMock()
+        self.client_session.initialize = AsyncMock(return_value=MagicMock(capabilities=MagicMock(tools=False)))
+        self._connected = True
+
+    @property
+    def public_identifier(self) -> dict[str, str]:
+        return {"type": "flaky"}
+
+
+class TestReconnectPolicy(unittest.TestCase):
+    """Tests for ReconnectPolicy backoff."""
+
+    def test_backoff_is_capped(self):
+        """Test that delays grow exponentially up to max_delay."""
+        policy = ReconnectPolicy(initial_delay=1.0, max_delay=5.0, multiplier=2.0, jitter=0.0)
+
+        self.assertEqual([policy.backoff(attempt) for attempt in range(1, 6)], [1.0, 2.0, 4.0, 5.0, 5.0])
+
+    def test_backoff_jitter(self):
+        """Test that jitter only shortens the delay by at most the jitter fraction."""
+        policy = ReconnectPolicy(initial_delay=2.0, jitter=0.5)
+
+        for _ in range(50):
+            self.assertTrue(1.0 <= policy.backoff(1) <= 2.0)
+
+    def test_invalid_options(self):
+        """Test that invalid options are rejected."""
+        with self.assertRaises(ValueError):
+            ReconnectPolicy(jitter=2)
+        with self.assertRaises(ValueError):
+            ReconnectPolicy(max_attempts=0)
+
+    def test_config(self):
+        """Test that the reconnect key configures the connector."""
+        connector = create_connector_from_config(
+            {"command": "python", "args": [], "reconnect": {"max_attempts": 2, "wait_timeout": 1}}
+        )
+        self.assertEqual(connector.reconnect_policy.max_attempts, 2)
+        self.assertEqual(connector.reconnect_policy.wait_timeout, 1)
+
+        connector = create_connector_from_config({"command": "python", "args": [], "reconnect": False})
+        self.assertFalse(connector.auto_reconnect)
+
+
+@patch("mcp_use.connectors.base.logger")
+class TestEnsureConnected(IsolatedAsyncioTestCase):
+    """Tests for BaseConnector._ensure_connected."""
+
+    def _lost_connector(self, **kwargs) -> FlakyConnector:
+        connector = FlakyConnector(**kwargs)
+        connector.reconnect_policy = ReconnectPolicy(initial_delay=0.001, max_delay=0.01, max_attempts=3)
+        connector.client_session = MagicMock()
+        connector._connected = False
+        connector._initialized = True
+        connector._tools = [Tool(name="echo", inputSchema={"type": "object"})]
+        return connector
+
+    async def test_concurrent_callers_share_one_attempt(self, _):
+        """Test that concurrent callers wait on a single reconnection."""
+        connector = self._lost_connector(connect_delay=0.01)
+
+        await asyncio.gather(*(connector._ensure_connected() for _ in range(10)))
+
+        self.assertEqual(connector.connect_calls, 1)
+        self.assertTrue(connector.is_connected)
+        self.assertEqual(connector.reconnect_stats["reconnects"], 1)
+        self.assertIsNone(connector.reconnect_stats["current_downtime"])
+        self.assertGreater(connector.reconnect_stats["total_downtime"], 0)
+
+    async def test_backoff_until_success(self, _):
+        """Test that failed attempts are retried and the cached tools are kept."""
+        connector = self._lost_connector(failures=2)
+
+        await connector._ensure_connected()
+
+        self.assertEqual(connector.connect_calls, 3)
+        self.assertEqual(connector.reconnect_stats["failed_attempts"], 2)
+        self.assertEqual(connector.reconnect_stats["reconnects"], 1)
+        connector.client_session.initialize.assert_awaited_once()
+
+    async def test_give_up_after_max_attempts(self, _):
+        """Test that callers get an error once the attempts are exhausted."""
+        connector = self._lost_connector(failures=10)
+
+        with self.assertRaises(RuntimeError):
+            await connector._ensure_connected()
+
+        self.assertEqual(connector.connect_calls, 3)
+        self.assertEqual([tool.name for tool in connector._tools], ["echo"])
+        self.assertIsNotNone(connector.reconnect_stats["current_downtime"])
+
+        # A later call starts a fresh attempt even though the session is gone
+        connector.failures = 0
+        await connector._ensure_connected()
+        self.assertTrue(connector.is_connected)
+
+    async def test_wait_deadline(self, _):
+        """Test that a caller stops waiting at its deadline without cancelling the attempt."""
+        connector = self._lost_connector(connect_delay=0.05)
+
+        with self.assertRaises(RuntimeError):
+            await connector._ensure_connected(timeout=0.001)
+
+        self.assertTrue(connector.reconnect_stats["reconnecting"])
+        await connector._ensure_connected()
+        self.assertEqual(connector.connect_calls, 1)
+
+    async def test_auto_reconnect_disabled(self, _):
+        """Test that a lost connection raises when auto_reconnect is off."""
+        connector = self._lost_connector()
+        connector.auto_reconnect = False
+
+        with self.assertRaises(RuntimeError):
+            await connector._ensure_connected()
+        self.assertEqual(connector.connect_calls, 0)
+
+    async def test_not_connected(self, _):
+        """Test that a connector that never connected does not reconnect."""
+        connector = FlakyConnector()
+
+        with self.assertRaises(RuntimeError):
+            await connector._ensure_connected()
+        self.assertEqual(connector.connect_calls, 0)
+
+    async def test_disconnect_cancels_reconnection(self, _):
+        """Test that disconnecting during a reconnection stops it and leaves no session."""
+        connector = self._lost_connector(connect_delay=0.05)
+        waiter = asyncio.create_task(connector._ensure_connected())
+        await asyncio.sleep(0.01)
+
+        await connector.disconnect()
+
+        with self.assertRaises(RuntimeError):
+            await waiter
+        await asyncio.sleep(0.06)
+        self.assertEqual(connector.connect_calls, 1)
+        self.assertFalse(connector.is_connected)
+        self.assertIsNone(connector.client_session)
+        self.assertFalse(connector.reconnect_stats["reconnecting"])
+        with self.assertRaises(RuntimeError):
+            await connector._ensure_connected()
+        self.assertEqual(connector.connect_calls, 1)
@@ -0,0 +1,198 @@
+"""
+Unit tests for the compact rendering of tool definitions.
+"""
+
+import copy
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from agent_fakes import FakeChatModel, make_agent
+from langchain_core.messages import AIMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from mcp_use import MCPAgent
+from mcp_use.adapters import ToolRenderer
+from mcp_use.adapters.langchain_adapter import McpTool
+from mcp_use.adapters.rendering import compact_schema, truncate_description
+from mcp_use.adapters.schemas import args_model_cache
+
+PERSON = {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string", "description": "Path of the file"},
+        "title": {"type": "string", "title": "Title"},
+        "limit": {"type": ["integer", "null"], "default": 10},
+        "owner": PERSON,
+        "reviewer": PERSON,
+        "tags": {"type": "array", "items": {"type": "string"}, "examples": [["a", "b"]]},
+    },
+    "required": ["path"],
+}
+
+
+def make_tool(schema: dict = SCHEMA, description: str = "Read a file") -> McpTool:
+    return McpTool(
+        name="read_file",
+        description=description,
+        args_schema=args_model_cache.get_model(schema),
+        tool_connector=MagicMock(),
+        adapter=None,
+    )
+
+
+class TestCompactSchema(unittest.TestCase):
+    def test_titles_and_null_defaults_are_dropped(self):
+        schema = {
+            "title": "Args",
+            "type": "object",
+            "properties": {"title": {"title": "Title", "type": "string"}, "x": {"type": "string", "default": None}},
+        }
+        self.assertEqual(
+            compact_schema(schema),
+            {"type": "object", "properties": {"title": {"type": "string"}, "x": {"type": "string"}}},
+        )
+
+    def test_trivial_any_of_is_collapsed(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "optional": {"anyOf": [{"type": "string"}, {"type": "null"}], "default": "a"},
+                "nullable": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+                "single": {"anyOf": [{"type": "array", "items": {"type": "string"}}], "description": "Items"},
+                "union": {"anyOf": [{"type": "string"}, {"type": "object"}]},
+            },
+            "required": ["nullable"],
+        }
+        properties = compact_schema(schema)["properties"]
+        self.assertEqual(properties["optional"], {"type": "string", "default": "a"})
+        self.assertEqual(properties["nullable"], {"type": ["string", "null"]})
+        self.assertEqual(properties["single"], {"type": "array", "items": {"type": "string"}, "description": "Items"})
+        self.assertEqual(properties["union"], {"type": ["string", "object"]})
+
+    def test_shared_definitions_are_deduped(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "owner": {"$ref": "#/$defs/Owner"},
+                "reviewer": {"$ref": "#/$defs/Reviewer"},
+                "address": {"$ref": "#/$defs/Address"},
+            },
+            "$defs": {
+                "Owner": {**PERSON, "title": "Owner"},
+                "Reviewer": {**PERSON, "title": "Reviewer"},
+                "Address": {"type": "object", "properties": {"city": {"type": "string"}}},
+                "Unused": {"type": "string"},
+            },
+        }
+        compacted = compact_schema(schema)
+        self.assertEqual(compacted["properties"]["owner"], {"$ref": "#/$defs/Owner"})
+        self.assertEqual(compacted["properties"]["reviewer"], {"$ref": "#/$defs/Owner"})
+        self.assertEqual(
+            compacted["properties"]["address"], {"type": "object", "properties": {"city": {"type": "string"}}}
+        )
+        self.assertEqual(compacted["$defs"], {"Owner": PERSON})
+
+    def test_recursive_definitions_are_kept(self):
+        node = {"type": "object", "properties": {"children": {"type": "array", "items": {"$ref": "#/$defs/Node"}}}}
+        schema = {"type": "object", "properties": {"root": {"$ref": "#/$defs/Node"}}, "$defs": {"Node": node}}
+        compacted = compact_schema(schema)
+        self.assertEqual(compacted["properties"]["root"], {"$ref": "#/$defs/Node"})
+        self.assertEqual(compacted["$defs"], {"Node": node})
+
+    def test_descriptions_are_truncated(self):
+        schema = {"type": "object", "properties": {"x": {"type": "string", "description": "word " * 50}}}
+        self.assertLessEqual(
+            len(compact_schema(schema, max_description_chars=20)["properties"]["x"]["description"]), 23
+        )
+
+    def test_does_not_mutate(self):
+        original = copy.deepcopy(SCHEMA)
+        compact_schema(SCHEMA, max_description_chars=5, drop_examples=True)
+        self.assertEqual(SCHEMA, original)
+
+    def test_truncate_description(self):
+        self.assertEqual(truncate_description("Read the file, then parse it", 16), "Read the file...")
+        self.assertEqual(truncate_description("Short", 16), "Short")
+        self.assertEqual(truncate_description("Short", None), "Short")
+
+
+class TestToolRenderer(unittest.TestCase):
+    def test_compact_definition(self):
+        definition = ToolRenderer().render(make_tool())
+        function = definition["function"]
+        self.assertEqual(
+            (definition["type"], function["name"], function["description"]), ("function", "read_file", "Read a file")
+        )
+        parameters = function["parameters"]
+        self.assertNotIn("title", parameters)
+        self.assertEqual(parameters["required"], ["path"])
+        self.assertEqual(parameters["properties"]["limit"], {"type": "integer", "default": 10})
+        self.assertEqual(parameters["properties"]["title"], {"type": "string"})
+        self.assertEqual(parameters["properties"]["owner"], parameters["properties"]["reviewer"])
+        self.assertEqual(len(parameters["$defs"]), 1)
+
+    def test_minimal_definition(self):
+        tool = make_tool(description="Read a file " + "and more " * 50)
+        function = ToolRenderer("minimal").render(tool)["function"]
+        self.assertLessEqual(len(function["description"]), 203)
+        self.assertNotIn("examples", function["parameters"]["properties"]["tags"])
+
+    def test_full_definition(self):
+        tool = make_tool()
+        self.assertEqual(ToolRenderer("full").render(tool), convert_to_openai_tool(tool))
+
+    def test_definitions_are_cached_per_tool(self):
+        renderer = ToolRenderer()
+        with patch.object(renderer, "_render", wraps=renderer._render) as render:
+            first = renderer.render(make_tool())
+            self.assertIs(renderer.render(make_tool()), first)
+            renderer.render(make_tool(description="Another description"))
+        self.assertEqual(render.call_count, 2)
+
+    def test_report(self):
+        report = ToolRenderer().report([make_tool()])
+        self.assertEqual(report["tools"], 1)
+        self.assertGreater(report["tokens_saved"], 0)
+        self.assertEqual(report["full_tokens"] - report["tokens"], report["tokens_saved"])
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            ToolRenderer("tiny")
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestAgentToolSchemaLevel(unittest.IsolatedAsyncioTestCase):
+    async def test_compact_definitions_are_bound(self):
+        for engine in ("executor", "native"):
+            with self.subTest(engine=engine):
+                llm = FakeChatModel(respond=lambda messages: AIMessage(content="Done"))
+                long_description = "Read a file " + "and more " * 50
+                agent = make_agent(
+                    llm,
+                    [make_tool(description=long_description)],
+                    engine=engine,
+                    tool_schema_level="minimal",
+                    system_prompt_template="Tools:\n{tool_descriptions}",
+                )
+                await agent.initialize()
+                self.assertEqual(await agent.run("Read", manage_connector=False), "Done")
+
+                bound = llm.bound[-1]
+                self.assertEqual(bound, [agent.tool_renderer.render(agent._tools[0])])
+                self.assertNotIn("title", bound[0]["function"]["parameters"])
+                self.assertLess(len(bound[0]["function"]["description"]), len(long_description))
+                self.assertEqual(
+                    agent.get_system_message().content, f"Tools:\n- read_file: {bound[0]['function']['description']}"
+                )
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            MCPAgent(llm=FakeChatModel(), connectors=[MagicMock()], tool_schema_level="tiny")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+"""
+Unit tests for the replicated connector.
+"""
+
+import asyncio
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from mcp.shared.exceptions import McpError
+from mcp.types import CallToolResult, ErrorData, TextContent, Tool, ToolAnnotations
+
+from mcp_use.config import create_connector_from_config
+from mcp_use.connectors.base import BaseConnector
+from mcp_use.connectors.http import HttpConnector
+from mcp_use.connectors.replicated import ReplicatedConnector, ReplicaUnavailableError
+
+
+class FakeReplica(BaseConnector):
+    """Replica answering tool calls after a delay, or failing."""
+
+    def __init__(self, name: str, delay: float = 0.0, error: Exception | None = None, connect_failures: int = 0):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.connect_failures = connect_failures
+        self.calls = 0
+
+    async def connect(self) -> None:
+        if self.connect_failures:
+            self.connect_failures -= 1
+            raise ConnectionError("refused")
+        self.client_session = MagicMock()
+        self._connected = True
+
+    async def initialize(self):
+        self._initialized = True
+        self._tools = [
+            Tool(name="search", inputSchema={}, annotations=ToolAnnotations(readOnlyHint=True)),
+            Tool(name="book", inputSchema={}),
+        ]
+        self._resources = []
+        self._prompts = []
+        return {"replica": self.name}
+
+    async def call_tool(self, name, arguments, read_timeout_seconds=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return CallToolResult(content=[TextContent(type="text", text=self.name)])
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def public_identifier(self) -> dict[str, str]:
+        return {"type": "fake", "name": self.name}
+
+
+async def connected(*replicas: FakeReplica, **options) -> ReplicatedConnector:
+    connector = ReplicatedConnector(list(replicas), **options)
+    await connector.connect()
+    await connector.initialize()
+    return connector
+
+
+def answered_by(result: CallToolResult) -> str:
+    return result.content[0].text
+
+
+class TestReplicatedConfig(unittest.TestCase):
+    """Tests for replicated server configuration."""
+
+    def test_url_list(self):
+        connector = create_connector_from_config(
+            {
+                "url": ["http://replica-1:8000/mcp", "http://replica-2:8000/mcp"],
+                "load_balancing": {"strategy": "least_outstanding", "hedge_after": 0.5},
+                "reconnect": {"max_attempts": 1},
+            }
+        )
+        self.assertIsInstance(connector, ReplicatedConnector)
+        self.assertEqual(connector.strategy, "least_outstanding")
+        self.assertEqual(connector.hedge_after, 0.5)
+        self.assertEqual(
+            [replica.connector.base_url for replica in connector.replicas],
+            [
+                "http://replica-1:8000/mcp",
+                "http://replica-2:8000/mcp",
+            ],
+        )
+        self.assertTrue(all(isinstance(replica.connector, HttpConnector) for replica in connector.replicas))
+        self.assertEqual(connector.replicas[0].connector.reconnect_policy.max_attempts, 1)
+
+    def test_url_list_with_http_pool(self):
+        connector = create_connector_from_config(
+            {
+                "url": ["http://pooled-1:8000/mcp", "http://pooled-2:8000/mcp", "http://pooled-2:8000/other"],
+                "http_pool": True,
+            }
+        )
+        first, second, third = (replica.connector.http_pool for replica in connector.replicas)
+        self.assertEqual(first.origin, "http://pooled-1:8000")
+        self.assertEqual(second.origin, "http://pooled-2:8000")
+        self.assertIs(second, third)
+
+    def test_single_url(self):
+        connector = create_connector_from_config({"url": "http://localhost:8000/mcp"})
+        self.assertIsInstance(connector, HttpConnector)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            ReplicatedConnector([])
+        with self.assertRaises(ValueError):
+            ReplicatedConnector([FakeReplica("a")], strategy="random")
+
+
+@patch("mcp_use.connectors.replicated.logger")
+class TestReplicatedConnector(IsolatedAsyncioTestCase):
+    """Tests for load balancing across replicas."""
+
+    async def test_round_robin(self, _):
+        connector = await connected(FakeReplica("a"), FakeReplica("b"))
+        results = [answered_by(await connector.call_tool("book", {})) for _ in range(4)]
+        self.assertEqual(sorted(results), ["a", "a", "b", "b"])
+        self.assertEqual([tool.name for tool in connector._tools], ["search", "book"])
+
+    async def test_least_outstanding(self, _):
+        slow, fast = FakeReplica("slow", delay=0.2), FakeReplica("fast")
+        connector = await connected(slow, fast, strategy="least_outstanding")
+        first = asyncio.create_task(connector.call_tool("book", {}))
+        await asyncio.sleep(0.01)
+        busy = "slow" if slow.calls else "fast"
+        for _ in range(3):
+            self.assertNotEqual(answered_by(await connector.call_tool("book", {})), busy)
+        await first
+
+    async def test_failed_replica_is_ejected(self, _):
+        broken, healthy = FakeReplica("broken", error=ConnectionError("down")), FakeReplica("healthy")
+        connector = await connected(broken, healthy)
+        outcomes = []
+        for _ in range(3):
+            try:
+                outcomes.append(answered_by(await connector.call_tool("book", {})))
+            except ConnectionError:
+                outcomes.append("error")
+        # A non-idempotent call is not retried, but the replica leaves the rotation
+        self.assertEqual(outcomes, ["error", "healthy", "healthy"])
+        self.assertEqual(broken.calls, 1)
+        self.assertTrue(connector.health()["replicas"][0]["ejected"])
+
+    async def test_idempotent_calls_fail_over(self, _):
+        broken, healthy = FakeReplica("broken", error=ConnectionError("down")), FakeReplica("healthy")
+        connector = await connected(broken, healthy)
+        for _ in range(4):
+            self.assertEqual(answered_by(await connector.call_tool("search", {})), "healthy")
+        self.assertEqual(broken.calls, 1)
+        self.assertEqual(connector.health()["failovers"], 1)
+
+    async def test_error_responses_do_not_fail_over(self, _):
+        invalid = McpError(ErrorData(code=-32602, message="invalid params"))
+        connector = await connected(FakeReplica("a", error=invalid), FakeReplica("b", error=invalid))
+        with self.assertRaises(McpError):
+            await connector.call_tool("search", {})
+        self.assertFalse(any(replica.ejected for replica in connector.replicas))
+
+    async def test_all_replicas_failing(self, _):
+        connector = await connected(
+            FakeReplica("a", error=ConnectionError("down")), FakeReplica("b", error=ConnectionError("down"))
+        )
+        with self.assertRaises(ConnectionError):
+            await connector.call_tool("search", {})
+        # Ejected replicas are still tried when no other is left
+        with self.assertRaises(ConnectionError):
+            await connector.call_tool("search", {})
+
+    async def test_hedging(self, _):
+        slow, fast = FakeReplica("slow", delay=1.0), FakeReplica("fast")
+        connector = await connected(slow, fast, strategy="least_outstanding", hedge_after=0.05)
+        connector._turn = iter(range(0, 100, 2))  # Always start with the slow replica
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self.assertEqual(answered_by(await connector.call_tool("search", {})), "fast")
+        self.assertLess(loop.time() - start, 0.5)
+        self.assertEqual(connector.health()["hedged"], 1)
+        await asyncio.sleep(0)
+        self.assertEqual(connector.replicas[0].outstanding, 0, "The slower attempt should be cancelled")
+
+    async def test_no_hedging_for_non_idempotent_tools(self, _):
+        slow, fast = FakeReplica("slow", delay=0.1), FakeReplica("fast")
+        connector = await connected(slow, fast, hedge_after=0.01)
+        connector._turn = iter(range(0, 100, 2))
+        self.assertEqual(answered_by(await connector.call_tool("book", {})), "slow")
+        self.assertEqual(fast.calls, 0)
+
+        connector.hedge_tools.add("book")
+        self.assertEqual(answered_by(await connector.call_tool("book", {})), "fast")
+
+    async def test_unreachable_replica_at_connect(self, _):
+        unreachable = FakeReplica("unreachable")
+
+        async def fail():
+            raise ConnectionError("refused")
+
+        unreachable.connect = fail
+        connector = await connected(unreachable, FakeReplica("b"))
+        self.assertTrue(connector.replicas[0].ejected)
+        self.assertEqual(answered_by(await connector.call_tool("book", {})), "b")
+
+    async def test_unreachable_replica_is_retried(self, _):
+        unreachable = FakeReplica("unreachable", connect_failures=1)
+        connector = await connected(unreachable, FakeReplica("b"), ejection_time=0.01)
+        self.assertIsNone(unreachable.client_session)
+
+        await asyncio.sleep(0.02)
+        results = {answered_by(await connector.call_tool("book", {})) for _ in range(2)}
+        self.assertEqual(results, {"unreachable", "b"})
+        self.assertTrue(unreachable._initialized)
+        self.assertFalse(connector.replicas[0].ejected)
+        self.assertFalse(connector.replicas[0].startup_failed)
+
+    async def test_unreachable_replica_without_auto_reconnect(self, _):
+        unreachable = FakeReplica("unreachable", connect_failures=1)
+        unreachable.auto_reconnect = False
+        connector = await connected(unreachable, FakeReplica("b"), ejection_time=0)
+        for _ in range(2):
+            self.assertEqual(answered_by(await connector.call_tool("book", {})), "b")
+        self.assertIsNone(unreachable.client_session)
+
+    async def test_disconnected_replica_is_not_reconnected(self, _):
+        stopped, healthy = FakeReplica("stopped"), FakeReplica("healthy")
+        connector = await connected(stopped, healthy, ejection_time=0)
+        stopped.auto_reconnect = False
+        await stopped.disconnect()
+        for _ in range(2):
+            self.assertEqual(answered_by(await connector.call_tool("book", {})), "healthy")
+        self.assertIsNone(stopped.client_session)
+        self.assertFalse(stopped.is_connected)
+
+    async def test_unsent_requests_fail_over(self, _):
+        unreachable = FakeReplica("unreachable", connect_failures=10)
+        connector = await connected(unreachable, FakeReplica("b"), ejection_time=0)
+        for _ in range(2):
+            # Not idempotent, but never sent to the unreachable replica
+            self.assertEqual(answered_by(await connector.call_tool("book", {})), "b")
+        self.assertGreaterEqual(connector.health()["failovers"], 1)
+        self.assertEqual(unreachable.calls, 0)
+
+        connector.replicas[1].connector.connect_failures = 10
+        await connector.replicas[1].connector.disconnect()
+        with self.assertRaises(ReplicaUnavailableError):
+            await connector.call_tool("book", {})
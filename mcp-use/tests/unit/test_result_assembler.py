@@ -0,0 +1,156 @@
+"""
+Unit tests for tool result assembly.
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.tools import ToolException
+from mcp.types import CallToolResult, ImageContent, TextContent
+
+from mcp_use import MCPAgent
+from mcp_use.adapters import LangChainAdapter
+from mcp_use.adapters.results import ResultAssembler
+from mcp_use.artifacts import MemoryArtifactStore
+
+
+def spilled_path(result: str) -> str:
+    match = re.search(r"saved to (.+)\]$", result)
+    return match.group(1) if match else None
+
+
+class TestResultAssembler(unittest.TestCase):
+    """Tests for the result assembler."""
+
+    def setUp(self):
+        self.spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.spill_dir.cleanup)
+
+    def test_invalid_caps(self):
+        with self.assertRaises(ValueError):
+            ResultAssembler(max_bytes=0)
+        with self.assertRaises(ValueError):
+            ResultAssembler(max_tokens=-1)
+
+    def test_no_cap(self):
+        self.assertEqual(ResultAssembler().assemble(iter(["a", "b", "c"])), "abc")
+
+    def test_under_cap(self):
+        self.assertEqual(ResultAssembler(max_bytes=10).assemble(["abc", "def"]), "abcdef")
+        self.assertFalse(os.listdir(self.spill_dir.name))
+
+    def test_truncate_without_spill(self):
+        result = ResultAssembler(max_bytes=4, spill=False).assemble(["abc", "def", "ghi"])
+        self.assertTrue(result.startswith("abcd\n\n[Result truncated: showing 4 of 9 bytes"))
+        self.assertIsNone(spilled_path(result))
+
+    def test_truncate_list_without_spill(self):
+        # The remaining parts are counted once, even when given a list
+        result = ResultAssembler(max_bytes=2, spill=False).assemble(["abc", "def"])
+        self.assertIn("showing 2 of 6 bytes", result)
+
+    def test_spill(self):
+        assembler = ResultAssembler(max_bytes=4, spill_dir=self.spill_dir.name)
+        result = assembler.assemble(["abc", "def", "ghi"])
+        self.assertTrue(result.startswith("abcd\n\n[Result truncated: showing 4 of 9 bytes"))
+        path = spilled_path(result)
+        self.assertEqual(os.path.dirname(path), self.spill_dir.name)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "abcdefghi")
+
+    def test_token_cap(self):
+        result = ResultAssembler(max_bytes=100, max_tokens=2, spill=False).assemble(["x" * 20])
+        self.assertTrue(result.startswith("x" * 8 + "\n\n[Result truncated: showing 8 of 20 bytes"))
+
+    def test_multibyte_boundary(self):
+        result = ResultAssembler(max_bytes=5, spill_dir=self.spill_dir.name).assemble(["é" * 4])
+        self.assertTrue(result.startswith("éé\n\n"))
+        self.assertIn("showing 4 of 8 bytes", result)
+        with open(spilled_path(result), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "é" * 4)
+
+    def test_error_removes_spill_file(self):
+        def parts():
+            yield "abcdef"
+            raise ToolException("Unexpected content type")
+
+        with self.assertRaises(ToolException):
+            ResultAssembler(max_bytes=2, spill_dir=self.spill_dir.name).assemble(parts())
+        self.assertFalse(os.listdir(self.spill_dir.name))
+
+    def test_cleanup_removes_spill_files(self):
+        assembler = ResultAssembler(max_bytes=4, spill_dir=self.spill_dir.name)
+        for _ in range(2):
+            assembler.assemble(["abcdef"])
+        self.assertEqual(len(os.listdir(self.spill_dir.name)), 2)
+        assembler.cleanup()
+        self.assertFalse(os.listdir(self.spill_dir.name))
+        self.assertEqual(assembler.spilled_paths, [])
+
+    @patch("mcp_use.adapters.results.logger", MagicMock())
+    def test_spill_to_artifact_store(self):
+        store = MemoryArtifactStore()
+        assembler = ResultAssembler(max_bytes=4, spill_dir=self.spill_dir.name, artifact_store=store)
+        result = assembler.assemble(["abc", "def"])
+        artifact_id = re.search(r"saved as artifact (\w+)\]$", result).group(1)
+        self.assertEqual(bytes(store.get(artifact_id)), b"abcdef")
+        self.assertEqual(store.info(artifact_id).mime_type, "text/plain")
+        self.assertFalse(os.listdir(self.spill_dir.name))
+
+        # Results too large for the store stay on disk
+        store.max_bytes = 8
+        result = assembler.assemble(["abcdefghijkl"])
+        with open(spilled_path(result), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "abcdefghijkl")
+        assembler.cleanup()
+        self.assertFalse(os.listdir(self.spill_dir.name))
+
+
+class TestParseToolResult(unittest.TestCase):
+    """Tests for tool result parsing in the LangChain adapter."""
+
+    def test_parts_are_joined(self):
+        result = CallToolResult(
+            content=[
+                TextContent(type="text", text="hello "),
+                ImageContent(type="image", data="aGk=", mimeType="image/png"),
+            ]
+        )
+        self.assertEqual(LangChainAdapter()._parse_mcp_tool_result(result), "hello aGk=")
+
+    def test_result_is_capped(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            adapter = LangChainAdapter(max_result_bytes=5, spill_dir=spill_dir)
+            result = CallToolResult(content=[TextContent(type="text", text="x" * 1000)])
+            parsed = adapter._parse_mcp_tool_result(result)
+            self.assertTrue(parsed.startswith("xxxxx\n\n[Result truncated: showing 5 of 1000 bytes"))
+            self.assertEqual(len(os.listdir(spill_dir)), 1)
+
+    def test_errors(self):
+        adapter = LangChainAdapter()
+        with self.assertRaises(ToolException):
+            adapter._parse_mcp_tool_result(CallToolResult(content=[], isError=False))
+        with self.assertRaises(ToolException):
+            adapter._parse_mcp_tool_result(
+                CallToolResult(content=[TextContent(type="text", text="boom")], isError=True)
+            )
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestAgentSpillFiles(unittest.IsolatedAsyncioTestCase):
+    """Tests for the spill files of an agent."""
+
+    async def test_close_removes_spill_files(self):
+        connector = MagicMock()
+        connector.disconnect = AsyncMock()
+        agent = MCPAgent(llm=MagicMock(), connectors=[connector], max_tool_result_tokens=1)
+        with tempfile.TemporaryDirectory() as spill_dir:
+            agent.adapter.result_assembler.spill_dir = spill_dir
+            agent.adapter._parse_mcp_tool_result(CallToolResult(content=[TextContent(type="text", text="x" * 100)]))
+            self.assertEqual(len(os.listdir(spill_dir)), 1)
+            await agent.close()
+            self.assertFalse(os.listdir(spill_dir))
@@ -0,0 +1,93 @@
+"""
+Unit tests for the time limit of agent runs.
+"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from agent_fakes import FakeChatModel, last_query, make_agent, tool_call, tool_results
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+
+from mcp_use import MCPAgent
+from mcp_use.connectors.timeouts import remaining_time
+
+
+def sleep_in_turn(messages: list[BaseMessage]) -> AIMessage:
+    """Ask to sleep for each duration of the query in turn, e.g. "0.01 10"."""
+    durations = last_query(messages).split()
+    done = len(tool_results(messages))
+    if done < len(durations):
+        return AIMessage(
+            content="", tool_calls=[tool_call("sleep", {"seconds": float(durations[done])}, f"sleep{done}")]
+        )
+    return AIMessage(content="Rested")
+
+
+class SleepTool(BaseTool):
+    name: str = "sleep"
+    description: str = "Sleep for some seconds"
+
+    _time_left: list = PrivateAttr(default_factory=list)
+    _cancelled: list = PrivateAttr(default_factory=list)
+
+    def _run(self, seconds: float) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, seconds: float) -> str:
+        self._time_left.append(remaining_time())
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            self._cancelled.append(seconds)
+            raise
+        return f"Slept {seconds}s"
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestRunTimeout(unittest.IsolatedAsyncioTestCase):
+    """Tests for runs bounded by a time limit."""
+
+    async def make_agent(self, engine: str) -> tuple[MCPAgent, SleepTool]:
+        tool = SleepTool()
+        agent = make_agent(FakeChatModel(respond=sleep_in_turn), [tool], engine=engine, max_steps=10)
+        await agent.initialize()
+        return agent, tool
+
+    async def test_run_stops_at_its_deadline(self):
+        for engine in ("executor", "native"):
+            with self.subTest(engine=engine):
+                agent, tool = await self.make_agent(engine)
+                result = await agent.run("0.01 10", manage_connector=False, timeout=0.2)
+
+                self.assertTrue(result.startswith("Agent stopped after reaching the time limit (0.2s)."))
+                self.assertIn("- sleep({'seconds': 0.01}): Slept 0.01s", result)
+                # The call running at the deadline is cancelled
+                self.assertEqual(tool._cancelled, [10.0])
+                # Each call gets at most the time left
+                self.assertLessEqual(tool._time_left[0], 0.2)
+                self.assertLess(tool._time_left[1], tool._time_left[0])
+                self.assertEqual(agent.get_conversation_history()[-1].content, result)
+
+    async def test_stream_yields_the_trace_then_the_partial_result(self):
+        agent, _ = await self.make_agent("native")
+        items = [item async for item in agent.stream("0.01 0.01 10", manage_connector=False, timeout=0.2)]
+        *steps, result = items
+        self.assertEqual([observation for _, observation in steps], ["Slept 0.01s", "Slept 0.01s"])
+        self.assertIn("Completed tool calls", result)
+
+    async def test_run_within_its_time_limit(self):
+        agent, tool = await self.make_agent("executor")
+        self.assertEqual(await agent.run("0.01", manage_connector=False, timeout=5), "Rested")
+        self.assertEqual(tool._cancelled, [])
+        self.assertIsNone(remaining_time())
+        self.assertEqual(await agent.run("0.01", manage_connector=False), "Rested")
+        self.assertIsNone(tool._time_left[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for the conversion of tool input schemas to Pydantic models.
+"""
+
+import copy
+import unittest
+from unittest.mock import MagicMock
+
+from mcp.types import Tool
+
+from mcp_use.adapters import LangChainAdapter
+from mcp_use.adapters.langchain_adapter import McpTool
+from mcp_use.adapters.schemas import ArgsModelCache, args_model_cache, normalize_schema, schema_hash
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": "Search query"},
+        "limit": {"type": ["integer", "null"]},
+        "filters": {"type": "array", "items": {"type": ["string", "null"]}},
+    },
+    "required": ["query"],
+}
+
+
+class TestNormalizeSchema(unittest.TestCase):
+    """Tests for schema normalization."""
+
+    def test_type_list_becomes_any_of(self):
+        normalized = normalize_schema(SCHEMA)
+        self.assertEqual(normalized["properties"]["limit"], {"anyOf": [{"type": "integer"}, {"type": "null"}]})
+        self.assertEqual(
+            normalized["properties"]["filters"]["items"], {"anyOf": [{"type": "string"}, {"type": "null"}]}
+        )
+
+    def test_does_not_mutate(self):
+        original = copy.deepcopy(SCHEMA)
+        normalize_schema(SCHEMA)
+        self.assertEqual(SCHEMA, original)
+
+    def test_fix_schema_does_not_mutate(self):
+        original = copy.deepcopy(SCHEMA)
+        fixed = LangChainAdapter().fix_schema(SCHEMA)
+        self.assertEqual(SCHEMA, original)
+        self.assertIn("anyOf", fixed["properties"]["limit"])
+
+    def test_normalizes_lists_of_schemas(self):
+        schema = {"anyOf": [{"type": ["string", "null"]}, {"type": "integer"}]}
+        self.assertEqual(
+            normalize_schema(schema),
+            {"anyOf": [{"anyOf": [{"type": "string"}, {"type": "null"}]}, {"type": "integer"}]},
+        )
+
+
+class TestSchemaHash(unittest.TestCase):
+    """Tests for the canonical schema hash."""
+
+    def test_key_order_does_not_matter(self):
+        properties = dict(reversed(SCHEMA["properties"].items()))
+        reordered = {"required": ["query"], "properties": properties, "type": "object"}
+        self.assertEqual(schema_hash(SCHEMA), schema_hash(reordered))
+
+    def test_different_schemas(self):
+        other = copy.deepcopy(SCHEMA)
+        other["required"] = []
+        self.assertNotEqual(schema_hash(SCHEMA), schema_hash(other))
+
+
+class TestArgsModelCache(unittest.TestCase):
+    """Tests for the argument model cache."""
+
+    def test_compiles_once(self):
+        cache = ArgsModelCache()
+        model = cache.get_model(SCHEMA)
+        self.assertIs(cache.get_model(copy.deepcopy(SCHEMA)), model)
+        self.assertEqual(cache.stats(), {"models": 1, "max_size": 4096, "hits": 1, "misses": 1})
+
+    def test_model_validates(self):
+        model = ArgsModelCache().get_model(SCHEMA)
+        args = model(query="mcp", limit=None)
+        self.assertEqual(args.query, "mcp")
+        self.assertIsNone(args.limit)
+        with self.assertRaises(ValueError):
+            model(limit=3)
+
+    def test_does_not_mutate(self):
+        original = copy.deepcopy(SCHEMA)
+        ArgsModelCache().get_model(SCHEMA)
+        self.assertEqual(SCHEMA, original)
+
+    def test_lru_eviction(self):
+        cache = ArgsModelCache(max_size=2)
+        schemas = [{"type": "object", "properties": {f"arg{i}": {"type": "string"}}} for i in range(3)]
+        first = cache.get_model(schemas[0])
+        cache.get_model(schemas[1])
+        cache.get_model(schemas[0])
+        cache.get_model(schemas[2])
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get_model(schemas[0]), first)
+        self.assertEqual(cache.stats()["misses"], 3)
+
+    def test_clear(self):
+        cache = ArgsModelCache()
+        cache.get_model(SCHEMA)
+        cache.clear()
+        self.assertEqual(cache.stats(), {"models": 0, "max_size": 4096, "hits": 0, "misses": 0})
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            ArgsModelCache(max_size=0)
+
+
+class TestAdapterUsesCache(unittest.TestCase):
+    """Tests for the adapter's use of the process-wide cache."""
+
+    def test_tools_share_models(self):
+        args_model_cache.clear()
+        tool = Tool(name="search", description="Search", inputSchema=copy.deepcopy(SCHEMA))
+        first = LangChainAdapter()._convert_tool(tool, MagicMock())
+        second = LangChainAdapter()._convert_tool(tool, MagicMock())
+        self.assertIs(first.args_schema, second.args_schema)
+        self.assertEqual(args_model_cache.stats()["misses"], 1)
+        self.assertEqual(tool.inputSchema, SCHEMA)
+
+    def test_tools_share_class(self):
+        adapter = LangChainAdapter()
+        tools = [
+            adapter._convert_tool(Tool(name=name, description=name, inputSchema=copy.deepcopy(SCHEMA)), MagicMock())
+            for name in ("search", "lookup")
+        ]
+        self.assertIs(type(tools[0]), McpTool)
+        self.assertIs(type(tools[1]), McpTool)
+        self.assertEqual([tool.name for tool in tools], ["search", "lookup"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Unit tests for the server manager shared by concurrent runs.
+"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agent_fakes import FakeChatModel, last_query, tool_call, tool_results
+from langchain_core.messages import AIMessage, BaseMessage
+from mcp.types import Tool
+
+from mcp_use import MCPAgent
+from mcp_use.adapters import LangChainAdapter
+from mcp_use.agents.prompts.system_prompt_builder import create_system_message
+from mcp_use.artifacts import MemoryArtifactStore
+from mcp_use.managers import ServerManager, ServerView
+
+SCHEMA = {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
+
+
+def make_client(server_tools: dict[str, list[str]]) -> MagicMock:
+    """Create a client whose sessions are created on demand, slowly."""
+    connectors = {}
+    for server_name, tool_names in server_tools.items():
+        tools = [Tool(name=name, inputSchema=SCHEMA) for name in tool_names]
+        connector = MagicMock()
+        connector.list_tools = AsyncMock(return_value=tools)
+        connector.list_resources = AsyncMock(return_value=[])
+        connector.list_prompts = AsyncMock(return_value=[])
+        connectors[server_name] = connector
+
+    async def create_session(server_name: str) -> MagicMock:
+        await asyncio.sleep(0.01)
+        return MagicMock(connector=connectors[server_name])
+
+    client = MagicMock()
+    client.get_server_names.return_value = list(connectors)
+    client.get_session.side_effect = ValueError("No session")
+    client.create_session = AsyncMock(side_effect=create_session)
+    return client
+
+
+def tool_named(tools: list, name: str):
+    return next(tool for tool in tools if tool.name == name)
+
+
+def switch_then_report(messages: list[BaseMessage]) -> AIMessage:
+    """Connect to the server named by the query, then report the active server."""
+    results = tool_results(messages)
+    if not results:
+        return AIMessage(
+            content="",
+            tool_calls=[tool_call("connect_to_mcp_server", {"server_name": last_query(messages)}, "connect")],
+        )
+    if len(results) == 1:
+        return AIMessage(content="", tool_calls=[tool_call("get_active_mcp_server", {}, "get")])
+    return AIMessage(content=results[-1].content)
+
+
+@patch("mcp_use.managers.tools.connect_server.logger", MagicMock())
+class TestServerViews(unittest.IsolatedAsyncioTestCase):
+    """Tests for the per-run views of a server manager."""
+
+    def setUp(self):
+        self.client = make_client({"files": ["read_file"], "web": ["fetch"]})
+        self.manager = ServerManager(self.client, LangChainAdapter())
+
+    async def test_views_have_their_own_active_server(self):
+        files, web = self.manager.view(), self.manager.view()
+        self.assertIsInstance(files, ServerView)
+
+        await asyncio.gather(
+            tool_named(files.tools, "connect_to_mcp_server").arun({"server_name": "files"}),
+            tool_named(web.tools, "connect_to_mcp_server").arun({"server_name": "web"}),
+        )
+        self.assertEqual((files.active_server, web.active_server), ("files", "web"))
+        self.assertIsNone(self.manager.active_server)
+        self.assertIn("read_file", [tool.name for tool in files.tools])
+        self.assertNotIn("read_file", [tool.name for tool in web.tools])
+        self.assertEqual(set(self.manager._server_tools), {"files", "web"})
+        self.assertIs(files.initialized_servers, self.manager.initialized_servers)
+
+    async def test_server_is_loaded_once(self):
+        views = [self.manager.view() for _ in range(3)]
+        await asyncio.gather(
+            *(tool_named(view.tools, "connect_to_mcp_server").arun({"server_name": "files"}) for view in views)
+        )
+        self.client.create_session.assert_awaited_once_with("files")
+
+    def test_shared_search_engine(self):
+        view = self.manager.view()
+        search = tool_named(view.tools, "search_mcp_tools")
+        self.assertIs(search._search_tool, self.manager.search_engine)
+        self.assertIs(view.tools[0], view.tools[0])
+
+    def test_artifact_tool(self):
+        self.assertNotIn("read_artifact", [tool.name for tool in self.manager.tools])
+        manager = ServerManager(self.client, LangChainAdapter(artifact_store=MemoryArtifactStore()))
+        self.assertIn("read_artifact", [tool.name for tool in manager.view().tools])
+
+    async def test_loading_a_server_invalidates_the_search_index(self):
+        self.manager.search_engine.is_indexed = True
+        await self.manager.view().load_server_tools("web")
+        self.assertFalse(self.manager.search_engine.is_indexed)
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.managers.tools.connect_server.logger", MagicMock())
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestAgentServerManager(unittest.IsolatedAsyncioTestCase):
+    """Tests for concurrent runs of an agent in server manager mode."""
+
+    async def test_concurrent_runs_switch_servers_independently(self):
+        client = make_client({"files": ["read_file"], "web": ["fetch"]})
+        agent = MCPAgent(
+            llm=FakeChatModel(respond=switch_then_report), client=client, use_server_manager=True, memory_enabled=False
+        )
+        await agent.initialize()
+
+        results = await asyncio.gather(*(agent.run(name, manage_connector=False) for name in ["files", "web"] * 2))
+        self.assertEqual(results, [f"Currently active MCP server: {name}" for name in ["files", "web"] * 2])
+        self.assertIsNone(agent.server_manager.active_server)
+
+    async def test_runs_share_system_messages_not_executors(self):
+        client = make_client({"files": ["read_file"], "web": ["fetch"]})
+        agent = MCPAgent(
+            llm=FakeChatModel(respond=switch_then_report), client=client, use_server_manager=True, memory_enabled=False
+        )
+        with (
+            patch("mcp_use.agents.mcpagent.create_system_message", wraps=create_system_message) as build,
+            patch.object(agent, "_build_agent", wraps=agent._build_agent) as build_agent,
+        ):
+            await agent.initialize()
+            results = await asyncio.gather(*(agent.run(name, manage_connector=False) for name in ["files", "web"] * 2))
+
+        self.assertEqual(results, [f"Currently active MCP server: {name}" for name in ["files", "web"] * 2])
+        # One system message for the management tools, then one per server
+        self.assertEqual(build.call_count, 3)
+        # The management tools of each run act on its own view, so runs do not share executors
+        self.assertEqual(build_agent.call_count, 1 + 2 * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
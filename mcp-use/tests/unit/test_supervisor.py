@@ -0,0 +1,116 @@
+"""
+Unit tests for the stdio process supervisor.
+"""
+
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+from mcp_use.client import MCPClient
+from mcp_use.config import create_connector_from_config
+from mcp_use.connectors.stdio import StdioConnector
+from mcp_use.connectors.supervisor import FAILED, HEALTHY, UNHEALTHY, ProcessSupervisor
+
+
+def make_connector(ping: AsyncMock) -> MagicMock:
+    connector = MagicMock()
+    connector.client_session.send_ping = ping
+    connector.is_connected = True
+    connector.reconnect = AsyncMock()
+    return connector
+
+
+async def hang():
+    await asyncio.sleep(10)
+
+
+@patch("mcp_use.connectors.supervisor.logger")
+class TestProcessSupervisor(IsolatedAsyncioTestCase):
+    """Tests for ProcessSupervisor probes and restarts."""
+
+    async def test_probe_success(self, _):
+        """Test that an answered ping marks the server healthy."""
+        supervisor = ProcessSupervisor(make_connector(AsyncMock()))
+
+        self.assertTrue(await supervisor.probe())
+        self.assertEqual(supervisor.state, HEALTHY)
+        self.assertIsNotNone(supervisor.last_probe_latency)
+
+    async def test_probe_timeout(self, _):
+        """Test that a hung server fails the probe."""
+        supervisor = ProcessSupervisor(make_connector(AsyncMock(side_effect=hang)), probe_timeout=0.01)
+
+        self.assertFalse(await supervisor.probe())
+        self.assertEqual(supervisor.state, UNHEALTHY)
+        self.assertEqual(supervisor.consecutive_failures, 1)
+        self.assertIn("timed out", supervisor.last_error)
+
+    async def test_restart_after_threshold(self, _):
+        """Test that the server is restarted after consecutive failed probes."""
+        ping = AsyncMock(side_effect=[ConnectionError("closed"), ConnectionError("closed"), None, None])
+        connector = make_connector(ping)
+        supervisor = ProcessSupervisor(connector, probe_interval=0.001, failure_threshold=2)
+
+        supervisor.start()
+        while supervisor.total_restarts == 0 or supervisor.state != HEALTHY:
+            await asyncio.sleep(0.001)
+        await supervisor.stop()
+
+        connector.reconnect.assert_awaited_once()
+        self.assertEqual(supervisor.health()["restarts"], 1)
+
+    async def test_restart_budget(self, _):
+        """Test that the supervisor gives up once the restart budget is spent."""
+        connector = make_connector(AsyncMock(side_effect=ConnectionError("closed")))
+        supervisor = ProcessSupervisor(connector, probe_interval=0.001, failure_threshold=1, max_restarts=2)
+
+        supervisor.start()
+        await asyncio.wait_for(supervisor._task, 1)
+
+        self.assertEqual(supervisor.state, FAILED)
+        self.assertEqual(connector.reconnect.await_count, 2)
+        self.assertEqual(supervisor.health()["restarts_in_window"], 2)
+
+
+class TestSupervisorConfig(IsolatedAsyncioTestCase):
+    """Tests for configuring supervision and reading health."""
+
+    def test_supervise_config(self):
+        """Test that the supervise key attaches a supervisor to stdio connectors."""
+        connector = create_connector_from_config(
+            {"command": "python", "args": ["server.py"], "supervise": {"probe_interval": 5, "max_restarts": 3}}
+        )
+
+        self.assertIsInstance(connector.supervisor, ProcessSupervisor)
+        self.assertEqual(connector.supervisor.probe_interval, 5)
+        self.assertEqual(connector.supervisor.max_restarts, 3)
+
+        connector = create_connector_from_config({"command": "python", "args": ["server.py"]})
+        self.assertIsNone(connector.supervisor)
+
+    def test_client_health(self):
+        """Test that MCPClient reports the health of each session."""
+        client = MCPClient()
+        supervised = StdioConnector("python", ["a.py"])
+        supervised.supervise()
+        plain = StdioConnector("python", ["b.py"])
+        client.sessions = {"a": MagicMock(connector=supervised), "b": MagicMock(connector=plain)}
+
+        with patch.object(StdioConnector, "is_connected", new_callable=PropertyMock, return_value=False):
+            health = client.get_server_health()
+
+        self.assertEqual(health["a"]["state"], "stopped")
+        self.assertEqual(health["a"]["restarts"], 0)
+        self.assertEqual(health["b"]["state"], "disconnected")
+        self.assertEqual(health["b"]["reconnects"]["reconnects"], 0)
+        self.assertEqual(list(client.get_server_health("b")), ["b"])
+
+    async def test_disconnect_stops_supervisor(self):
+        """Test that disconnecting stops the supervisor."""
+        connector = StdioConnector("python", ["a.py"])
+        supervisor = connector.supervise()
+        supervisor.stop = AsyncMock()
+
+        await connector.disconnect()
+
+        supervisor.stop.assert_awaited_once()
@@ -0,0 +1,111 @@
+"""
+Unit tests for lazy tool handles.
+"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp.types import Prompt, Resource, Tool
+
+from mcp_use.adapters import LangChainAdapter, ToolHandle
+from mcp_use.adapters.schemas import schema_hash
+from mcp_use.managers.server_manager import ServerManager
+
+SCHEMA = {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
+
+
+def make_connector(tools=None, resources=None, prompts=None):
+    connector = MagicMock()
+    connector.tools = tools or []
+    connector.list_tools = AsyncMock(return_value=tools or [])
+    connector.list_resources = AsyncMock(return_value=resources or [])
+    connector.list_prompts = AsyncMock(return_value=prompts or [])
+    return connector
+
+
+class TestToolHandles(unittest.IsolatedAsyncioTestCase):
+    """Tests for the adapter's tool handles."""
+
+    def setUp(self):
+        self.connector = make_connector(
+            tools=[
+                Tool(name="search", description="Search things", inputSchema=SCHEMA),
+                Tool(name="delete", description="Delete things", inputSchema=SCHEMA),
+            ],
+            resources=[Resource(uri="file:///notes.txt", name="My Notes")],
+            prompts=[Prompt(name="summarize", description="Summarize")],
+        )
+
+    async def test_handles_are_not_materialized(self):
+        adapter = LangChainAdapter()
+        with patch.object(adapter, "_convert_tool") as convert_tool:
+            handles = await adapter.load_tool_handles(self.connector)
+        convert_tool.assert_not_called()
+        self.assertEqual([handle.name for handle in handles], ["search", "delete", "my_notes", "summarize"])
+        self.assertEqual([handle.kind for handle in handles], ["tool", "tool", "resource", "prompt"])
+        self.assertFalse(any(handle.materialized for handle in handles))
+
+    async def test_descriptor(self):
+        handle = (await LangChainAdapter().load_tool_handles(self.connector))[0]
+        self.assertEqual(handle.description, "Search things")
+        self.assertEqual(handle.schema_hash, schema_hash(SCHEMA))
+
+    async def test_materialize_once(self):
+        handles = await LangChainAdapter().load_tool_handles(self.connector)
+        tool = handles[0].materialize()
+        self.assertIs(handles[0].materialize(), tool)
+        self.assertEqual(tool.name, "search")
+        self.assertFalse(handles[1].materialized)
+
+    async def test_handle_names_match_tools(self):
+        adapter = LangChainAdapter()
+        handles = await adapter.load_tool_handles(self.connector)
+        self.assertEqual([tool.name for tool in adapter.materialize(handles)], [handle.name for handle in handles])
+
+    async def test_disallowed_tools_have_no_handle(self):
+        handles = await LangChainAdapter(disallowed_tools=["delete"]).load_tool_handles(self.connector)
+        self.assertNotIn("delete", [handle.name for handle in handles])
+
+    async def test_handles_are_cached(self):
+        adapter = LangChainAdapter()
+        handles = await adapter.load_tool_handles(self.connector)
+        self.assertIs(await adapter.load_tool_handles(self.connector), handles)
+        self.connector.list_tools.assert_awaited_once()
+
+    async def test_load_tools_reuses_handles(self):
+        adapter = LangChainAdapter()
+        handles = await adapter.load_tool_handles(self.connector)
+        tool = handles[0].materialize()
+        tools = await adapter.load_tools_for_connector(self.connector)
+        self.assertIs(tools[0], tool)
+        self.assertEqual(len(tools), 4)
+
+    def test_repr(self):
+        handle = ToolHandle(MagicMock(), "tool", MagicMock(), MagicMock(), "search", "")
+        self.assertEqual(repr(handle), "ToolHandle(tool: search)")
+
+
+class TestServerManagerHandles(unittest.IsolatedAsyncioTestCase):
+    """Tests for the server manager's use of tool handles."""
+
+    async def test_only_active_server_is_materialized(self):
+        connectors = {
+            "files": make_connector(tools=[Tool(name="read_file", inputSchema=SCHEMA)]),
+            "web": make_connector(tools=[Tool(name="fetch", inputSchema=SCHEMA)]),
+        }
+        client = MagicMock()
+        client.get_server_names.return_value = list(connectors)
+        client.get_session.side_effect = lambda name: MagicMock(connector=connectors[name])
+        manager = ServerManager(client, LangChainAdapter())
+
+        await manager._prefetch_server_tools()
+        self.assertTrue(all(isinstance(handle, ToolHandle) for handle in manager._server_tools["web"]))
+
+        manager.active_server = "files"
+        self.assertIn("read_file", [tool.name for tool in manager.tools])
+        self.assertTrue(manager._server_tools["files"][0].materialized)
+        self.assertFalse(manager._server_tools["web"][0].materialized)
+
+
+if __name__ == "__main__":
+    unittest.main()
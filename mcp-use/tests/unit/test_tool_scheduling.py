@@ -0,0 +1,143 @@
+"""
+Unit tests for the concurrent execution of the tool calls of a step.
+"""
+
+import asyncio
+import unittest
+from typing import Any
+
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import BaseTool
+from mcp.types import ToolAnnotations
+
+from mcp_use.agents.executor import MCPAgentExecutor, ToolCallScheduler, is_serial_tool
+
+
+class Recorder:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.events: list[str] = []
+
+
+class SleepTool(BaseTool):
+    description: str = "Sleep, then echo the input"
+    tool_connector: Any = None
+    tool_annotations: ToolAnnotations | None = None
+    recorder: Any
+    delay: float = 0.02
+
+    def _run(self, text: str) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, text: str) -> str:
+        self.recorder.in_flight += 1
+        self.recorder.max_in_flight = max(self.recorder.max_in_flight, self.recorder.in_flight)
+        self.recorder.events.append(f"start {text}")
+        await asyncio.sleep(self.delay)
+        self.recorder.events.append(f"end {text}")
+        self.recorder.in_flight -= 1
+        return text.upper()
+
+
+def make_executor(tools: list[BaseTool], calls: list[tuple[str, str]], **kwargs) -> MCPAgentExecutor:
+    """Create an executor whose agent calls the given tools in one step, then finishes."""
+
+    def plan(inputs: dict) -> list[AgentAction] | AgentFinish:
+        if inputs["intermediate_steps"]:
+            return AgentFinish({"output": "done"}, "done")
+        return [AgentAction(tool, {"text": text}, "") for tool, text in calls]
+
+    return MCPAgentExecutor(agent=RunnableLambda(plan), tools=tools, **kwargs)
+
+
+class TestIsSerialTool(unittest.TestCase):
+    def test_annotations(self):
+        self.assertFalse(is_serial_tool(None))
+        self.assertFalse(is_serial_tool(ToolAnnotations(readOnlyHint=True)))
+        self.assertFalse(is_serial_tool(ToolAnnotations(destructiveHint=False, idempotentHint=True)))
+        self.assertTrue(is_serial_tool(ToolAnnotations(destructiveHint=True)))
+        self.assertTrue(is_serial_tool(ToolAnnotations(idempotentHint=False)))
+
+
+class TestToolCallScheduler(unittest.IsolatedAsyncioTestCase):
+    async def run_calls(self, scheduler, calls):
+        events = []
+
+        async def call(name, server, exclusive):
+            async with scheduler.slot(server, exclusive):
+                events.append(f"start {name}")
+                await asyncio.sleep(0.01)
+                events.append(f"end {name}")
+
+        await asyncio.gather(*(call(*c) for c in calls))
+        return events
+
+    async def test_shared_calls_run_concurrently(self):
+        events = await self.run_calls(ToolCallScheduler(), [("a", "s1", False), ("b", "s1", False)])
+        self.assertEqual(events, ["start a", "start b", "end a", "end b"])
+
+    async def test_per_server_bound(self):
+        events = await self.run_calls(
+            ToolCallScheduler(max_per_server=1), [("a", "s1", False), ("b", "s1", False), ("c", "s2", False)]
+        )
+        self.assertEqual(events[:2], ["start a", "start c"])
+        self.assertLess(events.index("end a"), events.index("start b"))
+
+    async def test_exclusive_call_runs_alone_in_order(self):
+        events = await self.run_calls(ToolCallScheduler(), [("a", "s1", False), ("w", "s1", True), ("b", "s2", False)])
+        self.assertEqual(events, ["start a", "end a", "start w", "end w", "start b", "end b"])
+
+    async def test_local_tools_are_not_bounded(self):
+        events = await self.run_calls(ToolCallScheduler(max_per_server=1), [("a", None, False), ("b", None, False)])
+        self.assertEqual(events[:2], ["start a", "start b"])
+
+    def test_invalid_bound(self):
+        with self.assertRaises(ValueError):
+            ToolCallScheduler(max_per_server=0)
+
+
+class TestMCPAgentExecutor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.server = object()
+
+    def tool(self, name, server=None, annotations=None, delay=0.02):
+        return SleepTool(
+            name=name,
+            tool_connector=server or self.server,
+            tool_annotations=annotations,
+            recorder=self.recorder,
+            delay=delay,
+        )
+
+    async def test_calls_run_concurrently_in_order(self):
+        # The slowest call is first: the intermediate steps still follow the call order
+        tools = [self.tool("slow", delay=0.05), self.tool("fast", delay=0.01)]
+        executor = make_executor(tools, [("slow", "a"), ("fast", "b"), ("fast", "c")], return_intermediate_steps=True)
+        result = await executor.ainvoke({"input": "go"})
+        self.assertEqual(self.recorder.max_in_flight, 3)
+        self.assertEqual([step[1] for step in result["intermediate_steps"]], ["A", "B", "C"])
+
+    async def test_per_server_bound(self):
+        executor = make_executor([self.tool("echo")], [("echo", "a"), ("echo", "b"), ("echo", "c")])
+        executor.max_tool_calls_per_server = 2
+        await executor.ainvoke({"input": "go"})
+        self.assertEqual(self.recorder.max_in_flight, 2)
+
+    async def test_serial_destructive_tools(self):
+        tools = [self.tool("read", annotations=ToolAnnotations(readOnlyHint=True))]
+        tools.append(self.tool("delete", annotations=ToolAnnotations(destructiveHint=True)))
+        calls = [("read", "a"), ("delete", "b"), ("read", "c")]
+
+        await make_executor(tools, calls).ainvoke({"input": "go"})
+        self.assertEqual(self.recorder.max_in_flight, 3)
+
+        self.recorder.events.clear()
+        await make_executor(tools, calls, serial_destructive_tools=True).ainvoke({"input": "go"})
+        self.assertEqual(self.recorder.events, ["start a", "end a", "start b", "end b", "start c", "end c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
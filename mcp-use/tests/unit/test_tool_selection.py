@@ -0,0 +1,180 @@
+"""
+Unit tests for the per-step selection of the tools shown to the LLM.
+"""
+
+import os
+import threading
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agent_fakes import EchoTool, EventRecorder, FakeChatModel, make_agent, tool_call, tool_results
+from langchain_core.agents import AgentAction
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+from langchain_core.tools import BaseTool
+from mcp.types import CallToolResult, TextContent, Tool
+
+from mcp_use.adapters.base import ToolHandle
+from mcp_use.agents import ToolSelector
+from mcp_use.agents.tool_selection import estimate_tool_tokens
+from mcp_use.managers.tools.search_tools import ToolSearchEngine
+
+VOCABULARY = ["file", "read", "write", "fetch", "url", "email", "send", "issue", "time", "weather", "page"]
+
+DESCRIPTIONS = {
+    "read_file": "Read a file from the disk",
+    "write_file": "Write a file to the disk",
+    "fetch_url": "Fetch the page at a url",
+    "send_email": "Send an email",
+    "create_issue": "Create an issue in the tracker",
+    "get_time": "Get the current time",
+    "get_weather": "Get the weather forecast",
+}
+
+
+class KeywordSearchEngine(ToolSearchEngine):
+    """Search engine embedding texts as keyword counts, without an embedding model."""
+
+    def _load_model(self) -> bool:
+        self.model = "keywords"
+        self.embedding_function = lambda texts: [[text.lower().count(word) for word in VOCABULARY] for text in texts]
+        return True
+
+
+def make_tools() -> list[BaseTool]:
+    return [EchoTool(name=name, description=description) for name, description in DESCRIPTIONS.items()]
+
+
+def names(tools: list[BaseTool]) -> list[str]:
+    return [tool.name for tool in tools]
+
+
+class TestToolSelector(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tools = make_tools()
+        self.selector = ToolSelector(top_k=2, pinned_tools=["get_time"], search_engine=KeywordSearchEngine())
+        await self.selector.index(self.tools)
+
+    async def test_top_k_and_pinned_tools_in_tool_order(self):
+        selected = await self.selector.select(self.tools, "Send an email about the weather")
+        self.assertEqual(names(selected), ["send_email", "get_time", "get_weather"])
+
+    async def test_called_tools_stay_selected(self):
+        steps = [(AgentAction(tool="read_file", tool_input={}, log=""), "Sunny")]
+        with patch.object(self.selector.search_engine, "search", return_value=[]) as search:
+            selected = await self.selector.select(self.tools, "Send an email", steps)
+        search.assert_called_once_with("Send an email\nread_file: Sunny", top_k=2)
+        self.assertEqual(names(selected), ["read_file", "get_time"])
+
+    def test_step_query_adds_the_last_tool_result(self):
+        steps = [(AgentAction(tool="fetch_url", tool_input={}, log=""), "x" * 1000)]
+        query = self.selector.step_query("Question", steps)
+        self.assertEqual(query, "Question\nfetch_url: " + "x" * 500)
+
+    async def test_all_tools_without_index(self):
+        selector = ToolSelector(top_k=2, search_engine=KeywordSearchEngine())
+        self.assertEqual(await selector.select(self.tools, "Send an email"), self.tools)
+
+    async def test_all_tools_within_top_k(self):
+        selector = ToolSelector(top_k=len(self.tools), search_engine=self.selector.search_engine)
+        self.assertEqual(await selector.select(self.tools, "Send an email"), self.tools)
+
+    async def test_same_tools_are_indexed_once(self):
+        with patch.object(self.selector.search_engine, "index_tools", AsyncMock()) as index_tools:
+            await self.selector.index(make_tools())
+        index_tools.assert_not_awaited()
+
+    def test_tokens(self):
+        expected = sum(estimate_tool_tokens(tool) for tool in self.tools[:2])
+        self.assertEqual(self.selector.tokens(self.tools[:2]), expected)
+        self.assertGreater(expected, 0)
+
+    async def test_search_runs_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        search = self.selector.search_engine.search
+        threads = []
+
+        def recording_search(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return search(*args, **kwargs)
+
+        with patch.object(self.selector.search_engine, "search", side_effect=recording_search):
+            await self.selector.select(self.tools, "Send an email")
+        self.assertNotEqual(threads, [loop_thread])
+
+    def test_default_engine_does_not_cache_queries(self):
+        self.assertFalse(ToolSelector().search_engine.use_caching)
+
+    def test_invalid_top_k(self):
+        with self.assertRaises(ValueError):
+            ToolSelector(top_k=0)
+
+
+def fetch_then_email(messages: list[BaseMessage]) -> AIMessage:
+    """Fetch a url, then email it."""
+    done = len(tool_results(messages))
+    if done < 2:
+        return AIMessage(
+            content="", tool_calls=[tool_call(["fetch_url", "send_email"][done], {"text": "x"}, f"call_{done}")]
+        )
+    return AIMessage(content="Done")
+
+
+def system_messages(llm: FakeChatModel) -> list[str]:
+    return [next(m.content for m in messages if isinstance(m, SystemMessage)) for messages in llm.received]
+
+
+@patch.dict(os.environ, {"MCP_USE_ANONYMIZED_TELEMETRY": "false"})
+@patch("mcp_use.agents.mcpagent.logger", MagicMock())
+class TestAgentToolSelection(unittest.IsolatedAsyncioTestCase):
+    async def test_each_step_shows_the_selected_tools(self):
+        for engine in ("executor", "native"):
+            with self.subTest(engine=engine):
+                llm, handler = FakeChatModel(respond=fetch_then_email), EventRecorder()
+                selector = ToolSelector(top_k=1, search_engine=KeywordSearchEngine())
+                agent = make_agent(llm, make_tools(), engine=engine, tool_selector=selector, callbacks=[handler])
+                await agent.initialize()
+
+                result = await agent.run("Fetch the page at the url", manage_connector=False)
+
+                self.assertEqual(result, "Done")
+                # A tool that was not shown can still be called, and is shown from then on
+                selections = [event["tools"] for event in handler.data("tool_selection")]
+                self.assertEqual(selections, [["fetch_url"], ["fetch_url"], ["fetch_url", "send_email"]])
+                self.assertIn("fetch_url", system_messages(llm)[0])
+                self.assertNotIn("send_email", system_messages(llm)[0])
+                self.assertIn("send_email", system_messages(llm)[2])
+                self.assertTrue(all(event["tokens_saved"] > 0 for event in handler.data("tool_selection")))
+
+    async def test_only_selected_and_called_tools_are_built(self):
+        llm = FakeChatModel(respond=fetch_then_email)
+        selector = ToolSelector(top_k=1, search_engine=KeywordSearchEngine())
+        agent = make_agent(llm, tool_selector=selector)
+        connector = MagicMock()
+        connector.call_tool = AsyncMock(return_value=CallToolResult(content=[TextContent(type="text", text="ok")]))
+        schema = {"type": "object", "properties": {"text": {"type": "string"}}}
+        handles = [
+            ToolHandle(
+                agent.adapter,
+                "tool",
+                Tool(name=name, description=description, inputSchema=schema),
+                connector,
+                name,
+                description,
+            )
+            for name, description in DESCRIPTIONS.items()
+        ]
+        agent.adapter._create_handles_from_connectors = AsyncMock(return_value=handles)
+        await agent.initialize()
+        self.assertFalse(any(handle.materialized for handle in handles))
+
+        result = await agent.run("Fetch the page at the url", manage_connector=False)
+
+        self.assertEqual(result, "Done")
+        # send_email was called without being shown, and was built for the call
+        built = [handle.name for handle in handles if handle.materialized]
+        self.assertEqual(built, ["fetch_url", "send_email"])
+        self.assertEqual([call.args[0] for call in connector.call_tool.await_args_list], ["fetch_url", "send_email"])
+
+
+if __name__ == "__main__":
+    unittest.main()
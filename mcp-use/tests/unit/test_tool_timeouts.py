@@ -0,0 +1,148 @@
+"""
+Unit tests for per-tool timeouts.
+"""
+
+import unittest
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from connector_fakes import DummyConnector
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from mcp_use.config import create_connector_from_config
+from mcp_use.connectors.timeouts import ToolTimeouts, is_timeout_error
+
+
+class TestToolTimeouts(unittest.TestCase):
+    """Tests for the timeout policy."""
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            ToolTimeouts(percentile=0)
+        with self.assertRaises(ValueError):
+            ToolTimeouts(min_timeout=10, max_timeout=5)
+        with self.assertRaises(ValueError):
+            ToolTimeouts(min_samples=10, window_size=5)
+
+    def test_tracking_only_by_default(self):
+        timeouts = ToolTimeouts()
+        for _ in range(50):
+            timeouts.record("search", 1.0)
+        self.assertIsNone(timeouts.timeout_for("search"))
+        self.assertIsNone(timeouts.read_timeout("search"))
+        self.assertEqual(timeouts.stats()["search"]["calls"], 50)
+
+    def test_override_and_default(self):
+        timeouts = ToolTimeouts(default=30, tools={"export": 600})
+        self.assertEqual(timeouts.timeout_for("export"), 600)
+        self.assertEqual(timeouts.timeout_for("search"), 30)
+        self.assertEqual(timeouts.read_timeout("search"), timedelta(seconds=30))
+
+    def test_adaptive_timeout(self):
+        timeouts = ToolTimeouts(adaptive=True, factor=2, min_timeout=1, max_timeout=100, min_samples=10)
+        for latency in range(1, 10):
+            timeouts.record("search", latency / 10)
+        # Warming up
+        self.assertEqual(timeouts.timeout_for("search"), 100)
+        timeouts.record("search", 4.0)
+        self.assertEqual(timeouts.latency_percentile("search"), 4.0)
+        self.assertEqual(timeouts.latency_percentile("search", 50), 0.5)
+        self.assertEqual(timeouts.timeout_for("search"), 8.0)
+
+    def test_adaptive_timeout_bounds(self):
+        timeouts = ToolTimeouts(adaptive=True, min_timeout=5, max_timeout=60, min_samples=1)
+        timeouts.record("fast", 0.01)
+        timeouts.record("slow", 100)
+        self.assertEqual(timeouts.timeout_for("fast"), 5)
+        self.assertEqual(timeouts.timeout_for("slow"), 60)
+
+    def test_rolling_window(self):
+        timeouts = ToolTimeouts(adaptive=True, factor=1, min_timeout=0, min_samples=2, window_size=2)
+        timeouts.record("search", 50)
+        timeouts.record("search", 1)
+        timeouts.record("search", 2)
+        self.assertEqual(timeouts.timeout_for("search"), 2)
+
+    def test_adaptive_timeout_backoff(self):
+        timeouts = ToolTimeouts(adaptive=True, factor=1, min_timeout=1, max_timeout=5, min_samples=1)
+        timeouts.record("search", 1)
+        backoff = []
+        for _ in range(4):
+            timeouts.record_timeout("search")
+            backoff.append(timeouts.timeout_for("search"))
+        self.assertEqual(backoff, [2, 4, 5, 5])
+        self.assertEqual(timeouts.stats()["search"]["timeouts"], 4)
+
+        # A completed call resets the backoff
+        timeouts.record("search", 1)
+        self.assertEqual(timeouts.timeout_for("search"), 1)
+
+        # Fixed timeouts do not back off
+        timeouts = ToolTimeouts(default=1)
+        timeouts.record_timeout("search")
+        self.assertEqual(timeouts.timeout_for("search"), 1)
+
+    def test_timeout_errors(self):
+        self.assertTrue(is_timeout_error(TimeoutError()))
+        self.assertTrue(is_timeout_error(McpError(ErrorData(code=408, message="timed out"))))
+        self.assertFalse(is_timeout_error(McpError(ErrorData(code=-32602, message="invalid params"))))
+        self.assertFalse(is_timeout_error(ConnectionError()))
+
+    def test_config(self):
+        connector = create_connector_from_config(
+            {"url": "http://localhost:8000/mcp", "timeouts": {"max_timeout": 120, "tools": {"export": 600}}}
+        )
+        self.assertTrue(connector.tool_timeouts.adaptive)
+        self.assertEqual(connector.tool_timeouts.max_timeout, 120)
+        self.assertEqual(connector.tool_timeouts.timeout_for("export"), 600)
+
+        connector = create_connector_from_config({"url": "http://localhost:8000/mcp", "timeouts": {"adaptive": False}})
+        self.assertFalse(connector.tool_timeouts.adaptive)
+
+
+class TestConnectorToolTimeouts(IsolatedAsyncioTestCase):
+    """Tests for tool timeouts in connectors."""
+
+    async def test_call_tool_uses_tool_timeout(self):
+        connector = DummyConnector()
+        connector.tool_timeouts = ToolTimeouts(tools={"export": 600})
+        connector.client_session.call_tool = AsyncMock()
+
+        await connector.call_tool("export", {})
+        connector.client_session.call_tool.assert_awaited_with("export", {}, timedelta(seconds=600))
+        await connector.call_tool("export", {}, read_timeout_seconds=timedelta(seconds=1))
+        connector.client_session.call_tool.assert_awaited_with("export", {}, timedelta(seconds=1))
+        self.assertEqual(connector.tool_timeouts.stats()["export"]["calls"], 2)
+
+    async def test_call_tool_records_timeouts(self):
+        connector = DummyConnector()
+        connector.client_session.call_tool = AsyncMock(side_effect=McpError(ErrorData(code=408, message="timed out")))
+        with self.assertRaises(McpError):
+            await connector.call_tool("export", {})
+        stats = connector.health()["tools"]["export"]
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertEqual(stats["calls"], 0)
+
+    async def test_slow_tool_eventually_succeeds(self):
+        connector = DummyConnector()
+        connector.tool_timeouts = ToolTimeouts(adaptive=True, factor=1, min_timeout=1, max_timeout=60, min_samples=1)
+        connector.tool_timeouts.record("export", 1)
+        attempts = []
+
+        async def call_tool(name, arguments, read_timeout_seconds):
+            # The tool now takes 3s and fails with shorter timeouts
+            attempts.append(read_timeout_seconds.total_seconds())
+            if read_timeout_seconds < timedelta(seconds=3):
+                raise McpError(ErrorData(code=408, message="timed out"))
+            return MagicMock()
+
+        connector.client_session.call_tool = call_tool
+        for _ in range(2):
+            with self.assertRaises(McpError):
+                await connector.call_tool("export", {})
+        await connector.call_tool("export", {})
+
+        self.assertEqual(attempts, [1, 2, 4])
+        self.assertEqual(connector.health()["tools"]["export"]["timeouts"], 2)
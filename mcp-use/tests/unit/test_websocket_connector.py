@@ -0,0 +1,217 @@
+"""
+Unit tests for the WebSocketConnector and its JSON-RPC multiplexer.
+"""
+
+import asyncio
+import json
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp.shared.exceptions import McpError
+from mcp.types import CallToolResult
+
+from mcp_use.connectors.jsonrpc import JsonRpcMultiplexer
+from mcp_use.connectors.websocket import WebSocketConnector
+
+
+class FakeConnection:
+    """Records sent frames and lets tests answer them."""
+
+    def __init__(self):
+        self.sent: list = []
+
+    async def send(self, raw: str) -> None:
+        self.sent.append(json.loads(raw))
+
+
+class TestJsonRpcMultiplexer(IsolatedAsyncioTestCase):
+    """Tests for JsonRpcMultiplexer."""
+
+    def setUp(self):
+        self.connection = FakeConnection()
+        self.multiplexer = JsonRpcMultiplexer(self.connection.send, request_timeout=1.0, max_in_flight=2)
+
+    async def _wait_for_sent(self, count: int) -> None:
+        while len(self.connection.sent) < count:
+            await asyncio.sleep(0)
+
+    async def test_request_resolves_result(self):
+        """Test that a response completes the matching request."""
+        task = asyncio.create_task(self.multiplexer.request("tools/list"))
+        await self._wait_for_sent(1)
+        request = self.connection.sent[0]
+
+        await self.multiplexer.dispatch(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {"tools": []}}))
+
+        self.assertEqual(await task, {"tools": []})
+        self.assertEqual(request["method"], "tools/list")
+        self.assertEqual(self.multiplexer.in_flight, 0)
+
+    async def test_out_of_order_responses(self):
+        """Test that concurrent requests are matched by id, not arrival order."""
+        first = asyncio.create_task(self.multiplexer.request("a"))
+        second = asyncio.create_task(self.multiplexer.request("b"))
+        await self._wait_for_sent(2)
+        ids = {message["method"]: message["id"] for message in self.connection.sent}
+
+        await self.multiplexer.dispatch(json.dumps({"jsonrpc": "2.0", "id": ids["b"], "result": "B"}))
+        await self.multiplexer.dispatch(json.dumps({"jsonrpc": "2.0", "id": ids["a"], "result": "A"}))
+
+        self.assertEqual(await first, "A")
+        self.assertEqual(await second, "B")
+
+    async def test_timeout_cleans_pending(self):
+        """Test that a request past its deadline raises and frees its slot."""
+        with patch("mcp_use.connectors.jsonrpc.logger"), self.assertRaises(TimeoutError):
+            await self.multiplexer.request("slow", timeout=0.01)
+
+        self.assertEqual(self.multiplexer.pending_requests, {})
+        # The late response is dropped without error
+        await self.multiplexer.dispatch(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}}))
+
+    async def test_given_up_requests_are_cancelled(self):
+        """Test that the server is told to stop working on requests that timed out or were cancelled."""
+        multiplexer = JsonRpcMultiplexer(self.connection.send, cancel_method="notifications/cancelled")
+        with patch("mcp_use.connectors.jsonrpc.logger"), self.assertRaises(TimeoutError):
+            await multiplexer.request("slow", timeout=0.01)
+        task = asyncio.create_task(multiplexer.request("cancelled"))
+        await self._wait_for_sent(3)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        slow, first_cancel, cancelled, second_cancel = self.connection.sent
+        self.assertEqual(first_cancel["method"], "notifications/cancelled")
+        self.assertEqual(first_cancel["params"]["requestId"], slow["id"])
+        self.assertNotIn("id", first_cancel)
+        self.assertEqual(second_cancel["params"]["requestId"], cancelled["id"])
+        self.assertEqual(multiplexer.pending_requests, {})
+
+    async def test_window_backpressure(self):
+        """Test that requests beyond the in-flight window wait for a free slot."""
+        tasks = [asyncio.create_task(self.multiplexer.request(f"m{i}")) for i in range(3)]
+        await self._wait_for_sent(2)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(len(self.connection.sent), 2)
+        self.assertEqual(self.multiplexer.in_flight, 2)
+
+        first_id = self.connection.sent[0]["id"]
+        await self.multiplexer.dispatch(json.dumps({"jsonrpc": "2.0", "id": first_id, "result": 0}))
+        await self._wait_for_sent(3)
+
+        for message in self.connection.sent[1:]:
+            await self.multiplexer.dispatch(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": 0}))
+        self.assertEqual(await asyncio.gather(*tasks), [0, 0, 0])
+
+    async def test_batch_preserves_order(self):
+        """Test that a batch is sent as one frame and results keep call order."""
+        task = asyncio.create_task(self.multiplexer.request_batch([("a", None), ("b", {"x": 1})]))
+        await self._wait_for_sent(1)
+        batch = self.connection.sent[0]
+
+        self.assertIsInstance(batch, list)
+        self.assertEqual([message["method"] for message in batch], ["a", "b"])
+        responses = [{"jsonrpc": "2.0", "id": message["id"], "result": message["method"]} for message in batch]
+        await self.multiplexer.dispatch(json.dumps(list(reversed(responses))))
+
+        self.assertEqual(await task, ["a", "b"])
+
+    async def test_concurrent_batches_do_not_deadlock(self):
+        """Test that batches filling the window wait for each other instead of deadlocking."""
+        tasks = [asyncio.create_task(self.multiplexer.request_batch([("a", None), ("b", None)])) for _ in range(2)]
+        for sent in range(1, 3):
+            await self._wait_for_sent(sent)
+            batch = self.connection.sent[-1]
+            await self.multiplexer.dispatch(json.dumps([{"jsonrpc": "2.0", "id": m["id"], "result": 1} for m in batch]))
+
+        self.assertEqual(await asyncio.gather(*tasks), [[1, 1], [1, 1]])
+
+    async def test_batch_larger_than_window(self):
+        """Test that a batch larger than the window is rejected."""
+        with self.assertRaises(ValueError):
+            await self.multiplexer.request_batch([("a", None)] * 3)
+
+    async def test_error_response_raises_mcp_error(self):
+        """Test that JSON-RPC errors are raised as McpError."""
+        task = asyncio.create_task(self.multiplexer.request("missing"))
+        await self._wait_for_sent(1)
+        error = {"code": -32601, "message": "Method not found"}
+        response = {"jsonrpc": "2.0", "id": self.connection.sent[0]["id"], "error": error}
+        await self.multiplexer.dispatch(json.dumps(response))
+
+        with self.assertRaises(McpError) as ctx:
+            await task
+        self.assertEqual(ctx.exception.error.code, -32601)
+
+    async def test_notification_dispatch(self):
+        """Test that notifications are passed to the notification handler."""
+        handler = AsyncMock()
+        self.multiplexer.notification_handler = handler
+        notification = {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+
+        await self.multiplexer.dispatch(json.dumps(notification))
+
+        handler.assert_awaited_once_with(notification)
+
+    async def test_server_request_without_handler(self):
+        """Test that server requests are answered with method not found."""
+        await self.multiplexer.dispatch(json.dumps({"jsonrpc": "2.0", "id": "s1", "method": "ping"}))
+
+        self.assertEqual(self.connection.sent[0]["id"], "s1")
+        self.assertEqual(self.connection.sent[0]["error"]["code"], -32601)
+
+    async def test_close_fails_pending(self):
+        """Test that closing fails pending requests and rejects new ones."""
+        task = asyncio.create_task(self.multiplexer.request("a"))
+        await self._wait_for_sent(1)
+
+        self.multiplexer.close(ConnectionError("gone"))
+
+        with self.assertRaises(ConnectionError):
+            await task
+        with self.assertRaises(ConnectionError):
+            await self.multiplexer.request("b")
+
+
+class TestWebSocketConnector(IsolatedAsyncioTestCase):
+    """Tests for WebSocketConnector on top of the multiplexer."""
+
+    def setUp(self):
+        self.connector = WebSocketConnector("ws://localhost:8080", auth_token="token")
+
+    def test_init(self):
+        """Test connector initialization."""
+        self.assertEqual(self.connector.headers, {"Authorization": "Bearer token"})
+        self.assertEqual(self.connector.request_timeout, 60.0)
+        self.assertEqual(self.connector.max_in_flight, 64)
+        self.assertFalse(self.connector.is_connected)
+        self.assertEqual(self.connector.pending_requests, {})
+
+    async def test_call_tool_returns_typed_result(self):
+        """Test that call_tool parses the result and passes the timeout."""
+        multiplexer = MagicMock()
+        multiplexer.request = AsyncMock(return_value={"content": [{"type": "text", "text": "ok"}]})
+        self.connector._multiplexer = multiplexer
+
+        result = await self.connector.call_tool("echo", {"x": 1}, timedelta(seconds=5))
+
+        self.assertIsInstance(result, CallToolResult)
+        self.assertEqual(result.content[0].text, "ok")
+        multiplexer.request.assert_awaited_once_with("tools/call", {"name": "echo", "arguments": {"x": 1}}, 5.0)
+
+    async def test_notification_forwarded_to_message_handler(self):
+        """Test that server notifications reach the message handler."""
+        handler = AsyncMock()
+        self.connector.message_handler = handler
+
+        await self.connector._handle_notification({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+
+        handler.assert_awaited_once()
+        self.assertEqual(handler.await_args.args[0].root.method, "notifications/tools/list_changed")
+
+    async def test_send_request_not_connected(self):
+        """Test that requests fail when not connected."""
+        with self.assertRaises(RuntimeError):
+            await self.connector.request("ping")